@@ -1,11 +1,12 @@
 import base64
+import time
 import warnings
 from typing import Any, Callable, Dict, Iterator, List, Optional, Type, Union
 from uuid import UUID
 
 import sseclient
 from pydantic import TypeAdapter
-from requests import HTTPError, Response
+from requests import HTTPError, Response, Session
 
 from alpaca.broker.enums import ACHRelationshipStatus
 from alpaca.broker.models import (
@@ -56,9 +57,14 @@ from alpaca.common.constants import (
     ACCOUNT_ACTIVITIES_DEFAULT_PAGE_SIZE,
     BROKER_DOCUMENT_UPLOAD_LIMIT,
 )
-from alpaca.common.enums import BaseURL, PaginationType
+from alpaca.common.enums import BaseURL, JSONBackend, PaginationType
 from alpaca.common.exceptions import APIError
-from alpaca.common.rest import HTTPResult, RESTClient
+from alpaca.common.instrumentation import RequestHooks
+from alpaca.common.metrics import MetricsSink
+from alpaca.common.rate_limit import RateLimiter
+from alpaca.common.retry import RetryPolicy
+from alpaca.common.rest import APICall, HTTPResult, RESTClient
+from alpaca.common.sessions import DEFAULT_TIMEOUT, Timeout
 from alpaca.common.utils import (
     validate_symbol_or_asset_id,
     validate_symbol_or_contract_id,
@@ -148,6 +154,14 @@ class BrokerClient(RESTClient):
         sandbox: bool = True,
         raw_data: bool = False,
         url_override: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        session: Optional[Session] = None,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
     ):
         """
         Args:
@@ -158,6 +172,23 @@ class BrokerClient(RESTClient):
             raw_data (bool): True if you want raw response instead of wrapped responses. Defaults to False.
                 This has not been implemented yet.
             url_override (Optional[str]): A url to override and use as the base url.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests.
+              Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request
+              are reported to this sink, labeled with the templated endpoint. Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its
+              timings. Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, e.g. JSONBackend.ORJSON
+              for large market data pages. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed
+              transparently. Defaults to True.
+            session (Optional[Session]): The requests session used to send requests, e.g. one made with
+              `create_session` to size its connection pool. Pass the same instance to several clients to share one
+              pool between them. Defaults to None.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
         """
         base_url = (
             url_override
@@ -172,6 +203,14 @@ class BrokerClient(RESTClient):
             api_version=api_version,
             sandbox=sandbox,
             raw_data=raw_data,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            session=session,
+            timeout=timeout,
         )
 
     def _get_auth_headers(self) -> dict:
@@ -204,7 +243,7 @@ class BrokerClient(RESTClient):
                 )
                 params["limit"] = normalized_page_size
 
-            response = self.get(endpoint, params)
+            response, span = self._send("GET", endpoint, params)
             if response is None:
                 break
             result = response.get(response_field, None)
@@ -225,7 +264,9 @@ class BrokerClient(RESTClient):
             if self._use_raw_data:
                 yield result
             else:
-                yield TypeAdapter(type=List[base_model_type]).validate_python(result)
+                yield self._validate_response(
+                    TypeAdapter(type=List[base_model_type]), result, span
+                )
 
             if max_items_limit is not None and total_items >= max_items_limit:
                 break
@@ -255,9 +296,9 @@ class BrokerClient(RESTClient):
         """
 
         data = account_data.to_request_fields()
-        response = self.post("/accounts", data)
+        response, span = self._send("POST", "/accounts", data)
 
-        return Account(**response)
+        return self._validate_response(Account, response, span)
 
     def get_account_by_id(
         self,
@@ -307,12 +348,9 @@ class BrokerClient(RESTClient):
         if len(params) < 1:
             raise ValueError("update_data must contain at least 1 field to change")
 
-        response = self.patch(f"/accounts/{account_id}", params)
-
-        if self._use_raw_data:
-            return response
-
-        return Account(**response)
+        return self._call(
+            APICall("PATCH", f"/accounts/{account_id}", params, response_model=Account)
+        )
 
     def delete_account(
         self,
@@ -379,15 +417,12 @@ class BrokerClient(RESTClient):
         if "entities" in params and params["entities"] is not None:
             params["entities"] = ",".join(params["entities"])
 
-        response = self.get(
-            f"/accounts",
-            params,
+        return self._call(
+            APICall(
+                "GET", f"/accounts", params, response_model=TypeAdapter(List[Account])
+            )
         )
 
-        if self._use_raw_data:
-            return response
-        return TypeAdapter(List[Account]).validate_python(response)
-
     def get_trade_account_by_id(
         self,
         account_id: Union[UUID, str],
@@ -405,12 +440,13 @@ class BrokerClient(RESTClient):
 
         account_id = validate_uuid_id_param(account_id)
 
-        result = self.get(f"/trading/accounts/{account_id}/account")
-
-        if self._use_raw_data:
-            return result
-
-        return TradeAccount(**result)
+        return self._call(
+            APICall(
+                "GET",
+                f"/trading/accounts/{account_id}/account",
+                response_model=TradeAccount,
+            )
+        )
 
     def upload_documents_to_account(
         self,
@@ -489,16 +525,15 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id, "account_id")
 
-        result = self.patch(
-            f"/trading/accounts/{account_id}/account/configurations",
-            config.model_dump(),
+        return self._call(
+            APICall(
+                "PATCH",
+                f"/trading/accounts/{account_id}/account/configurations",
+                config.model_dump(),
+                response_model=TradeAccountConfiguration,
+            )
         )
 
-        if self._use_raw_data:
-            return result
-
-        return TradeAccountConfiguration(**result)
-
     def get_cip_data_for_account_by_id(
         self,
         account_id: Union[UUID, str],
@@ -690,16 +725,15 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id)
 
-        result = self.get(
-            f"/accounts/{account_id}/documents",
-            documents_filter.to_request_fields() if documents_filter else {},
+        return self._call(
+            APICall(
+                "GET",
+                f"/accounts/{account_id}/documents",
+                documents_filter.to_request_fields() if documents_filter else {},
+                response_model=TypeAdapter(List[TradeDocument]),
+            )
         )
 
-        if self._use_raw_data:
-            return result
-
-        return TypeAdapter(List[TradeDocument]).validate_python(result)
-
     def get_trade_document_for_account_by_id(
         self,
         account_id: Union[UUID, str],
@@ -722,12 +756,13 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id)
         document_id = validate_uuid_id_param(document_id, "document_id")
 
-        response = self.get(f"/accounts/{account_id}/documents/{document_id}")
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(TradeDocument).validate_python(response)
+        return self._call(
+            APICall(
+                "GET",
+                f"/accounts/{account_id}/documents/{document_id}",
+                response_model=TypeAdapter(TradeDocument),
+            )
+        )
 
     def download_trade_document_for_account_by_id(
         self,
@@ -749,8 +784,6 @@ class BrokerClient(RESTClient):
 
         account_id = validate_uuid_id_param(account_id)
         document_id = validate_uuid_id_param(document_id, "document_id")
-        response: Optional[Response] = None
-
         # self.get/post/etc all set follow redirects to false, however API will return a 301 redirect we need to follow,
         # so we just do a raw request
 
@@ -758,35 +791,23 @@ class BrokerClient(RESTClient):
         base_url = self._base_url + ""
 
         target_url = f"{base_url}/{self._api_version}/accounts/{account_id}/documents/{document_id}/download"
-        num_tries = 0
-
-        while num_tries <= self._retry:
-            response = self._session.get(
-                url=target_url,
-                headers=self._get_default_headers(),
-                allow_redirects=True,
-                stream=True,
-            )
-            num_tries += 1
-
-            try:
-                response.raise_for_status()
-            except HTTPError as http_error:
-                if response.status_code in self._retry_codes:
-                    continue
-                if "code" in response.text:
-                    error = response.json()
-                    if "code" in error:
-                        raise APIError(error, http_error)
-                else:
-                    raise http_error
-
-            # if we got here there were no issues', so response is now a value
-            break
-
-        if response is None:
-            # we got here either by error or someone has mis-configured us, so we didn't even try
-            raise Exception("Somehow we never made a request for download!")
+
+        response = self._get_with_retry(
+            url=target_url,
+            headers=self._get_default_headers(),
+            allow_redirects=True,
+            stream=True,
+        )
+
+        try:
+            response.raise_for_status()
+        except HTTPError as http_error:
+            if "code" in response.text:
+                error = response.json()
+                if "code" in error:
+                    raise APIError(error, http_error)
+            else:
+                raise http_error
 
         with open(file_path, "wb") as f:
             # we specify chunk_size none which is okay since we set stream to true above, so chunks will be as we
@@ -822,15 +843,15 @@ class BrokerClient(RESTClient):
                 f"CreatePlaidRelationshipRequest instance. Got unsupported {type(ach_data)} instead."
             )
 
-        response = self.post(
-            f"/accounts/{account_id}/ach_relationships", ach_data.to_request_fields()
+        return self._call(
+            APICall(
+                "POST",
+                f"/accounts/{account_id}/ach_relationships",
+                ach_data.to_request_fields(),
+                response_model=ACHRelationship,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return ACHRelationship(**response)
-
     def get_ach_relationships_for_account(
         self,
         account_id: Union[UUID, str],
@@ -852,12 +873,14 @@ class BrokerClient(RESTClient):
         if statuses is not None and len(statuses) != 0:
             params["statuses"] = ",".join(statuses)
 
-        response = self.get(f"/accounts/{account_id}/ach_relationships", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[ACHRelationship]).validate_python(response)
+        return self._call(
+            APICall(
+                "GET",
+                f"/accounts/{account_id}/ach_relationships",
+                params,
+                response_model=TypeAdapter(List[ACHRelationship]),
+            )
+        )
 
     def delete_ach_relationship_for_account(
         self,
@@ -896,15 +919,15 @@ class BrokerClient(RESTClient):
             Bank: The Bank that was created.
         """
         account_id = validate_uuid_id_param(account_id)
-        response = self.post(
-            f"/accounts/{account_id}/recipient_banks", bank_data.to_request_fields()
+        return self._call(
+            APICall(
+                "POST",
+                f"/accounts/{account_id}/recipient_banks",
+                bank_data.to_request_fields(),
+                response_model=Bank,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Bank(**response)
-
     def get_banks_for_account(
         self,
         account_id: Union[UUID, str],
@@ -919,12 +942,13 @@ class BrokerClient(RESTClient):
             List[Bank]: List of Banks returned by the query.
         """
         account_id = validate_uuid_id_param(account_id)
-        response = self.get(f"/accounts/{account_id}/recipient_banks")
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[Bank]).validate_python(response)
+        return self._call(
+            APICall(
+                "GET",
+                f"/accounts/{account_id}/recipient_banks",
+                response_model=TypeAdapter(List[Bank]),
+            )
+        )
 
     def delete_bank_for_account(
         self,
@@ -962,15 +986,15 @@ class BrokerClient(RESTClient):
             Transfer: The Transfer that was created.
         """
         account_id = validate_uuid_id_param(account_id)
-        response = self.post(
-            f"/accounts/{account_id}/transfers", transfer_data.to_request_fields()
+        return self._call(
+            APICall(
+                "POST",
+                f"/accounts/{account_id}/transfers",
+                transfer_data.to_request_fields(),
+                response_model=Transfer,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Transfer(**response)
-
     def get_transfers_for_account(
         self,
         account_id: Union[UUID, str],
@@ -1025,7 +1049,9 @@ class BrokerClient(RESTClient):
 
         while True:
             request_fields["offset"] = total_items
-            result = self.get(f"/accounts/{account_id}/transfers", request_fields)
+            result, span = self._send(
+                "GET", f"/accounts/{account_id}/transfers", request_fields
+            )
 
             # The api returns [] when it's done.
             if not isinstance(result, List) or len(result) == 0:
@@ -1042,7 +1068,7 @@ class BrokerClient(RESTClient):
             else:
                 total_items += num_items_returned
 
-            yield TypeAdapter(List[Transfer]).validate_python(result)
+            yield self._validate_response(TypeAdapter(List[Transfer]), result, span)
 
             if max_items_limit is not None and total_items >= max_items_limit:
                 break
@@ -1082,11 +1108,13 @@ class BrokerClient(RESTClient):
             List[Position]: List of open positions from the account.
         """
         account_id = validate_uuid_id_param(account_id)
-        response = self.get(f"/trading/accounts/{account_id}/positions")
-
-        if self._use_raw_data:
-            return response
-        return TypeAdapter(List[Position]).validate_python(response)
+        return self._call(
+            APICall(
+                "GET",
+                f"/trading/accounts/{account_id}/positions",
+                response_model=TypeAdapter(List[Position]),
+            )
+        )
 
     def get_all_accounts_positions(
         self,
@@ -1097,12 +1125,9 @@ class BrokerClient(RESTClient):
         Returns:
             AllAccountsPositions: The collection of open positions keyed by account_id.
         """
-        response = self.get("/accounts/positions")
-
-        if self._use_raw_data:
-            return response
-
-        return AllAccountsPositions(**response)
+        return self._call(
+            APICall("GET", "/accounts/positions", response_model=AllAccountsPositions)
+        )
 
     def get_open_position_for_account(
         self, account_id: Union[UUID, str], symbol_or_asset_id: Union[UUID, str]
@@ -1119,15 +1144,14 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id)
         symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
-        response = self.get(
-            f"/trading/accounts/{account_id}/positions/{symbol_or_asset_id}"
+        return self._call(
+            APICall(
+                "GET",
+                f"/trading/accounts/{account_id}/positions/{symbol_or_asset_id}",
+                response_model=Position,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Position(**response)
-
     def close_all_positions_for_account(
         self,
         account_id: Union[UUID, str],
@@ -1147,15 +1171,15 @@ class BrokerClient(RESTClient):
               order id.
         """
         account_id = validate_uuid_id_param(account_id)
-        response = self.delete(
-            f"/trading/accounts/{account_id}/positions",
-            {"cancel_orders": cancel_orders} if cancel_orders else None,
+        return self._call(
+            APICall(
+                "DELETE",
+                f"/trading/accounts/{account_id}/positions",
+                {"cancel_orders": cancel_orders} if cancel_orders else None,
+                response_model=TypeAdapter(List[ClosePositionResponse]),
+            )
         )
 
-        if self._use_raw_data:
-            return response
-        return TypeAdapter(List[ClosePositionResponse]).validate_python(response)
-
     def close_position_for_account(
         self,
         account_id: Union[UUID, str],
@@ -1177,16 +1201,15 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id)
         symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
-        response = self.delete(
-            f"/trading/accounts/{account_id}/positions/{symbol_or_asset_id}",
-            close_options.to_request_fields() if close_options else {},
+        return self._call(
+            APICall(
+                "DELETE",
+                f"/trading/accounts/{account_id}/positions/{symbol_or_asset_id}",
+                close_options.to_request_fields() if close_options else {},
+                response_model=Order,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Order(**response)
-
     def get_portfolio_history_for_account(
         self,
         account_id: Union[UUID, str],
@@ -1204,16 +1227,15 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id)
 
-        response = self.get(
-            f"/trading/accounts/{account_id}/account/portfolio/history",
-            history_filter.to_request_fields() if history_filter else {},
+        return self._call(
+            APICall(
+                "GET",
+                f"/trading/accounts/{account_id}/account/portfolio/history",
+                history_filter.to_request_fields() if history_filter else {},
+                response_model=PortfolioHistory,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return PortfolioHistory(**response)
-
     # ############################## CLOCK & CALENDAR ################################# #
 
     def get_clock(self) -> Union[Clock, RawData]:
@@ -1225,12 +1247,7 @@ class BrokerClient(RESTClient):
             Clock: The market Clock data
         """
 
-        response = self.get("/clock")
-
-        if self._use_raw_data:
-            return response
-
-        return Clock(**response)
+        return self._call(APICall("GET", "/clock", response_model=Clock))
 
     def get_calendar(
         self,
@@ -1250,15 +1267,15 @@ class BrokerClient(RESTClient):
             List[Calendar]: A list of Calendar objects representing the market days.
         """
 
-        result = self.get(
-            "/calendar", filters.to_request_fields() if filters is not None else {}
+        return self._call(
+            APICall(
+                "GET",
+                "/calendar",
+                filters.to_request_fields() if filters is not None else {},
+                response_model=TypeAdapter(List[Calendar]),
+            )
         )
 
-        if self._use_raw_data:
-            return result
-
-        return TypeAdapter(List[Calendar]).validate_python(result)
-
     # ############################## WATCHLISTS ################################# #
 
     def get_watchlists_for_account(
@@ -1276,12 +1293,13 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id, "account_id")
 
-        result = self.get(f"/trading/accounts/{account_id}/watchlists")
-
-        if self._use_raw_data:
-            return result
-
-        return TypeAdapter(List[Watchlist]).validate_python(result)
+        return self._call(
+            APICall(
+                "GET",
+                f"/trading/accounts/{account_id}/watchlists",
+                response_model=TypeAdapter(List[Watchlist]),
+            )
+        )
 
     def get_watchlist_for_account_by_id(
         self,
@@ -1301,12 +1319,13 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id, "account_id")
         watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
 
-        result = self.get(f"/trading/accounts/{account_id}/watchlists/{watchlist_id}")
-
-        if self._use_raw_data:
-            return result
-
-        return Watchlist(**result)
+        return self._call(
+            APICall(
+                "GET",
+                f"/trading/accounts/{account_id}/watchlists/{watchlist_id}",
+                response_model=Watchlist,
+            )
+        )
 
     def create_watchlist_for_account(
         self,
@@ -1325,16 +1344,15 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id, "account_id")
 
-        result = self.post(
-            f"/trading/accounts/{account_id}/watchlists",
-            watchlist_data.to_request_fields(),
+        return self._call(
+            APICall(
+                "POST",
+                f"/trading/accounts/{account_id}/watchlists",
+                watchlist_data.to_request_fields(),
+                response_model=Watchlist,
+            )
         )
 
-        if self._use_raw_data:
-            return result
-
-        return Watchlist(**result)
-
     def update_watchlist_for_account_by_id(
         self,
         account_id: Union[UUID, str],
@@ -1357,16 +1375,15 @@ class BrokerClient(RESTClient):
         watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
         account_id = validate_uuid_id_param(account_id, "account_id")
 
-        result = self.put(
-            f"/trading/accounts/{account_id}/watchlists/{watchlist_id}",
-            watchlist_data.to_request_fields(),
+        return self._call(
+            APICall(
+                "PUT",
+                f"/trading/accounts/{account_id}/watchlists/{watchlist_id}",
+                watchlist_data.to_request_fields(),
+                response_model=Watchlist,
+            )
         )
 
-        if self._use_raw_data:
-            return result
-
-        return Watchlist(**result)
-
     def add_asset_to_watchlist_for_account_by_id(
         self,
         account_id: Union[UUID, str],
@@ -1388,15 +1405,15 @@ class BrokerClient(RESTClient):
 
         params = {"symbol": symbol}
 
-        result = self.post(
-            f"/trading/accounts/{account_id}/watchlists/{watchlist_id}", params
+        return self._call(
+            APICall(
+                "POST",
+                f"/trading/accounts/{account_id}/watchlists/{watchlist_id}",
+                params,
+                response_model=Watchlist,
+            )
         )
 
-        if self._use_raw_data:
-            return result
-
-        return Watchlist(**result)
-
     def delete_watchlist_from_account_by_id(
         self,
         account_id: Union[UUID, str],
@@ -1437,15 +1454,14 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id, "account_id")
         watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
 
-        result = self.delete(
-            f"/trading/accounts/{account_id}/watchlists/{watchlist_id}/{symbol}"
+        return self._call(
+            APICall(
+                "DELETE",
+                f"/trading/accounts/{account_id}/watchlists/{watchlist_id}/{symbol}",
+                response_model=Watchlist,
+            )
         )
 
-        if self._use_raw_data:
-            return result
-
-        return Watchlist(**result)
-
     # ############################## JOURNALS ################################# #
 
     def create_journal(
@@ -1465,12 +1481,7 @@ class BrokerClient(RESTClient):
         """
         params = journal_data.to_request_fields() if journal_data else {}
 
-        response = self.post("/journals", params)
-
-        if self._use_raw_data:
-            return response
-
-        return Journal(**response)
+        return self._call(APICall("POST", "/journals", params, response_model=Journal))
 
     def create_batch_journal(
         self,
@@ -1489,12 +1500,14 @@ class BrokerClient(RESTClient):
         """
         params = batch_data.to_request_fields() if batch_data else {}
 
-        response = self.post("/journals/batch", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[BatchJournalResponse]).validate_python(response)
+        return self._call(
+            APICall(
+                "POST",
+                "/journals/batch",
+                params,
+                response_model=TypeAdapter(List[BatchJournalResponse]),
+            )
+        )
 
     def create_reverse_batch_journal(
         self,
@@ -1513,12 +1526,14 @@ class BrokerClient(RESTClient):
         """
         params = reverse_batch_data.to_request_fields() if reverse_batch_data else {}
 
-        response = self.post("/journals/reverse_batch", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[BatchJournalResponse]).validate_python(response)
+        return self._call(
+            APICall(
+                "POST",
+                "/journals/reverse_batch",
+                params,
+                response_model=TypeAdapter(List[BatchJournalResponse]),
+            )
+        )
 
     def get_journals(
         self, journal_filter: Optional[GetJournalsRequest] = None
@@ -1534,12 +1549,11 @@ class BrokerClient(RESTClient):
         """
         params = journal_filter.to_request_fields() if journal_filter else {}
 
-        response = self.get("/journals", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[Journal]).validate_python(response)
+        return self._call(
+            APICall(
+                "GET", "/journals", params, response_model=TypeAdapter(List[Journal])
+            )
+        )
 
     def get_journal_by_id(
         self, journal_id: Union[UUID, str] = None
@@ -1555,12 +1569,9 @@ class BrokerClient(RESTClient):
         """
         journal_id = validate_uuid_id_param(journal_id, "journal id")
 
-        response = self.get(f"/journals/{journal_id}")
-
-        if self._use_raw_data:
-            return response
-
-        return Journal(**response)
+        return self._call(
+            APICall("GET", f"/journals/{journal_id}", response_model=Journal)
+        )
 
     def cancel_journal_by_id(
         self,
@@ -1597,14 +1608,16 @@ class BrokerClient(RESTClient):
         # checking to see if we specified at least one param
         params = filter.to_request_fields() if filter is not None else {}
 
-        response = self.get(f"/assets", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(
-            List[Asset],
-        ).validate_python(response)
+        return self._call(
+            APICall(
+                "GET",
+                f"/assets",
+                params,
+                response_model=TypeAdapter(
+                    List[Asset],
+                ),
+            )
+        )
 
     def get_asset(self, symbol_or_asset_id: Union[UUID, str]) -> Union[Asset, RawData]:
         """
@@ -1620,12 +1633,9 @@ class BrokerClient(RESTClient):
 
         symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
 
-        response = self.get(f"/assets/{symbol_or_asset_id}")
-
-        if self._use_raw_data:
-            return response
-
-        return Asset(**response)
+        return self._call(
+            APICall("GET", f"/assets/{symbol_or_asset_id}", response_model=Asset)
+        )
 
     # ############################## ORDERS ################################# #
 
@@ -1646,12 +1656,14 @@ class BrokerClient(RESTClient):
 
         data = order_data.to_request_fields()
 
-        response = self.post(f"/trading/accounts/{account_id}/orders", data)
-
-        if self._use_raw_data:
-            return response
-
-        return Order(**response)
+        return self._call(
+            APICall(
+                "POST",
+                f"/trading/accounts/{account_id}/orders",
+                data,
+                response_model=Order,
+            )
+        )
 
     def get_orders_for_account(
         self, account_id: Union[UUID, str], filter: Optional[GetOrdersRequest] = None
@@ -1674,14 +1686,16 @@ class BrokerClient(RESTClient):
         if "symbols" in params and isinstance(params["symbols"], list):
             params["symbols"] = ",".join(params["symbols"])
 
-        response = self.get(f"/trading/accounts/{account_id}/orders", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(
-            List[Order],
-        ).validate_python(response)
+        return self._call(
+            APICall(
+                "GET",
+                f"/trading/accounts/{account_id}/orders",
+                params,
+                response_model=TypeAdapter(
+                    List[Order],
+                ),
+            )
+        )
 
     def get_order_for_account_by_id(
         self,
@@ -1706,12 +1720,14 @@ class BrokerClient(RESTClient):
         # checking to see if we specified at least one param
         params = filter.to_request_fields() if filter is not None else {}
 
-        response = self.get(f"/trading/accounts/{account_id}/orders/{order_id}", params)
-
-        if self._use_raw_data:
-            return response
-
-        return Order(**response)
+        return self._call(
+            APICall(
+                "GET",
+                f"/trading/accounts/{account_id}/orders/{order_id}",
+                params,
+                response_model=Order,
+            )
+        )
 
     def get_order_for_account_by_client_id(
         self, account_id: Union[UUID, str], client_id: str
@@ -1730,15 +1746,15 @@ class BrokerClient(RESTClient):
 
         params = {"client_order_id": client_id}
 
-        response = self.get(
-            f"/trading/accounts/{account_id}/orders:by_client_order_id", params
+        return self._call(
+            APICall(
+                "GET",
+                f"/trading/accounts/{account_id}/orders:by_client_order_id",
+                params,
+                response_model=Order,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Order(**response)
-
     def replace_order_for_account_by_id(
         self,
         account_id: Union[UUID, str],
@@ -1762,15 +1778,15 @@ class BrokerClient(RESTClient):
         # checking to see if we specified at least one param
         params = order_data.to_request_fields() if order_data is not None else {}
 
-        response = self.patch(
-            f"/trading/accounts/{account_id}/orders/{order_id}", params
+        return self._call(
+            APICall(
+                "PATCH",
+                f"/trading/accounts/{account_id}/orders/{order_id}",
+                params,
+                response_model=Order,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Order(**response)
-
     def cancel_orders_for_account(
         self, account_id: Union[UUID, str]
     ) -> Union[List[CancelOrderResponse], RawData]:
@@ -1785,14 +1801,15 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id, "account_id")
 
-        response = self.delete(f"/trading/accounts/{account_id}/orders")
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(
-            List[CancelOrderResponse],
-        ).validate_python(response)
+        return self._call(
+            APICall(
+                "DELETE",
+                f"/trading/accounts/{account_id}/orders",
+                response_model=TypeAdapter(
+                    List[CancelOrderResponse],
+                ),
+            )
+        )
 
     def cancel_order_for_account_by_id(
         self, account_id: Union[UUID, str], order_id: Union[UUID, str]
@@ -1829,14 +1846,16 @@ class BrokerClient(RESTClient):
         if "ca_types" in params and isinstance(params["ca_types"], list):
             params["ca_types"] = ",".join(params["ca_types"])
 
-        response = self.get("/corporate_actions/announcements", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(
-            List[CorporateActionAnnouncement],
-        ).validate_python(response)
+        return self._call(
+            APICall(
+                "GET",
+                "/corporate_actions/announcements",
+                params,
+                response_model=TypeAdapter(
+                    List[CorporateActionAnnouncement],
+                ),
+            )
+        )
 
     def get_corporate_announcement_by_id(
         self, corporate_announcment_id: Union[UUID, str]
@@ -1852,15 +1871,14 @@ class BrokerClient(RESTClient):
             corporate_announcment_id, "corporate_announcment_id"
         )
 
-        response = self.get(
-            f"/corporate_actions/announcements/{corporate_announcment_id}"
+        return self._call(
+            APICall(
+                "GET",
+                f"/corporate_actions/announcements/{corporate_announcment_id}",
+                response_model=CorporateActionAnnouncement,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return CorporateActionAnnouncement(**response)
-
     # ############################## EVENTS ################################# #
 
     def get_account_status_events(
@@ -1883,13 +1901,18 @@ class BrokerClient(RESTClient):
 
         url = self._base_url + "/" + self._api_version + "/events/accounts/status"
 
-        response = self._session.get(
+        response = self._get_with_retry(
             url=url,
             params=params,
             stream=True,
             headers=self._get_sse_headers(),
         )
 
+        try:
+            response.raise_for_status()
+        except HTTPError as http_error:
+            raise APIError(response.text, http_error)
+
         client = sseclient.SSEClient(response)
 
         for event in client.events():
@@ -1912,13 +1935,18 @@ class BrokerClient(RESTClient):
 
         url = self._base_url + "/" + self._api_version + "/events/trades"
 
-        response = self._session.get(
+        response = self._get_with_retry(
             url=url,
             params=params,
             stream=True,
             headers=self._get_sse_headers(),
         )
 
+        try:
+            response.raise_for_status()
+        except HTTPError as http_error:
+            raise APIError(response.text, http_error)
+
         client = sseclient.SSEClient(response)
 
         for event in client.events():
@@ -1941,13 +1969,18 @@ class BrokerClient(RESTClient):
 
         url = self._base_url + "/" + self._api_version + "/events/journals/status"
 
-        response = self._session.get(
+        response = self._get_with_retry(
             url=url,
             params=params,
             stream=True,
             headers=self._get_sse_headers(),
         )
 
+        try:
+            response.raise_for_status()
+        except HTTPError as http_error:
+            raise APIError(response.text, http_error)
+
         client = sseclient.SSEClient(response)
 
         for event in client.events():
@@ -1972,13 +2005,18 @@ class BrokerClient(RESTClient):
 
         url = self._base_url + "/" + self._api_version + "/events/transfers/status"
 
-        response = self._session.get(
+        response = self._get_with_retry(
             url=url,
             params=params,
             stream=True,
             headers=self._get_sse_headers(),
         )
 
+        try:
+            response.raise_for_status()
+        except HTTPError as http_error:
+            raise APIError(response.text, http_error)
+
         client = sseclient.SSEClient(response)
 
         for event in client.events():
@@ -2003,18 +2041,59 @@ class BrokerClient(RESTClient):
 
         url = self._base_url + "/" + self._api_version + "/events/nta"
 
-        response = self._session.get(
+        response = self._get_with_retry(
             url=url,
             params=params,
             stream=True,
             headers=self._get_sse_headers(),
         )
 
+        try:
+            response.raise_for_status()
+        except HTTPError as http_error:
+            raise APIError(response.text, http_error)
+
         client = sseclient.SSEClient(response)
 
         for event in client.events():
             yield event.data
 
+    def _get_with_retry(self, url: str, **kwargs) -> Response:
+        """
+        Sends a GET request straight through the session, for the responses that can't be handled by `_request`
+        such as file downloads and event streams. Failed attempts are retried as allowed by the client's retry
+        policy.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs: Passed on to `Session.get`.
+
+        Returns:
+            Response: The last response received, which may still be an error.
+        """
+        retry_state = self._retry_policy.start()
+
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+
+            response = self._session.get(url=url, **kwargs)
+
+            if self._rate_limiter is not None:
+                self._rate_limiter.update_from_headers(response.headers)
+
+            if response.ok:
+                return response
+
+            delay = self._retry_policy.get_retry_delay(
+                retry_state, response.status_code, response.headers
+            )
+            if delay is None:
+                return response
+
+            response.close()
+            time.sleep(delay)
+
     def _get_sse_headers(self) -> dict:
         headers = self._get_default_headers()
 
@@ -2042,15 +2121,15 @@ class BrokerClient(RESTClient):
             Portfolio: Newly created portfolio.
         """
 
-        response = self.post(
-            "/rebalancing/portfolios", data=portfolio_request.to_request_fields()
+        return self._call(
+            APICall(
+                "POST",
+                "/rebalancing/portfolios",
+                data=portfolio_request.to_request_fields(),
+                response_model=Portfolio,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Portfolio(**response)
-
     def get_all_portfolios(
         self,
         filter: Optional[GetPortfoliosRequest] = None,
@@ -2067,17 +2146,17 @@ class BrokerClient(RESTClient):
             List[Portfolio]: List of portfolios.
         """
 
-        response = self.get(
-            "/rebalancing/portfolios", filter.to_request_fields() if filter else {}
+        return self._call(
+            APICall(
+                "GET",
+                "/rebalancing/portfolios",
+                filter.to_request_fields() if filter else {},
+                response_model=TypeAdapter(
+                    List[Portfolio],
+                ),
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(
-            List[Portfolio],
-        ).validate_python(response)
-
     def get_portfolio_by_id(
         self, portfolio_id: Union[UUID, str]
     ) -> Union[Portfolio, RawData]:
@@ -2091,12 +2170,13 @@ class BrokerClient(RESTClient):
             Portfolio: The portfolio queried.
         """
 
-        response = self.get(f"/rebalancing/portfolios/{portfolio_id}")
-
-        if self._use_raw_data:
-            return response
-
-        return Portfolio(**response)
+        return self._call(
+            APICall(
+                "GET",
+                f"/rebalancing/portfolios/{portfolio_id}",
+                response_model=Portfolio,
+            )
+        )
 
     def update_portfolio_by_id(
         self,
@@ -2119,16 +2199,15 @@ class BrokerClient(RESTClient):
         """
         portfolio_id = validate_uuid_id_param(portfolio_id)
 
-        response = self.patch(
-            f"/rebalancing/portfolios/{portfolio_id}",
-            data=update_request.to_request_fields(),
+        return self._call(
+            APICall(
+                "PATCH",
+                f"/rebalancing/portfolios/{portfolio_id}",
+                data=update_request.to_request_fields(),
+                response_model=Portfolio,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Portfolio(**response)
-
     def inactivate_portfolio_by_id(self, portfolio_id: Union[UUID, str]) -> None:
         """
         Sets a portfolio to “inactive”, so it can be filtered out of the list request.
@@ -2159,15 +2238,15 @@ class BrokerClient(RESTClient):
             Subscription: Newly created subscription.
         """
 
-        response = self.post(
-            "/rebalancing/subscriptions", data=subscription_request.to_request_fields()
+        return self._call(
+            APICall(
+                "POST",
+                "/rebalancing/subscriptions",
+                data=subscription_request.to_request_fields(),
+                response_model=Subscription,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Subscription(**response)
-
     def get_all_subscriptions(
         self,
         filter: Optional[GetSubscriptionsRequest] = None,
@@ -2219,12 +2298,13 @@ class BrokerClient(RESTClient):
         """
         subscription_id = validate_uuid_id_param(subscription_id)
 
-        response = self.get(f"/rebalancing/subscriptions/{subscription_id}")
-
-        if self._use_raw_data:
-            return response
-
-        return Subscription(**response)
+        return self._call(
+            APICall(
+                "GET",
+                f"/rebalancing/subscriptions/{subscription_id}",
+                response_model=Subscription,
+            )
+        )
 
     def unsubscribe_account(self, subscription_id: Union[UUID, str]) -> None:
         """
@@ -2252,15 +2332,15 @@ class BrokerClient(RESTClient):
             RebalancingRun: The rebalancing run initiated.
         """
 
-        response = self.post(
-            "/rebalancing/runs", data=rebalancing_run_request.to_request_fields()
+        return self._call(
+            APICall(
+                "POST",
+                "/rebalancing/runs",
+                data=rebalancing_run_request.to_request_fields(),
+                response_model=RebalancingRun,
+            )
         )
 
-        if self._use_raw_data:
-            return response
-
-        return RebalancingRun(**response)
-
     def get_all_runs(
         self,
         filter: Optional[GetRunsRequest] = None,
@@ -2306,12 +2386,9 @@ class BrokerClient(RESTClient):
         """
         run_id = validate_uuid_id_param(run_id)
 
-        response = self.get(f"/rebalancing/runs/{run_id}")
-
-        if self._use_raw_data:
-            return response
-
-        return RebalancingRun(**response)
+        return self._call(
+            APICall("GET", f"/rebalancing/runs/{run_id}", response_model=RebalancingRun)
+        )
 
     def cancel_run_by_id(self, run_id: Union[UUID, str]) -> None:
         """
@@ -11,3 +11,30 @@ PageItem = TypeVar("PageItem")  # Generic type for an item from a paginated requ
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_WAIT_SECONDS = 3
 DEFAULT_RETRY_EXCEPTION_CODES = [429, 504]
+DEFAULT_RETRY_MAX_WAIT_SECONDS = 60
+
+DEFAULT_RECONNECT_WAIT_SECONDS = 0.5
+DEFAULT_RECONNECT_MAX_WAIT_SECONDS = 30
+# a connection that stayed up this long resets the reconnect backoff
+DEFAULT_RECONNECT_RESET_SECONDS = 60
+
+DEFAULT_ASYNC_MAX_CONNECTIONS = 100
+DEFAULT_ASYNC_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 5.0
+
+# the pools of the sync clients' sessions, sized for a thread pool fanning out requests to one host
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_TCP_KEEPALIVE_IDLE_SECONDS = 60
+
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10.0
+DEFAULT_READ_TIMEOUT_SECONDS = 60.0
+
+DEFAULT_RATE_LIMIT_PER_MINUTE = 200
+DEFAULT_RATE_LIMIT_UTILIZATION = 0.9
+
+# latest and snapshot requests for more symbols than this are split into batches (the option endpoints' limit)
+SYMBOL_BATCH_MAX_SYMBOLS = 100
+# the maximum length of the symbols param of a batch, keeps request URLs well below server limits
+SYMBOL_BATCH_MAX_LENGTH = 4000
+DEFAULT_SYMBOL_BATCH_WORKERS = 8
@@ -18,8 +18,8 @@ class BaseURL(str, Enum):
 
 class PaginationType(str, Enum):
     """
-    An enum for choosing what type of pagination of results you'd like for BrokerClient functions that support
-    pagination.
+    An enum for choosing what type of pagination of results you'd like for BrokerClient and historical market data
+    functions that support pagination.
 
     Attributes:
         NONE: Requests that we perform no pagination of results and just return the single response the API gave us.
@@ -33,6 +33,19 @@ class PaginationType(str, Enum):
     ITERATOR = "iterator"
 
 
+class JSONBackend(str, Enum):
+    """
+    The library REST clients decode JSON responses with.
+
+    Attributes:
+        STDLIB: The standard library's json module.
+        ORJSON: orjson, which parses large responses several times faster. Requires the orjson package.
+    """
+
+    STDLIB = "json"
+    ORJSON = "orjson"
+
+
 class Sort(str, Enum):
     ASC = "asc"
     DESC = "desc"
@@ -44,4 +44,6 @@ class RetryException(Exception):
     Thrown by RESTClient's internally to represent a request that should be retried.
     """
 
-    pass
+    def __init__(self, delay: float = 0) -> None:
+        super().__init__()
+        self.delay = delay
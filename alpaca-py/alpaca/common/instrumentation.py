@@ -0,0 +1,285 @@
+import re
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from alpaca.common.metrics import (
+    REST_BODY_BYTES,
+    REST_PHASE_SECONDS,
+    REST_REQUEST_SECONDS,
+    REST_REQUESTS,
+    REST_WIRE_BYTES,
+    Labels,
+    MetricsSink,
+)
+
+# waiting for the client's rate limiter
+PHASE_RATE_LIMIT = "rate_limit"
+# from sending the request until the response headers arrived, including DNS, connecting and the server's time
+PHASE_RESPONSE = "response"
+# reading the response body
+PHASE_DOWNLOAD = "download"
+# parsing the response body as JSON
+PHASE_DECODE = "decode"
+# waiting between the attempts of a retried request
+PHASE_RETRY_SLEEP = "retry_sleep"
+# validating the decoded response into models
+PHASE_VALIDATE = "validate"
+
+_UUID = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+# path segments followed by a symbol or an ID
+_SYMBOL_COLLECTIONS = ("assets", "positions", "contracts", "snapshots")
+
+
+def template_endpoint(path: str) -> str:
+    """Replaces the IDs and symbols in an API path with placeholders, so requests to the same endpoint share a label.
+
+    Args:
+        path (str): The path, e.g. "/v2/orders/61e69015-8549-4bfd-b9c3-01e75843f47d".
+
+    Returns:
+        str: The templated path, e.g. "/v2/orders/{id}".
+    """
+    segments = path.split("/")
+    for i, segment in enumerate(segments):
+        if not segment:
+            continue
+        if segment.isdigit() or _UUID.fullmatch(segment):
+            segments[i] = "{id}"
+        elif i > 0 and segments[i - 1] in _SYMBOL_COLLECTIONS:
+            segments[i] = "{symbol}"
+        elif i > 1 and segments[i - 2] == "watchlists" and segments[i - 1] == "{id}":
+            segments[i] = "{symbol}"
+    return "/".join(segments)
+
+
+class RequestSpan:
+    """
+    The timings of one call to a REST endpoint, including its retries.
+
+    Attributes:
+        method (str): The HTTP method, e.g. "GET".
+        endpoint (str): The templated path of the endpoint, e.g. "/v2/orders/{id}".
+        url (str): The URL the request was sent to.
+        attempts (int): The number of times the request was sent.
+        status_code (Optional[int]): The status code of the last response, None if no response was received.
+        error (Optional[BaseException]): The error the request failed with, if it did.
+        phases (Dict[str, float]): The number of seconds spent in each phase of the request, summed over its
+          attempts, keyed by phase, e.g. "response" or "retry_sleep".
+        wire_bytes (int): The size of the response bodies as received, before decompression, summed over its
+          attempts.
+        body_bytes (int): The size of the response bodies after decompression, summed over its attempts.
+        started_at (float): The `time.perf_counter` time the request was started at.
+        duration (Optional[float]): The number of seconds from starting the request until its response was decoded,
+          None while it is in progress.
+    """
+
+    def __init__(self, method: str, endpoint: str, url: str) -> None:
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.attempts = 0
+        self.status_code: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.phases: Dict[str, float] = {}
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self.started_at = time.perf_counter()
+        self.duration: Optional[float] = None
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        """Adds time spent in a phase.
+
+        Args:
+            phase (str): The phase, e.g. "decode".
+            seconds (float): The time spent.
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def add_response_size(self, wire_bytes: int, body_bytes: int) -> None:
+        """Adds the size of a response body.
+
+        Args:
+            wire_bytes (int): The size as received, before decompression.
+            body_bytes (int): The size after decompression.
+        """
+        self.wire_bytes += wire_bytes
+        self.body_bytes += body_bytes
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        """How many times larger the response bodies were after decompression, None if there were none."""
+        return self.body_bytes / self.wire_bytes if self.wire_bytes else None
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Marks the request as done.
+
+        Args:
+            error (Optional[BaseException]): The error the request failed with, if it did.
+        """
+        self.duration = time.perf_counter() - self.started_at
+        self.error = error
+
+    @property
+    def labels(self) -> Labels:
+        """The labels of the request's metrics."""
+        return {
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "status": str(self.status_code) if self.status_code else "error",
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestSpan(method={self.method!r}, endpoint={self.endpoint!r}, attempts={self.attempts}, "
+            f"status_code={self.status_code}, duration={self.duration}, phases={self.phases}, "
+            f"wire_bytes={self.wire_bytes}, body_bytes={self.body_bytes})"
+        )
+
+
+class RequestHooks:
+    """
+    Callbacks around the requests of a REST client, e.g. to log slow calls or to forward the spans to a tracer.
+
+    Subclass it and override the methods you need. The hooks run in the thread or task making the request, so they
+    should be quick.
+    """
+
+    def before_request(self, span: RequestSpan) -> None:
+        """Called before a request is sent for the first time.
+
+        Args:
+            span (RequestSpan): The span of the request, without timings yet.
+        """
+
+    def after_request(self, span: RequestSpan) -> None:
+        """Called once the response of a request was decoded, or the request failed.
+
+        Validating the response of a single request into models happens after this, and is added to the span's
+        "validate" phase. Market data calls made of several requests, e.g. pages or shards, report validating to
+        the metrics sink only, labeled with the endpoint, as it doesn't belong to any one of their spans.
+
+        Args:
+            span (RequestSpan): The span of the request.
+        """
+
+
+def start_span(
+    method: str,
+    endpoint: str,
+    url: str,
+    hooks: Optional[RequestHooks],
+    sink: Optional[MetricsSink],
+) -> RequestSpan:
+    """Starts the span of a request.
+
+    Args:
+        method (str): The HTTP method.
+        endpoint (str): The path of the endpoint, templated with `template_endpoint`.
+        url (str): The URL the request is sent to.
+        hooks (Optional[RequestHooks]): The client's hooks.
+        sink (Optional[MetricsSink]): The client's metrics sink.
+
+    Returns:
+        RequestSpan: The span.
+    """
+    span = RequestSpan(method.upper(), template_endpoint(endpoint), url)
+    if hooks is not None:
+        hooks.before_request(span)
+    return span
+
+
+def finish_span(
+    span: RequestSpan,
+    hooks: Optional[RequestHooks],
+    sink: Optional[MetricsSink],
+    error: Optional[BaseException] = None,
+) -> None:
+    """Finishes the span of a request and reports it.
+
+    Args:
+        span (RequestSpan): The span.
+        hooks (Optional[RequestHooks]): The client's hooks.
+        sink (Optional[MetricsSink]): The client's metrics sink.
+        error (Optional[BaseException]): The error the request failed with, if it did.
+    """
+    span.finish(error)
+    if sink is not None:
+        labels = span.labels
+        sink.increment(REST_REQUESTS, 1, labels)
+        sink.observe(REST_REQUEST_SECONDS, span.duration, labels)
+        sink.increment(REST_WIRE_BYTES, span.wire_bytes, labels)
+        sink.increment(REST_BODY_BYTES, span.body_bytes, labels)
+        for phase, seconds in span.phases.items():
+            sink.observe(
+                REST_PHASE_SECONDS,
+                seconds,
+                _phase_labels(span.method, span.endpoint, phase),
+            )
+    if hooks is not None:
+        hooks.after_request(span)
+
+
+@contextmanager
+def timed_phase(
+    phase: str, span: Optional[RequestSpan], sink: Optional[MetricsSink]
+) -> Iterator[None]:
+    """Times the enclosed code as a phase of a request's span.
+
+    Args:
+        phase (str): The phase, e.g. "validate".
+        span (Optional[RequestSpan]): The span of the request, None if the client isn't instrumented.
+        sink (Optional[MetricsSink]): The metrics sink of the client that made the request.
+    """
+    if span is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started_at
+        span.add_phase(phase, seconds)
+        # phases of a finished span, like validating its response, are reported as they happen
+        if sink is not None and span.duration is not None:
+            sink.observe(
+                REST_PHASE_SECONDS,
+                seconds,
+                _phase_labels(span.method, span.endpoint, phase),
+            )
+
+
+@contextmanager
+def timed_endpoint_phase(
+    phase: str, method: str, endpoint: str, sink: Optional[MetricsSink]
+) -> Iterator[None]:
+    """Times the enclosed code as a phase of a call to an endpoint that was made of several requests, e.g. the pages
+    of a market data request, so it can't be added to any one of their spans.
+
+    Args:
+        phase (str): The phase, e.g. "validate".
+        method (str): The HTTP method.
+        endpoint (str): The path of the endpoint, templated with `template_endpoint`.
+        sink (Optional[MetricsSink]): The metrics sink of the client that made the call.
+    """
+    if sink is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        sink.observe(
+            REST_PHASE_SECONDS,
+            time.perf_counter() - started_at,
+            _phase_labels(method.upper(), template_endpoint(endpoint), phase),
+        )
+
+
+def _phase_labels(method: str, endpoint: str, phase: str) -> Labels:
+    return {"method": method, "endpoint": endpoint, "phase": phase}
@@ -0,0 +1,352 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import prometheus_client
+except ImportError:  # prometheus_client is only required by PrometheusMetricsSink
+    prometheus_client = None
+
+# the number of data messages received, per channel
+STREAM_MESSAGES = "stream_messages_total"
+# the size of the frames received, which can hold messages of several channels
+STREAM_BYTES = "stream_bytes_total"
+# the time taken to decode a frame into its messages
+STREAM_DECODE_SECONDS = "stream_decode_seconds"
+# the time between the exchange timestamp of a message and receiving it
+STREAM_LATENCY_SECONDS = "stream_latency_seconds"
+# the time between receiving a message and passing it to its handler
+STREAM_QUEUE_DELAY_SECONDS = "stream_queue_delay_seconds"
+# the time taken to parse and handle a message
+STREAM_HANDLER_SECONDS = "stream_handler_seconds"
+
+# the number of requests made to the REST API, per endpoint and status
+REST_REQUESTS = "rest_requests_total"
+# the time taken by a request until its response was decoded, including retries
+REST_REQUEST_SECONDS = "rest_request_seconds"
+# the time spent in each phase of a request, e.g. waiting for the response or validating it
+REST_PHASE_SECONDS = "rest_request_phase_seconds"
+# the size of the response bodies as received, before decompression
+REST_WIRE_BYTES = "rest_response_wire_bytes_total"
+# the size of the response bodies after decompression
+REST_BODY_BYTES = "rest_response_bytes_total"
+
+Labels = Dict[str, str]
+
+# histogram buckets from 100 microseconds to 10 seconds
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class MetricsSink(ABC):
+    """
+    Receives the metrics of the clients and streams.
+
+    Counters are increased with `increment` and timings are passed to `observe`, both with labels like the stream
+    and the channel they belong to. Subclass it to forward the metrics to your monitoring system.
+    """
+
+    @abstractmethod
+    def increment(self, name: str, value: float, labels: Labels) -> None:
+        """Increases a counter.
+
+        Args:
+            name (str): The name of the counter, e.g. "stream_messages_total".
+            value (float): The amount to increase it by.
+            labels (Labels): The labels of the counter, e.g. {"stream": "data", "channel": "trades"}.
+        """
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        """Records an observation of a histogram.
+
+        Args:
+            name (str): The name of the histogram, e.g. "stream_latency_seconds".
+            value (float): The observed value, in seconds for timings.
+            labels (Labels): The labels of the histogram.
+        """
+
+
+class CallbackMetricsSink(MetricsSink):
+    """
+    Passes every metric to a function, e.g. to send them to StatsD.
+
+    The function is called synchronously on the stream's event loop, so it should not block.
+    """
+
+    def __init__(self, callback: Callable[[str, str, float, Labels], None]) -> None:
+        """
+        Args:
+            callback (Callable[[str, str, float, Labels], None]): Called with the kind of the metric, "counter" or
+              "histogram", its name, the value and the labels.
+        """
+        self._callback = callback
+
+    def increment(self, name: str, value: float, labels: Labels) -> None:
+        self._callback("counter", name, value, labels)
+
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        self._callback("histogram", name, value, labels)
+
+
+class HistogramSummary:
+    """
+    The count, sum and extremes of the observations of a histogram kept by an InMemoryMetricsSink.
+
+    Attributes:
+        count (int): The number of observations.
+        total (float): The sum of the observations.
+        minimum (Optional[float]): The smallest observation.
+        maximum (Optional[float]): The largest observation.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The mean of the observations, or None if there are none."""
+        return self.total / self.count if self.count else None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def __repr__(self) -> str:
+        return (
+            f"HistogramSummary(count={self.count}, total={self.total}, "
+            f"minimum={self.minimum}, maximum={self.maximum})"
+        )
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    Keeps the metrics in memory, e.g. to log them periodically or to check a stream's lag from your own code.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Tuple], float] = {}
+        self._histograms: Dict[Tuple[str, Tuple], HistogramSummary] = {}
+        self._rate_counters: Dict[Tuple[str, Tuple], float] = {}
+        self._rate_time = time.monotonic()
+
+    def increment(self, name: str, value: float, labels: Labels) -> None:
+        key = (name, _freeze(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        key = (name, _freeze(labels))
+        with self._lock:
+            summary = self._histograms.get(key)
+            if summary is None:
+                summary = self._histograms[key] = HistogramSummary()
+            summary.add(value)
+
+    def get_counter(self, name: str, **labels: str) -> float:
+        """Returns the value of a counter.
+
+        Args:
+            name (str): The name of the counter.
+            **labels: The labels of the counter.
+
+        Returns:
+            float: The value, 0 if it was never increased.
+        """
+        return self._counters.get((name, _freeze(labels)), 0)
+
+    def get_histogram(self, name: str, **labels: str) -> HistogramSummary:
+        """Returns the summary of a histogram.
+
+        Args:
+            name (str): The name of the histogram.
+            **labels: The labels of the histogram.
+
+        Returns:
+            HistogramSummary: The summary, empty if nothing was observed.
+        """
+        return self._histograms.get((name, _freeze(labels)), HistogramSummary())
+
+    def get_rates(self) -> Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float]:
+        """Returns how much each counter increased per second since the last call, e.g. the messages per second of
+        each channel.
+
+        Returns:
+            Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float]: The rates keyed by the name of the counter and its
+              sorted label pairs.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._rate_time
+            rates = {
+                key: (value - self._rate_counters.get(key, 0)) / elapsed
+                for key, value in self._counters.items()
+            }
+            self._rate_counters = dict(self._counters)
+            self._rate_time = now
+        return rates
+
+
+class PrometheusMetricsSink(MetricsSink):
+    """
+    Exports the metrics as Prometheus counters and histograms. Requires the prometheus_client package.
+
+    Each metric is registered the first time it is reported, with the label names it is reported with.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[Any] = None,
+        namespace: str = "alpaca",
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """
+        Args:
+            registry (Optional[prometheus_client.CollectorRegistry]): The registry to register the metrics in.
+              Defaults to the default registry of prometheus_client.
+            namespace (str): The prefix of the metric names. Defaults to "alpaca".
+            buckets (Tuple[float, ...]): The upper bounds of the histogram buckets, in seconds. Defaults to 100
+              microseconds up to 10 seconds.
+
+        Raises:
+            ImportError: If prometheus_client is not installed.
+        """
+        if prometheus_client is None:
+            raise ImportError(
+                "PrometheusMetricsSink requires prometheus_client. Install it with `pip install alpaca-py[metrics]`."
+            )
+        self._registry = (
+            registry if registry is not None else prometheus_client.REGISTRY
+        )
+        self._namespace = namespace
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Any] = {}
+
+    def increment(self, name: str, value: float, labels: Labels) -> None:
+        self._get_metric(prometheus_client.Counter, name, labels).labels(**labels).inc(
+            value
+        )
+
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        self._get_metric(prometheus_client.Histogram, name, labels).labels(
+            **labels
+        ).observe(value)
+
+    def _get_metric(self, metric_type: type, name: str, labels: Labels) -> Any:
+        metric = self._metrics.get(name)
+        if metric is not None:
+            return metric
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                kwargs = (
+                    {"buckets": self._buckets}
+                    if metric_type is prometheus_client.Histogram
+                    else {}
+                )
+                metric = self._metrics[name] = metric_type(
+                    name,
+                    name.replace("_", " "),
+                    labelnames=sorted(labels),
+                    namespace=self._namespace,
+                    registry=self._registry,
+                    **kwargs,
+                )
+        return metric
+
+
+class StreamMetrics:
+    """
+    Reports the metrics of a websocket stream to a sink, labeled with the stream's name.
+    """
+
+    def __init__(self, sink: MetricsSink, stream: str) -> None:
+        """
+        Args:
+            sink (MetricsSink): The sink to report to.
+            stream (str): The name of the stream, e.g. "data" or "trading".
+        """
+        self.sink = sink
+        self._stream_labels = {"stream": stream}
+        self._channel_labels: Dict[str, Labels] = {}
+
+    def _labels(self, channel: str) -> Labels:
+        labels = self._channel_labels.get(channel)
+        if labels is None:
+            labels = self._channel_labels[channel] = {
+                **self._stream_labels,
+                "channel": channel,
+            }
+        return labels
+
+    def record_frame(self, size: int, decode_seconds: float) -> None:
+        """Reports a frame received.
+
+        Args:
+            size (int): The size of the frame in bytes.
+            decode_seconds (float): The time taken to decode the frame.
+        """
+        self.sink.increment(STREAM_BYTES, size, self._stream_labels)
+        self.sink.observe(STREAM_DECODE_SECONDS, decode_seconds, self._stream_labels)
+
+    def record_message(
+        self, channel: str, timestamp: Optional[int], received_at: int
+    ) -> None:
+        """Reports a data message received.
+
+        Args:
+            channel (str): The channel of the message.
+            timestamp (Optional[int]): The exchange timestamp of the message in nanoseconds since the epoch, if it
+              has one.
+            received_at (int): The time the message was received in nanoseconds since the epoch.
+        """
+        labels = self._labels(channel)
+        self.sink.increment(STREAM_MESSAGES, 1, labels)
+        if timestamp is not None:
+            self.sink.observe(
+                STREAM_LATENCY_SECONDS, (received_at - timestamp) / 1e9, labels
+            )
+
+    def record_handled(
+        self, channel: str, queue_delay: float, handler_seconds: float
+    ) -> None:
+        """Reports a message passed to its handler.
+
+        Args:
+            channel (str): The channel of the message.
+            queue_delay (float): The time between receiving the message and starting to handle it.
+            handler_seconds (float): The time taken to parse and handle the message.
+        """
+        labels = self._labels(channel)
+        self.sink.observe(STREAM_QUEUE_DELAY_SECONDS, queue_delay, labels)
+        self.sink.observe(STREAM_HANDLER_SECONDS, handler_seconds, labels)
+
+
+def _freeze(labels: Labels) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted(labels.items()))
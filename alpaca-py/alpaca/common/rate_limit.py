@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from typing import Mapping, Optional
+
+from alpaca.common.constants import (
+    DEFAULT_RATE_LIMIT_PER_MINUTE,
+    DEFAULT_RATE_LIMIT_UTILIZATION,
+)
+
+
+class RateLimiter:
+    """
+    A token bucket that paces requests to stay just under an API rate limit, instead of finding out about the limit
+    from 429 responses.
+
+    Every request reserves a token before it is sent. Tokens refill continuously at `utilization` times the limit, and
+    a caller that finds the bucket empty is given the next free slot and sleeps until it. The limiter is safe to share
+    between threads and event loops, so a single instance should be passed to every client that uses the same API key.
+
+    The limit is recalibrated from the `X-RateLimit-Limit`, `X-RateLimit-Remaining` and `X-RateLimit-Reset` response
+    headers, so the configured limit only needs to be a reasonable starting point.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = DEFAULT_RATE_LIMIT_PER_MINUTE,
+        burst: Optional[int] = None,
+        utilization: float = DEFAULT_RATE_LIMIT_UTILIZATION,
+    ) -> None:
+        """
+        Args:
+            requests_per_minute (int): The initial request limit per minute. Updated from response headers.
+            burst (Optional[int]): The maximum number of requests that can be sent back to back. Defaults to one
+              second worth of requests.
+            utilization (float): The fraction of the limit to schedule requests at, leaving headroom for clock skew
+              and other consumers of the same key. Must be in (0, 1].
+        """
+        if requests_per_minute < 1:
+            raise ValueError("requests_per_minute must be positive")
+
+        if not 0 < utilization <= 1:
+            raise ValueError("utilization must be greater than 0 and at most 1")
+
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be positive")
+
+        self._lock = threading.Lock()
+        self._utilization = utilization
+        self._fixed_burst = burst
+        self._limit = requests_per_minute
+        self._rate, self._capacity = self._rate_and_capacity(requests_per_minute)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    @property
+    def limit(self) -> int:
+        """The request limit per minute the limiter is currently calibrated to."""
+        return self._limit
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self) -> None:
+        """Suspends the calling coroutine until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Recalibrates the limiter from the rate limit headers of an API response.
+
+        Args:
+            headers (Mapping[str, str]): The response headers. Lookups should be case-insensitive, as they are for
+              both requests and httpx responses.
+        """
+        limit = _header_int(headers, "X-RateLimit-Limit")
+        remaining = _header_int(headers, "X-RateLimit-Remaining")
+        reset = _header_int(headers, "X-RateLimit-Reset")
+
+        with self._lock:
+            now = self._refill()
+
+            if limit is not None and limit > 0 and limit != self._limit:
+                self._limit = limit
+                self._rate, self._capacity = self._rate_and_capacity(limit)
+                self._tokens = min(self._tokens, self._capacity)
+
+            if remaining is not None:
+                # the server knows about requests from other processes that we don't
+                self._tokens = min(self._tokens, float(remaining))
+
+                if remaining <= 0 and reset is not None:
+                    # reset is a unix timestamp, convert it to our monotonic clock
+                    wait = max(0.0, reset - time.time())
+                    self._blocked_until = max(self._blocked_until, now + wait)
+
+    def _rate_and_capacity(self, requests_per_minute: int):
+        rate = requests_per_minute * self._utilization / 60
+        capacity = float(
+            self._fixed_burst if self._fixed_burst is not None else max(1, int(rate))
+        )
+        return rate, capacity
+
+    def _refill(self) -> float:
+        """Adds the tokens accrued since the last update. Must be called holding the lock."""
+        now = time.monotonic()
+        # no tokens accrue while the server has told us to wait for its window to reset
+        since = max(self._updated_at, self._blocked_until)
+        if now > since:
+            self._tokens = min(
+                self._capacity, self._tokens + (now - since) * self._rate
+            )
+        self._updated_at = now
+        return now
+
+    def _reserve(self) -> float:
+        """Takes a token and returns how long the caller has to wait before using it."""
+        with self._lock:
+            now = self._refill()
+            # tokens may go negative, which queues callers one refill interval apart
+            self._tokens -= 1
+            blocked = max(0.0, self._blocked_until - now)
+            return blocked + max(0.0, -self._tokens / self._rate)
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
@@ -0,0 +1,106 @@
+import asyncio
+import gzip
+import struct
+import time
+from typing import Awaitable, Callable, Iterator, Optional, Tuple, Union
+
+# each frame is stored as its receive time in nanoseconds since the epoch, its length, and whether it is text
+_FRAME_HEADER = struct.Struct("<qI?")
+
+Frame = Union[bytes, str]
+
+
+class FrameRecorder:
+    """
+    Appends the frames received by a websocket stream to a gzip compressed log, with their receive times.
+
+    Recording to an existing log appends to it, so a log can hold several sessions. Read a log with `read_frames`,
+    or feed it back through a stream with the stream's `replay`.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): The path of the log.
+        """
+        self.path = path
+        self._file = gzip.open(path, "ab")
+
+    def write(self, frame: Frame, received_at: Optional[int] = None) -> None:
+        """Appends a frame to the log.
+
+        Args:
+            frame (Frame): The frame as received, bytes or text.
+            received_at (Optional[int]): The receive time in nanoseconds since the epoch. Defaults to now.
+        """
+        if received_at is None:
+            received_at = time.time_ns()
+        is_text = isinstance(frame, str)
+        payload = frame.encode() if is_text else frame
+        self._file.write(_FRAME_HEADER.pack(received_at, len(payload), is_text))
+        self._file.write(payload)
+
+    def close(self) -> None:
+        """Flushes and closes the log."""
+        self._file.close()
+
+
+def read_frames(path: str) -> Iterator[Tuple[int, Frame]]:
+    """Reads the frames of a log written by a FrameRecorder.
+
+    Args:
+        path (str): The path of the log.
+
+    Returns:
+        Iterator[Tuple[int, Frame]]: The receive time in nanoseconds since the epoch and the frame, in the order they
+          were received.
+    """
+    with gzip.open(path, "rb") as file:
+        while True:
+            header = file.read(_FRAME_HEADER.size)
+            if len(header) < _FRAME_HEADER.size:
+                # a log cut off while writing ends with a partial frame
+                return
+            received_at, length, is_text = _FRAME_HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length:
+                return
+            yield received_at, payload.decode() if is_text else payload
+
+
+async def replay_frames(
+    path: str,
+    handle_frame: Callable[[Frame], Awaitable[None]],
+    speed: Optional[float] = None,
+) -> int:
+    """Passes the frames of a log to a stream's frame handler.
+
+    Args:
+        path (str): The path of the log.
+        handle_frame (Callable[[Frame], Awaitable[None]]): Decodes and dispatches a frame.
+        speed (Optional[float]): How many times faster than they were received to replay the frames, e.g. 1 for real
+          time. Defaults to replaying them as fast as the handlers can take them.
+
+    Returns:
+        int: The number of frames replayed.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError("speed must be positive")
+
+    loop = asyncio.get_running_loop()
+    first_received_at = None
+    started_at = loop.time()
+    count = 0
+
+    for received_at, frame in read_frames(path):
+        if speed is not None:
+            if first_received_at is None:
+                first_received_at = received_at
+            due = started_at + (received_at - first_received_at) / 1e9 / speed
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await handle_frame(frame)
+        count += 1
+
+    return count
@@ -1,26 +1,154 @@
 from collections import defaultdict
 from collections.abc import Callable
+import asyncio
+import json
 import time
 import base64
 from abc import ABC
-from typing import Any, Dict, List, Optional, Type, Union, Tuple, Iterator
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from requests import Session
 from requests.exceptions import HTTPError
 from itertools import chain
 
+try:
+    import httpx
+except ImportError:  # httpx is only required by the async clients
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # orjson is only required by JSONBackend.ORJSON
+    orjson = None
+
 from alpaca.common.constants import (
     DEFAULT_RETRY_ATTEMPTS,
     DEFAULT_RETRY_WAIT_SECONDS,
     DEFAULT_RETRY_EXCEPTION_CODES,
+    DEFAULT_SYMBOL_BATCH_WORKERS,
+    SYMBOL_BATCH_MAX_LENGTH,
+    SYMBOL_BATCH_MAX_SYMBOLS,
 )
 
 from alpaca import __version__
 from alpaca.common.exceptions import APIError, RetryException
+from alpaca.common.instrumentation import (
+    PHASE_DECODE,
+    PHASE_DOWNLOAD,
+    PHASE_RATE_LIMIT,
+    PHASE_RESPONSE,
+    PHASE_RETRY_SLEEP,
+    PHASE_VALIDATE,
+    RequestHooks,
+    RequestSpan,
+    finish_span,
+    start_span,
+    timed_endpoint_phase,
+    timed_phase,
+)
+from alpaca.common.metrics import MetricsSink
+from alpaca.common.rate_limit import RateLimiter
+from alpaca.common.retry import RetryPolicy, RetryState
+from alpaca.common.sessions import (
+    DEFAULT_TIMEOUT,
+    Timeout,
+    create_async_http_client,
+    create_session,
+    to_httpx_timeout,
+)
 from alpaca.common.types import RawData, HTTPResult, Credentials
 from .constants import PageItem
-from .enums import PaginationType, BaseURL
+from .enums import JSONBackend, PaginationType, BaseURL, Sort
+
+if TYPE_CHECKING:
+    from alpaca.data.cache import LatestDataCache, MarketDataCache
+
+
+class APICall:
+    """
+    A call to an API endpoint: the request to send and the model to validate its response into.
+
+    Client methods build their calls in code shared by a client and its async twin, so the two only differ in
+    whether they await sending it, see `RESTClient._call`.
+
+    Attributes:
+        method (str): The HTTP method, e.g. "GET".
+        path (str): The API endpoint path.
+        data (Optional[Union[dict, str]]): The query params or the json payload.
+        response_model (Optional[Union[Type[BaseModel], TypeAdapter]]): The model class, or a TypeAdapter of the
+          response's type, to validate the response into. None to return the response as decoded.
+        base_url (Optional[Union[BaseURL, str]]): The base URL of the API. Defaults to the client's base URL.
+        api_version (Optional[str]): The API version. Defaults to the client's API version.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[dict, str]] = None,
+        response_model: Optional[Union[Type[BaseModel], TypeAdapter]] = None,
+        base_url: Optional[Union[BaseURL, str]] = None,
+        api_version: Optional[str] = None,
+    ) -> None:
+        self.method = method
+        self.path = path
+        self.data = data
+        self.response_model = response_model
+        self.base_url = base_url
+        self.api_version = api_version
+
+
+class MarketDataQuery:
+    """
+    A request to a market data endpoint and how to wrap its entries, shared by a data client and its async twin.
+
+    Attributes:
+        path (str): The API endpoint path.
+        params (Dict[str, Any]): The query parameters.
+        wrap (Callable[[Any], Any]): Turns the entries of the request, or of one page of it, into what the client
+          method returns, e.g. a BarSet.
+        page_limit (int): The maximum number of items per page.
+        page_size (Optional[int]): The number of items to request per page. Missing for endpoints that don't
+          paginate, e.g. the latest endpoints.
+        no_sub_key (bool): Whether the entries are the response itself rather than under a data key.
+        decoder_factory (Optional[Callable[[], Any]]): Creates a decoder that consumes the entries of each page, see
+          `RESTClient._get_marketdata`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        wrap: Callable[[Any], Any],
+        page_limit: int = 10_000,
+        page_size: Optional[int] = None,
+        no_sub_key: bool = False,
+        decoder_factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self.path = path
+        self.params = params
+        self.wrap = wrap
+        self.page_limit = page_limit
+        self.page_size = page_size
+        self.no_sub_key = no_sub_key
+        self.decoder_factory = decoder_factory
 
 
 class RESTClient(ABC):
@@ -39,6 +167,16 @@ class RESTClient(ABC):
         retry_attempts: Optional[int] = None,
         retry_wait_seconds: Optional[int] = None,
         retry_exception_codes: Optional[List[int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        marketdata_cache: Optional["MarketDataCache"] = None,
+        latest_cache: Optional["LatestDataCache"] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        session: Optional[Session] = None,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
     ) -> None:
         """Abstract base class for REST clients. Handles submitting HTTP requests to
         Alpaca API endpoints.
@@ -54,8 +192,31 @@ class RESTClient(ABC):
             sandbox (bool): False if the live API should be used.
             raw_data (bool): Whether API responses should be wrapped in data models or returned raw.
             retry_attempts (Optional[int]): The number of times to retry a request that returns a RetryException.
-            retry_wait_seconds (Optional[int]): The number of seconds to wait between requests before retrying.
+            retry_wait_seconds (Optional[int]): The number of seconds to wait before the first retry. Later retries
+              back off exponentially.
             retry_exception_codes (Optional[List[int]]): The API exception codes to retry a request on.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests. Takes
+              precedence over the other retry arguments. Defaults to None.
+            marketdata_cache (Optional[MarketDataCache]): A cache to serve historical bars, quotes and trades from.
+              Defaults to None.
+            latest_cache (Optional[LatestDataCache]): A cache to serve latest data and snapshots from. Defaults to
+              None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request are
+              reported to this sink, labeled with the templated endpoint, e.g. "/v2/orders/{id}". Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its timings.
+              Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, straight from the response
+              bytes. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed transparently.
+              gzip and deflate are always accepted, br with the brotli package and zstd with the zstandard package
+              installed. Turn it off if decompressing costs more than the transfer saves. Defaults to True.
+            session (Optional[Session]): The requests session used to send requests, e.g. one made with
+              `create_session` to size its connection pool. Pass the same instance to several clients to share one
+              pool between them. The session is only closed by `close` if it was created here. Defaults to None.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
         """
 
         self._api_key, self._secret_key, self._oauth_token = self._validate_credentials(
@@ -66,21 +227,52 @@ class RESTClient(ABC):
         self._sandbox: bool = sandbox
         self._use_basic_auth: bool = use_basic_auth
         self._use_raw_data: bool = raw_data
-        self._session: Session = Session()
+        self._owns_session: bool = session is None
+        self._session: Session = session if session is not None else create_session()
+        self._timeout: Optional[Timeout] = timeout
 
         # setting up request retry configurations
-        self._retry: int = DEFAULT_RETRY_ATTEMPTS
-        self._retry_wait: int = DEFAULT_RETRY_WAIT_SECONDS
-        self._retry_codes: List[int] = DEFAULT_RETRY_EXCEPTION_CODES
+        if retry_policy is None:
+            retry_policy = RetryPolicy(
+                max_retries=(
+                    retry_attempts
+                    if retry_attempts and retry_attempts > 0
+                    else DEFAULT_RETRY_ATTEMPTS
+                ),
+                base_wait=(
+                    retry_wait_seconds
+                    if retry_wait_seconds and retry_wait_seconds > 0
+                    else DEFAULT_RETRY_WAIT_SECONDS
+                ),
+                retry_codes=retry_exception_codes or DEFAULT_RETRY_EXCEPTION_CODES,
+            )
+
+        self._retry_policy: RetryPolicy = retry_policy
+
+        self._rate_limiter: Optional[RateLimiter] = rate_limiter
+
+        self._marketdata_cache: Optional["MarketDataCache"] = marketdata_cache
+
+        self._latest_cache: Optional["LatestDataCache"] = latest_cache
 
-        if retry_attempts and retry_attempts > 0:
-            self._retry = retry_attempts
+        self._metrics_sink: Optional[MetricsSink] = metrics_sink
 
-        if retry_wait_seconds and retry_wait_seconds > 0:
-            self._retry_wait = retry_wait_seconds
+        self._request_hooks: Optional[RequestHooks] = request_hooks
 
-        if retry_exception_codes:
-            self._retry_codes = retry_exception_codes
+        self._json_loads: Callable[[bytes], Any] = _get_json_loads(json_backend)
+
+        self._compress_responses: bool = compress_responses
+
+    def __enter__(self) -> "RESTClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the connections of the underlying session, if it is owned by this client."""
+        if self._owns_session:
+            self._session.close()
 
     def _request(
         self,
@@ -91,7 +283,7 @@ class RESTClient(ABC):
         api_version: Optional[str] = None,
     ) -> HTTPResult:
         """Prepares and submits HTTP requests to given API endpoint and returns response.
-        Handles retrying if 429 (Rate Limit) error arises.
+        Retries failed requests as allowed by the client's retry policy.
 
         Args:
             method (str): The API endpoint HTTP method
@@ -104,19 +296,58 @@ class RESTClient(ABC):
         Returns:
             HTTPResult: The response from the API
         """
-        base_url = base_url or self._base_url
-        version = api_version if api_version else self._api_version
-        url: str = base_url + "/" + version + path
+        response, _ = self._send(method, path, data, base_url, api_version)
+        return response
 
-        headers = self._get_default_headers()
+    def _send(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[dict, str]] = None,
+        base_url: Optional[Union[BaseURL, str]] = None,
+        api_version: Optional[str] = None,
+    ) -> Tuple[HTTPResult, Optional[RequestSpan]]:
+        """Sends a request like `_request`, and also returns its span, so that validating the response can be timed
+        as part of it.
+
+        Returns:
+            Tuple[HTTPResult, Optional[RequestSpan]]: The response, and its span if the client is instrumented
+        """
+        url = self._get_request_url(path, base_url, api_version)
+        opts = self._get_request_opts(method, data)
+        retry_state = self._retry_policy.start()
+        span = self._start_span(method, path, url, api_version)
+
+        with self._reporting_span(span):
+            while True:
+                try:
+                    response = self._one_request(method, url, opts, retry_state, span)
+                    return response, span
+                except RetryException as retry:
+                    if span is not None:
+                        span.add_phase(PHASE_RETRY_SLEEP, retry.delay)
+                    time.sleep(retry.delay)
+
+    def _get_request_opts(
+        self, method: str, data: Optional[Union[dict, str]] = None
+    ) -> dict:
+        """Returns the keyword arguments of the session's request method for a request.
+
+        Args:
+            method (str): The API endpoint HTTP method
+            data (Optional[Union[dict, str]]): The query params or the json payload. Defaults to None.
 
+        Returns:
+            dict: The headers, params or payload and the request options
+        """
         opts = {
-            "headers": headers,
+            "headers": self._get_default_headers(),
             # Since we allow users to set endpoint URL via env var,
             # human error to put non-SSL endpoint could exploit
             # uncanny issues in non-GET request redirecting http->https.
             # It's better to fail early if the URL isn't right.
             "allow_redirects": False,
+            "timeout": self._timeout,
         }
 
         if method.upper() in ["GET", "DELETE"]:
@@ -124,15 +355,82 @@ class RESTClient(ABC):
         else:
             opts["json"] = data
 
-        retry = self._retry
+        return opts
 
-        while retry >= 0:
-            try:
-                return self._one_request(method, url, opts, retry)
-            except RetryException:
-                time.sleep(self._retry_wait)
-                retry -= 1
-                continue
+    @contextmanager
+    def _reporting_span(self, span: Optional[RequestSpan]) -> Iterator[None]:
+        """Finishes and reports the span of a request once the enclosed code returned or raised."""
+        if span is None:
+            yield
+            return
+
+        try:
+            yield
+        except Exception as error:
+            finish_span(span, self._request_hooks, self._metrics_sink, error)
+            raise
+        finish_span(span, self._request_hooks, self._metrics_sink)
+
+    def _start_span(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        api_version: Optional[str] = None,
+    ) -> Optional[RequestSpan]:
+        """Starts the span of a request, if the client reports metrics or has request hooks.
+
+        Args:
+            method (str): The API endpoint HTTP method
+            path (str): The API endpoint path
+            url (str): The API endpoint URL
+            api_version (Optional[str]): The API version. Defaults to the client's API version.
+
+        Returns:
+            Optional[RequestSpan]: The span, None if the client isn't instrumented.
+        """
+        if self._metrics_sink is None and self._request_hooks is None:
+            return None
+        return start_span(
+            method,
+            self._get_endpoint(path, api_version),
+            url,
+            self._request_hooks,
+            self._metrics_sink,
+        )
+
+    def _get_endpoint(self, path: str, api_version: Optional[str] = None) -> str:
+        """Returns the path of an API endpoint including its version, e.g. "/v2/clock", to label its metrics with.
+
+        Args:
+            path (str): The API endpoint path
+            api_version (Optional[str]): The API version. Defaults to the client's API version.
+
+        Returns:
+            str: The versioned path
+        """
+        version = api_version if api_version else self._api_version
+        return "/" + version + path
+
+    def _get_request_url(
+        self,
+        path: str,
+        base_url: Optional[Union[BaseURL, str]] = None,
+        api_version: Optional[str] = None,
+    ) -> str:
+        """Builds the full URL for an API endpoint path.
+
+        Args:
+            path (str): The API endpoint path
+            base_url (Optional[Union[BaseURL, str]]): The base URL of the API. Defaults to the client's base URL.
+            api_version (Optional[str]): The API version. Defaults to the client's API version.
+
+        Returns:
+            str: The full URL of the endpoint
+        """
+        base_url = base_url or self._base_url
+        version = api_version if api_version else self._api_version
+        return base_url + "/" + version + path
 
     def _get_default_headers(self) -> dict:
         """
@@ -146,6 +444,10 @@ class RESTClient(ABC):
 
         headers["User-Agent"] = "APCA-PY/" + __version__
 
+        if not self._compress_responses:
+            # the HTTP libraries ask for compressed responses unless told otherwise
+            headers["Accept-Encoding"] = "identity"
+
         return headers
 
     def _get_auth_headers(self) -> dict:
@@ -173,9 +475,16 @@ class RESTClient(ABC):
 
         return headers
 
-    def _one_request(self, method: str, url: str, opts: dict, retry: int) -> dict:
+    def _one_request(
+        self,
+        method: str,
+        url: str,
+        opts: dict,
+        retry_state: RetryState,
+        span: Optional[RequestSpan] = None,
+    ) -> dict:
         """Perform one request, possibly raising RetryException in the case
-        the response is 429. Otherwise, if error text contain "code" string,
+        the retry policy allows retrying the response. Otherwise, if error text contain "code" string,
         then it decodes to json object and returns APIError.
         Returns the body json in the 200 status.
 
@@ -183,31 +492,87 @@ class RESTClient(ABC):
             method (str): The HTTP method - GET, POST, etc
             url (str): The API endpoint URL
             opts (dict): Contains optional parameters including headers and parameters
-            retry (int): The number of times to retry in case of RetryException
+            retry_state (RetryState): The retries made so far for this request
+            span (Optional[RequestSpan]): The span to add the timings of this attempt to. Defaults to None.
 
         Raises:
-            RetryException: Raised if request produces 429 error and retry limit has not been reached
+            RetryException: Raised if the retry policy allows retrying the error response
             APIError: Raised if API returns an error
 
         Returns:
             dict: The response data
         """
+        if span is not None:
+            span.attempts += 1
+
+        if self._rate_limiter is not None:
+            started_at = time.perf_counter()
+            self._rate_limiter.acquire()
+            if span is not None:
+                span.add_phase(PHASE_RATE_LIMIT, time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
         response = self._session.request(method, url, **opts)
 
+        if span is not None:
+            # requests measures the time until the headers arrived, the body is read after
+            total = time.perf_counter() - started_at
+            waiting = min(response.elapsed.total_seconds(), total)
+            span.add_phase(PHASE_RESPONSE, waiting)
+            span.add_phase(PHASE_DOWNLOAD, total - waiting)
+            span.status_code = response.status_code
+            # the raw response counts the bytes read from the connection, before decompression
+            span.add_response_size(response.raw.tell(), len(response.content))
+
+        return self._handle_response(response, HTTPError, retry_state, span)
+
+    def _handle_response(
+        self,
+        response: Any,
+        http_error_type: Type[Exception],
+        retry_state: RetryState,
+        span: Optional[RequestSpan] = None,
+    ) -> HTTPResult:
+        """Checks the status of a response and decodes its body. Shared by the sync and async clients, whose
+        responses have the same interface.
+
+        Args:
+            response (Any): The requests or httpx response.
+            http_error_type (Type[Exception]): The error `raise_for_status` raises for an error status.
+            retry_state (RetryState): The retries made so far for this request
+            span (Optional[RequestSpan]): The span to add the decoding time to. Defaults to None.
+
+        Raises:
+            RetryException: Raised if the retry policy allows retrying the error response
+            APIError: Raised if API returns an error
+
+        Returns:
+            HTTPResult: The response data
+        """
+        if self._rate_limiter is not None:
+            self._rate_limiter.update_from_headers(response.headers)
+
         try:
             response.raise_for_status()
-        except HTTPError as http_error:
+        except http_error_type as http_error:
             # retry if we hit Rate Limit
-            if response.status_code in self._retry_codes and retry > 0:
-                raise RetryException()
+            delay = self._retry_policy.get_retry_delay(
+                retry_state, response.status_code, response.headers
+            )
+            if delay is not None:
+                raise RetryException(delay)
 
             # raise API error for all other errors
-            error = response.text
-
-            raise APIError(error, http_error)
+            raise APIError(response.text, http_error)
 
-        if response.text != "":
-            return response.json()
+        # decoding the body to text first would be wasted work, and guessing its encoding can take longer than parsing
+        if response.content:
+            if span is None:
+                return self._json_loads(response.content)
+            started_at = time.perf_counter()
+            result = self._json_loads(response.content)
+            span.add_phase(PHASE_DECODE, time.perf_counter() - started_at)
+            return result
 
     def get(
         self, path: str, data: Optional[Union[dict, str]] = None, **kwargs
@@ -277,6 +642,79 @@ class RESTClient(ABC):
         """
         return self._request("DELETE", path, data)
 
+    def _call(self, call: APICall) -> Any:
+        """Sends a call and validates its response into the call's response model, unless the client returns raw
+        data.
+
+        Args:
+            call (APICall): The call to send
+
+        Returns:
+            Any: The validated or raw response
+        """
+        response, span = self._send(
+            call.method, call.path, call.data, call.base_url, call.api_version
+        )
+        if call.response_model is None or self._use_raw_data:
+            return response
+        return self._validate_response(call.response_model, response, span)
+
+    def _fetch_marketdata(
+        self,
+        query: MarketDataQuery,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Any:
+        """Fetches a market data query and wraps its entries, or the entries of each of its pages for
+        `PaginationType.ITERATOR`.
+
+        Args:
+            query (MarketDataQuery): The query to fetch
+            max_workers (Optional[int]): If set, shards the request and fetches the shards concurrently.
+            time_slice (Optional[timedelta]): The length of the time range of each shard.
+            handle_pagination (Optional[PaginationType]): How to handle pagination, see `_get_marketdata`.
+
+        Returns:
+            Any: The wrapped entries, or an iterator of the wrapped pages
+        """
+        result = self._get_marketdata(
+            path=query.path,
+            params=query.params,
+            page_limit=query.page_limit,
+            page_size=query.page_size,
+            no_sub_key=query.no_sub_key,
+            max_workers=max_workers,
+            time_slice=time_slice,
+            decoder_factory=query.decoder_factory,
+            handle_pagination=handle_pagination,
+        )
+
+        if handle_pagination == PaginationType.ITERATOR:
+            return (self._wrap_marketdata(query, page) for page in result)
+
+        return self._wrap_marketdata(query, result)
+
+    def _wrap_marketdata(self, query: MarketDataQuery, result: Any) -> Any:
+        """Wraps the entries of a market data query, or of one of its pages. As they may come from several requests,
+        the time taken is reported to the client's metrics sink as the validate phase of the endpoint rather than of
+        a request's span.
+
+        Args:
+            query (MarketDataQuery): The query
+            result (Any): The entries, or the decoder they were decoded into
+
+        Returns:
+            Any: The wrapped entries
+        """
+        with timed_endpoint_phase(
+            PHASE_VALIDATE,
+            "GET",
+            self._get_endpoint(query.path),
+            self._metrics_sink,
+        ):
+            return query.wrap(result)
+
     # TODO: Refactor to be able to handle both parsing to types and parsing to collections of types (parse_as_obj)
     def response_wrapper(
         self, model: Type[BaseModel], raw_data: RawData, **kwargs
@@ -298,6 +736,28 @@ class RESTClient(ABC):
         else:
             return model(raw_data=raw_data, **kwargs)
 
+    def _validate_response(
+        self,
+        model: Union[Type[BaseModel], TypeAdapter],
+        data: RawData,
+        span: Optional[RequestSpan] = None,
+    ) -> Any:
+        """Validates a response into a model. The time taken is added to the validate phase of the request's span.
+
+        Args:
+            model (Union[Type[BaseModel], TypeAdapter]): The model class, or a TypeAdapter of the response's type
+            data (RawData): The decoded response
+            span (Optional[RequestSpan]): The span of the request the response is of, as returned by `_send`.
+              None if the client isn't instrumented or the time shouldn't be reported.
+
+        Returns:
+            Any: The validated response
+        """
+        with timed_phase(PHASE_VALIDATE, span, self._metrics_sink):
+            if isinstance(model, TypeAdapter):
+                return model.validate_python(data)
+            return model(**data)
+
     @staticmethod
     def _validate_pagination(
         max_items_limit: Optional[int], handle_pagination: Optional[PaginationType]
@@ -372,40 +832,958 @@ class RESTClient(ABC):
         page_limit: int = 10_000,
         page_size: Optional[int] = None,
         no_sub_key: bool = False,
-    ) -> Dict[str, List[Any]]:
-        d = defaultdict(list)
-        # Missing page_size indicates that we should not set a limit (e.g. for latest endpoints)
-        actual_limit = min(page_size, page_limit) if page_size else None
-        limit = params.get("limit")
-        total_items = 0
-        page_token = params.get("page_token")
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        decoder_factory: Optional[Callable[[], Any]] = None,
+        handle_pagination: Optional[PaginationType] = None,
+        use_cache: bool = True,
+    ) -> Any:
+        """Fetches every page of a market data endpoint.
+
+        Args:
+            path (str): The API endpoint path.
+            params (Dict[str, Any]): The query parameters.
+            page_limit (int): The maximum number of items per page.
+            page_size (Optional[int]): The number of items to request per page. Missing for endpoints that don't
+              paginate, e.g. the latest endpoints.
+            no_sub_key (bool): Whether the entries are the response itself rather than under a data key.
+            max_workers (Optional[int]): If set, shards the request and fetches the shards concurrently.
+            time_slice (Optional[timedelta]): The length of the time range of each shard.
+            decoder_factory (Optional[Callable[[], Any]]): Creates a decoder with `decode_page` and `extend` methods
+              that consumes the entries of each page, instead of accumulating them. The decoder is returned instead
+              of the entries.
+            handle_pagination (Optional[PaginationType]): FULL (the default) returns all pages merged, NONE only
+              the first page and ITERATOR an iterator of pages, each decoded separately.
+            use_cache (bool): Whether to serve FULL requests from the client's market data and latest data caches,
+              if it has them.
+
+        Returns:
+            Any: The entries of all pages keyed by symbol, or the decoder if `decoder_factory` is set.
+        """
+        handle_pagination = _validate_marketdata_pagination(
+            handle_pagination, max_workers
+        )
+
+        if (
+            use_cache
+            and handle_pagination == PaginationType.FULL
+            and self._marketdata_cache is not None
+            and self._marketdata_cache.is_cacheable(path, params)
+        ):
+            entries = self._marketdata_cache.get_marketdata(
+                path,
+                params,
+                lambda gap_params: self._get_marketdata(
+                    path,
+                    gap_params,
+                    page_limit,
+                    page_size,
+                    no_sub_key,
+                    max_workers=max_workers,
+                    time_slice=time_slice,
+                    use_cache=False,
+                ),
+            )
+            return _decode_marketdata_page(entries, decoder_factory)
+
+        if (
+            use_cache
+            and handle_pagination == PaginationType.FULL
+            and self._latest_cache is not None
+            and self._latest_cache.is_cacheable(path, params)
+        ):
+            return self._latest_cache.get_marketdata(
+                path,
+                params,
+                lambda missing_params: self._get_marketdata(
+                    path,
+                    missing_params,
+                    page_limit,
+                    page_size,
+                    no_sub_key,
+                    use_cache=False,
+                ),
+            )
+
+        batches = _batch_symbol_params(path, params)
+        if (
+            len(batches) > 1
+            and handle_pagination == PaginationType.FULL
+            and max_workers is None
+            and decoder_factory is None
+        ):
+            # too many symbols for one request, fetch them in batches in parallel
+            with ThreadPoolExecutor(
+                max_workers=min(len(batches), DEFAULT_SYMBOL_BATCH_WORKERS)
+            ) as executor:
+                return _merge_symbol_batches(
+                    executor.map(
+                        lambda batch: self._get_marketdata(
+                            path,
+                            batch,
+                            page_limit,
+                            page_size,
+                            no_sub_key,
+                            use_cache=False,
+                        ),
+                        batches,
+                    )
+                )
+
+        if max_workers is not None:
+            # split the request into shards, fetch them in parallel and merge the results in shard order
+            shards = _shard_marketdata_params(params, time_slice)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    lambda shard: self._get_marketdata(
+                        path,
+                        shard,
+                        page_limit,
+                        page_size,
+                        no_sub_key,
+                        decoder_factory=decoder_factory,
+                        use_cache=False,
+                    ),
+                    shards,
+                )
+                if decoder_factory is not None:
+                    return _merge_decoded_shards(results)
+                return _merge_marketdata_shards(results)
+
+        pages = self._iter_marketdata(path, params, page_limit, page_size, no_sub_key)
+
+        if handle_pagination == PaginationType.NONE:
+            # only fetch the first page
+            return _decode_marketdata_page(next(pages, {}), decoder_factory)
+
+        if handle_pagination == PaginationType.ITERATOR:
+            return (_decode_marketdata_page(page, decoder_factory) for page in pages)
+
+        merged = _MergedPages(decoder_factory)
+        for entries in pages:
+            merged.add(entries)
+        return merged.result()
+
+    def _iter_marketdata(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        page_limit: int = 10_000,
+        page_size: Optional[int] = None,
+        no_sub_key: bool = False,
+    ) -> Iterator[RawData]:
+        """Fetches the pages of a market data endpoint one at a time, as they are consumed.
+
+        Args:
+            path (str): The API endpoint path.
+            params (Dict[str, Any]): The query parameters.
+            page_limit (int): The maximum number of items per page.
+            page_size (Optional[int]): The number of items to request per page.
+            no_sub_key (bool): Whether the entries are the response itself rather than under a data key.
+
+        Yields:
+            RawData: The entries of each page keyed by symbol.
+        """
+        cursor = _PageCursor(params, page_limit, page_size)
 
         while True:
-            # adjusts the limit parameter value if it is over the page_limit
-            if limit:
-                # actual_limit is the adjusted total number of items to query per request
-                actual_limit = min(int(limit) - total_items, page_limit)
-                if actual_limit < 1:
-                    break
-            params["limit"] = actual_limit
-            params["page_token"] = page_token
-
-            response = self.get(path=path, data=params)
-
-            for k, v in _get_marketdata_entries(response, no_sub_key).items():
-                if isinstance(v, list):
-                    d[k].extend(v)
-                else:
-                    d[k] = v
-
-            # if we've sent a request with a limit, increment count
-            if actual_limit:
-                total_items = sum([len(items) for items in d.values()])
-
-            page_token = response.get("next_page_token", None)
-            if page_token is None:
+            page_params = cursor.next_params()
+            if page_params is None:
                 break
-        return dict(d)
+
+            response = self.get(path=path, data=page_params)
+            entries = _get_marketdata_entries(response, no_sub_key)
+            cursor.advance(response, entries)
+
+            yield entries
+
+
+class AsyncRESTClient(RESTClient):
+    """Abstract base class for asyncio REST clients"""
+
+    def __init__(
+        self,
+        base_url: Union[BaseURL, str],
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        oauth_token: Optional[str] = None,
+        use_basic_auth: bool = False,
+        api_version: str = "v2",
+        sandbox: bool = False,
+        raw_data: bool = False,
+        retry_attempts: Optional[int] = None,
+        retry_wait_seconds: Optional[int] = None,
+        retry_exception_codes: Optional[List[int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        latest_cache: Optional["LatestDataCache"] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Abstract base class for asyncio REST clients. Submits HTTP requests to Alpaca API endpoints over a
+        connection-pooled httpx transport, so many requests can be in flight on a single event loop.
+
+        Args:
+            base_url (Union[BaseURL, str]): The base url to target requests to. Should be an instance of BaseURL, but
+              allows for raw str if you need to override
+            api_key (Optional[str]): The api key string for authentication.
+            secret_key (Optional[str]): The corresponding secret key string for the api key.
+            oauth_token (Optional[str]): The oauth token if authenticating via OAuth.
+            use_basic_auth (bool): Whether API requests should use basic authorization headers.
+            api_version (Optional[str]): The API version for the endpoints.
+            sandbox (bool): False if the live API should be used.
+            raw_data (bool): Whether API responses should be wrapped in data models or returned raw.
+            retry_attempts (Optional[int]): The number of times to retry a request that returns a RetryException.
+            retry_wait_seconds (Optional[int]): The number of seconds to wait before the first retry. Later retries
+              back off exponentially.
+            retry_exception_codes (Optional[List[int]]): The API exception codes to retry a request on.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests. Takes
+              precedence over the other retry arguments. Defaults to None.
+            http_client (Optional[httpx.AsyncClient]): The httpx client used to send requests. Pass the same instance
+              to several clients to share one connection pool between them. The client is only closed by `aclose`
+              if it was created here. Defaults to None.
+            latest_cache (Optional[LatestDataCache]): A cache to serve latest data and snapshots from. Defaults to
+              None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request are
+              reported to this sink, labeled with the templated endpoint, e.g. "/v2/orders/{id}". Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its timings.
+              Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, straight from the response
+              bytes. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed transparently.
+              gzip and deflate are always accepted, br with the brotli package and zstd with the zstandard package
+              installed. Turn it off if decompressing costs more than the transfer saves. Defaults to True.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Applies to requests sent through a given `http_client` too. Defaults to 10
+              seconds to connect and 60 to read.
+        """
+        if httpx is None:
+            raise ImportError(
+                "The async clients require httpx. Install it with `pip install alpaca-py[async]`."
+            )
+
+        super().__init__(
+            base_url=base_url,
+            api_key=api_key,
+            secret_key=secret_key,
+            oauth_token=oauth_token,
+            use_basic_auth=use_basic_auth,
+            api_version=api_version,
+            sandbox=sandbox,
+            raw_data=raw_data,
+            retry_attempts=retry_attempts,
+            retry_wait_seconds=retry_wait_seconds,
+            retry_exception_codes=retry_exception_codes,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            latest_cache=latest_cache,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            timeout=timeout,
+        )
+
+        self._owns_http_client: bool = http_client is None
+        self._http_client: httpx.AsyncClient = (
+            http_client if http_client is not None else create_async_http_client()
+        )
+        self._httpx_timeout: httpx.Timeout = to_httpx_timeout(timeout)
+
+    async def __aenter__(self) -> "AsyncRESTClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the underlying httpx client, if it is owned by this client."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[dict, str]] = None,
+        base_url: Optional[Union[BaseURL, str]] = None,
+        api_version: Optional[str] = None,
+    ) -> HTTPResult:
+        """Prepares and submits HTTP requests to given API endpoint and returns response.
+        Retries failed requests as allowed by the client's retry policy.
+
+        Args:
+            method (str): The API endpoint HTTP method
+            path (str): The API endpoint path
+            data (Optional[Union[dict, str]]): Either the payload in json format, query params urlencoded, or a dict
+             of values to be converted to appropriate format based on `method`. Defaults to None.
+            base_url (Optional[Union[BaseURL, str]]): The base URL of the API. Defaults to None.
+            api_version (Optional[str]): The API version. Defaults to None.
+
+        Returns:
+            HTTPResult: The response from the API
+        """
+        response, _ = await self._send(method, path, data, base_url, api_version)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[dict, str]] = None,
+        base_url: Optional[Union[BaseURL, str]] = None,
+        api_version: Optional[str] = None,
+    ) -> Tuple[HTTPResult, Optional[RequestSpan]]:
+        """Sends a request like `_request`, and also returns its span, so that validating the response can be timed
+        as part of it.
+
+        Returns:
+            Tuple[HTTPResult, Optional[RequestSpan]]: The response, and its span if the client is instrumented
+        """
+        url = self._get_request_url(path, base_url, api_version)
+        opts = self._get_request_opts(method, data)
+        retry_state = self._retry_policy.start()
+        span = self._start_span(method, path, url, api_version)
+
+        with self._reporting_span(span):
+            while True:
+                try:
+                    response = await self._one_request(
+                        method, url, opts, retry_state, span
+                    )
+                    return response, span
+                except RetryException as retry:
+                    if span is not None:
+                        span.add_phase(PHASE_RETRY_SLEEP, retry.delay)
+                    await asyncio.sleep(retry.delay)
+
+    def _get_request_opts(
+        self, method: str, data: Optional[Union[dict, str]] = None
+    ) -> dict:
+        """Returns the keyword arguments of the httpx client's request method for a request.
+
+        Args:
+            method (str): The API endpoint HTTP method
+            data (Optional[Union[dict, str]]): The query params or the json payload. Defaults to None.
+
+        Returns:
+            dict: The headers, params or payload and the request options
+        """
+        opts = {
+            # requests drops headers set to None (e.g. unauthenticated crypto clients), httpx does not
+            "headers": {
+                k: v for k, v in self._get_default_headers().items() if v is not None
+            },
+            # see RESTClient._get_request_opts for why redirects are not followed
+            "follow_redirects": False,
+            "timeout": self._httpx_timeout,
+        }
+
+        if method.upper() in ["GET", "DELETE"]:
+            opts["params"] = _to_query_params(data)
+        else:
+            opts["json"] = data
+
+        return opts
+
+    async def _one_request(
+        self,
+        method: str,
+        url: str,
+        opts: dict,
+        retry_state: RetryState,
+        span: Optional[RequestSpan] = None,
+    ) -> dict:
+        """Perform one request, possibly raising RetryException in the case
+        the retry policy allows retrying the response. Otherwise, if error text contain "code" string,
+        then it decodes to json object and returns APIError.
+        Returns the body json in the 200 status.
+
+        Args:
+            method (str): The HTTP method - GET, POST, etc
+            url (str): The API endpoint URL
+            opts (dict): Contains optional parameters including headers and parameters
+            retry_state (RetryState): The retries made so far for this request
+            span (Optional[RequestSpan]): The span to add the timings of this attempt to. Defaults to None.
+
+        Raises:
+            RetryException: Raised if the retry policy allows retrying the error response
+            APIError: Raised if API returns an error
+
+        Returns:
+            dict: The response data
+        """
+        if span is not None:
+            span.attempts += 1
+
+        if self._rate_limiter is not None:
+            started_at = time.perf_counter()
+            await self._rate_limiter.async_acquire()
+            if span is not None:
+                span.add_phase(PHASE_RATE_LIMIT, time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
+        response = await self._http_client.request(method, url, **opts)
+
+        if span is not None:
+            # httpx reads the body before returning, so the download can't be told apart from the response
+            span.add_phase(PHASE_RESPONSE, time.perf_counter() - started_at)
+            span.status_code = response.status_code
+            span.add_response_size(response.num_bytes_downloaded, len(response.content))
+
+        return self._handle_response(response, httpx.HTTPStatusError, retry_state, span)
+
+    async def _call(self, call: APICall) -> Any:
+        """Sends a call and validates its response into the call's response model, unless the client returns raw
+        data.
+
+        Args:
+            call (APICall): The call to send
+
+        Returns:
+            Any: The validated or raw response
+        """
+        response, span = await self._send(
+            call.method, call.path, call.data, call.base_url, call.api_version
+        )
+        if call.response_model is None or self._use_raw_data:
+            return response
+        return self._validate_response(call.response_model, response, span)
+
+    async def _fetch_marketdata(
+        self,
+        query: MarketDataQuery,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Any:
+        """Fetches a market data query and wraps its entries, or the entries of each of its pages for
+        `PaginationType.ITERATOR`.
+
+        Args:
+            query (MarketDataQuery): The query to fetch
+            max_workers (Optional[int]): If set, shards the request and fetches the shards concurrently.
+            time_slice (Optional[timedelta]): The length of the time range of each shard.
+            handle_pagination (Optional[PaginationType]): How to handle pagination, see `_get_marketdata`.
+
+        Returns:
+            Any: The wrapped entries, or an async iterator of the wrapped pages
+        """
+        result = await self._get_marketdata(
+            path=query.path,
+            params=query.params,
+            page_limit=query.page_limit,
+            page_size=query.page_size,
+            no_sub_key=query.no_sub_key,
+            max_workers=max_workers,
+            time_slice=time_slice,
+            decoder_factory=query.decoder_factory,
+            handle_pagination=handle_pagination,
+        )
+
+        if handle_pagination == PaginationType.ITERATOR:
+            return (self._wrap_marketdata(query, page) async for page in result)
+
+        return self._wrap_marketdata(query, result)
+
+    async def get(
+        self, path: str, data: Optional[Union[dict, str]] = None, **kwargs
+    ) -> HTTPResult:
+        """Performs a single GET request
+
+        Args:
+            path (str): The API endpoint path
+            data (Union[dict, str], optional): Query parameters to send, either
+            as a str urlencoded, or a dict of values to be converted. Defaults to None.
+
+        Returns:
+            dict: The response
+        """
+        return await self._request("GET", path, data, **kwargs)
+
+    async def post(
+        self, path: str, data: Optional[Union[dict, List[dict]]] = None
+    ) -> HTTPResult:
+        """Performs a single POST request
+
+        Args:
+            path (str): The API endpoint path
+            data (Optional[Union[dict, List[dict]]): The json payload as a dict of values to be converted.
+             Defaults to None.
+
+        Returns:
+            dict: The response
+        """
+        return await self._request("POST", path, data)
+
+    async def put(self, path: str, data: Optional[dict] = None) -> dict:
+        """Performs a single PUT request
+
+        Args:
+            path (str): The API endpoint path
+            data (Optional[dict]): The json payload as a dict of values to be converted.
+             Defaults to None.
+
+        Returns:
+            dict: The response
+        """
+        return await self._request("PUT", path, data)
+
+    async def patch(self, path: str, data: Optional[dict] = None) -> dict:
+        """Performs a single PATCH request
+
+        Args:
+            path (str): The API endpoint path
+            data (Optional[dict]): The json payload as a dict of values to be converted.
+             Defaults to None.
+
+        Returns:
+            dict: The response
+        """
+        return await self._request("PATCH", path, data)
+
+    async def delete(self, path, data: Optional[Union[dict, str]] = None) -> dict:
+        """Performs a single DELETE request
+
+        Args:
+            path (str): The API endpoint path
+            data (Union[dict, str], optional): The payload if any. Defaults to None.
+
+        Returns:
+            dict: The response
+        """
+        return await self._request("DELETE", path, data)
+
+    async def _get_marketdata(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        page_limit: int = 10_000,
+        page_size: Optional[int] = None,
+        no_sub_key: bool = False,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        decoder_factory: Optional[Callable[[], Any]] = None,
+        handle_pagination: Optional[PaginationType] = None,
+        use_cache: bool = True,
+    ) -> Any:
+        """Fetches every page of a market data endpoint.
+
+        Args:
+            path (str): The API endpoint path.
+            params (Dict[str, Any]): The query parameters.
+            page_limit (int): The maximum number of items per page.
+            page_size (Optional[int]): The number of items to request per page. Missing for endpoints that don't
+              paginate, e.g. the latest endpoints.
+            no_sub_key (bool): Whether the entries are the response itself rather than under a data key.
+            max_workers (Optional[int]): If set, shards the request and fetches the shards concurrently.
+            time_slice (Optional[timedelta]): The length of the time range of each shard.
+            decoder_factory (Optional[Callable[[], Any]]): Creates a decoder with `decode_page` and `extend` methods
+              that consumes the entries of each page, instead of accumulating them. The decoder is returned instead
+              of the entries.
+            handle_pagination (Optional[PaginationType]): FULL (the default) returns all pages merged, NONE only
+              the first page and ITERATOR an iterator of pages, each decoded separately.
+            use_cache (bool): Whether to serve FULL requests from the client's latest data cache, if it has one.
+
+        Returns:
+            Any: The entries of all pages keyed by symbol, or the decoder if `decoder_factory` is set.
+        """
+        handle_pagination = _validate_marketdata_pagination(
+            handle_pagination, max_workers
+        )
+
+        if (
+            use_cache
+            and handle_pagination == PaginationType.FULL
+            and self._latest_cache is not None
+            and self._latest_cache.is_cacheable(path, params)
+        ):
+            return await self._latest_cache.async_get_marketdata(
+                path,
+                params,
+                lambda missing_params: self._get_marketdata(
+                    path,
+                    missing_params,
+                    page_limit,
+                    page_size,
+                    no_sub_key,
+                    use_cache=False,
+                ),
+            )
+
+        batches = _batch_symbol_params(path, params)
+        if (
+            len(batches) > 1
+            and handle_pagination == PaginationType.FULL
+            and max_workers is None
+            and decoder_factory is None
+        ):
+            # too many symbols for one request, fetch them in batches concurrently
+            semaphore = asyncio.Semaphore(DEFAULT_SYMBOL_BATCH_WORKERS)
+
+            async def fetch_batch(batch: Dict[str, Any]) -> Any:
+                async with semaphore:
+                    return await self._get_marketdata(
+                        path,
+                        batch,
+                        page_limit,
+                        page_size,
+                        no_sub_key,
+                        use_cache=False,
+                    )
+
+            return _merge_symbol_batches(
+                await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+            )
+
+        if max_workers is not None:
+            # split the request into shards, fetch them concurrently and merge the results in shard order
+            shards = _shard_marketdata_params(params, time_slice)
+            semaphore = asyncio.Semaphore(max_workers)
+
+            async def fetch_shard(shard: Dict[str, Any]) -> Any:
+                async with semaphore:
+                    return await self._get_marketdata(
+                        path,
+                        shard,
+                        page_limit,
+                        page_size,
+                        no_sub_key,
+                        decoder_factory=decoder_factory,
+                        use_cache=False,
+                    )
+
+            results = await asyncio.gather(*(fetch_shard(shard) for shard in shards))
+            if decoder_factory is not None:
+                return _merge_decoded_shards(results)
+            return _merge_marketdata_shards(results)
+
+        pages = self._iter_marketdata(path, params, page_limit, page_size, no_sub_key)
+
+        if handle_pagination == PaginationType.NONE:
+            # only fetch the first page
+            try:
+                page = await pages.__anext__()
+            except StopAsyncIteration:
+                page = {}
+            await pages.aclose()
+            return _decode_marketdata_page(page, decoder_factory)
+
+        if handle_pagination == PaginationType.ITERATOR:
+            return (
+                _decode_marketdata_page(page, decoder_factory) async for page in pages
+            )
+
+        merged = _MergedPages(decoder_factory)
+        async for entries in pages:
+            merged.add(entries)
+        return merged.result()
+
+    async def _iter_marketdata(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        page_limit: int = 10_000,
+        page_size: Optional[int] = None,
+        no_sub_key: bool = False,
+    ) -> AsyncIterator[RawData]:
+        """Fetches the pages of a market data endpoint one at a time, as they are consumed.
+
+        Args:
+            path (str): The API endpoint path.
+            params (Dict[str, Any]): The query parameters.
+            page_limit (int): The maximum number of items per page.
+            page_size (Optional[int]): The number of items to request per page.
+            no_sub_key (bool): Whether the entries are the response itself rather than under a data key.
+
+        Yields:
+            RawData: The entries of each page keyed by symbol.
+        """
+        cursor = _PageCursor(params, page_limit, page_size)
+
+        while True:
+            page_params = cursor.next_params()
+            if page_params is None:
+                break
+
+            response = await self.get(path=path, data=page_params)
+            entries = _get_marketdata_entries(response, no_sub_key)
+            cursor.advance(response, entries)
+
+            yield entries
+
+
+def _get_json_loads(backend: Optional[JSONBackend]) -> Callable[[bytes], Any]:
+    """Returns the function that decodes response bodies with a JSON backend.
+
+    Args:
+        backend (Optional[JSONBackend]): The backend. Defaults to the standard library.
+
+    Raises:
+        ImportError: If the backend's package is not installed.
+
+    Returns:
+        Callable[[bytes], Any]: Decodes a JSON document from its bytes.
+    """
+    if backend is None or backend == JSONBackend.STDLIB:
+        return json.loads
+    if backend == JSONBackend.ORJSON:
+        if orjson is None:
+            raise ImportError(
+                "JSONBackend.ORJSON requires orjson. Install it with `pip install alpaca-py[speedups]`."
+            )
+        return orjson.loads
+    raise ValueError(f"Invalid JSON backend: {backend}.")
+
+
+def _to_query_params(data: Optional[Union[dict, str]]) -> Optional[Union[dict, str]]:
+    """Converts query parameters to the form `requests` would send them in, since httpx encodes
+    None, bool and enum values differently.
+    """
+    if not isinstance(data, dict):
+        return data
+
+    def to_query_value(val: Any) -> Any:
+        if isinstance(val, list):
+            return [to_query_value(v) for v in val]
+        if isinstance(val, Enum) and isinstance(val.value, str):
+            return val.value
+        if isinstance(val, str):
+            return val
+        return str(val)
+
+    return {k: to_query_value(v) for k, v in data.items() if v is not None}
+
+
+def _shard_marketdata_params(
+    params: Dict[str, Any], time_slice: Optional[timedelta] = None
+) -> List[Dict[str, Any]]:
+    """Splits the params of a multi-symbol market data request into one set of params per symbol and, if
+    `time_slice` is given, per time slice of at most that length. Shards are ordered by symbol and then in the
+    requested sort order of time, so merging their results in order keeps the ordering of the unsharded request.
+
+    Args:
+        params (Dict[str, Any]): The request params, with symbols joined by commas.
+        time_slice (Optional[timedelta]): The maximum time range of a single shard.
+
+    Raises:
+        ValueError: Raised if a limit is set, or if time slicing is requested without a start time.
+
+    Returns:
+        List[Dict[str, Any]]: The params for each shard.
+    """
+    if params.get("limit"):
+        raise ValueError("limit cannot be used when splitting a request into shards")
+
+    time_ranges: List[Tuple[Optional[str], Optional[str]]] = [
+        (params.get("start"), params.get("end"))
+    ]
+
+    if time_slice is not None:
+        if time_slice <= timedelta(0):
+            raise ValueError("time_slice must be a positive duration")
+        if params.get("start") is None:
+            raise ValueError("start must be set to split a request into time slices")
+
+        start = datetime.fromisoformat(params["start"])
+        end = (
+            datetime.fromisoformat(params["end"])
+            if params.get("end") is not None
+            else datetime.now(timezone.utc)
+        )
+
+        time_ranges = []
+        while start <= end:
+            slice_end = start + time_slice
+            # start and end are both inclusive, so slices must not share their boundary
+            time_ranges.append(
+                (
+                    start.isoformat(),
+                    min(slice_end - timedelta(microseconds=1), end).isoformat(),
+                )
+            )
+            start = slice_end
+
+        if params.get("sort") == Sort.DESC:
+            time_ranges.reverse()
+
+    shards = []
+    for symbol in str(params["symbols"]).split(","):
+        for start, end in time_ranges:
+            shard = {**params, "symbols": symbol, "start": start, "end": end}
+            shards.append({k: v for k, v in shard.items() if v is not None})
+
+    return shards
+
+
+def _merge_marketdata_shards(
+    results: Iterable[Dict[str, List[Any]]]
+) -> Dict[str, List[Any]]:
+    """Merges the results of sharded market data requests, in shard order."""
+    d = defaultdict(list)
+    for result in results:
+        for k, v in result.items():
+            d[k].extend(v)
+    return dict(d)
+
+
+def _batch_symbol_params(path: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Splits the params of a latest or snapshot request for many symbols into batches that stay within the server's
+    symbol limit and a safe URL length. Other requests are returned as a single batch.
+
+    Args:
+        path (str): The API endpoint path.
+        params (Dict[str, Any]): The request params, with symbols joined by commas.
+
+    Returns:
+        List[Dict[str, Any]]: The params for each batch.
+    """
+    symbols = params.get("symbols")
+    if (
+        not symbols
+        or params.get("page_token")
+        or not ("/latest" in path or path.endswith("/snapshots"))
+    ):
+        return [params]
+
+    batches: List[List[str]] = [[]]
+    length = 0
+    for symbol in dict.fromkeys(str(symbols).split(",")):
+        if batches[-1] and (
+            len(batches[-1]) >= SYMBOL_BATCH_MAX_SYMBOLS
+            or length + len(symbol) + 1 > SYMBOL_BATCH_MAX_LENGTH
+        ):
+            batches.append([])
+            length = 0
+        batches[-1].append(symbol)
+        length += len(symbol) + 1
+
+    if len(batches) == 1:
+        return [params]
+
+    return [{**params, "symbols": ",".join(batch)} for batch in batches]
+
+
+def _merge_symbol_batches(results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merges the results of batched latest or snapshot requests, in batch order."""
+    merged: Dict[str, Any] = {}
+    for result in results:
+        merged.update(result)
+    return merged
+
+
+def _merge_decoded_shards(decoders: Iterable[Any]) -> Any:
+    """Merges the decoders of sharded market data requests, in shard order."""
+    decoders = iter(decoders)
+    merged = next(decoders)
+    for decoder in decoders:
+        merged.extend(decoder)
+    return merged
+
+
+def _validate_marketdata_pagination(
+    handle_pagination: Optional[PaginationType], max_workers: Optional[int]
+) -> PaginationType:
+    """Resolves the pagination type of a market data request and checks that it can be combined with sharding."""
+    handle_pagination = RESTClient._validate_pagination(None, handle_pagination)
+
+    if max_workers is not None and handle_pagination != PaginationType.FULL:
+        raise ValueError("max_workers can only be specified for PaginationType.FULL")
+
+    return handle_pagination
+
+
+def _decode_marketdata_page(
+    entries: RawData, decoder_factory: Optional[Callable[[], Any]]
+) -> Any:
+    """Returns the entries of a page, or a decoder that consumed them if `decoder_factory` is set."""
+    if decoder_factory is None:
+        return entries
+    decoder = decoder_factory()
+    decoder.decode_page(entries)
+    return decoder
+
+
+class _MergedPages:
+    """Merges the entries of the pages of a market data request, or decodes them into one decoder."""
+
+    def __init__(self, decoder_factory: Optional[Callable[[], Any]] = None) -> None:
+        self._decoder = decoder_factory() if decoder_factory is not None else None
+        self._entries: Dict[str, Any] = defaultdict(list)
+
+    def add(self, entries: RawData) -> None:
+        if self._decoder is not None:
+            self._decoder.decode_page(entries)
+            return
+
+        for k, v in entries.items():
+            if isinstance(v, list):
+                self._entries[k].extend(v)
+            else:
+                self._entries[k] = v
+
+    def result(self) -> Any:
+        if self._decoder is not None:
+            return self._decoder
+        return dict(self._entries)
+
+
+class _PageCursor:
+    """Keeps track of the page token and of the items left to request while paging through a market data
+    endpoint."""
+
+    def __init__(
+        self, params: Dict[str, Any], page_limit: int, page_size: Optional[int]
+    ) -> None:
+        self._params = dict(params)
+        self._page_limit = page_limit
+        # Missing page_size indicates that we should not set a limit (e.g. for latest endpoints)
+        self._actual_limit = min(page_size, page_limit) if page_size else None
+        self._limit = params.get("limit")
+        self._total_items = 0
+        self._page_token = params.get("page_token")
+        self._done = False
+
+    def next_params(self) -> Optional[Dict[str, Any]]:
+        """Returns the params of the next page, None once all pages were requested."""
+        if self._done:
+            return None
+
+        # adjusts the limit parameter value if it is over the page_limit
+        if self._limit:
+            # actual_limit is the adjusted total number of items to query per request
+            self._actual_limit = min(
+                int(self._limit) - self._total_items, self._page_limit
+            )
+            if self._actual_limit < 1:
+                return None
+
+        self._params["limit"] = self._actual_limit
+        self._params["page_token"] = self._page_token
+        return self._params
+
+    def advance(self, response: HTTPResult, entries: RawData) -> None:
+        """Moves past a page.
+
+        Args:
+            response (HTTPResult): The response of the page.
+            entries (RawData): The entries of the page.
+        """
+        # if we've sent a request with a limit, increment count
+        if self._actual_limit:
+            self._total_items += sum(
+                len(items) for items in entries.values() if isinstance(items, list)
+            )
+
+        self._page_token = response.get("next_page_token", None)
+        if self._page_token is None:
+            self._done = True
 
 
 def _get_marketdata_entries(response: HTTPResult, no_sub_key: bool) -> RawData:
@@ -0,0 +1,245 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Mapping, Optional
+
+from alpaca.common.constants import (
+    DEFAULT_RECONNECT_MAX_WAIT_SECONDS,
+    DEFAULT_RECONNECT_RESET_SECONDS,
+    DEFAULT_RECONNECT_WAIT_SECONDS,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_EXCEPTION_CODES,
+    DEFAULT_RETRY_MAX_WAIT_SECONDS,
+    DEFAULT_RETRY_WAIT_SECONDS,
+)
+
+
+class RetryState:
+    """
+    Tracks the retries of a single logical request. Created by `RetryPolicy.start` and passed back to
+    `RetryPolicy.get_retry_delay` after every failed attempt.
+
+    Attributes:
+        started_at (float): The monotonic time the first attempt was sent at.
+        retries (int): The number of retries scheduled so far.
+        status_retries (Dict[int, int]): The number of retries scheduled so far for each status code.
+    """
+
+    def __init__(self) -> None:
+        self.started_at: float = time.monotonic()
+        self.retries: int = 0
+        self.status_retries: Dict[int, int] = {}
+
+    @property
+    def elapsed(self) -> float:
+        """The number of seconds since the first attempt was sent."""
+        return time.monotonic() - self.started_at
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Waits grow exponentially from `base_wait` up to `max_wait`, with full jitter so that many clients hitting the
+    same limit don't retry in lockstep. When the server says when it will accept requests again, through
+    `Retry-After` or `X-RateLimit-Reset`, the retry is scheduled after that time instead.
+
+    Subclass and override `get_retry_delay` or `backoff` to customize the behaviour.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_RETRY_ATTEMPTS,
+        base_wait: float = DEFAULT_RETRY_WAIT_SECONDS,
+        max_wait: float = DEFAULT_RETRY_MAX_WAIT_SECONDS,
+        retry_codes: Optional[Iterable[int]] = None,
+        status_budgets: Optional[Dict[int, int]] = None,
+        deadline: Optional[float] = None,
+        jitter: bool = True,
+    ) -> None:
+        """
+        Args:
+            max_retries (int): The maximum number of retries of a request, across all status codes.
+            base_wait (float): The wait in seconds before the first retry. Doubles with every retry.
+            max_wait (float): The upper bound in seconds of the backoff between two attempts.
+            retry_codes (Optional[Iterable[int]]): The HTTP status codes to retry a request on. Defaults to 429 and
+              504.
+            status_budgets (Optional[Dict[int, int]]): The maximum number of retries for individual status codes,
+              e.g. `{504: 1}`. Codes without a budget may use all of `max_retries`.
+            deadline (Optional[float]): The maximum number of seconds a request may take including all retries. A
+              retry that would be sent after the deadline is not made. Defaults to no deadline.
+            jitter (bool): Whether to randomize waits. Only disable this for a single client.
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+
+        if base_wait < 0 or max_wait < 0:
+            raise ValueError("waits must not be negative")
+
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+
+        self.max_retries = max_retries
+        self.base_wait = base_wait
+        self.max_wait = max_wait
+        self.retry_codes = frozenset(
+            retry_codes if retry_codes is not None else DEFAULT_RETRY_EXCEPTION_CODES
+        )
+        self.status_budgets = dict(status_budgets or {})
+        self.deadline = deadline
+        self.jitter = jitter
+
+    def start(self) -> RetryState:
+        """Returns the state to track a new request with."""
+        return RetryState()
+
+    def is_retryable(self, status_code: int) -> bool:
+        """Whether a response with the given status code may be retried at all."""
+        return status_code in self.retry_codes
+
+    def backoff(self, retries: int) -> float:
+        """Returns the wait before a retry when the server gave no hint.
+
+        Args:
+            retries (int): The number of retries made before this one.
+
+        Returns:
+            float: The wait in seconds.
+        """
+        wait = min(self.max_wait, self.base_wait * 2**retries)
+        if self.jitter:
+            return random.uniform(0, wait)
+        return wait
+
+    def get_retry_delay(
+        self,
+        state: RetryState,
+        status_code: int,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """Decides whether to retry a failed attempt and records the retry in `state`.
+
+        Args:
+            state (RetryState): The state of the request, as returned by `start`.
+            status_code (int): The HTTP status code of the failed attempt.
+            headers (Optional[Mapping[str, str]]): The response headers of the failed attempt.
+
+        Returns:
+            Optional[float]: The number of seconds to wait before retrying, or None if the request should not be
+              retried.
+        """
+        if not self.is_retryable(status_code):
+            return None
+
+        if state.retries >= self.max_retries:
+            return None
+
+        status_retries = state.status_retries.get(status_code, 0)
+        if status_retries >= self.status_budgets.get(status_code, self.max_retries):
+            return None
+
+        delay = self.backoff(state.retries)
+
+        server_delay = (
+            _get_server_delay(status_code, headers) if headers is not None else None
+        )
+        if server_delay is not None:
+            # jitter on top of the server's reset time, so waiting clients don't all come back at once
+            delay = server_delay + (
+                random.uniform(0, self.base_wait) if self.jitter else 0
+            )
+
+        if self.deadline is not None and state.elapsed + delay > self.deadline:
+            return None
+
+        state.retries += 1
+        state.status_retries[status_code] = status_retries + 1
+
+        return delay
+
+
+class ReconnectPolicy:
+    """
+    Decides when a websocket stream reconnects after losing its connection.
+
+    Like `RetryPolicy`, waits grow exponentially from `base_wait` up to `max_wait` with full jitter, so that a fleet
+    of streams dropped by the same outage doesn't reconnect all at once. A connection that stays up for `reset_after`
+    seconds starts the backoff over.
+    """
+
+    def __init__(
+        self,
+        base_wait: float = DEFAULT_RECONNECT_WAIT_SECONDS,
+        max_wait: float = DEFAULT_RECONNECT_MAX_WAIT_SECONDS,
+        max_attempts: Optional[int] = None,
+        reset_after: float = DEFAULT_RECONNECT_RESET_SECONDS,
+        jitter: bool = True,
+    ) -> None:
+        """
+        Args:
+            base_wait (float): The upper bound in seconds of the wait before the first reconnect. Doubles with every
+              failed attempt.
+            max_wait (float): The upper bound in seconds of the wait between two attempts.
+            max_attempts (Optional[int]): The number of consecutive failed attempts after which the stream gives up.
+              Defaults to reconnecting forever.
+            reset_after (float): The number of seconds a connection has to stay up to reset the backoff.
+            jitter (bool): Whether to randomize waits. Only disable this for a single stream.
+        """
+        if base_wait < 0 or max_wait < 0:
+            raise ValueError("waits must not be negative")
+
+        if max_attempts is not None and max_attempts < 0:
+            raise ValueError("max_attempts must not be negative")
+
+        self.base_wait = base_wait
+        self.max_wait = max_wait
+        self.max_attempts = max_attempts
+        self.reset_after = reset_after
+        self.jitter = jitter
+
+    def get_reconnect_delay(self, attempts: int) -> Optional[float]:
+        """Returns the wait before the next connection attempt.
+
+        Args:
+            attempts (int): The number of consecutive failed attempts so far.
+
+        Returns:
+            Optional[float]: The wait in seconds, or None if the stream should give up.
+        """
+        if self.max_attempts is not None and attempts >= self.max_attempts:
+            return None
+
+        wait = min(self.max_wait, self.base_wait * 2**attempts)
+        if self.jitter:
+            return random.uniform(0, wait)
+        return wait
+
+
+def _get_server_delay(status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+    """Reads how long the server wants us to wait from the Retry-After or X-RateLimit-Reset headers."""
+    delays = []
+
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            delays.append(float(retry_after))
+        except ValueError:
+            try:
+                delays.append(
+                    parsedate_to_datetime(retry_after).timestamp() - time.time()
+                )
+            except (TypeError, ValueError):
+                pass
+
+    # the reset header is sent with every response, but only means something once we are rate limited
+    reset = headers.get("X-RateLimit-Reset")
+    if reset is not None and status_code == 429:
+        try:
+            delays.append(float(reset) - time.time())
+        except ValueError:
+            pass
+
+    if not delays:
+        return None
+
+    return max(0.0, max(delays))
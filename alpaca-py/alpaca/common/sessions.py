@@ -0,0 +1,159 @@
+import socket
+from typing import List, Optional, Tuple, Union
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+try:
+    import httpx
+except ImportError:  # httpx is only required by the async clients
+    httpx = None
+
+from alpaca.common.constants import (
+    DEFAULT_ASYNC_MAX_CONNECTIONS,
+    DEFAULT_ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_READ_TIMEOUT_SECONDS,
+    DEFAULT_TCP_KEEPALIVE_IDLE_SECONDS,
+)
+
+# the connect and read timeouts in seconds, or one timeout for both
+Timeout = Union[float, Tuple[float, float]]
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (
+    DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_READ_TIMEOUT_SECONDS,
+)
+
+
+def _tcp_keepalive_options(idle_seconds: int) -> List[Tuple[int, int, int]]:
+    """Returns the socket options turning on TCP keep-alive probes after a connection was idle for a while, as far
+    as the platform supports them."""
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Linux names the idle time TCP_KEEPIDLE, macOS TCP_KEEPALIVE
+    idle_option = getattr(socket, "TCP_KEEPIDLE", None) or getattr(
+        socket, "TCP_KEEPALIVE", None
+    )
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, idle_seconds))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, idle_seconds))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3))
+    return options
+
+
+class _PoolAdapter(HTTPAdapter):
+    """An HTTPAdapter whose connections are opened with extra socket options."""
+
+    def __init__(self, socket_options: List[Tuple[int, int, int]], **kwargs) -> None:
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    tcp_keepalive: bool = True,
+    tcp_keepalive_idle_seconds: int = DEFAULT_TCP_KEEPALIVE_IDLE_SECONDS,
+) -> Session:
+    """Creates a requests session with a tuned connection pool, for the `session` argument of the REST clients.
+
+    Pass the same session to several clients to share one pool between them. A session is safe to share between
+    threads, and keeps the connections to a host open between requests, so a thread pool of up to `pool_maxsize`
+    workers can send requests without opening new connections.
+
+    Args:
+        pool_connections (int): The number of hosts to keep a pool of connections for. Defaults to 10.
+        pool_maxsize (int): The maximum number of connections kept open to each host. Should be at least the
+          number of threads sending requests at once. Defaults to 32.
+        pool_block (bool): Whether a request waits for a free connection when all `pool_maxsize` connections to its
+          host are in use, instead of opening a connection that is discarded afterwards. Defaults to False.
+        tcp_keepalive (bool): Whether to send TCP keep-alive probes on idle connections, so connections dropped by
+          a firewall or NAT are noticed before a request is sent on them. Defaults to True.
+        tcp_keepalive_idle_seconds (int): The number of seconds a connection is idle before the first probe, and
+          between probes. Defaults to 60.
+
+    Returns:
+        Session: The session.
+    """
+    if pool_connections < 1 or pool_maxsize < 1:
+        raise ValueError("pool_connections and pool_maxsize must be positive")
+
+    socket_options = list(HTTPConnection.default_socket_options)
+    if tcp_keepalive:
+        socket_options += _tcp_keepalive_options(tcp_keepalive_idle_seconds)
+
+    session = Session()
+    adapter = _PoolAdapter(
+        socket_options,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_async_http_client(
+    max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+    timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
+) -> "httpx.AsyncClient":
+    """Creates an httpx client with a tuned connection pool, for the `http_client` argument of the async REST
+    clients. Requires the httpx package.
+
+    Args:
+        max_connections (int): The maximum number of connections open at once, over all hosts. Defaults to 100.
+        max_keepalive_connections (int): The maximum number of idle connections kept open. Defaults to 20.
+        keepalive_expiry (Optional[float]): The number of seconds an idle connection is kept open, None to keep it
+          open until the server closes it. Defaults to 5.
+        timeout (Optional[Timeout]): The connect and read timeouts of requests not given their own, None to wait
+          forever. Defaults to 10 seconds to connect and 60 to read.
+
+    Raises:
+        ImportError: If httpx is not installed.
+
+    Returns:
+        httpx.AsyncClient: The client.
+    """
+    if httpx is None:
+        raise ImportError(
+            "The async clients require httpx. Install it with `pip install alpaca-py[async]`."
+        )
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=to_httpx_timeout(timeout),
+    )
+
+
+def to_httpx_timeout(timeout: Optional[Timeout]) -> "httpx.Timeout":
+    """Converts connect and read timeouts to an httpx timeout, which also applies the read timeout to writing the
+    request and waiting for a connection from the pool.
+
+    Args:
+        timeout (Optional[Timeout]): The connect and read timeouts, or one timeout for both. None to wait forever.
+
+    Returns:
+        httpx.Timeout: The timeout.
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
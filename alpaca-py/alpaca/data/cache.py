@@ -0,0 +1,597 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from alpaca.common.enums import Sort
+from alpaca.common.types import RawData
+from alpaca.data.columnar import _to_timestamps
+
+# how long after the fact market data is considered final, and may be cached
+DEFAULT_CACHE_SETTLE_TIME = timedelta(minutes=15)
+
+# the endpoints whose results are cached
+_CACHEABLE_ENDPOINTS = ("/bars", "/quotes", "/trades")
+
+# the params that select which part of a series is returned, rather than which series
+_RANGE_PARAMS = {"symbols", "start", "end", "limit", "page_token", "sort"}
+
+# the longest period a bar of each timeframe unit covers, keyed by the units and aliases the API accepts
+_TIMEFRAME_UNITS = {
+    "Min": timedelta(minutes=1),
+    "T": timedelta(minutes=1),
+    "Hour": timedelta(hours=1),
+    "H": timedelta(hours=1),
+    "Day": timedelta(days=1),
+    "D": timedelta(days=1),
+    "Week": timedelta(weeks=1),
+    "W": timedelta(weeks=1),
+    "Month": timedelta(days=31),
+    "M": timedelta(days=31),
+}
+
+# how many seconds the latest data of a symbol is reused by default
+DEFAULT_LATEST_CACHE_TTL = 1.0
+
+DEFAULT_LATEST_CACHE_MAX_ENTRIES = 10_000
+
+# cached for symbols the API returned nothing for, so they aren't requested again until the entry expires
+_NOT_FOUND = object()
+
+TimeRange = Tuple[pd.Timestamp, pd.Timestamp]
+
+
+class CacheEntry:
+    """
+    The cached rows of one series, i.e. one symbol of one endpoint with one set of parameters.
+
+    Attributes:
+        ranges (List[Tuple[pd.Timestamp, pd.Timestamp]]): The time ranges that have been fetched, merged and sorted.
+          Both ends are inclusive.
+        rows (List[RawData]): The raw rows within those ranges, sorted by timestamp.
+    """
+
+    def __init__(self, ranges: List[TimeRange], rows: List[RawData]) -> None:
+        self.ranges = ranges
+        self.rows = rows
+
+
+class MarketDataCache(ABC):
+    """
+    Base class of caches for historical bars, quotes and trades.
+
+    A cached request only fetches the parts of its time range that are not cached yet, and merges them with the
+    cached rows. Subclasses decide where entries are stored by implementing `load` and `save`.
+
+    Requests are cached if they have a start time and no limit. Data newer than `settle_time` is always fetched again,
+    since the API may still amend it. Bars count as new until `settle_time` after their period ended, so a bar that
+    is still being built, like today's daily bar, is never cached.
+    """
+
+    def __init__(self, settle_time: timedelta = DEFAULT_CACHE_SETTLE_TIME) -> None:
+        """
+        Args:
+            settle_time (timedelta): How old data must be to be cached.
+        """
+        self._settle_time = settle_time
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[CacheEntry]:
+        """Loads the entry of a series.
+
+        Args:
+            key (str): Identifies the endpoint, symbol and parameters of the series.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if nothing is cached for the key.
+        """
+
+    @abstractmethod
+    def save(self, key: str, entry: CacheEntry) -> None:
+        """Saves the entry of a series, replacing the previous entry.
+
+        Args:
+            key (str): Identifies the endpoint, symbol and parameters of the series.
+            entry (CacheEntry): The entry to store.
+        """
+
+    def is_cacheable(self, path: str, params: Dict[str, Any]) -> bool:
+        """Whether the results of a market data request can be served from this cache."""
+        return (
+            path.endswith(_CACHEABLE_ENDPOINTS)
+            and _get_bar_length(params) is not None
+            and params.get("symbols") is not None
+            and params.get("start") is not None
+            and not params.get("limit")
+            and not params.get("page_token")
+        )
+
+    def get_marketdata(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        fetch: Callable[[Dict[str, Any]], Dict[str, List[RawData]]],
+    ) -> Dict[str, List[RawData]]:
+        """Returns the rows of a request, fetching only the time ranges that aren't cached.
+
+        Args:
+            path (str): The API endpoint path.
+            params (Dict[str, Any]): The request params, see `is_cacheable`.
+            fetch (Callable[[Dict[str, Any]], Dict[str, List[RawData]]]): Fetches all pages of a request with the
+              given params and returns the rows keyed by symbol.
+
+        Returns:
+            Dict[str, List[RawData]]: The rows keyed by symbol, in the requested sort order.
+        """
+        now = pd.Timestamp(datetime.now(timezone.utc))
+        start = _to_utc(params["start"])
+        end = _to_utc(params["end"]) if params.get("end") is not None else now
+        # rows are timestamped with the start of their bar, so a row has settled once its whole bar has
+        settled = min(end, now - self._settle_time - _get_bar_length(params))
+        symbols = str(params["symbols"]).split(",")
+
+        # the lock only guards loading and saving entries, so requests for other series are fetched in parallel
+        with self._lock:
+            entries: Dict[str, CacheEntry] = {}
+            missing: Dict[str, List[TimeRange]] = {}
+            groups: Dict[Tuple[TimeRange, ...], List[str]] = defaultdict(list)
+            for symbol in symbols:
+                entries[symbol] = self.load(_get_cache_key(path, symbol, params)) or (
+                    CacheEntry([], [])
+                )
+                missing[symbol] = _get_missing_ranges(
+                    entries[symbol].ranges, start, end
+                )
+                if missing[symbol]:
+                    groups[tuple(missing[symbol])].append(symbol)
+
+        # symbols missing the same ranges are fetched together
+        fetched: Dict[str, List[RawData]] = defaultdict(list)
+        for gaps, group in groups.items():
+            for gap_start, gap_end in gaps:
+                gap_params = {k: v for k, v in params.items() if k not in _RANGE_PARAMS}
+                gap_params["symbols"] = ",".join(group)
+                gap_params["start"] = gap_start.isoformat()
+                gap_params["end"] = gap_end.isoformat()
+                for symbol, rows in fetch(gap_params).items():
+                    fetched[symbol].extend(rows)
+
+        result = {}
+        for symbol in symbols:
+            entry = entries[symbol]
+            rows, timestamps = _merge_rows(entry.rows, fetched.get(symbol, []))
+
+            if missing[symbol] and settled >= start:
+                key = _get_cache_key(path, symbol, params)
+                with self._lock:
+                    # another request may have saved the series while this one was fetching, keep what it added
+                    current = self.load(key) or CacheEntry([], [])
+                    stored_rows, stored_timestamps = _merge_rows(
+                        current.rows, fetched.get(symbol, [])
+                    )
+                    # only store what has settled, the rest is fetched again next time
+                    stored = stored_timestamps.searchsorted(settled, side="right")
+                    self.save(
+                        key,
+                        CacheEntry(
+                            _merge_ranges(current.ranges + [(start, settled)]),
+                            stored_rows[:stored],
+                        ),
+                    )
+
+            first = timestamps.searchsorted(start, side="left")
+            last = timestamps.searchsorted(end, side="right")
+            symbol_rows = rows[first:last]
+
+            if params.get("sort") == Sort.DESC:
+                symbol_rows.reverse()
+
+            if symbol_rows:
+                result[symbol] = symbol_rows
+
+        return result
+
+
+class InMemoryMarketDataCache(MarketDataCache):
+    """A market data cache that lives as long as the process, e.g. to share between clients in a notebook."""
+
+    def __init__(self, settle_time: timedelta = DEFAULT_CACHE_SETTLE_TIME) -> None:
+        super().__init__(settle_time)
+        self._entries: Dict[str, CacheEntry] = {}
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        return self._entries.get(key)
+
+    def save(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+
+
+class FileMarketDataCache(MarketDataCache):
+    """
+    A market data cache that stores one gzipped file per series in a directory, so repeated runs of a backtest are
+    served from disk.
+
+    Rows are stored column by column under their raw API keys, which keeps the files compact and lets them be
+    loaded back into exactly the rows the API returned.
+    """
+
+    def __init__(
+        self, directory: str, settle_time: timedelta = DEFAULT_CACHE_SETTLE_TIME
+    ) -> None:
+        """
+        Args:
+            directory (str): The directory to store the cache files in. Created if it doesn't exist.
+            settle_time (timedelta): How old data must be to be cached.
+        """
+        super().__init__(settle_time)
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with gzip.open(self._get_path(key), "rt", encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if stored.get("key") != key:
+            # a hash collision, treat it as a miss
+            return None
+
+        ranges = [
+            (pd.Timestamp(start), pd.Timestamp(end)) for start, end in stored["ranges"]
+        ]
+        columns = stored["columns"]
+        rows = [
+            {k: v for k, v in zip(columns, values) if v is not None}
+            for values in zip(*columns.values())
+        ]
+        return CacheEntry(ranges, rows)
+
+    def save(self, key: str, entry: CacheEntry) -> None:
+        keys = list(dict.fromkeys(k for row in entry.rows for k in row))
+        stored = {
+            "key": key,
+            "ranges": [
+                [start.isoformat(), end.isoformat()] for start, end in entry.ranges
+            ],
+            "columns": {k: [row.get(k) for row in entry.rows] for k in keys},
+        }
+
+        # write to a temporary file first, so readers never see a partially written file
+        fd, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with gzip.open(os.fdopen(fd, "wb"), "wt", encoding="utf-8") as f:
+                json.dump(stored, f, separators=(",", ":"))
+            os.replace(temp_path, self._get_path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _get_path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self._directory, f"{digest}.json.gz")
+
+
+class LatestDataCache:
+    """
+    A short-lived in-memory cache for the latest bars, quotes and trades, latest orderbooks and snapshots.
+
+    Entries are kept per symbol, so requests for overlapping symbol lists only fetch the symbols that aren't cached.
+    Concurrent requests for a symbol that is already being fetched wait for that fetch instead of making their own
+    request, whether they come from threads or coroutines. Entries expire after their endpoint's TTL, and the least
+    recently used entries are evicted once the cache is full.
+
+    Share one instance between clients to share the cached data.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_LATEST_CACHE_TTL,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_LATEST_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Args:
+            ttl (float): How many seconds an entry is reused for.
+            endpoint_ttls (Optional[Dict[str, float]]): The TTL for individual endpoints keyed by path, e.g.
+              `{"/options/snapshots": 5}`. Endpoints without a TTL use `ttl`.
+            max_entries (int): The maximum number of symbols cached across all endpoints.
+        """
+        if ttl < 0 or any(value < 0 for value in (endpoint_ttls or {}).values()):
+            raise ValueError("ttl must not be negative")
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        self._ttl = ttl
+        self._endpoint_ttls = dict(endpoint_ttls or {})
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # the pending fetches of each symbol, kept apart since threads can't wait on asyncio futures
+        self._pending: Dict[str, Future] = {}
+        self._async_pending: Dict[str, asyncio.Future] = {}
+
+    def is_cacheable(self, path: str, params: Dict[str, Any]) -> bool:
+        """Whether the results of a market data request can be served from this cache."""
+        return (
+            ("/latest" in path or path.endswith("/snapshots"))
+            and params.get("symbols") is not None
+            and not params.get("page_token")
+        )
+
+    def get_marketdata(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        fetch: Callable[[Dict[str, Any]], Dict[str, RawData]],
+    ) -> Dict[str, RawData]:
+        """Returns the entries of a request, fetching only the symbols that aren't cached or being fetched.
+
+        Args:
+            path (str): The API endpoint path.
+            params (Dict[str, Any]): The request params, see `is_cacheable`.
+            fetch (Callable[[Dict[str, Any]], Dict[str, RawData]]): Fetches a request with the given params and
+              returns the entries keyed by symbol.
+
+        Returns:
+            Dict[str, RawData]: The entries keyed by symbol.
+        """
+        symbols = str(params["symbols"]).split(",")
+        keys = {symbol: _get_cache_key(path, symbol, params) for symbol in symbols}
+
+        with self._lock:
+            values, waiting, missing = self._lookup(keys, self._pending)
+            owned = {symbol: Future() for symbol in missing}
+            self._pending.update({keys[s]: future for s, future in owned.items()})
+
+        if missing:
+            try:
+                entries = fetch({**params, "symbols": ",".join(missing)})
+            except BaseException as error:
+                self._fail(keys, owned, self._pending, error)
+                raise
+            values.update(self._complete(path, keys, owned, self._pending, entries))
+
+        for symbol, future in waiting.items():
+            values[symbol] = future.result()
+
+        return _get_found_entries(symbols, values)
+
+    async def async_get_marketdata(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        fetch: Callable[[Dict[str, Any]], Awaitable[Dict[str, RawData]]],
+    ) -> Dict[str, RawData]:
+        """The asyncio version of `get_marketdata`.
+
+        Args:
+            path (str): The API endpoint path.
+            params (Dict[str, Any]): The request params, see `is_cacheable`.
+            fetch (Callable[[Dict[str, Any]], Awaitable[Dict[str, RawData]]]): Fetches a request with the given params
+              and returns the entries keyed by symbol.
+
+        Returns:
+            Dict[str, RawData]: The entries keyed by symbol.
+        """
+        symbols = str(params["symbols"]).split(",")
+        keys = {symbol: _get_cache_key(path, symbol, params) for symbol in symbols}
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            values, waiting, missing = self._lookup(keys, self._async_pending)
+            owned = {symbol: loop.create_future() for symbol in missing}
+            self._async_pending.update({keys[s]: future for s, future in owned.items()})
+
+        if missing:
+            try:
+                entries = await fetch({**params, "symbols": ",".join(missing)})
+            except BaseException as error:
+                self._fail(keys, owned, self._async_pending, error)
+                raise
+            values.update(
+                self._complete(path, keys, owned, self._async_pending, entries)
+            )
+
+        retry = []
+        for symbol, future in waiting.items():
+            try:
+                values[symbol] = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # this request was cancelled, not the one it was waiting for
+                    raise
+                retry.append(symbol)
+
+        if retry:
+            # the request fetching these symbols was cancelled, which says nothing about this one
+            retried = await self.async_get_marketdata(
+                path, {**params, "symbols": ",".join(retry)}, fetch
+            )
+            values.update({symbol: retried.get(symbol, _NOT_FOUND) for symbol in retry})
+
+        return _get_found_entries(symbols, values)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(
+        self, keys: Dict[str, str], pending: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], List[str]]:
+        """Sorts the symbols of a request into cached, being fetched and missing. Must hold the lock."""
+        now = time.monotonic()
+        values = {}
+        waiting = {}
+        missing = []
+        for symbol, key in keys.items():
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                values[symbol] = entry[1]
+            elif key in pending:
+                waiting[symbol] = pending[key]
+            else:
+                missing.append(symbol)
+        return values, waiting, missing
+
+    def _complete(
+        self,
+        path: str,
+        keys: Dict[str, str],
+        owned: Dict[str, Any],
+        pending: Dict[str, Any],
+        entries: Dict[str, RawData],
+    ) -> Dict[str, Any]:
+        expires_at = time.monotonic() + self._endpoint_ttls.get(path, self._ttl)
+        values = {symbol: entries.get(symbol, _NOT_FOUND) for symbol in owned}
+
+        with self._lock:
+            for symbol, value in values.items():
+                key = keys[symbol]
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+                pending.pop(key, None)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        for symbol, future in owned.items():
+            future.set_result(values[symbol])
+
+        return values
+
+    def _fail(
+        self,
+        keys: Dict[str, str],
+        owned: Dict[str, Any],
+        pending: Dict[str, Any],
+        error: BaseException,
+    ) -> None:
+        with self._lock:
+            for symbol in owned:
+                pending.pop(keys[symbol], None)
+
+        for future in owned.values():
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+                continue
+            future.set_exception(error)
+            # mark the error as retrieved, it is raised to the caller that made the request
+            future.exception()
+
+
+def _get_cache_key(path: str, symbol: str, params: Dict[str, Any]) -> str:
+    """Identifies a series by its endpoint, symbol and the params that aren't about the time range, e.g. the
+    timeframe, feed and adjustment."""
+    series_params = sorted(
+        (k, str(getattr(v, "value", v)))
+        for k, v in params.items()
+        if k not in _RANGE_PARAMS and v is not None
+    )
+    return json.dumps([path, symbol, series_params])
+
+
+def _get_bar_length(params: Dict[str, Any]) -> Optional[timedelta]:
+    """Returns the longest period a bar of the request's timeframe covers, zero for quotes and trades, which happen
+    at their timestamp. None if the timeframe isn't understood."""
+    timeframe = params.get("timeframe")
+    if timeframe is None:
+        return timedelta(0)
+
+    match = re.fullmatch(
+        r"(\d+)([A-Za-z]+)", str(getattr(timeframe, "value", timeframe))
+    )
+    if match is None or match.group(2) not in _TIMEFRAME_UNITS:
+        return None
+    return int(match.group(1)) * _TIMEFRAME_UNITS[match.group(2)]
+
+
+def _get_missing_ranges(
+    ranges: List[TimeRange], start: pd.Timestamp, end: pd.Timestamp
+) -> List[TimeRange]:
+    """Returns the parts of [start, end] that aren't covered by the sorted, merged ranges. Missing ranges include
+    the ends of the neighbouring cached ranges, since a row exactly at the boundary may be on either side.
+    """
+    missing = []
+    cursor = start
+    for range_start, range_end in ranges:
+        if range_end < cursor:
+            continue
+        if range_start > end:
+            break
+        if range_start > cursor:
+            missing.append((cursor, range_start))
+        cursor = max(cursor, range_end)
+
+    if cursor < end or not _is_covered(ranges, end):
+        missing.append((cursor, end))
+
+    return missing
+
+
+def _is_covered(ranges: List[TimeRange], timestamp: pd.Timestamp) -> bool:
+    return any(start <= timestamp <= end for start, end in ranges)
+
+
+def _merge_ranges(ranges: List[TimeRange]) -> List[TimeRange]:
+    merged: List[TimeRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _merge_rows(
+    cached: List[RawData], fetched: List[RawData]
+) -> Tuple[List[RawData], pd.DatetimeIndex]:
+    """Merges fetched rows into the cached rows, sorted by timestamp. Fetched rows replace the cached rows with the
+    same timestamp, since the ranges are fetched again including their boundaries."""
+    if not fetched:
+        return cached, _to_timestamps([row["t"] for row in cached])
+
+    cached_times = _to_timestamps([row["t"] for row in cached])
+    fetched_times = _to_timestamps([row["t"] for row in fetched])
+    kept = ~cached_times.isin(fetched_times)
+
+    rows = [row for row, keep in zip(cached, kept) if keep] + fetched
+    times = cached_times[kept].append(fetched_times)
+    order = np.argsort(times, kind="stable")
+
+    return [rows[i] for i in order], times[order]
+
+
+def _to_utc(value: Any) -> pd.Timestamp:
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        return timestamp.tz_localize("UTC")
+    return timestamp.tz_convert("UTC")
+
+
+def _get_found_entries(
+    symbols: List[str], values: Dict[str, Any]
+) -> Dict[str, RawData]:
+    return {
+        symbol: values[symbol]
+        for symbol in dict.fromkeys(symbols)
+        if values[symbol] is not _NOT_FOUND
+    }
@@ -0,0 +1,145 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Type
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from alpaca.common.models import ValidateBaseModel as BaseModel
+from alpaca.common.types import RawData
+
+# fields stored as float64 columns; missing values become NaN
+_FLOAT_FIELDS = {
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "trade_count",
+    "vwap",
+    "price",
+    "size",
+    "bid_price",
+    "bid_size",
+    "ask_price",
+    "ask_size",
+}
+
+# fields stored as int64 columns, or as nullable Int64 if any value is missing
+_INT_FIELDS = {"id"}
+
+# the unit pandas stores datetimes in, "us" from pandas 3 and "ns" before
+_DATETIME_UNIT = getattr(
+    pd.DatetimeIndex([datetime(2000, 1, 1, tzinfo=timezone.utc)]), "unit", "ns"
+)
+
+
+class MarketDataColumns:
+    """
+    Decodes pages of historical market data into one buffer per field, for building a DataFrame without creating
+    a model for every row.
+
+    Each page is consumed as soon as it arrives and only the column values are kept, so the raw rows of a page can
+    be freed before the next one is fetched.
+    """
+
+    def __init__(self, mapping: Dict[str, str], model: Type[BaseModel]) -> None:
+        """
+        Args:
+            mapping (Dict[str, str]): The mapping of raw API keys to field names, e.g. BAR_MAPPING.
+            model (Type[BaseModel]): The model the rows would otherwise be parsed into. Used to order the columns
+              the same way as the model's `df`.
+        """
+        self._fields = [
+            field for field in model.model_fields if field in mapping.values()
+        ]
+        self._keys = {field: key for key, field in mapping.items()}
+        self._symbols: List[str] = []
+        self._counts: List[int] = []
+        self._columns: Dict[str, List[Any]] = {field: [] for field in self._fields}
+
+    def __len__(self) -> int:
+        return sum(self._counts)
+
+    def decode_page(self, entries: Dict[str, List[RawData]]) -> None:
+        """Appends one page of rows keyed by symbol to the column buffers.
+
+        Args:
+            entries (Dict[str, List[RawData]]): The rows of the page keyed by symbol.
+        """
+        for symbol, rows in entries.items():
+            rows = [row for row in rows if row is not None]
+            if not rows:
+                continue
+
+            self._symbols.append(symbol)
+            self._counts.append(len(rows))
+
+            for field, column in self._columns.items():
+                key = self._keys[field]
+                column.extend([row.get(key) for row in rows])
+
+    def extend(self, other: "MarketDataColumns") -> None:
+        """Appends the rows decoded by another buffer, e.g. the buffer of another shard of the same request.
+
+        Args:
+            other (MarketDataColumns): The buffer to append. Must use the same mapping.
+        """
+        self._symbols.extend(other._symbols)
+        self._counts.extend(other._counts)
+        for field, column in self._columns.items():
+            column.extend(other._columns[field])
+
+    def to_frame(self) -> DataFrame:
+        """Builds a DataFrame indexed by symbol and timestamp, with the same columns as the model set's `df`.
+        Timestamps are truncated to microseconds like the models' datetimes.
+
+        Returns:
+            DataFrame: The decoded data.
+        """
+        data = {
+            "symbol": np.repeat(
+                np.array(self._symbols, dtype=object),
+                np.array(self._counts, dtype=np.int64),
+            )
+        }
+
+        for field, values in self._columns.items():
+            data[field] = _to_array(field, values)
+
+        df = pd.DataFrame(data)
+        df = df.set_index(["symbol", "timestamp"])
+
+        # drop null columns
+        df.dropna(axis=1, how="all", inplace=True)
+
+        return df
+
+
+def _to_array(field: str, values: List[Any]) -> Any:
+    if field == "timestamp":
+        # the models hold datetimes, which truncate the API's nanoseconds to microseconds
+        timestamps = _to_timestamps(values).floor("us")
+        if _DATETIME_UNIT != "ns":
+            timestamps = timestamps.as_unit(_DATETIME_UNIT)
+        return timestamps
+
+    if field in _FLOAT_FIELDS:
+        return np.array(values, dtype=np.float64)
+
+    if field in _INT_FIELDS:
+        if None in values:
+            return pd.array(values, dtype="Int64")
+        return np.array(values, dtype=np.int64)
+
+    # strings and lists of conditions stay python objects
+    return values
+
+
+def _to_timestamps(values: List[str]) -> pd.DatetimeIndex:
+    try:
+        # RFC-3339 timestamps from the API vary in their fractional second precision
+        return pd.to_datetime(values, utc=True, format="ISO8601")
+    except (TypeError, ValueError):
+        # pandas < 2.0 doesn't support the ISO8601 format, but infers it per value
+        return pd.to_datetime(values, utc=True)
@@ -182,3 +182,20 @@ class CorporateActionsType(str, Enum):
     NAME_CHANGE = "name_change"
     WORTHLESS_REMOVAL = "worthless_removal"
     RIGHTS_DISTRIBUTION = "rights_distribution"
+
+
+class OverflowPolicy(str, Enum):
+    """
+    What a stream does with a new message when its dispatch queue is full.
+
+    Attributes:
+        BLOCK (str): Wait for the handlers to make room. The socket isn't read in the meantime.
+        DROP_OLDEST (str): Drop the oldest queued message.
+        CONFLATE_LATEST (str): Replace the queued quote or bar of the same type and symbol with the new one, or merge
+          an orderbook update into the queued one. Drop the oldest queued message if there is none, or for
+          messages that can't be conflated, like trades and news.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    CONFLATE_LATEST = "conflate_latest"
@@ -1,10 +1,22 @@
-from alpaca.data.historical.crypto import CryptoHistoricalDataClient
+from alpaca.data.historical.crypto import (
+    AsyncCryptoHistoricalDataClient,
+    CryptoHistoricalDataClient,
+)
 from alpaca.data.historical.news import NewsClient
-from alpaca.data.historical.option import OptionHistoricalDataClient
+from alpaca.data.historical.option import (
+    AsyncOptionHistoricalDataClient,
+    OptionHistoricalDataClient,
+)
 from alpaca.data.historical.screener import ScreenerClient
-from alpaca.data.historical.stock import StockHistoricalDataClient
+from alpaca.data.historical.stock import (
+    AsyncStockHistoricalDataClient,
+    StockHistoricalDataClient,
+)
 
 __all__ = [
+    "AsyncCryptoHistoricalDataClient",
+    "AsyncOptionHistoricalDataClient",
+    "AsyncStockHistoricalDataClient",
     "CryptoHistoricalDataClient",
     "StockHistoricalDataClient",
     "NewsClient",
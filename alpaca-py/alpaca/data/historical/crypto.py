@@ -1,13 +1,23 @@
-from typing import Dict, Optional, Union
+from datetime import timedelta
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterator, Optional, Union
 
-from alpaca.common.enums import BaseURL
-from alpaca.common.rest import RESTClient
+from pandas import DataFrame
+
+from requests import Session
+
+from alpaca.common.enums import BaseURL, JSONBackend, PaginationType
+from alpaca.common.instrumentation import RequestHooks
+from alpaca.common.metrics import MetricsSink
+from alpaca.common.rate_limit import RateLimiter
+from alpaca.common.retry import RetryPolicy
+from alpaca.common.rest import AsyncRESTClient, RESTClient
+from alpaca.common.sessions import DEFAULT_TIMEOUT, Timeout
 from alpaca.common.types import Credentials, RawData
 from alpaca.data import Bar, Snapshot
+from alpaca.data.cache import LatestDataCache, MarketDataCache
 from alpaca.data.enums import CryptoFeed
-from alpaca.data.historical.utils import (
-    parse_obj_as_symbol_dict,
-)
+from alpaca.data.mappings import BAR_MAPPING, QUOTE_MAPPING, TRADE_MAPPING
+from alpaca.data.historical.utils import series_query, symbol_dict_query
 from alpaca.data.models import BarSet, Orderbook, Quote, QuoteSet, Trade, TradeSet
 from alpaca.data.requests import (
     CryptoBarsRequest,
@@ -20,6 +30,9 @@ from alpaca.data.requests import (
     CryptoTradesRequest,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
 
 class CryptoHistoricalDataClient(RESTClient):
     """
@@ -43,6 +56,16 @@ class CryptoHistoricalDataClient(RESTClient):
         url_override: Optional[str] = None,
         use_basic_auth: bool = False,
         sandbox: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[MarketDataCache] = None,
+        latest_cache: Optional[LatestDataCache] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        session: Optional[Session] = None,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
     ) -> None:
         """
         Instantiates a Historical Data Client for Crypto Data.
@@ -58,6 +81,27 @@ class CryptoHistoricalDataClient(RESTClient):
             use_basic_auth (bool, optional): If true, API requests will use basic authorization headers. Set to true if using
               broker api sandbox credentials
             sandbox (bool): True if using sandbox mode. Defaults to False.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests.
+              Defaults to None.
+            cache (Optional[MarketDataCache]): A cache to serve historical bars, quotes and trades from, e.g. a
+              FileMarketDataCache. Only the time ranges that aren't cached are fetched. Defaults to None.
+            latest_cache (Optional[LatestDataCache]): A cache to serve latest data and snapshots from. Concurrent
+              requests for the same symbols share one API request. Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request
+              are reported to this sink, labeled with the templated endpoint. Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its
+              timings. Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, e.g. JSONBackend.ORJSON
+              for large market data pages. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed
+              transparently. Defaults to True.
+            session (Optional[Session]): The requests session used to send requests, e.g. one made with
+              `create_session` to size its connection pool. Pass the same instance to several clients to share one
+              pool between them. Defaults to None.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
         """
 
         base_url = (
@@ -75,84 +119,161 @@ class CryptoHistoricalDataClient(RESTClient):
             sandbox=sandbox,
             raw_data=raw_data,
             use_basic_auth=use_basic_auth,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            marketdata_cache=cache,
+            latest_cache=latest_cache,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            session=session,
+            timeout=timeout,
         )
 
     def get_crypto_bars(
-        self, request_params: CryptoBarsRequest, feed: CryptoFeed = CryptoFeed.US
-    ) -> Union[BarSet, RawData]:
+        self,
+        request_params: CryptoBarsRequest,
+        feed: CryptoFeed = CryptoFeed.US,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[BarSet, RawData, DataFrame, Iterator[Union[BarSet, RawData, DataFrame]]]:
         """Gets bar/candle data for a cryptocurrency or list of cryptocurrencies.
 
         Args:
             request_params (CryptoBarsRequest): The parameters for the request.
             feed (CryptoFeed): The data feed for crypto bars.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
 
         Returns:
-            Union[BarSet, RawData]: The crypto bar data either in raw or wrapped form
+            Union[BarSet, RawData, DataFrame, Iterator]: The crypto bar data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
         """
 
         # paginated get request for crypto market data api
-        raw_bars = self._get_marketdata(
-            path=f"/crypto/{feed.value}/bars",
-            params=request_params.to_request_fields(),
-            page_size=10_000,
+        return self._fetch_marketdata(
+            series_query(
+                path=f"/crypto/{feed.value}/bars",
+                params=request_params.to_request_fields(),
+                data_set=BarSet,
+                model=Bar,
+                mapping=BAR_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
         )
 
-        if self._use_raw_data:
-            return raw_bars
-
-        return BarSet(raw_bars)
-
     def get_crypto_quotes(
-        self, request_params: CryptoQuoteRequest, feed: CryptoFeed = CryptoFeed.US
-    ) -> Union[QuoteSet, RawData]:
+        self,
+        request_params: CryptoQuoteRequest,
+        feed: CryptoFeed = CryptoFeed.US,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        QuoteSet, RawData, DataFrame, Iterator[Union[QuoteSet, RawData, DataFrame]]
+    ]:
         """Returns the quote data for a cryptocurrency or list of cryptocurrencies.
 
         Args:
             request_params (CryptoQuoteRequest): The parameters for the request.
             feed (CryptoFeed): The data feed for crypto quotes.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
 
         Returns:
-            Union[QuoteSet, RawData]: The crypto quote data either in raw or wrapped form
+            Union[QuoteSet, RawData, DataFrame, Iterator]: The crypto quote data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
         """
 
         # paginated get request for market data api
-        raw_quotes = self._get_marketdata(
-            path=f"/crypto/{feed.value}/quotes",
-            params=request_params.to_request_fields(),
-            page_size=10_000,
+        return self._fetch_marketdata(
+            series_query(
+                path=f"/crypto/{feed.value}/quotes",
+                params=request_params.to_request_fields(),
+                data_set=QuoteSet,
+                model=Quote,
+                mapping=QUOTE_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
         )
 
-        if self._use_raw_data:
-            return raw_quotes
-
-        return QuoteSet(raw_quotes)
-
     def get_crypto_trades(
-        self, request_params: CryptoTradesRequest, feed: CryptoFeed = CryptoFeed.US
-    ) -> Union[TradeSet, RawData]:
+        self,
+        request_params: CryptoTradesRequest,
+        feed: CryptoFeed = CryptoFeed.US,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        TradeSet, RawData, DataFrame, Iterator[Union[TradeSet, RawData, DataFrame]]
+    ]:
         """Returns the price and sales history over a given time period for a cryptocurrency
         or list of cryptocurrencies.
 
         Args:
             request_params (CryptoTradesRequest): The parameters for the request.
             feed (CryptoFeed): The data feed for crypto trades.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
 
         Returns:
-            Union[TradeSet, RawData]: The trade data either in raw or wrapped form
+            Union[TradeSet, RawData, DataFrame, Iterator]: The trade data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
         """
 
         # paginated get request for market data api
-        raw_trades = self._get_marketdata(
-            path=f"/crypto/{feed.value}/trades",
-            params=request_params.to_request_fields(),
-            page_size=10_000,
+        return self._fetch_marketdata(
+            series_query(
+                path=f"/crypto/{feed.value}/trades",
+                params=request_params.to_request_fields(),
+                data_set=TradeSet,
+                model=Trade,
+                mapping=TRADE_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
         )
 
-        if self._use_raw_data:
-            return raw_trades
-
-        return TradeSet(raw_trades)
-
     def get_crypto_latest_trade(
         self, request_params: CryptoLatestTradeRequest, feed: CryptoFeed = CryptoFeed.US
     ) -> Union[Dict[str, Trade], RawData]:
@@ -166,16 +287,15 @@ class CryptoHistoricalDataClient(RESTClient):
             Union[Dict[str, Trade], RawData]: The latest trade in raw or wrapped format
         """
 
-        raw_trades = self._get_marketdata(
-            path=f"/crypto/{feed.value}/latest/trades",
-            params=request_params.to_request_fields(),
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/crypto/{feed.value}/latest/trades",
+                params=request_params.to_request_fields(),
+                model=Trade,
+                use_raw_data=self._use_raw_data,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_trades
-
-        return parse_obj_as_symbol_dict(Trade, raw_trades)
-
     def get_crypto_latest_quote(
         self, request_params: CryptoLatestQuoteRequest, feed: CryptoFeed = CryptoFeed.US
     ) -> Union[Dict[str, Quote], RawData]:
@@ -189,16 +309,15 @@ class CryptoHistoricalDataClient(RESTClient):
             Union[Dict[str, Quote], RawData]: The latest quote in raw or wrapped format
         """
 
-        raw_quotes = self._get_marketdata(
-            path=f"/crypto/{feed.value}/latest/quotes",
-            params=request_params.to_request_fields(),
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/crypto/{feed.value}/latest/quotes",
+                params=request_params.to_request_fields(),
+                model=Quote,
+                use_raw_data=self._use_raw_data,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_quotes
-
-        return parse_obj_as_symbol_dict(Quote, raw_quotes)
-
     def get_crypto_latest_bar(
         self, request_params: CryptoLatestBarRequest, feed: CryptoFeed = CryptoFeed.US
     ) -> Union[Dict[str, Bar], RawData]:
@@ -212,16 +331,15 @@ class CryptoHistoricalDataClient(RESTClient):
             Union[Dict[str, Bar], RawData]: The latest bar in raw or wrapped format
         """
 
-        raw_bars = self._get_marketdata(
-            path=f"/crypto/{feed.value}/latest/bars",
-            params=request_params.to_request_fields(),
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/crypto/{feed.value}/latest/bars",
+                params=request_params.to_request_fields(),
+                model=Bar,
+                use_raw_data=self._use_raw_data,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_bars
-
-        return parse_obj_as_symbol_dict(Bar, raw_bars)
-
     def get_crypto_latest_orderbook(
         self,
         request_params: CryptoLatestOrderbookRequest,
@@ -238,16 +356,15 @@ class CryptoHistoricalDataClient(RESTClient):
             Union[Dict[str, Orderbook], RawData]: The orderbook data either in raw or wrapped form.
         """
 
-        raw_orderbooks = self._get_marketdata(
-            path=f"/crypto/{feed.value}/latest/orderbooks",
-            params=request_params.to_request_fields(),
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/crypto/{feed.value}/latest/orderbooks",
+                params=request_params.to_request_fields(),
+                model=Orderbook,
+                use_raw_data=self._use_raw_data,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_orderbooks
-
-        return parse_obj_as_symbol_dict(Orderbook, raw_orderbooks)
-
     def get_crypto_snapshot(
         self, request_params: CryptoSnapshotRequest, feed: CryptoFeed = CryptoFeed.US
     ) -> Union[Snapshot, RawData]:
@@ -262,16 +379,15 @@ class CryptoHistoricalDataClient(RESTClient):
             Union[SnapshotSet, RawData]: The snapshot data either in raw or wrapped form
         """
 
-        raw_snapshots = self._get_marketdata(
-            path=f"/crypto/{feed.value}/snapshots",
-            params=request_params.to_request_fields(),
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/crypto/{feed.value}/snapshots",
+                params=request_params.to_request_fields(),
+                model=Snapshot,
+                use_raw_data=self._use_raw_data,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_snapshots
-
-        return parse_obj_as_symbol_dict(Snapshot, raw_snapshots)
-
     # We override the _validate_credentials static method for crypto,
     # because crypto does not actually require authentication.
     @staticmethod
@@ -297,3 +413,363 @@ class CryptoHistoricalDataClient(RESTClient):
             )
 
         return api_key, secret_key, oauth_token
+
+
+class AsyncCryptoHistoricalDataClient(AsyncRESTClient):
+    """
+    An asyncio REST client for retrieving crypto market data.
+
+    Takes the same request models and returns the same response models as CryptoHistoricalDataClient, but every
+    endpoint method is a coroutine.
+
+    This client does not need any authentication to use.
+    You can instantiate it with or without API keys.
+
+    However, authenticating increases your data rate limit.
+
+    Learn more about crypto historical data here:
+    https://alpaca.markets/docs/api-references/market-data-api/crypto-pricing-data/historical/
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        oauth_token: Optional[str] = None,
+        raw_data: bool = False,
+        url_override: Optional[str] = None,
+        use_basic_auth: bool = False,
+        sandbox: bool = False,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        latest_cache: Optional[LatestDataCache] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Instantiates an asyncio Historical Data Client for Crypto Data.
+
+        Args:
+            api_key (Optional[str], optional): Alpaca API key. Defaults to None.
+            secret_key (Optional[str], optional): Alpaca API secret key. Defaults to None.
+            oauth_token (Optional[str]): The oauth token if authenticating via OAuth. Defaults to None.
+            raw_data (bool, optional): If true, API responses will not be wrapped and raw responses will be returned from
+              methods. Defaults to False. This has not been implemented yet.
+            url_override (Optional[str], optional): If specified allows you to override the base url the client points
+              to for proxy/testing.
+            use_basic_auth (bool, optional): If true, API requests will use basic authorization headers. Set to true if using
+              broker api sandbox credentials
+            sandbox (bool): True if using sandbox mode. Defaults to False.
+            http_client (Optional[httpx.AsyncClient]): An httpx client to send requests with, e.g. to share one
+              connection pool between several clients. Defaults to None.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests.
+              Defaults to None.
+            latest_cache (Optional[LatestDataCache]): A cache to serve latest data and snapshots from. Concurrent
+              requests for the same symbols share one API request. Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request
+              are reported to this sink, labeled with the templated endpoint. Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its
+              timings. Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, e.g. JSONBackend.ORJSON
+              for large market data pages. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed
+              transparently. Defaults to True.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
+        """
+
+        base_url = (
+            url_override
+            if url_override is not None
+            else BaseURL.DATA_SANDBOX if sandbox else BaseURL.DATA
+        )
+
+        super().__init__(
+            api_key=api_key,
+            secret_key=secret_key,
+            oauth_token=oauth_token,
+            api_version="v1beta3",
+            base_url=base_url,
+            sandbox=sandbox,
+            raw_data=raw_data,
+            use_basic_auth=use_basic_auth,
+            http_client=http_client,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            latest_cache=latest_cache,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            timeout=timeout,
+        )
+
+    async def get_crypto_bars(
+        self,
+        request_params: CryptoBarsRequest,
+        feed: CryptoFeed = CryptoFeed.US,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        BarSet, RawData, DataFrame, AsyncIterator[Union[BarSet, RawData, DataFrame]]
+    ]:
+        """Gets bar/candle data for a cryptocurrency or list of cryptocurrencies.
+
+        Args:
+            request_params (CryptoBarsRequest): The parameters for the request.
+            feed (CryptoFeed): The data feed for crypto bars.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
+
+        Returns:
+            Union[BarSet, RawData, DataFrame, AsyncIterator]: The crypto bar data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
+        """
+
+        # paginated get request for crypto market data api
+        return await self._fetch_marketdata(
+            series_query(
+                path=f"/crypto/{feed.value}/bars",
+                params=request_params.to_request_fields(),
+                data_set=BarSet,
+                model=Bar,
+                mapping=BAR_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
+        )
+
+    async def get_crypto_quotes(
+        self,
+        request_params: CryptoQuoteRequest,
+        feed: CryptoFeed = CryptoFeed.US,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        QuoteSet, RawData, DataFrame, AsyncIterator[Union[QuoteSet, RawData, DataFrame]]
+    ]:
+        """Returns the quote data for a cryptocurrency or list of cryptocurrencies.
+
+        Args:
+            request_params (CryptoQuoteRequest): The parameters for the request.
+            feed (CryptoFeed): The data feed for crypto quotes.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
+
+        Returns:
+            Union[QuoteSet, RawData, DataFrame, AsyncIterator]: The crypto quote data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
+        """
+
+        # paginated get request for market data api
+        return await self._fetch_marketdata(
+            series_query(
+                path=f"/crypto/{feed.value}/quotes",
+                params=request_params.to_request_fields(),
+                data_set=QuoteSet,
+                model=Quote,
+                mapping=QUOTE_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
+        )
+
+    async def get_crypto_trades(
+        self,
+        request_params: CryptoTradesRequest,
+        feed: CryptoFeed = CryptoFeed.US,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        TradeSet, RawData, DataFrame, AsyncIterator[Union[TradeSet, RawData, DataFrame]]
+    ]:
+        """Returns the price and sales history over a given time period for a cryptocurrency
+        or list of cryptocurrencies.
+
+        Args:
+            request_params (CryptoTradesRequest): The parameters for the request.
+            feed (CryptoFeed): The data feed for crypto trades.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
+
+        Returns:
+            Union[TradeSet, RawData, DataFrame, AsyncIterator]: The trade data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
+        """
+
+        # paginated get request for market data api
+        return await self._fetch_marketdata(
+            series_query(
+                path=f"/crypto/{feed.value}/trades",
+                params=request_params.to_request_fields(),
+                data_set=TradeSet,
+                model=Trade,
+                mapping=TRADE_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
+        )
+
+    async def get_crypto_latest_trade(
+        self, request_params: CryptoLatestTradeRequest, feed: CryptoFeed = CryptoFeed.US
+    ) -> Union[Dict[str, Trade], RawData]:
+        """Returns the latest trade for a coin.
+
+        Args:
+            request_params (CryptoLatestTradeRequest): The parameters for the request.
+            feed (CryptoFeed): The data feed for the latest crypto trade.
+
+        Returns:
+            Union[Dict[str, Trade], RawData]: The latest trade in raw or wrapped format
+        """
+
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/crypto/{feed.value}/latest/trades",
+                params=request_params.to_request_fields(),
+                model=Trade,
+                use_raw_data=self._use_raw_data,
+            )
+        )
+
+    async def get_crypto_latest_quote(
+        self, request_params: CryptoLatestQuoteRequest, feed: CryptoFeed = CryptoFeed.US
+    ) -> Union[Dict[str, Quote], RawData]:
+        """Returns the latest quote for a coin.
+
+        Args:
+            request_params (CryptoLatestQuoteRequest): The parameters for the request.
+            feed (CryptoFeed): The data feed for the latest crypto quote.
+
+        Returns:
+            Union[Dict[str, Quote], RawData]: The latest quote in raw or wrapped format
+        """
+
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/crypto/{feed.value}/latest/quotes",
+                params=request_params.to_request_fields(),
+                model=Quote,
+                use_raw_data=self._use_raw_data,
+            )
+        )
+
+    async def get_crypto_latest_bar(
+        self, request_params: CryptoLatestBarRequest, feed: CryptoFeed = CryptoFeed.US
+    ) -> Union[Dict[str, Bar], RawData]:
+        """Returns the latest minute bar for a coin.
+
+        Args:
+            request_params (CryptoLatestBarRequest): The parameters for the request.
+            feed (CryptoFeed): The data feed for the latest crypto bar.
+
+        Returns:
+            Union[Dict[str, Bar], RawData]: The latest bar in raw or wrapped format
+        """
+
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/crypto/{feed.value}/latest/bars",
+                params=request_params.to_request_fields(),
+                model=Bar,
+                use_raw_data=self._use_raw_data,
+            )
+        )
+
+    async def get_crypto_latest_orderbook(
+        self,
+        request_params: CryptoLatestOrderbookRequest,
+        feed: CryptoFeed = CryptoFeed.US,
+    ) -> Union[Dict[str, Orderbook], RawData]:
+        """
+        Returns the latest orderbook state for the queried crypto symbols.
+
+        Args:
+            request_params (CryptoOrderbookRequest): The parameters for the orderbook request.
+            feed (CryptoFeed): The data feed for the latest crypto orderbook.
+
+        Returns:
+            Union[Dict[str, Orderbook], RawData]: The orderbook data either in raw or wrapped form.
+        """
+
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/crypto/{feed.value}/latest/orderbooks",
+                params=request_params.to_request_fields(),
+                model=Orderbook,
+                use_raw_data=self._use_raw_data,
+            )
+        )
+
+    async def get_crypto_snapshot(
+        self, request_params: CryptoSnapshotRequest, feed: CryptoFeed = CryptoFeed.US
+    ) -> Union[Snapshot, RawData]:
+        """Returns snapshots of queried crypto symbols. Snapshots contain latest trade, latest quote, latest minute bar,
+        latest daily bar and previous daily bar data for the queried symbols.
+
+        Args:
+            request_params (CryptoSnapshotRequest): The parameters for the snapshot request.
+            feed (CryptoFeed): The data feed for crypto snapshots.
+
+        Returns:
+            Union[SnapshotSet, RawData]: The snapshot data either in raw or wrapped form
+        """
+
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/crypto/{feed.value}/snapshots",
+                params=request_params.to_request_fields(),
+                model=Snapshot,
+                use_raw_data=self._use_raw_data,
+            )
+        )
+
+    # crypto does not require authentication, see CryptoHistoricalDataClient
+    _validate_credentials = staticmethod(
+        CryptoHistoricalDataClient._validate_credentials
+    )
@@ -1,7 +1,14 @@
 from typing import Optional, Union
 
-from alpaca.common.enums import BaseURL
+from requests import Session
+
+from alpaca.common.enums import BaseURL, JSONBackend
+from alpaca.common.instrumentation import RequestHooks
+from alpaca.common.metrics import MetricsSink
+from alpaca.common.rate_limit import RateLimiter
+from alpaca.common.retry import RetryPolicy
 from alpaca.common.rest import RESTClient
+from alpaca.common.sessions import DEFAULT_TIMEOUT, Timeout
 from alpaca.common.types import RawData
 from alpaca.data.models.news import NewsSet
 from alpaca.data.requests import NewsRequest
@@ -21,6 +28,14 @@ class NewsClient(RESTClient):
         use_basic_auth: bool = False,
         raw_data: bool = False,
         url_override: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        session: Optional[Session] = None,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
     ) -> None:
         """
         Instantiates a Historical Data Client.
@@ -34,6 +49,23 @@ class NewsClient(RESTClient):
               methods. Defaults to False. This has not been implemented yet.
             url_override (Optional[str], optional): If specified allows you to override the base url the client points
               to for proxy/testing.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests.
+              Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request
+              are reported to this sink, labeled with the templated endpoint. Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its
+              timings. Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, e.g. JSONBackend.ORJSON
+              for large market data pages. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed
+              transparently. Defaults to True.
+            session (Optional[Session]): The requests session used to send requests, e.g. one made with
+              `create_session` to size its connection pool. Pass the same instance to several clients to share one
+              pool between them. Defaults to None.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
         """
         super().__init__(
             api_key=api_key,
@@ -44,6 +76,14 @@ class NewsClient(RESTClient):
             base_url=url_override if url_override is not None else BaseURL.DATA,
             sandbox=False,
             raw_data=raw_data,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            session=session,
+            timeout=timeout,
         )
 
     def get_news(self, request_params: NewsRequest) -> Union[RawData, NewsSet]:
@@ -1,13 +1,23 @@
+from datetime import timedelta
 from enum import Enum
-from typing import Dict, Optional, Union
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterator, Optional, Union
 
-from alpaca.common.enums import BaseURL
-from alpaca.common.rest import RESTClient
+from pandas import DataFrame
+
+from requests import Session
+
+from alpaca.common.enums import BaseURL, JSONBackend, PaginationType
+from alpaca.common.instrumentation import RequestHooks
+from alpaca.common.metrics import MetricsSink
+from alpaca.common.rate_limit import RateLimiter
+from alpaca.common.retry import RetryPolicy
+from alpaca.common.rest import AsyncRESTClient, MarketDataQuery, RESTClient
+from alpaca.common.sessions import DEFAULT_TIMEOUT, Timeout
 from alpaca.common.types import RawData
-from alpaca.data.historical.utils import (
-    parse_obj_as_symbol_dict,
-)
-from alpaca.data.models.bars import BarSet
+from alpaca.data.cache import LatestDataCache, MarketDataCache
+from alpaca.data.mappings import BAR_MAPPING, TRADE_MAPPING
+from alpaca.data.historical.utils import series_query, symbol_dict_query
+from alpaca.data.models.bars import Bar, BarSet
 from alpaca.data.models.quotes import Quote
 from alpaca.data.models.snapshots import OptionsSnapshot
 from alpaca.data.models.trades import Trade, TradeSet
@@ -20,6 +30,26 @@ from alpaca.data.requests import (
     OptionTradesRequest,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
+
+def _option_chain_query(
+    request_params: OptionChainRequest, use_raw_data: bool
+) -> MarketDataQuery:
+    """Builds the query of the option chain endpoint, which takes the underlying symbol in its path."""
+    params = request_params.to_request_fields()
+    del params["underlying_symbol"]
+
+    return symbol_dict_query(
+        path=f"/options/snapshots/{request_params.underlying_symbol}",
+        params=params,
+        model=OptionsSnapshot,
+        use_raw_data=use_raw_data,
+        page_limit=1000,
+        page_size=1000,
+    )
+
 
 class OptionHistoricalDataClient(RESTClient):
     """
@@ -37,6 +67,16 @@ class OptionHistoricalDataClient(RESTClient):
         raw_data: bool = False,
         url_override: Optional[str] = None,
         sandbox: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[MarketDataCache] = None,
+        latest_cache: Optional[LatestDataCache] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        session: Optional[Session] = None,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
     ) -> None:
         """
         Instantiates a Historical Data Client.
@@ -52,6 +92,27 @@ class OptionHistoricalDataClient(RESTClient):
             url_override (Optional[str], optional): If specified allows you to override the base url the client points
               to for proxy/testing.
             sandbox (bool): True if using sandbox mode. Defaults to False.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests.
+              Defaults to None.
+            cache (Optional[MarketDataCache]): A cache to serve historical bars, quotes and trades from, e.g. a
+              FileMarketDataCache. Only the time ranges that aren't cached are fetched. Defaults to None.
+            latest_cache (Optional[LatestDataCache]): A cache to serve latest data and snapshots from. Concurrent
+              requests for the same symbols share one API request. Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request
+              are reported to this sink, labeled with the templated endpoint. Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its
+              timings. Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, e.g. JSONBackend.ORJSON
+              for large market data pages. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed
+              transparently. Defaults to True.
+            session (Optional[Session]): The requests session used to send requests, e.g. one made with
+              `create_session` to size its connection pool. Pass the same instance to several clients to share one
+              pool between them. Defaults to None.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
         """
 
         base_url = (
@@ -69,33 +130,63 @@ class OptionHistoricalDataClient(RESTClient):
             base_url=base_url,
             sandbox=sandbox,
             raw_data=raw_data,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            marketdata_cache=cache,
+            latest_cache=latest_cache,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            session=session,
+            timeout=timeout,
         )
 
     def get_option_bars(
-        self, request_params: OptionBarsRequest
-    ) -> Union[BarSet, RawData]:
+        self,
+        request_params: OptionBarsRequest,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[BarSet, RawData, DataFrame, Iterator[Union[BarSet, RawData, DataFrame]]]:
         """Returns bar data for an option contract or list of option contracts over a given
         time period and timeframe.
 
         Args:
             request_params (OptionBarsRequest): The request object for retrieving option bar data.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
 
         Returns:
-            Union[BarSet, RawData]: The bar data either in raw or wrapped form
+            Union[BarSet, RawData, DataFrame, Iterator]: The bar data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
         """
 
         # paginated get request for market data api
-        raw_bars = self._get_marketdata(
-            path=f"/options/bars",
-            params=request_params.to_request_fields(),
-            page_size=10_000,
+        return self._fetch_marketdata(
+            series_query(
+                path=f"/options/bars",
+                params=request_params.to_request_fields(),
+                data_set=BarSet,
+                model=Bar,
+                mapping=BAR_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
         )
 
-        if self._use_raw_data:
-            return raw_bars
-
-        return BarSet(raw_bars)
-
     def get_option_exchange_codes(self) -> RawData:
         """Returns the mapping between the option exchange codes and the corresponding exchanges names.
 
@@ -124,16 +215,15 @@ class OptionHistoricalDataClient(RESTClient):
         Returns:
             Union[Dict[str, Quote], RawData]: The latest quote in raw or wrapped format
         """
-        raw_latest_quotes = self._get_marketdata(
-            path=f"/options/quotes/latest",
-            params=request_params.to_request_fields(),
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/options/quotes/latest",
+                params=request_params.to_request_fields(),
+                model=Quote,
+                use_raw_data=self._use_raw_data,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_latest_quotes
-
-        return parse_obj_as_symbol_dict(Quote, raw_latest_quotes)
-
     def get_option_latest_trade(
         self, request_params: OptionLatestTradeRequest
     ) -> Union[Dict[str, Trade], RawData]:
@@ -145,38 +235,59 @@ class OptionHistoricalDataClient(RESTClient):
         Returns:
             Union[Dict[str, Trade], RawData]: The latest trade in raw or wrapped format
         """
-        raw_latest_trades = self._get_marketdata(
-            path=f"/options/trades/latest",
-            params=request_params.to_request_fields(),
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/options/trades/latest",
+                params=request_params.to_request_fields(),
+                model=Trade,
+                use_raw_data=self._use_raw_data,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_latest_trades
-
-        return parse_obj_as_symbol_dict(Trade, raw_latest_trades)
-
     def get_option_trades(
-        self, request_params: OptionTradesRequest
-    ) -> Union[TradeSet, RawData]:
+        self,
+        request_params: OptionTradesRequest,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        TradeSet, RawData, DataFrame, Iterator[Union[TradeSet, RawData, DataFrame]]
+    ]:
         """The historical option trades API provides trade data for a list of contract symbols between the specified dates up to 7 days ago.
 
         Args:
             request_params (OptionTradesRequest): The request object for retrieving option trade data.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
 
         Returns:
-            Union[TradeSet, RawData]: The trade data either in raw or wrapped form
+            Union[TradeSet, RawData, DataFrame, Iterator]: The trade data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
         """
-        raw_trades = self._get_marketdata(
-            path=f"/options/trades",
-            params=request_params.to_request_fields(),
-            page_size=10_000,
+        return self._fetch_marketdata(
+            series_query(
+                path=f"/options/trades",
+                params=request_params.to_request_fields(),
+                data_set=TradeSet,
+                model=Trade,
+                mapping=TRADE_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
         )
 
-        if self._use_raw_data:
-            return raw_trades
-
-        return TradeSet(raw_trades)
-
     def get_option_snapshot(
         self, request_params: OptionSnapshotRequest
     ) -> Union[Dict[str, OptionsSnapshot], RawData]:
@@ -189,18 +300,17 @@ class OptionHistoricalDataClient(RESTClient):
         Returns:
             Union[Dict[str, OptionsSnapshot], RawData]: The snapshot data either in raw or wrapped form
         """
-        raw_snapshots = self._get_marketdata(
-            path=f"/options/snapshots",
-            params=request_params.to_request_fields(),
-            page_limit=1000,
-            page_size=1000,
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/options/snapshots",
+                params=request_params.to_request_fields(),
+                model=OptionsSnapshot,
+                use_raw_data=self._use_raw_data,
+                page_limit=1000,
+                page_size=1000,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_snapshots
-
-        return parse_obj_as_symbol_dict(OptionsSnapshot, raw_snapshots)
-
     def get_option_chain(
         self, request_params: OptionChainRequest
     ) -> Union[Dict[str, OptionsSnapshot], RawData]:
@@ -214,17 +324,284 @@ class OptionHistoricalDataClient(RESTClient):
             Union[Dict[str, OptionsSnapshot], RawData]: The snapshot data either in raw or wrapped form
         """
 
-        params = request_params.to_request_fields()
-        del params["underlying_symbol"]
+        return self._fetch_marketdata(
+            _option_chain_query(request_params, self._use_raw_data)
+        )
+
+
+class AsyncOptionHistoricalDataClient(AsyncRESTClient):
+    """
+    The asyncio REST client for interacting with Alpaca Market Data API option data endpoints.
+
+    Takes the same request models and returns the same response models as OptionHistoricalDataClient, but every
+    endpoint method is a coroutine.
+
+    Learn more on https://docs.alpaca.markets/docs/about-market-data-api
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        oauth_token: Optional[str] = None,
+        use_basic_auth: bool = False,
+        raw_data: bool = False,
+        url_override: Optional[str] = None,
+        sandbox: bool = False,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        latest_cache: Optional[LatestDataCache] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Instantiates an asyncio Historical Data Client.
+
+        Args:
+            api_key (Optional[str], optional): Alpaca API key. Defaults to None.
+            secret_key (Optional[str], optional): Alpaca API secret key. Defaults to None.
+            oauth_token (Optional[str]): The oauth token if authenticating via OAuth. Defaults to None.
+            use_basic_auth (bool, optional): If true, API requests will use basic authorization headers. Set to true if using
+              broker api sandbox credentials
+            raw_data (bool, optional): If true, API responses will not be wrapped and raw responses will be returned from
+              methods. Defaults to False. This has not been implemented yet.
+            url_override (Optional[str], optional): If specified allows you to override the base url the client points
+              to for proxy/testing.
+            sandbox (bool): True if using sandbox mode. Defaults to False.
+            http_client (Optional[httpx.AsyncClient]): An httpx client to send requests with, e.g. to share one
+              connection pool between several clients. Defaults to None.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests.
+              Defaults to None.
+            latest_cache (Optional[LatestDataCache]): A cache to serve latest data and snapshots from. Concurrent
+              requests for the same symbols share one API request. Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request
+              are reported to this sink, labeled with the templated endpoint. Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its
+              timings. Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, e.g. JSONBackend.ORJSON
+              for large market data pages. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed
+              transparently. Defaults to True.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
+        """
+
+        base_url = (
+            url_override
+            if url_override is not None
+            else BaseURL.DATA_SANDBOX if sandbox else BaseURL.DATA
+        )
+
+        super().__init__(
+            api_key=api_key,
+            secret_key=secret_key,
+            oauth_token=oauth_token,
+            use_basic_auth=use_basic_auth,
+            api_version="v1beta1",
+            base_url=base_url,
+            sandbox=sandbox,
+            raw_data=raw_data,
+            http_client=http_client,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            latest_cache=latest_cache,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            timeout=timeout,
+        )
+
+    async def get_option_bars(
+        self,
+        request_params: OptionBarsRequest,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        BarSet, RawData, DataFrame, AsyncIterator[Union[BarSet, RawData, DataFrame]]
+    ]:
+        """Returns bar data for an option contract or list of option contracts over a given
+        time period and timeframe.
+
+        Args:
+            request_params (OptionBarsRequest): The request object for retrieving option bar data.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
+
+        Returns:
+            Union[BarSet, RawData, DataFrame, AsyncIterator]: The bar data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
+        """
+
+        # paginated get request for market data api
+        return await self._fetch_marketdata(
+            series_query(
+                path=f"/options/bars",
+                params=request_params.to_request_fields(),
+                data_set=BarSet,
+                model=Bar,
+                mapping=BAR_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
+        )
+
+    async def get_option_exchange_codes(self) -> RawData:
+        """Returns the mapping between the option exchange codes and the corresponding exchanges names.
+
+        Args:
+            None
 
-        raw_snapshots = self._get_marketdata(
-            path=f"/options/snapshots/{request_params.underlying_symbol}",
-            params=params,
-            page_limit=1000,
-            page_size=1000,
+        Returns:
+            RawData: The mapping between the option exchange codes and the corresponding exchanges names.
+        """
+        path = "/options/meta/exchanges"
+        raw_exchange_code = await self.get(
+            path=path,
+            api_version=self._api_version,
         )
 
-        if self._use_raw_data:
-            return raw_snapshots
+        return raw_exchange_code
 
-        return parse_obj_as_symbol_dict(OptionsSnapshot, raw_snapshots)
+    async def get_option_latest_quote(
+        self, request_params: OptionLatestQuoteRequest
+    ) -> Union[Dict[str, Quote], RawData]:
+        """Retrieves the latest quote for an option symbol or list of option symbols.
+
+        Args:
+            request_params (OptionLatestQuoteRequest): The request object for retrieving the latest quote data.
+
+        Returns:
+            Union[Dict[str, Quote], RawData]: The latest quote in raw or wrapped format
+        """
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/options/quotes/latest",
+                params=request_params.to_request_fields(),
+                model=Quote,
+                use_raw_data=self._use_raw_data,
+            )
+        )
+
+    async def get_option_latest_trade(
+        self, request_params: OptionLatestTradeRequest
+    ) -> Union[Dict[str, Trade], RawData]:
+        """Retrieves the latest trade for an option symbol or list of option symbols.
+
+        Args:
+            request_params (OptionLatestTradeRequest): The request object for retrieving the latest trade data.
+
+        Returns:
+            Union[Dict[str, Trade], RawData]: The latest trade in raw or wrapped format
+        """
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/options/trades/latest",
+                params=request_params.to_request_fields(),
+                model=Trade,
+                use_raw_data=self._use_raw_data,
+            )
+        )
+
+    async def get_option_trades(
+        self,
+        request_params: OptionTradesRequest,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        TradeSet, RawData, DataFrame, AsyncIterator[Union[TradeSet, RawData, DataFrame]]
+    ]:
+        """The historical option trades API provides trade data for a list of contract symbols between the specified dates up to 7 days ago.
+
+        Args:
+            request_params (OptionTradesRequest): The request object for retrieving option trade data.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
+
+        Returns:
+            Union[TradeSet, RawData, DataFrame, AsyncIterator]: The trade data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
+        """
+        return await self._fetch_marketdata(
+            series_query(
+                path=f"/options/trades",
+                params=request_params.to_request_fields(),
+                data_set=TradeSet,
+                model=Trade,
+                mapping=TRADE_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
+        )
+
+    async def get_option_snapshot(
+        self, request_params: OptionSnapshotRequest
+    ) -> Union[Dict[str, OptionsSnapshot], RawData]:
+        """Returns snapshots of queried symbols. OptionsSnapshot contain latest trade,
+        latest quote, implied volatility, and greeks for the queried symbols.
+
+        Args:
+            request_params (OptionSnapshotRequest): The request object for retrieving snapshot data.
+
+        Returns:
+            Union[Dict[str, OptionsSnapshot], RawData]: The snapshot data either in raw or wrapped form
+        """
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path=f"/options/snapshots",
+                params=request_params.to_request_fields(),
+                model=OptionsSnapshot,
+                use_raw_data=self._use_raw_data,
+                page_limit=1000,
+                page_size=1000,
+            )
+        )
+
+    async def get_option_chain(
+        self, request_params: OptionChainRequest
+    ) -> Union[Dict[str, OptionsSnapshot], RawData]:
+        """The option chain endpoint for underlying symbol provides the latest trade, latest quote,
+        implied volatility, and greeks for each contract symbol of the underlying symbol.
+
+        Args:
+            request_params (OptionChainRequest): The request object for retrieving snapshot data.
+
+        Returns:
+            Union[Dict[str, OptionsSnapshot], RawData]: The snapshot data either in raw or wrapped form
+        """
+
+        return await self._fetch_marketdata(
+            _option_chain_query(request_params, self._use_raw_data)
+        )
@@ -1,15 +1,25 @@
 from collections import defaultdict
+from datetime import timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterator, List, Optional, Union
+
+from pandas import DataFrame
+
+from requests import Session
 
 from alpaca.common.constants import DATA_V2_MAX_LIMIT
-from alpaca.common.enums import BaseURL
-from alpaca.common.rest import RESTClient
+from alpaca.common.enums import BaseURL, JSONBackend, PaginationType
+from alpaca.common.instrumentation import RequestHooks
+from alpaca.common.metrics import MetricsSink
+from alpaca.common.rate_limit import RateLimiter
+from alpaca.common.retry import RetryPolicy
+from alpaca.common.rest import AsyncRESTClient, RESTClient
+from alpaca.common.sessions import DEFAULT_TIMEOUT, Timeout
 from alpaca.common.types import RawData
 from alpaca.data import Bar, Quote, Snapshot, Trade
-from alpaca.data.historical.utils import (
-    parse_obj_as_symbol_dict,
-)
+from alpaca.data.cache import LatestDataCache, MarketDataCache
+from alpaca.data.mappings import BAR_MAPPING, QUOTE_MAPPING, TRADE_MAPPING
+from alpaca.data.historical.utils import series_query, symbol_dict_query
 from alpaca.data.models import BarSet, QuoteSet, TradeSet
 from alpaca.data.requests import (
     StockBarsRequest,
@@ -21,6 +31,9 @@ from alpaca.data.requests import (
     StockTradesRequest,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
 
 class StockHistoricalDataClient(RESTClient):
     """
@@ -38,6 +51,16 @@ class StockHistoricalDataClient(RESTClient):
         raw_data: bool = False,
         url_override: Optional[str] = None,
         sandbox: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[MarketDataCache] = None,
+        latest_cache: Optional[LatestDataCache] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        session: Optional[Session] = None,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
     ) -> None:
         """
         Instantiates a Historical Data Client.
@@ -53,6 +76,27 @@ class StockHistoricalDataClient(RESTClient):
             url_override (Optional[str], optional): If specified allows you to override the base url the client points
               to for proxy/testing.
             sandbox (bool): True if using sandbox mode. Defaults to False.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests.
+              Defaults to None.
+            cache (Optional[MarketDataCache]): A cache to serve historical bars, quotes and trades from, e.g. a
+              FileMarketDataCache. Only the time ranges that aren't cached are fetched. Defaults to None.
+            latest_cache (Optional[LatestDataCache]): A cache to serve latest data and snapshots from. Concurrent
+              requests for the same symbols share one API request. Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request
+              are reported to this sink, labeled with the templated endpoint. Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its
+              timings. Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, e.g. JSONBackend.ORJSON
+              for large market data pages. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed
+              transparently. Defaults to True.
+            session (Optional[Session]): The requests session used to send requests, e.g. one made with
+              `create_session` to size its connection pool. Pass the same instance to several clients to share one
+              pool between them. Defaults to None.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
         """
 
         base_url = (
@@ -70,75 +114,149 @@ class StockHistoricalDataClient(RESTClient):
             base_url=base_url,
             sandbox=sandbox,
             raw_data=raw_data,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            marketdata_cache=cache,
+            latest_cache=latest_cache,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            session=session,
+            timeout=timeout,
         )
 
     def get_stock_bars(
-        self, request_params: StockBarsRequest
-    ) -> Union[BarSet, RawData]:
+        self,
+        request_params: StockBarsRequest,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[BarSet, RawData, DataFrame, Iterator[Union[BarSet, RawData, DataFrame]]]:
         """Returns bar data for an equity or list of equities over a given
         time period and timeframe.
 
         Args:
             request_params (GetStockBarsRequest): The request object for retrieving stock bar data.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
 
         Returns:
-            Union[BarSet, RawData]: The bar data either in raw or wrapped form
+            Union[BarSet, RawData, DataFrame, Iterator]: The bar data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
         """
-        raw_bars = self._get_marketdata(
-            path="/stocks/bars",
-            params=request_params.to_request_fields(),
-            page_size=10_000,
+        return self._fetch_marketdata(
+            series_query(
+                path="/stocks/bars",
+                params=request_params.to_request_fields(),
+                data_set=BarSet,
+                model=Bar,
+                mapping=BAR_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
         )
 
-        if self._use_raw_data:
-            return raw_bars
-
-        return BarSet(raw_bars)
-
     def get_stock_quotes(
-        self, request_params: StockQuotesRequest
-    ) -> Union[QuoteSet, RawData]:
+        self,
+        request_params: StockQuotesRequest,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        QuoteSet, RawData, DataFrame, Iterator[Union[QuoteSet, RawData, DataFrame]]
+    ]:
         """Returns level 1 quote data over a given time period for a security or list of securities.
 
         Args:
             request_params (GetStockQuotesRequest): The request object for retrieving stock quote data.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
 
         Returns:
-            Union[QuoteSet, RawData]: The quote data either in raw or wrapped form
+            Union[QuoteSet, RawData, DataFrame, Iterator]: The quote data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
         """
-        raw_quotes = self._get_marketdata(
-            path="/stocks/quotes",
-            params=request_params.to_request_fields(),
-            page_size=10_000,
+        return self._fetch_marketdata(
+            series_query(
+                path="/stocks/quotes",
+                params=request_params.to_request_fields(),
+                data_set=QuoteSet,
+                model=Quote,
+                mapping=QUOTE_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
         )
 
-        if self._use_raw_data:
-            return raw_quotes
-
-        return QuoteSet(raw_quotes)
-
     def get_stock_trades(
-        self, request_params: StockTradesRequest
-    ) -> Union[TradeSet, RawData]:
+        self,
+        request_params: StockTradesRequest,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        TradeSet, RawData, DataFrame, Iterator[Union[TradeSet, RawData, DataFrame]]
+    ]:
         """Returns the price and sales history over a given time period for a security or list of securities.
 
         Args:
             request_params (GetStockTradesRequest): The request object for retrieving stock trade data.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
 
         Returns:
-            Union[TradeSet, RawData]: The trade data either in raw or wrapped form
+            Union[TradeSet, RawData, DataFrame, Iterator]: The trade data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
         """
-        raw_trades = self._get_marketdata(
-            path="/stocks/trades",
-            params=request_params.to_request_fields(),
-            page_size=10_000,
+        return self._fetch_marketdata(
+            series_query(
+                path="/stocks/trades",
+                params=request_params.to_request_fields(),
+                data_set=TradeSet,
+                model=Trade,
+                mapping=TRADE_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
         )
 
-        if self._use_raw_data:
-            return raw_trades
-
-        return TradeSet(raw_trades)
-
     def get_stock_latest_trade(
         self, request_params: StockLatestTradeRequest
     ) -> Union[Dict[str, Trade], RawData]:
@@ -150,16 +268,15 @@ class StockHistoricalDataClient(RESTClient):
         Returns:
             Union[Dict[str, Trade], RawData]: The latest trade in raw or wrapped format
         """
-        raw_latest_trades = self._get_marketdata(
-            path="/stocks/trades/latest",
-            params=request_params.to_request_fields(),
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path="/stocks/trades/latest",
+                params=request_params.to_request_fields(),
+                model=Trade,
+                use_raw_data=self._use_raw_data,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_latest_trades
-
-        return parse_obj_as_symbol_dict(Trade, raw_latest_trades)
-
     def get_stock_latest_quote(
         self, request_params: StockLatestQuoteRequest
     ) -> Union[Dict[str, Quote], RawData]:
@@ -171,16 +288,15 @@ class StockHistoricalDataClient(RESTClient):
         Returns:
             Union[Dict[str, Quote], RawData]: The latest quote in raw or wrapped format
         """
-        raw_latest_quotes = self._get_marketdata(
-            path="/stocks/quotes/latest",
-            params=request_params.to_request_fields(),
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path="/stocks/quotes/latest",
+                params=request_params.to_request_fields(),
+                model=Quote,
+                use_raw_data=self._use_raw_data,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_latest_quotes
-
-        return parse_obj_as_symbol_dict(Quote, raw_latest_quotes)
-
     def get_stock_latest_bar(
         self, request_params: StockLatestBarRequest
     ) -> Union[Dict[str, Bar], RawData]:
@@ -192,16 +308,15 @@ class StockHistoricalDataClient(RESTClient):
         Returns:
             Union[Dict[str, Bar], RawData]: The latest minute bar in raw or wrapped format
         """
-        raw_latest_bars = self._get_marketdata(
-            path="/stocks/bars/latest",
-            params=request_params.to_request_fields(),
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path="/stocks/bars/latest",
+                params=request_params.to_request_fields(),
+                model=Bar,
+                use_raw_data=self._use_raw_data,
+            )
         )
 
-        if self._use_raw_data:
-            return raw_latest_bars
-
-        return parse_obj_as_symbol_dict(Bar, raw_latest_bars)
-
     def get_stock_snapshot(
         self, request_params: StockSnapshotRequest
     ) -> Union[Dict[str, Snapshot], RawData]:
@@ -214,13 +329,317 @@ class StockHistoricalDataClient(RESTClient):
         Returns:
             Union[SnapshotSet, RawData]: The snapshot data either in raw or wrapped form
         """
-        raw_snapshots = self._get_marketdata(
-            path="/stocks/snapshots",
-            params=request_params.to_request_fields(),
-            no_sub_key=True,
+        return self._fetch_marketdata(
+            symbol_dict_query(
+                path="/stocks/snapshots",
+                params=request_params.to_request_fields(),
+                model=Snapshot,
+                use_raw_data=self._use_raw_data,
+                no_sub_key=True,
+            )
+        )
+
+
+class AsyncStockHistoricalDataClient(AsyncRESTClient):
+    """
+    The asyncio REST client for interacting with Alpaca Market Data API stock data endpoints.
+
+    Takes the same request models and returns the same response models as StockHistoricalDataClient, but every
+    endpoint method is a coroutine.
+
+    Learn more on https://alpaca.markets/docs/market-data/
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        oauth_token: Optional[str] = None,
+        use_basic_auth: bool = False,
+        raw_data: bool = False,
+        url_override: Optional[str] = None,
+        sandbox: bool = False,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        latest_cache: Optional[LatestDataCache] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Instantiates an asyncio Historical Data Client.
+
+        Args:
+            api_key (Optional[str], optional): Alpaca API key. Defaults to None.
+            secret_key (Optional[str], optional): Alpaca API secret key. Defaults to None.
+            oauth_token (Optional[str]): The oauth token if authenticating via OAuth. Defaults to None.
+            use_basic_auth (bool, optional): If true, API requests will use basic authorization headers. Set to true if using
+              broker api sandbox credentials
+            raw_data (bool, optional): If true, API responses will not be wrapped and raw responses will be returned from
+              methods. Defaults to False. This has not been implemented yet.
+            url_override (Optional[str], optional): If specified allows you to override the base url the client points
+              to for proxy/testing.
+            sandbox (bool): True if using sandbox mode. Defaults to False.
+            http_client (Optional[httpx.AsyncClient]): An httpx client to send requests with, e.g. to share one
+              connection pool between several clients. Defaults to None.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests.
+              Defaults to None.
+            latest_cache (Optional[LatestDataCache]): A cache to serve latest data and snapshots from. Concurrent
+              requests for the same symbols share one API request. Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request
+              are reported to this sink, labeled with the templated endpoint. Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its
+              timings. Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, e.g. JSONBackend.ORJSON
+              for large market data pages. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed
+              transparently. Defaults to True.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
+        """
+
+        base_url = (
+            url_override
+            if url_override is not None
+            else BaseURL.DATA_SANDBOX if sandbox else BaseURL.DATA
+        )
+
+        super().__init__(
+            api_key=api_key,
+            secret_key=secret_key,
+            oauth_token=oauth_token,
+            use_basic_auth=use_basic_auth,
+            api_version="v2",
+            base_url=base_url,
+            sandbox=sandbox,
+            raw_data=raw_data,
+            http_client=http_client,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            latest_cache=latest_cache,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            timeout=timeout,
+        )
+
+    async def get_stock_bars(
+        self,
+        request_params: StockBarsRequest,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        BarSet, RawData, DataFrame, AsyncIterator[Union[BarSet, RawData, DataFrame]]
+    ]:
+        """Returns bar data for an equity or list of equities over a given
+        time period and timeframe.
+
+        Args:
+            request_params (GetStockBarsRequest): The request object for retrieving stock bar data.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
+
+        Returns:
+            Union[BarSet, RawData, DataFrame, AsyncIterator]: The bar data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
+        """
+        return await self._fetch_marketdata(
+            series_query(
+                path="/stocks/bars",
+                params=request_params.to_request_fields(),
+                data_set=BarSet,
+                model=Bar,
+                mapping=BAR_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
         )
 
-        if self._use_raw_data:
-            return raw_snapshots
+    async def get_stock_quotes(
+        self,
+        request_params: StockQuotesRequest,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        QuoteSet, RawData, DataFrame, AsyncIterator[Union[QuoteSet, RawData, DataFrame]]
+    ]:
+        """Returns level 1 quote data over a given time period for a security or list of securities.
+
+        Args:
+            request_params (GetStockQuotesRequest): The request object for retrieving stock quote data.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
+
+        Returns:
+            Union[QuoteSet, RawData, DataFrame, AsyncIterator]: The quote data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
+        """
+        return await self._fetch_marketdata(
+            series_query(
+                path="/stocks/quotes",
+                params=request_params.to_request_fields(),
+                data_set=QuoteSet,
+                model=Quote,
+                mapping=QUOTE_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
+        )
+
+    async def get_stock_trades(
+        self,
+        request_params: StockTradesRequest,
+        max_workers: Optional[int] = None,
+        time_slice: Optional[timedelta] = None,
+        as_frame: bool = False,
+        handle_pagination: Optional[PaginationType] = None,
+    ) -> Union[
+        TradeSet, RawData, DataFrame, AsyncIterator[Union[TradeSet, RawData, DataFrame]]
+    ]:
+        """Returns the price and sales history over a given time period for a security or list of securities.
+
+        Args:
+            request_params (GetStockTradesRequest): The request object for retrieving stock trade data.
+            max_workers (Optional[int]): If set, the request is split into one request per symbol (and per
+              `time_slice`) which are fetched in parallel by up to this many workers and merged. Defaults to None.
+            time_slice (Optional[timedelta]): If set together with `max_workers`, the time range of each symbol is
+              also split into slices of at most this length. Requires `start` to be set. Defaults to None.
+            as_frame (bool): If True, the pages are decoded straight into a DataFrame indexed by symbol and timestamp,
+              without building a model per row. Takes precedence over `raw_data`. Defaults to False.
+            handle_pagination (Optional[PaginationType]): What kind of pagination you want. If None then defaults to
+              `PaginationType.FULL`. `PaginationType.ITERATOR` yields the data one page at a time as it is fetched,
+              and `PaginationType.NONE` only fetches the first page. Only FULL can be combined with `max_workers`.
+
+        Returns:
+            Union[TradeSet, RawData, DataFrame, AsyncIterator]: The trade data either in raw or wrapped form,
+              or a DataFrame if `as_frame` is set. An iterator of those per page for
+              `PaginationType.ITERATOR`.
+        """
+        return await self._fetch_marketdata(
+            series_query(
+                path="/stocks/trades",
+                params=request_params.to_request_fields(),
+                data_set=TradeSet,
+                model=Trade,
+                mapping=TRADE_MAPPING,
+                use_raw_data=self._use_raw_data,
+                as_frame=as_frame,
+            ),
+            max_workers=max_workers,
+            time_slice=time_slice,
+            handle_pagination=handle_pagination,
+        )
+
+    async def get_stock_latest_trade(
+        self, request_params: StockLatestTradeRequest
+    ) -> Union[Dict[str, Trade], RawData]:
+        """Retrieves the latest trade for an equity symbol or list of equities.
+
+        Args:
+            request_params (StockLatestTradeRequest): The request object for retrieving the latest trade data.
+
+        Returns:
+            Union[Dict[str, Trade], RawData]: The latest trade in raw or wrapped format
+        """
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path="/stocks/trades/latest",
+                params=request_params.to_request_fields(),
+                model=Trade,
+                use_raw_data=self._use_raw_data,
+            )
+        )
 
-        return parse_obj_as_symbol_dict(Snapshot, raw_snapshots)
+    async def get_stock_latest_quote(
+        self, request_params: StockLatestQuoteRequest
+    ) -> Union[Dict[str, Quote], RawData]:
+        """Retrieves the latest quote for an equity symbol or list of equity symbols.
+
+        Args:
+            request_params (StockLatestQuoteRequest): The request object for retrieving the latest quote data.
+
+        Returns:
+            Union[Dict[str, Quote], RawData]: The latest quote in raw or wrapped format
+        """
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path="/stocks/quotes/latest",
+                params=request_params.to_request_fields(),
+                model=Quote,
+                use_raw_data=self._use_raw_data,
+            )
+        )
+
+    async def get_stock_latest_bar(
+        self, request_params: StockLatestBarRequest
+    ) -> Union[Dict[str, Bar], RawData]:
+        """Retrieves the latest minute bar for an equity symbol or list of equity symbols.
+
+        Args:
+            request_params (StockLatestBarRequest): The request object for retrieving the latest bar data.
+
+        Returns:
+            Union[Dict[str, Bar], RawData]: The latest minute bar in raw or wrapped format
+        """
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path="/stocks/bars/latest",
+                params=request_params.to_request_fields(),
+                model=Bar,
+                use_raw_data=self._use_raw_data,
+            )
+        )
+
+    async def get_stock_snapshot(
+        self, request_params: StockSnapshotRequest
+    ) -> Union[Dict[str, Snapshot], RawData]:
+        """Returns snapshots of queried symbols. Snapshots contain latest trade, latest quote, latest minute bar,
+        latest daily bar and previous daily bar data for the queried symbols.
+
+        Args:
+            request_params (StockSnapshotRequest): The request object for retrieving snapshot data.
+
+        Returns:
+            Union[SnapshotSet, RawData]: The snapshot data either in raw or wrapped form
+        """
+        return await self._fetch_marketdata(
+            symbol_dict_query(
+                path="/stocks/snapshots",
+                params=request_params.to_request_fields(),
+                model=Snapshot,
+                use_raw_data=self._use_raw_data,
+                no_sub_key=True,
+            )
+        )
@@ -1,7 +1,10 @@
 from collections import defaultdict
-from typing import Dict, Type
+from functools import partial
+from typing import Any, Callable, Dict, Type
 
 from alpaca.common import HTTPResult, RawData
+from alpaca.common.rest import MarketDataQuery
+from alpaca.data.columnar import MarketDataColumns
 
 """
 These functions were created and put in this file to handle all of the edge cases
@@ -28,3 +31,99 @@ def parse_obj_as_symbol_dict(model: Type, raw_data: RawData) -> Dict[str, Type]:
     return {
         k: model(symbol=k, raw_data=v) for k, v in raw_data.items() if v is not None
     }
+
+
+def wrap_marketdata(
+    result: Any,
+    data_set: Callable[[RawData], Any],
+    use_raw_data: bool,
+    as_frame: bool,
+) -> Any:
+    """
+    Wraps the result of a paginated market data request, or of one of its pages, in the form the caller asked for.
+
+    Args:
+        result (Any): The raw entries keyed by symbol, or the columns they were decoded into if `as_frame` is set.
+        data_set (Callable[[RawData], Any]): The data set to wrap raw entries in, e.g. BarSet.
+        use_raw_data (bool): Whether the client returns raw data.
+        as_frame (bool): Whether the entries were decoded into columns to return as a DataFrame.
+
+    Returns:
+        Any: The DataFrame, raw data or data set
+    """
+    if as_frame:
+        return result.to_frame()
+
+    if use_raw_data:
+        return result
+
+    return data_set(result)
+
+
+def series_query(
+    path: str,
+    params: Dict[str, Any],
+    data_set: Callable[[RawData], Any],
+    model: Type,
+    mapping: Dict[str, str],
+    use_raw_data: bool,
+    as_frame: bool,
+) -> MarketDataQuery:
+    """
+    Builds the query of a paginated bars, quotes or trades endpoint, shared by a data client and its async twin.
+
+    Args:
+        path (str): The API endpoint path.
+        params (Dict[str, Any]): The query parameters.
+        data_set (Callable[[RawData], Any]): The data set to wrap raw entries in, e.g. BarSet.
+        model (Type): The model of a single entry, e.g. Bar.
+        mapping (Dict[str, str]): The mapping of the entry's model fields to the API's keys, e.g. BAR_MAPPING.
+        use_raw_data (bool): Whether the client returns raw data.
+        as_frame (bool): Whether to decode the entries into columns to return as a DataFrame.
+
+    Returns:
+        MarketDataQuery: The query
+    """
+    return MarketDataQuery(
+        path=path,
+        params=params,
+        wrap=partial(
+            wrap_marketdata,
+            data_set=data_set,
+            use_raw_data=use_raw_data,
+            as_frame=as_frame,
+        ),
+        page_size=10_000,
+        decoder_factory=(
+            partial(MarketDataColumns, mapping, model) if as_frame else None
+        ),
+    )
+
+
+def symbol_dict_query(
+    path: str, params: Dict[str, Any], model: Type, use_raw_data: bool, **kwargs
+) -> MarketDataQuery:
+    """
+    Builds the query of an endpoint returning one entry per symbol, e.g. latest data or snapshots, shared by a data
+    client and its async twin.
+
+    Args:
+        path (str): The API endpoint path.
+        params (Dict[str, Any]): The query parameters.
+        model (Type): The model to parse the entry of each symbol into.
+        use_raw_data (bool): Whether the client returns raw data.
+        kwargs: Any other MarketDataQuery parameters, e.g. page_size.
+
+    Returns:
+        MarketDataQuery: The query
+    """
+    if use_raw_data:
+        wrap = _identity
+    else:
+        wrap = partial(parse_obj_as_symbol_dict, model)
+
+    return MarketDataQuery(path=path, params=params, wrap=wrap, **kwargs)
+
+
+def _identity(raw_data: RawData) -> RawData:
+    return raw_data
@@ -1,11 +1,13 @@
 from alpaca.data.live.crypto import CryptoDataStream
 from alpaca.data.live.news import NewsDataStream
 from alpaca.data.live.option import OptionDataStream
+from alpaca.data.live.sharding import ShardedDataStream
 from alpaca.data.live.stock import StockDataStream
 
 __all__ = [
     "CryptoDataStream",
     "NewsDataStream",
     "OptionDataStream",
+    "ShardedDataStream",
     "StockDataStream",
 ]
@@ -1,7 +1,11 @@
 from typing import Awaitable, Callable, Dict, Optional, Union
 
 from alpaca.common.enums import BaseURL
-from alpaca.data.enums import CryptoFeed
+from alpaca.common.metrics import MetricsSink
+from alpaca.common.retry import ReconnectPolicy
+from alpaca.data.enums import CryptoFeed, OverflowPolicy
+from alpaca.data.live.dispatch import DEFAULT_DISPATCH_QUEUE_SIZE, MessageIterator
+from alpaca.data.live.health import StreamGap
 from alpaca.data.live.websocket import DataStream
 from alpaca.data.models.bars import Bar
 from alpaca.data.models.orderbooks import Orderbook
@@ -22,6 +26,15 @@ class CryptoDataStream(DataStream):
         feed: CryptoFeed = CryptoFeed.US,
         url_override: Optional[str] = None,
         websocket_params: Optional[Dict] = None,
+        dispatch_workers: Optional[int] = None,
+        dispatch_queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        tick_records: bool = False,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        stale_timeouts: Optional[Dict[str, float]] = None,
+        gap_handler: Optional[Callable[[StreamGap], Awaitable[None]]] = None,
+        record_path: Optional[str] = None,
+        metrics_sink: Optional[MetricsSink] = None,
     ) -> None:
         """
         Instantiates a WebSocket client for accessing live cryptocurrency data.
@@ -34,6 +47,23 @@ class CryptoDataStream(DataStream):
             websocket_params (Optional[Dict], optional): Any parameters for configuring websocket connection. Defaults to None.
             url_override (Optional[str]): If specified allows you to override the base url the client
               points to for proxy/testing. Defaults to None.
+            dispatch_workers (Optional[int]): If set, messages are queued as they are read and handled by this many
+              worker tasks, so slow handlers don't hold up reading the socket. Defaults to None.
+            dispatch_queue_size (int): The maximum number of queued messages per worker.
+            overflow_policy (OverflowPolicy): What to do with a new message when its queue is full. Defaults to
+              waiting for the handlers.
+            tick_records (bool): Whether trades, quotes and bars are delivered as lightweight TradeTick, QuoteTick
+              and BarTick records with integer nanosecond timestamps, built without validation. Defaults to False.
+            reconnect_policy (Optional[ReconnectPolicy]): When to reconnect after the connection is lost.
+              Defaults to exponential backoff with jitter, reconnecting forever.
+            stale_timeouts (Optional[Dict[str, float]]): The number of seconds each channel, e.g. "trades",
+              may go without a message before the connection is reopened. Defaults to None.
+            gap_handler (Optional[Callable[[StreamGap], Awaitable[None]]]): A coroutine called with the
+              data each channel may have missed while reconnecting. Defaults to None.
+            record_path (Optional[str]): If set, every frame received is appended to a gzip compressed log at
+              this path, which `replay` can feed back through the handlers. Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the stream reports message counts, sizes, timings
+              and latencies per channel to this sink. Defaults to None.
         """
         super().__init__(
             endpoint=(
@@ -45,10 +75,24 @@ class CryptoDataStream(DataStream):
             secret_key=secret_key,
             raw_data=raw_data,
             websocket_params=websocket_params,
+            dispatch_workers=dispatch_workers,
+            dispatch_queue_size=dispatch_queue_size,
+            overflow_policy=overflow_policy,
+            tick_records=tick_records,
+            reconnect_policy=reconnect_policy,
+            stale_timeouts=stale_timeouts,
+            gap_handler=gap_handler,
+            record_path=record_path,
+            metrics_sink=metrics_sink,
         )
 
     def subscribe_trades(
-        self, handler: Callable[[Union[Trade, Dict]], Awaitable[None]], *symbols: str
+        self,
+        handler: Callable[[Union[Trade, Dict]], Awaitable[None]],
+        *symbols: str,
+        batch: bool = False,
+        batch_window: Optional[float] = None,
+        columnar: bool = False,
     ) -> None:
         """Subscribe to trades.
 
@@ -56,11 +100,30 @@ class CryptoDataStream(DataStream):
             handler (Callable[[Union[Trade, Dict]], Awaitable[None]): The coroutine callback
                 function to handle the incoming data.
             *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            batch (bool): Whether the handler is called with a list of the trades that arrived together, at least
+                the trades of one websocket message, instead of once per trade. Defaults to False.
+            batch_window (Optional[float]): If set, the number of seconds to collect a batch of trades for.
+                Defaults to None.
+            columnar (bool): Whether a batch is a dict of numpy arrays keyed by field instead of a list, with
+                timestamps as integer nanoseconds. Defaults to False.
         """
-        self._subscribe(handler, symbols, self._handlers["trades"])
+        self._subscribe(
+            handler,
+            symbols,
+            self._handlers["trades"],
+            batch=batch,
+            batch_window=batch_window,
+            columnar=columnar,
+        )
 
     def subscribe_quotes(
-        self, handler: Callable[[Union[Quote, Dict]], Awaitable[None]], *symbols: str
+        self,
+        handler: Callable[[Union[Quote, Dict]], Awaitable[None]],
+        *symbols: str,
+        conflate: bool = False,
+        batch: bool = False,
+        batch_window: Optional[float] = None,
+        columnar: bool = False,
     ) -> None:
         """Subscribe to quotes
 
@@ -68,11 +131,33 @@ class CryptoDataStream(DataStream):
             handler (Callable[[Union[Quote, Dict]], Awaitable[None]]): The coroutine callback
                 function to handle the incoming data.
             *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            conflate (bool): Whether the handler only receives the latest quote of each symbol. Quotes that
+                arrive while the handler is busy replace the pending quote of their symbol. Defaults to False.
+            batch (bool): Whether the handler is called with a list of the quotes that arrived together, at least
+                the quotes of one websocket message, instead of once per quote. With `conflate`, a dict of the
+                latest quote of each symbol instead. Defaults to False.
+            batch_window (Optional[float]): If set, the number of seconds to collect a batch of quotes for. Can't be
+                used with `conflate`. Defaults to None.
+            columnar (bool): Whether a batch is a dict of numpy arrays keyed by field instead of a list, with
+                timestamps as integer nanoseconds. Can't be used with `conflate`. Defaults to False.
         """
-        self._subscribe(handler, symbols, self._handlers["quotes"])
+        self._subscribe(
+            handler,
+            symbols,
+            self._handlers["quotes"],
+            conflate=conflate,
+            batch=batch,
+            batch_window=batch_window,
+            columnar=columnar,
+        )
 
     def subscribe_bars(
-        self, handler: Callable[[Union[Bar, Dict]], Awaitable[None]], *symbols: str
+        self,
+        handler: Callable[[Union[Bar, Dict]], Awaitable[None]],
+        *symbols: str,
+        batch: bool = False,
+        batch_window: Optional[float] = None,
+        columnar: bool = False,
     ) -> None:
         """Subscribe to minute bars
 
@@ -80,11 +165,29 @@ class CryptoDataStream(DataStream):
             handler (Callable[[Union[Quote, Dict]], Awaitable[None]]): The coroutine callback
                 function to handle the incoming data.
             *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            batch (bool): Whether the handler is called with a list of the bars that arrived together, at least
+                the bars of one websocket message, instead of once per bar. Defaults to False.
+            batch_window (Optional[float]): If set, the number of seconds to collect a batch of bars for.
+                Defaults to None.
+            columnar (bool): Whether a batch is a dict of numpy arrays keyed by field instead of a list, with
+                timestamps as integer nanoseconds. Defaults to False.
         """
-        self._subscribe(handler, symbols, self._handlers["bars"])
+        self._subscribe(
+            handler,
+            symbols,
+            self._handlers["bars"],
+            batch=batch,
+            batch_window=batch_window,
+            columnar=columnar,
+        )
 
     def subscribe_updated_bars(
-        self, handler: Callable[[Union[Bar, Dict]], Awaitable[None]], *symbols: str
+        self,
+        handler: Callable[[Union[Bar, Dict]], Awaitable[None]],
+        *symbols: str,
+        batch: bool = False,
+        batch_window: Optional[float] = None,
+        columnar: bool = False,
     ) -> None:
         """Subscribe to updated minute bars
 
@@ -92,11 +195,29 @@ class CryptoDataStream(DataStream):
             handler (Callable[[Union[Bar, Dict]], Awaitable[None]]): The coroutine callback
                 function to handle the incoming data.
             *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            batch (bool): Whether the handler is called with a list of the bars that arrived together, at least
+                the bars of one websocket message, instead of once per bar. Defaults to False.
+            batch_window (Optional[float]): If set, the number of seconds to collect a batch of bars for.
+                Defaults to None.
+            columnar (bool): Whether a batch is a dict of numpy arrays keyed by field instead of a list, with
+                timestamps as integer nanoseconds. Defaults to False.
         """
-        self._subscribe(handler, symbols, self._handlers["updatedBars"])
+        self._subscribe(
+            handler,
+            symbols,
+            self._handlers["updatedBars"],
+            batch=batch,
+            batch_window=batch_window,
+            columnar=columnar,
+        )
 
     def subscribe_daily_bars(
-        self, handler: Callable[[Union[Bar, Dict]], Awaitable[None]], *symbols: str
+        self,
+        handler: Callable[[Union[Bar, Dict]], Awaitable[None]],
+        *symbols: str,
+        batch: bool = False,
+        batch_window: Optional[float] = None,
+        columnar: bool = False,
     ) -> None:
         """Subscribe to daily bars
 
@@ -104,11 +225,28 @@ class CryptoDataStream(DataStream):
             handler (Callable[[Union[Bar, Dict]], Awaitable[None]]): The coroutine callback
                 function to handle the incoming data.
             *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            batch (bool): Whether the handler is called with a list of the bars that arrived together, at least
+                the bars of one websocket message, instead of once per bar. Defaults to False.
+            batch_window (Optional[float]): If set, the number of seconds to collect a batch of bars for.
+                Defaults to None.
+            columnar (bool): Whether a batch is a dict of numpy arrays keyed by field instead of a list, with
+                timestamps as integer nanoseconds. Defaults to False.
         """
-        self._subscribe(handler, symbols, self._handlers["dailyBars"])
+        self._subscribe(
+            handler,
+            symbols,
+            self._handlers["dailyBars"],
+            batch=batch,
+            batch_window=batch_window,
+            columnar=columnar,
+        )
 
     def subscribe_orderbooks(
-        self, handler: Callable[[Union[Orderbook, Dict]], Awaitable[None]], *symbols
+        self,
+        handler: Callable[[Union[Orderbook, Dict]], Awaitable[None]],
+        *symbols: str,
+        conflate: bool = False,
+        batch: bool = False,
     ) -> None:
         """Subscribe to orderbooks
 
@@ -116,8 +254,75 @@ class CryptoDataStream(DataStream):
             handler (Callable[[Union[Bar, Dict]], Awaitable[None]]): The coroutine callback
                 function to handle the incoming data.
             *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            conflate (bool): Whether the handler only receives the latest orderbook of each symbol. Orderbooks that
+                arrive while the handler is busy replace the pending orderbook of their symbol. Defaults to False.
+            batch (bool): Whether the handler is called with a list of the orderbooks that arrived together instead
+                of once per orderbook. With `conflate`, a dict of the latest orderbook of each symbol instead.
+                Defaults to False.
+        """
+        self._subscribe(
+            handler,
+            symbols,
+            self._handlers["orderbooks"],
+            conflate=conflate,
+            batch=batch,
+        )
+
+    def trades(
+        self, *symbols: str, queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE
+    ) -> MessageIterator:
+        """Subscribe to trades through an async iterator, e.g. `async for trade in stream.trades("BTC/USD")`.
+
+        Args:
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            queue_size (int): The maximum number of trades queued for the iterator.
+
+        Returns:
+            MessageIterator: The iterator of the Trade objects, or raw dicts. Unsubscribes when closed.
+        """
+        return self._iterate("trades", symbols, queue_size)
+
+    def quotes(
+        self, *symbols: str, queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE
+    ) -> MessageIterator:
+        """Subscribe to quotes through an async iterator, e.g. `async for quote in stream.quotes("BTC/USD")`.
+
+        Args:
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            queue_size (int): The maximum number of quotes queued for the iterator.
+
+        Returns:
+            MessageIterator: The iterator of the Quote objects, or raw dicts. Unsubscribes when closed.
+        """
+        return self._iterate("quotes", symbols, queue_size)
+
+    def bars(
+        self, *symbols: str, queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE
+    ) -> MessageIterator:
+        """Subscribe to minute bars through an async iterator, e.g. `async for bar in stream.bars("BTC/USD")`.
+
+        Args:
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            queue_size (int): The maximum number of bars queued for the iterator.
+
+        Returns:
+            MessageIterator: The iterator of the Bar objects, or raw dicts. Unsubscribes when closed.
+        """
+        return self._iterate("bars", symbols, queue_size)
+
+    def orderbooks(
+        self, *symbols: str, queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE
+    ) -> MessageIterator:
+        """Subscribe to orderbooks through an async iterator, e.g. `async for book in stream.orderbooks("BTC/USD")`.
+
+        Args:
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            queue_size (int): The maximum number of orderbooks queued for the iterator.
+
+        Returns:
+            MessageIterator: The iterator of the Orderbook objects, or raw dicts. Unsubscribes when closed.
         """
-        self._subscribe(handler, symbols, self._handlers["orderbooks"])
+        return self._iterate("orderbooks", symbols, queue_size)
 
     def unsubscribe_trades(self, *symbols: str) -> None:
         """Unsubscribe from trades
@@ -0,0 +1,560 @@
+import asyncio
+import itertools
+import logging
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from alpaca.data.columnar import _FLOAT_FIELDS, _INT_FIELDS
+from alpaca.data.enums import OverflowPolicy
+
+log = logging.getLogger(__name__)
+
+DEFAULT_DISPATCH_QUEUE_SIZE = 10_000
+
+# the fields stored as float64 columns by `to_columns`
+_NUMERIC_FIELDS = _FLOAT_FIELDS | _INT_FIELDS
+
+# the message types whose latest message supersedes the earlier ones: quotes, minute, updated and daily bars and
+# orderbooks. Trades, corrections, cancels, news and the like are never conflated.
+_CONFLATABLE_TYPES = {"q", "b", "u", "d", "o"}
+
+
+class DispatchStats:
+    """
+    Counts the messages passing through a stream's dispatch queues.
+
+    Attributes:
+        received (int): The number of messages read from the socket.
+        dispatched (int): The number of messages passed to the handlers.
+        dropped (int): The number of messages dropped because a queue was full.
+        conflated (int): The number of messages replaced by a newer message of the same type and symbol.
+    """
+
+    def __init__(self) -> None:
+        self.received: int = 0
+        self.dispatched: int = 0
+        self.dropped: int = 0
+        self.conflated: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"DispatchStats(received={self.received}, dispatched={self.dispatched}, "
+            f"dropped={self.dropped}, conflated={self.conflated})"
+        )
+
+
+class DispatchQueue:
+    """A bounded queue of stream messages that applies an overflow policy when it is full."""
+
+    def __init__(
+        self, maxsize: int, overflow_policy: OverflowPolicy, stats: DispatchStats
+    ) -> None:
+        """
+        Args:
+            maxsize (int): The maximum number of queued messages.
+            overflow_policy (OverflowPolicy): What to do with a new message when the queue is full.
+            stats (DispatchStats): The counters to record dropped and conflated messages in.
+        """
+        self._maxsize = maxsize
+        self._overflow_policy = overflow_policy
+        self._stats = stats
+        # the type and symbol and the message, keyed by a sequence number
+        self._items: "OrderedDict[int, Tuple[Tuple, Dict]]" = OrderedDict()
+        # the sequence number of the newest queued message of each conflatable type and symbol
+        self._latest: Dict[Tuple, int] = {}
+        self._sequence = itertools.count()
+        self._changed = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def put(self, key: Tuple[Optional[str], Optional[str]], msg: Dict) -> None:
+        """Queues a message, waiting for room if the queue is full and the policy is to block.
+
+        Args:
+            key (Tuple[Optional[str], Optional[str]]): The type and symbol of the message.
+            msg (Dict): The message.
+        """
+        async with self._changed:
+            if len(self._items) >= self._maxsize:
+                if self._overflow_policy == OverflowPolicy.BLOCK:
+                    await self._changed.wait_for(
+                        lambda: len(self._items) < self._maxsize
+                    )
+                elif (
+                    self._overflow_policy == OverflowPolicy.CONFLATE_LATEST
+                    and key in self._latest
+                ):
+                    # keeps the position of the replaced message
+                    sequence = self._latest[key]
+                    _, queued = self._items[sequence]
+                    if key[0] == "o":
+                        msg = merge_orderbook_updates(queued, msg)
+                    self._items[sequence] = (key, msg)
+                    self._stats.conflated += 1
+                    return
+                else:
+                    self._pop()
+                    self._stats.dropped += 1
+
+            sequence = next(self._sequence)
+            self._items[sequence] = (key, msg)
+            if key[0] in _CONFLATABLE_TYPES:
+                self._latest[key] = sequence
+            self._changed.notify_all()
+
+    async def get(self) -> Dict:
+        """Removes and returns the oldest message, waiting for one if the queue is empty."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: len(self._items) > 0)
+            msg = self._pop()
+            self._changed.notify_all()
+            return msg
+
+    def _pop(self) -> Dict:
+        sequence, (key, msg) = self._items.popitem(last=False)
+        if self._latest.get(key) == sequence:
+            del self._latest[key]
+        return msg
+
+
+class MessageDispatcher:
+    """
+    Decouples reading a stream's socket from handling its messages.
+
+    Messages are spread over one queue per worker by type and symbol, so the messages of a type and symbol are
+    handled in order while other messages are handled concurrently. The reader only waits for the handlers if a
+    queue is full and the overflow policy is to block.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[Dict], Awaitable[None]],
+        workers: int,
+        queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        stats: Optional[DispatchStats] = None,
+    ) -> None:
+        """
+        Args:
+            dispatch (Callable[[Dict], Awaitable[None]]): Passes a message to its handler.
+            workers (int): The number of queues and the tasks draining them.
+            queue_size (int): The maximum number of messages in each queue.
+            overflow_policy (OverflowPolicy): What to do with a new message when its queue is full.
+            stats (Optional[DispatchStats]): The counters to record the messages in.
+        """
+        if workers < 1:
+            raise ValueError("workers must be positive")
+
+        if queue_size < 1:
+            raise ValueError("queue_size must be positive")
+
+        self._dispatch = dispatch
+        self._workers = workers
+        self._queue_size = queue_size
+        self._overflow_policy = overflow_policy
+        self.stats = stats if stats is not None else DispatchStats()
+        self._queues: List[DispatchQueue] = []
+        self._tasks: List[asyncio.Task] = []
+        # set while no message is queued, being queued or being handled
+        self._idle: Optional[asyncio.Event] = None
+        self._handling = 0
+        # puts that may still be waiting for their queue, whose message isn't in it yet
+        self._putting = 0
+
+    def start(self) -> None:
+        """Creates the queues and starts the workers on the running event loop."""
+        self._queues = [
+            DispatchQueue(self._queue_size, self._overflow_policy, self.stats)
+            for _ in range(self._workers)
+        ]
+        self._tasks = [
+            asyncio.ensure_future(self._work(queue)) for queue in self._queues
+        ]
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def join(self) -> None:
+        """Waits until every queued message has been handled."""
+        if self._idle is not None:
+            await self._idle.wait()
+
+    async def stop(self) -> None:
+        """Stops the workers. Messages that are still queued are discarded."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queues = []
+
+    async def put(self, msg: Dict) -> None:
+        """Queues a message for its handler.
+
+        Args:
+            msg (Dict): The message from the websocket connection.
+        """
+        self.stats.received += 1
+        key = (msg.get("T"), msg.get("S"))
+        # a stable hash, so a symbol is always handled by the same worker
+        index = zlib.crc32(f"{key[0]}:{key[1]}".encode()) % len(self._queues)
+        self._idle.clear()
+        self._putting += 1
+        try:
+            await self._queues[index].put(key, msg)
+        finally:
+            self._putting -= 1
+            # a cancelled put leaves nothing for the workers to set the event after
+            self._update_idle()
+
+    async def _work(self, queue: DispatchQueue) -> None:
+        while True:
+            msg = await queue.get()
+            self._handling += 1
+            try:
+                await self._dispatch(msg)
+            except Exception as e:
+                # a failing handler must not stop the worker
+                log.exception(f"error in message handler: {str(e)}")
+            finally:
+                self._handling -= 1
+            self.stats.dispatched += 1
+            self._update_idle()
+
+    def _update_idle(self) -> None:
+        if (
+            not self._handling
+            and not self._putting
+            and not any(len(queue) for queue in self._queues)
+        ):
+            self._idle.set()
+
+
+class BufferedHandler(ABC):
+    """
+    Base class of handler wrappers that buffer raw messages and pass them to the handler once it is ready for them.
+
+    A worker task calls the handler with everything buffered since its last call, so messages that arrive while the
+    handler is busy are delivered together on the next call.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[None]],
+        cast: Callable[[Dict], Any],
+        window: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            handler (Callable[[Any], Awaitable[None]]): The coroutine callback function to handle the messages.
+            cast (Callable[[Dict], Any]): Parses a raw message for the handler.
+            window (Optional[float]): If set, the number of seconds to keep buffering after a message arrives before
+              calling the handler. Defaults to calling it as soon as the event loop is free.
+        """
+        if window is not None and window < 0:
+            raise ValueError("window must not be negative")
+
+        self._handler = handler
+        self._cast = cast
+        self._window = window
+        self._ready: Optional[asyncio.Event] = None
+        # set while nothing is buffered or being passed to the handler
+        self._idle: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def offer(self, msg: Dict) -> None:
+        """Buffers a message for the handler.
+
+        Args:
+            msg (Dict): The raw message.
+        """
+        self._buffer(msg)
+
+        if self._task is None or self._task.done():
+            self._ready = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._task = asyncio.ensure_future(self._work())
+        self._idle.clear()
+        self._ready.set()
+
+    async def join(self) -> None:
+        """Waits until everything buffered has been passed to the handler."""
+        if self._task is not None and not self._task.done():
+            await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stops passing messages to the handler. Buffered messages are discarded."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._clear()
+
+    @abstractmethod
+    def _buffer(self, msg: Dict) -> None:
+        """Adds a message to the buffer."""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Empties the buffer."""
+
+    @abstractmethod
+    async def _deliver(self) -> None:
+        """Empties the buffer into the handler."""
+
+    async def _work(self) -> None:
+        while True:
+            await self._ready.wait()
+            if self._window is not None:
+                await asyncio.sleep(self._window)
+            self._ready.clear()
+
+            try:
+                await self._deliver()
+            except Exception as e:
+                # a failing handler must not stop the worker
+                log.exception(f"error in message handler: {str(e)}")
+            if not self._ready.is_set():
+                self._idle.set()
+
+
+class ConflatingHandler(BufferedHandler):
+    """
+    Wraps a handler so that it only receives the latest message of each symbol.
+
+    Messages are kept raw until the handler is ready for them, and a message that arrives before the handler got to
+    the previous message of its symbol replaces it. So in bursts the handler is called, and messages are parsed, far
+    less often than messages arrive.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[None]],
+        cast: Callable[[Dict], Any],
+        batch: bool = False,
+        merge: Optional[Callable[[Dict, Dict], Dict]] = None,
+        stats: Optional[DispatchStats] = None,
+    ) -> None:
+        """
+        Args:
+            handler (Callable[[Any], Awaitable[None]]): The coroutine callback function to handle the messages.
+            cast (Callable[[Dict], Any]): Parses a raw message for the handler.
+            batch (bool): Whether to call the handler once with a dict of the latest message of each symbol,
+              instead of once per symbol.
+            merge (Optional[Callable[[Dict, Dict], Dict]]): Combines a pending message with a newer one, for
+              messages that are updates rather than replacements, e.g. `merge_orderbook_updates`. Defaults to keeping
+              the newer message.
+            stats (Optional[DispatchStats]): The counters to record conflated messages in.
+        """
+        super().__init__(handler, cast)
+        self._batch = batch
+        self._merge = merge
+        self.stats = stats if stats is not None else DispatchStats()
+        self._pending: Dict[str, Dict] = {}
+
+    def _buffer(self, msg: Dict) -> None:
+        symbol = msg.get("S")
+        pending = self._pending.get(symbol)
+        if pending is not None:
+            self.stats.conflated += 1
+            if self._merge is not None:
+                msg = self._merge(pending, msg)
+        self._pending[symbol] = msg
+
+    def _clear(self) -> None:
+        self._pending = {}
+
+    async def _deliver(self) -> None:
+        pending, self._pending = self._pending, {}
+        if self._batch:
+            await self._handler(
+                {symbol: self._cast(msg) for symbol, msg in pending.items()}
+            )
+        else:
+            for msg in pending.values():
+                await self._handler(self._cast(msg))
+
+
+class BatchHandler(BufferedHandler):
+    """
+    Wraps a handler so that it receives lists of messages instead of one message per call.
+
+    A batch holds the messages that arrived while the handler was busy or, with a `window`, within that window. At
+    least the messages of one websocket frame arrive together.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[None]],
+        cast: Callable[[Dict], Any],
+        window: Optional[float] = None,
+        mapping: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Args:
+            handler (Callable[[Any], Awaitable[None]]): The coroutine callback function to handle the batches.
+            cast (Callable[[Dict], Any]): Parses a raw message for the handler.
+            window (Optional[float]): If set, the number of seconds to collect messages for after the first message
+              of a batch arrives. Defaults to None.
+            mapping (Optional[Dict[str, str]]): If set, the handler receives each batch as columns instead of a list,
+              see `to_columns`. Maps the raw keys of the messages to column names, e.g. TRADE_MAPPING.
+        """
+        super().__init__(handler, cast, window)
+        self._mapping = mapping
+        self._pending: List[Dict] = []
+
+    def _buffer(self, msg: Dict) -> None:
+        self._pending.append(msg)
+
+    def _clear(self) -> None:
+        self._pending = []
+
+    async def _deliver(self) -> None:
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        if self._mapping is not None:
+            await self._handler(to_columns(pending, self._mapping))
+        else:
+            await self._handler([self._cast(msg) for msg in pending])
+
+
+def to_columns(msgs: List[Dict], mapping: Dict[str, str]) -> Dict[str, np.ndarray]:
+    """Converts raw stream messages into one array per field, without building a model per message.
+
+    Args:
+        msgs (List[Dict]): The raw messages.
+        mapping (Dict[str, str]): Maps the raw keys of the messages to column names, e.g. TRADE_MAPPING.
+
+    Returns:
+        Dict[str, np.ndarray]: The `symbol` column and one column per mapped field. Timestamps are integer nanoseconds
+          since the epoch, numbers are float64, and everything else is kept as python objects.
+    """
+    columns = {"symbol": np.array([msg.get("S") for msg in msgs], dtype=object)}
+
+    for key, field in mapping.items():
+        values = [msg.get(key) for msg in msgs]
+        if key == "t":
+            columns[field] = np.array(
+                [
+                    value.to_unix_nano() if hasattr(value, "to_unix_nano") else value
+                    for value in values
+                ],
+                dtype=np.int64,
+            )
+        elif field in _NUMERIC_FIELDS:
+            columns[field] = np.array(
+                [np.nan if value is None else value for value in values],
+                dtype=np.float64,
+            )
+        else:
+            column = np.empty(len(values), dtype=object)
+            # assigned per element so that list values, e.g. conditions, are kept as lists
+            for i, value in enumerate(values):
+                column[i] = value
+            columns[field] = column
+
+    return columns
+
+
+def merge_orderbook_updates(older: Dict, newer: Dict) -> Dict:
+    """Combines two raw orderbook messages of a symbol into one with the same effect.
+
+    Orderbook messages only contain the price levels that changed, with a size of 0 for removed levels, unless
+    they reset the whole book.
+
+    Args:
+        older (Dict): The earlier message.
+        newer (Dict): The later message.
+
+    Returns:
+        Dict: The combined message.
+    """
+    if newer.get("r"):
+        # a reset replaces everything before it
+        return newer
+
+    merged = dict(newer)
+    for side in ("b", "a"):
+        levels = {level["p"]: level for level in older.get(side, [])}
+        levels.update((level["p"], level) for level in newer.get(side, []))
+        if older.get("r"):
+            # still a full book, which doesn't list removed levels
+            levels = {p: level for p, level in levels.items() if level["s"] != 0}
+        # bids from the highest price down, asks from the lowest up
+        merged[side] = sorted(
+            levels.values(), key=lambda level: level["p"], reverse=side == "b"
+        )
+
+    if older.get("r"):
+        merged["r"] = True
+
+    return merged
+
+
+class MessageIterator:
+    """
+    Delivers the messages of a subscription through `async for` instead of a handler.
+
+    Messages are queued until they are iterated over. When the queue is full, reading the stream waits for the
+    iterator. Call `aclose` to unsubscribe when done with the iterator, iteration ends when the stream stops.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+        on_close: Optional[Callable[["MessageIterator"], None]] = None,
+    ) -> None:
+        """
+        Args:
+            maxsize (int): The maximum number of queued messages.
+            on_close (Optional[Callable[[MessageIterator], None]]): Called once when the iterator is closed, e.g. to
+              unsubscribe it.
+        """
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._on_close = on_close
+        self._closed = False
+
+    async def put(self, msg: Any) -> None:
+        """Queues a message for the iterator. Used as the handler of the subscription.
+
+        Args:
+            msg (Any): The parsed or raw message.
+        """
+        if not self._closed:
+            await self._queue.put(msg)
+
+    def __aiter__(self) -> "MessageIterator":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        msg = await self._queue.get()
+        if msg is _END_OF_STREAM:
+            raise StopAsyncIteration
+        return msg
+
+    async def aclose(self) -> None:
+        """Ends the iteration. Messages that are still queued are iterated over first."""
+        self.end()
+
+    def end(self) -> None:
+        """Ends the iteration, like `aclose`, but can be called outside of a coroutine."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._on_close is not None:
+            self._on_close(self)
+        try:
+            self._queue.put_nowait(_END_OF_STREAM)
+        except asyncio.QueueFull:
+            # the iteration ends once the queued messages are taken
+            pass
+
+
+# marks the end of the messages of a MessageIterator
+_END_OF_STREAM = object()
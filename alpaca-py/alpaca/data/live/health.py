@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta
+
+
+class StreamGap:
+    """
+    A stretch of a channel's data that may have been missed because the stream reconnected.
+
+    Attributes:
+        channel (str): The channel of the data, e.g. "trades".
+        last_timestamp (datetime): The timestamp of the last message of the channel before the connection was lost.
+        first_timestamp (datetime): The timestamp of the first message of the channel after reconnecting.
+    """
+
+    def __init__(
+        self, channel: str, last_timestamp: datetime, first_timestamp: datetime
+    ) -> None:
+        self.channel = channel
+        self.last_timestamp = last_timestamp
+        self.first_timestamp = first_timestamp
+
+    @property
+    def duration(self) -> timedelta:
+        """The time between the last message before and the first message after reconnecting."""
+        return self.first_timestamp - self.last_timestamp
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamGap(channel={self.channel!r}, last_timestamp={self.last_timestamp!r}, "
+            f"first_timestamp={self.first_timestamp!r})"
+        )
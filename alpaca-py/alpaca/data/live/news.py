@@ -1,6 +1,11 @@
 from typing import Awaitable, Callable, Dict, Optional, Union
 
 from alpaca.common.enums import BaseURL
+from alpaca.common.metrics import MetricsSink
+from alpaca.common.retry import ReconnectPolicy
+from alpaca.data.enums import OverflowPolicy
+from alpaca.data.live.dispatch import DEFAULT_DISPATCH_QUEUE_SIZE, MessageIterator
+from alpaca.data.live.health import StreamGap
 from alpaca.data.live.websocket import DataStream
 from alpaca.data.models.news import News
 
@@ -17,6 +22,14 @@ class NewsDataStream(DataStream):
         raw_data: bool = False,
         websocket_params: Optional[Dict] = None,
         url_override: Optional[str] = None,
+        dispatch_workers: Optional[int] = None,
+        dispatch_queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        stale_timeouts: Optional[Dict[str, float]] = None,
+        gap_handler: Optional[Callable[[StreamGap], Awaitable[None]]] = None,
+        record_path: Optional[str] = None,
+        metrics_sink: Optional[MetricsSink] = None,
     ) -> None:
         """
         Instantiates a WebSocket client for accessing live news.
@@ -28,6 +41,21 @@ class NewsDataStream(DataStream):
                 connection. Defaults to None.
             url_override (Optional[str]): If specified allows you to override the base url the client
                 points to for proxy/testing. Defaults to None.
+            dispatch_workers (Optional[int]): If set, messages are queued as they are read and handled by this many
+                worker tasks, so slow handlers don't hold up reading the socket. Defaults to None.
+            dispatch_queue_size (int): The maximum number of queued messages per worker.
+            overflow_policy (OverflowPolicy): What to do with a new message when its queue is full. Defaults to
+                waiting for the handlers.
+            reconnect_policy (Optional[ReconnectPolicy]): When to reconnect after the connection is lost.
+                Defaults to exponential backoff with jitter, reconnecting forever.
+            stale_timeouts (Optional[Dict[str, float]]): The number of seconds each channel, e.g. "news",
+                may go without a message before the connection is reopened. Defaults to None.
+            gap_handler (Optional[Callable[[StreamGap], Awaitable[None]]]): A coroutine called with the
+                data each channel may have missed while reconnecting. Defaults to None.
+            record_path (Optional[str]): If set, every frame received is appended to a gzip compressed log at
+                this path, which `replay` can feed back through the handlers. Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the stream reports message counts, sizes, timings
+                and latencies per channel to this sink. Defaults to None.
         """
         super().__init__(
             endpoint=(
@@ -39,6 +67,14 @@ class NewsDataStream(DataStream):
             secret_key=secret_key,
             raw_data=raw_data,
             websocket_params=websocket_params,
+            dispatch_workers=dispatch_workers,
+            dispatch_queue_size=dispatch_queue_size,
+            overflow_policy=overflow_policy,
+            reconnect_policy=reconnect_policy,
+            stale_timeouts=stale_timeouts,
+            gap_handler=gap_handler,
+            record_path=record_path,
+            metrics_sink=metrics_sink,
         )
 
     def subscribe_news(
@@ -53,6 +89,20 @@ class NewsDataStream(DataStream):
         """
         self._subscribe(handler, symbols, self._handlers["news"])
 
+    def news(
+        self, *symbols: str, queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE
+    ) -> MessageIterator:
+        """Subscribe to news through an async iterator, e.g. `async for article in stream.news("AAPL")`.
+
+        Args:
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+            queue_size (int): The maximum number of news articles queued for the iterator.
+
+        Returns:
+            MessageIterator: The iterator of the News objects, or raw dicts. Unsubscribes when closed.
+        """
+        return self._iterate("news", symbols, queue_size)
+
     def unsubscribe_news(self, *symbols: str) -> None:
         """Unsubscribe from news
 
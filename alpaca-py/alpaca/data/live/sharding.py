@@ -0,0 +1,355 @@
+import asyncio
+import logging
+import multiprocessing
+import queue
+import threading
+import zlib
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from alpaca.data.live.dispatch import DEFAULT_DISPATCH_QUEUE_SIZE
+from alpaca.data.live.websocket import DataStream
+
+log = logging.getLogger(__name__)
+
+# the most events the consumer takes off the shared queue at once
+_MAX_EVENT_BATCH = 1000
+
+# how long a shard waits before trying again to queue a message when the queue is full
+_PUT_RETRY_SECONDS = 0.01
+
+
+class ShardedDataStream:
+    """
+    Spreads the subscriptions of a data stream over several websocket connections, so that reading and parsing the
+    messages of thousands of symbols isn't limited to one event loop.
+
+    Symbols are assigned to shards by a hash of the symbol, so all messages of a symbol arrive on the same connection
+    and reach the handlers in order. Each shard runs its own DataStream in a thread, or in a process with
+    `use_processes`, parses the messages there, and passes them back to the handlers, which all run in the event
+    loop of `run`.
+
+    Subscriptions have to be made before the stream is started.
+    """
+
+    def __init__(
+        self,
+        stream_factory: Callable[[], DataStream],
+        shards: int,
+        use_processes: bool = False,
+        queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+    ) -> None:
+        """
+        Args:
+            stream_factory (Callable[[], DataStream]): Creates the stream of a shard, e.g.
+              `functools.partial(StockDataStream, api_key, secret_key, feed=DataFeed.SIP)`. Has to be picklable
+              with `use_processes`.
+            shards (int): The number of connections to spread the symbols over. Alpaca limits the number of
+              concurrent connections per account, so this can't be more than your subscription allows.
+            use_processes (bool): Whether each shard runs in its own process instead of a thread, so that parsing
+              the messages of different shards runs on different cores. Defaults to False.
+            queue_size (int): The maximum number of parsed messages waiting for the handlers. Shards wait for the
+              handlers when it is reached.
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+
+        self._stream_factory = stream_factory
+        self._shards = shards
+        self._use_processes = use_processes
+        self._queue_size = queue_size
+        self._handlers: Dict[str, Dict[str, Callable]] = defaultdict(dict)
+        self._workers: List[Any] = []
+        self._stop_event: Optional[Any] = None
+        self._running = False
+
+    def get_shard(self, symbol: str) -> int:
+        """Returns the index of the shard a symbol is subscribed on.
+
+        Args:
+            symbol (str): The symbol. "*" is always subscribed on the first shard.
+
+        Returns:
+            int: The index of the shard.
+        """
+        if symbol == "*":
+            return 0
+        return zlib.crc32(symbol.encode()) % self._shards
+
+    def subscribe_trades(
+        self, handler: Callable[[Any], Awaitable[None]], *symbols: str
+    ) -> None:
+        """Subscribe to trades.
+
+        Args:
+            handler (Callable[[Any], Awaitable[None]]): The coroutine callback
+                function to handle the incoming data.
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+        """
+        self._subscribe("trades", handler, symbols)
+
+    def subscribe_quotes(
+        self, handler: Callable[[Any], Awaitable[None]], *symbols: str
+    ) -> None:
+        """Subscribe to quotes.
+
+        Args:
+            handler (Callable[[Any], Awaitable[None]]): The coroutine callback
+                function to handle the incoming data.
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+        """
+        self._subscribe("quotes", handler, symbols)
+
+    def subscribe_bars(
+        self, handler: Callable[[Any], Awaitable[None]], *symbols: str
+    ) -> None:
+        """Subscribe to minute bars.
+
+        Args:
+            handler (Callable[[Any], Awaitable[None]]): The coroutine callback
+                function to handle the incoming data.
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+        """
+        self._subscribe("bars", handler, symbols)
+
+    def subscribe_updated_bars(
+        self, handler: Callable[[Any], Awaitable[None]], *symbols: str
+    ) -> None:
+        """Subscribe to updated minute bars.
+
+        Args:
+            handler (Callable[[Any], Awaitable[None]]): The coroutine callback
+                function to handle the incoming data.
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+        """
+        self._subscribe("updatedBars", handler, symbols)
+
+    def subscribe_daily_bars(
+        self, handler: Callable[[Any], Awaitable[None]], *symbols: str
+    ) -> None:
+        """Subscribe to daily bars.
+
+        Args:
+            handler (Callable[[Any], Awaitable[None]]): The coroutine callback
+                function to handle the incoming data.
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+        """
+        self._subscribe("dailyBars", handler, symbols)
+
+    def subscribe_orderbooks(
+        self, handler: Callable[[Any], Awaitable[None]], *symbols: str
+    ) -> None:
+        """Subscribe to orderbooks. Only supported by crypto streams.
+
+        Args:
+            handler (Callable[[Any], Awaitable[None]]): The coroutine callback
+                function to handle the incoming data.
+            *symbols: List of ticker symbols to subscribe to. "*" for everything.
+        """
+        self._subscribe("orderbooks", handler, symbols)
+
+    def _subscribe(
+        self, channel: str, handler: Callable, symbols: Tuple[str, ...]
+    ) -> None:
+        if self._running:
+            raise RuntimeError("can't subscribe after the stream was started")
+        if not asyncio.iscoroutinefunction(handler):
+            raise ValueError("handler must be a coroutine function")
+        for symbol in symbols:
+            self._handlers[channel][symbol] = handler
+
+    def _get_subscriptions(self) -> List[Dict[str, List[str]]]:
+        """Returns the symbols to subscribe to of each shard keyed by channel."""
+        subscriptions = [defaultdict(list) for _ in range(self._shards)]
+        for channel, handlers in self._handlers.items():
+            for symbol in handlers:
+                subscriptions[self.get_shard(symbol)][channel].append(symbol)
+        return [dict(shard) for shard in subscriptions]
+
+    def run(self) -> None:
+        """Starts the shards and handles their messages until the stream is stopped."""
+        try:
+            asyncio.run(self._run_forever())
+        except KeyboardInterrupt:
+            print("keyboard interrupt, bye")
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stops the shards. Can be called from any thread."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    async def _run_forever(self) -> None:
+        if self._use_processes:
+            context = multiprocessing.get_context()
+            events = context.Queue(self._queue_size)
+            self._stop_event = context.Event()
+            worker_type = context.Process
+        else:
+            events = queue.Queue(self._queue_size)
+            self._stop_event = threading.Event()
+            worker_type = threading.Thread
+
+        self._running = True
+        self._workers = [
+            worker_type(
+                target=_run_shard,
+                args=(self._stream_factory, subscriptions, events, self._stop_event),
+                name=f"data-stream-shard-{index}",
+                daemon=True,
+            )
+            for index, subscriptions in enumerate(self._get_subscriptions())
+            if subscriptions
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        try:
+            await self._consume(events)
+        finally:
+            self._stop_event.set()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _join_workers, self._workers, events)
+            self._workers = []
+            self._running = False
+
+    async def _consume(self, events: Any) -> None:
+        """Passes the messages of the shards to the handlers until every shard has stopped"""
+        loop = asyncio.get_running_loop()
+        live_shards = len(self._workers)
+
+        while live_shards > 0:
+            batch = await loop.run_in_executor(None, _get_events, events)
+            if not batch:
+                # a shard that died without saying so won't send anything anymore
+                live_shards = min(
+                    live_shards, sum(worker.is_alive() for worker in self._workers)
+                )
+                continue
+
+            for event in batch:
+                if event is None:
+                    live_shards -= 1
+                    continue
+
+                channel, symbol, msg = event
+                handlers = self._handlers[channel]
+                handler = handlers.get(symbol, handlers.get("*"))
+                if handler is None:
+                    continue
+                try:
+                    await handler(msg)
+                except Exception as e:
+                    # a failing handler must not stop the other symbols
+                    log.exception(f"error in message handler: {str(e)}")
+
+
+def _get_events(events: Any) -> List[Optional[Tuple[str, str, Any]]]:
+    """Waits up to a second for the next message of the shards and takes everything else that is queued with it."""
+    try:
+        batch = [events.get(timeout=1)]
+    except queue.Empty:
+        return []
+    while len(batch) < _MAX_EVENT_BATCH:
+        try:
+            batch.append(events.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _join_workers(workers: List[Any], events: Any) -> None:
+    """Waits for the shards to exit, discarding the messages they still queue so that none stays stuck putting one."""
+    for worker in workers:
+        while True:
+            worker.join(timeout=0.1)
+            if not worker.is_alive():
+                break
+            _discard_events(events)
+    _discard_events(events)
+
+
+def _discard_events(events: Any) -> None:
+    while True:
+        try:
+            events.get_nowait()
+        except queue.Empty:
+            return
+
+
+def _put_event(events: Any, event: Any, stop_event: Any) -> bool:
+    """Queues an event, waiting while the queue is full unless the stream is stopped. Blocks the calling thread.
+
+    Returns:
+        bool: Whether the event was queued, False if the stream was stopped first.
+    """
+    while True:
+        try:
+            events.put(event, timeout=_PUT_RETRY_SECONDS)
+            return True
+        except queue.Full:
+            if stop_event.is_set():
+                return False
+
+
+def _run_shard(
+    stream_factory: Callable[[], DataStream],
+    subscriptions: Dict[str, List[str]],
+    events: Any,
+    stop_event: Any,
+) -> None:
+    """Runs the stream of one shard and puts its parsed messages on the events queue. Runs in a thread or process.
+
+    Args:
+        stream_factory (Callable[[], DataStream]): Creates the stream.
+        subscriptions (Dict[str, List[str]]): The symbols to subscribe to keyed by channel.
+        events (Any): The queue of the messages, a `queue.Queue` or `multiprocessing.Queue`. Ends with None once the
+          shard has stopped.
+        stop_event (Any): Stops the shard when set.
+    """
+    try:
+        stream = stream_factory()
+        for channel, symbols in subscriptions.items():
+            stream._subscribe(
+                _forward_to(events, channel, stop_event),
+                tuple(symbols),
+                stream._handlers[channel],
+            )
+        asyncio.run(_run_stream(stream, stop_event))
+    except Exception as e:
+        log.exception(f"error in data stream shard: {str(e)}")
+    finally:
+        # once stopped, the consumer no longer waits for this
+        _put_event(events, None, stop_event)
+
+
+def _forward_to(
+    events: Any, channel: str, stop_event: Any
+) -> Callable[[Any], Awaitable[None]]:
+    async def forward(msg: Any) -> None:
+        symbol = msg.get("S") if isinstance(msg, dict) else msg.symbol
+        event = (channel, symbol, msg)
+        # waiting for room in the queue must not block the shard's loop, which also keeps the connection alive
+        while True:
+            try:
+                events.put_nowait(event)
+                return
+            except queue.Full:
+                if stop_event.is_set():
+                    return
+                await asyncio.sleep(_PUT_RETRY_SECONDS)
+
+    return forward
+
+
+async def _run_stream(stream: DataStream, stop_event: Any) -> None:
+    running = asyncio.ensure_future(stream._run_forever())
+
+    # the stop event can be a process-shared one, which can only be polled from a loop
+    while not stop_event.is_set() and not running.done():
+        await asyncio.wait([running], timeout=0.1)
+    if not running.done():
+        await stream.stop_ws()
+    await running
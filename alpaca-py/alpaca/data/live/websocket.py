@@ -1,8 +1,19 @@
 import asyncio
 import logging
-import queue
+import time
 from collections import defaultdict
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from datetime import datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import msgpack
 import websockets
@@ -10,7 +21,23 @@ from pydantic import BaseModel
 from websockets.legacy import client as websockets_legacy
 
 from alpaca import __version__
+from alpaca.common.metrics import MetricsSink, StreamMetrics
+from alpaca.common.recording import Frame, FrameRecorder, replay_frames
+from alpaca.common.retry import ReconnectPolicy
 from alpaca.common.types import RawData
+from alpaca.data.enums import OverflowPolicy
+from alpaca.data.live.dispatch import (
+    DEFAULT_DISPATCH_QUEUE_SIZE,
+    BatchHandler,
+    BufferedHandler,
+    ConflatingHandler,
+    DispatchStats,
+    MessageDispatcher,
+    MessageIterator,
+    merge_orderbook_updates,
+)
+from alpaca.data.live.health import StreamGap
+from alpaca.data.mappings import BAR_MAPPING, QUOTE_MAPPING, TRADE_MAPPING
 from alpaca.data.models import (
     Bar,
     News,
@@ -21,9 +48,31 @@ from alpaca.data.models import (
     TradeCorrection,
     TradingStatus,
 )
+from alpaca.data.models.ticks import Tick, to_tick
 
 log = logging.getLogger(__name__)
 
+# messages about the connection itself, which are always handled as soon as they are read
+_CONTROL_MESSAGE_TYPES = ("success", "subscription", "error")
+
+# the channel of each type of data message
+_CHANNELS = {
+    "t": "trades",
+    "q": "quotes",
+    "o": "orderbooks",
+    "b": "bars",
+    "u": "updatedBars",
+    "d": "dailyBars",
+    "s": "statuses",
+    "l": "lulds",
+    "n": "news",
+    "c": "corrections",
+    "x": "cancelErrors",
+}
+
+# the key of the receive time a message carries to its handler while metrics are reported
+_RECEIVED_AT = "_received_at"
+
 
 class DataStream:
     """
@@ -37,6 +86,15 @@ class DataStream:
         secret_key: str,
         raw_data: bool = False,
         websocket_params: Optional[Dict] = None,
+        dispatch_workers: Optional[int] = None,
+        dispatch_queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        tick_records: bool = False,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        stale_timeouts: Optional[Dict[str, float]] = None,
+        gap_handler: Optional[Callable[[StreamGap], Awaitable[None]]] = None,
+        record_path: Optional[str] = None,
+        metrics_sink: Optional[MetricsSink] = None,
     ) -> None:
         """Creates a new DataStream instance.
 
@@ -46,7 +104,35 @@ class DataStream:
             secret_key (str): Alpaca API secret key.
             raw_data (bool, optional): Whether to return raw API data or parsed data. Defaults to False.
             websocket_params (Optional[Dict], optional): Any websocket connection configuration parameters. Defaults to None.
+            dispatch_workers (Optional[int]): If set, messages are queued as they are read and handled by this many
+              worker tasks, so slow handlers don't hold up reading the socket. Messages of the same type and symbol
+              are handled in order. Defaults to None, which handles each message before reading the next.
+            dispatch_queue_size (int): The maximum number of queued messages per worker.
+            overflow_policy (OverflowPolicy): What to do with a new message when its queue is full. Defaults to
+              waiting for the handlers.
+            tick_records (bool): Whether trades, quotes and bars are parsed into lightweight TradeTick, QuoteTick and
+              BarTick records with integer nanosecond timestamps instead of the validated models. Other messages are
+              parsed as usual. Defaults to False.
+            reconnect_policy (Optional[ReconnectPolicy]): When to reconnect after the connection is lost. Defaults to
+              exponential backoff with jitter, reconnecting forever.
+            stale_timeouts (Optional[Dict[str, float]]): The number of seconds each channel, e.g. "trades", may go
+              without a message before the connection is considered stale and reopened. Only set this for channels
+              that are always busy while you are connected. Defaults to None.
+            gap_handler (Optional[Callable[[StreamGap], Awaitable[None]]]): A coroutine called for each channel
+              after a reconnect, with the timestamps of its last message before and first message after the
+              reconnect, e.g. to backfill the gap from the historical data API. Gaps are logged either way.
+            record_path (Optional[str]): If set, every frame received is appended with its receive time to a gzip
+              compressed log at this path, which `replay` can feed back through the handlers. Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the stream reports the messages and bytes received, decode
+              and handler times, the latency from the exchange timestamp of each message to receiving it and the
+              delay from receiving it to handling it, per channel, to this sink. Defaults to None.
+
+        Raises:
+            ValueError: If both raw_data and tick_records are set.
         """
+        if raw_data and tick_records:
+            raise ValueError("raw_data and tick_records can't be used together")
+
         self._endpoint = endpoint
         self._api_key = api_key
         self._secret_key = secret_key
@@ -54,7 +140,10 @@ class DataStream:
         self._running = False
         self._loop = None
         self._raw_data = raw_data
-        self._stop_stream_queue = queue.Queue()
+        self._tick_records = tick_records
+        self._stop_event: Optional[asyncio.Event] = None
+        # set when something is subscribed to while the stream waits for its first subscription
+        self._subscribed_event: Optional[asyncio.Event] = None
         self._handlers = {
             "trades": {},
             "quotes": {},
@@ -81,6 +170,44 @@ class DataStream:
         if websocket_params:
             self._websocket_params = websocket_params
 
+        self._dispatch_workers = dispatch_workers
+        self._dispatch_queue_size = dispatch_queue_size
+        self._overflow_policy = overflow_policy
+        self._dispatch_stats = DispatchStats()
+        self._dispatcher: Optional[MessageDispatcher] = None
+        self._task: Optional[asyncio.Task] = None
+        # tasks started from inside the loop, e.g. subscribing from a handler
+        self._tasks: Set[asyncio.Task] = set()
+        self._iterators: Set[MessageIterator] = set()
+
+        if gap_handler is not None:
+            self._ensure_coroutine(gap_handler)
+
+        self._reconnect_policy = (
+            reconnect_policy if reconnect_policy is not None else ReconnectPolicy()
+        )
+        self._reconnect_attempts = 0
+        self._connected_at: Optional[float] = None
+        self._stale_timeouts = dict(stale_timeouts or {})
+        self._gap_handler = gap_handler
+        # the monotonic time of the last message and the timestamp of the last data of each channel
+        self._last_received: Dict[str, float] = {}
+        self._last_timestamps: Dict[str, Any] = {}
+        # the channels whose first message since reconnecting is still outstanding
+        self._gap_channels: Dict[str, Any] = {}
+        self._record_path = record_path
+        self._recorder: Optional[FrameRecorder] = None
+        self._metrics = (
+            StreamMetrics(metrics_sink, self._name)
+            if metrics_sink is not None
+            else None
+        )
+
+    @property
+    def dispatch_stats(self) -> DispatchStats:
+        """The counts of received, dispatched, dropped and conflated messages."""
+        return self._dispatch_stats
+
     async def _connect(self) -> None:
         """Attempts to connect to the websocket endpoint.
         If the connection attempt fails a value error is thrown.
@@ -143,32 +270,181 @@ class DataStream:
             self._running = False
 
     async def stop_ws(self) -> None:
-        """Signals websocket connection should close by adding a closing message to the stop_stream_queue"""
+        """Signals the stream to stop and closes the websocket connection, which ends waiting for data right away"""
         self._should_run = False
-        if self._stop_stream_queue.empty():
-            self._stop_stream_queue.put_nowait({"should_stop": True})
-        await asyncio.sleep(0)
+        self._get_stop_event().set()
+        await self.close()
+
+    def _prepare_run(self) -> None:
+        """Clears a stop requested by an earlier run. Called before the stream's task is started, so a stop requested
+        before the task first runs is not overwritten."""
+        self._should_run = True
+        self._stop_event = None
+
+    def _has_subscriptions(self) -> bool:
+        """Whether anything is subscribed to, which the connection is only opened for"""
+        return any(
+            v
+            for k, v in self._handlers.items()
+            if k not in ("cancelErrors", "corrections")
+        )
+
+    def _notify_subscribed(self) -> None:
+        """Wakes up the stream if it is waiting for its first subscription. Safe to call from any thread."""
+        event = self._subscribed_event
+        if event is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(event.set)
+
+    async def _wait_for_subscription(self) -> bool:
+        """Waits until something is subscribed to or the stream is signaled to stop
+
+        Returns:
+            bool: Whether to open the connection, False if the stream was signaled to stop.
+        """
+        self._subscribed_event = asyncio.Event()
+        try:
+            while self._should_run and not self._has_subscriptions():
+                subscribed = asyncio.ensure_future(self._subscribed_event.wait())
+                stopped = asyncio.ensure_future(self._get_stop_event().wait())
+                try:
+                    await asyncio.wait(
+                        {subscribed, stopped}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    for waiter in (subscribed, stopped):
+                        waiter.cancel()
+                    await asyncio.gather(subscribed, stopped, return_exceptions=True)
+                self._subscribed_event.clear()
+        finally:
+            self._subscribed_event = None
+        return self._should_run
+
+    def _get_stop_event(self) -> asyncio.Event:
+        """Returns the event set when the stream is signaled to stop. Created in the stream's loop on first use."""
+        if self._stop_event is None:
+            self._stop_event = asyncio.Event()
+        return self._stop_event
+
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Waits until the stream is signaled to stop or the timeout has passed
+
+        Args:
+            timeout (float): The maximum number of seconds to wait
+
+        Returns:
+            bool: Whether the stream was signaled to stop.
+        """
+        try:
+            await asyncio.wait_for(self._get_stop_event().wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
 
     async def _consume(self) -> None:
         """Distributes data from websocket connection to appropriate callbacks"""
-        while True:
-            if not self._stop_stream_queue.empty():
-                self._stop_stream_queue.get(timeout=1)
-                await self.close()
-                break
-            else:
-                try:
-                    r = await asyncio.wait_for(self._ws.recv(), 5)
-                    msgs = msgpack.unpackb(r)
-                    for msg in msgs:
-                        await self._dispatch(msg)
-                except asyncio.TimeoutError:
-                    # ws.recv is hanging when no data is received. by using
-                    # wait_for we break when no data is received, allowing us
-                    # to break the loop when needed
-                    pass
-
-    def _cast(self, msg: Dict) -> Union[BaseModel, RawData]:
+        # stop_ws closes the connection, which ends the wait for the next frame
+        ws = self._ws
+        while self._should_run:
+            try:
+                r = await ws.recv()
+            except websockets.ConnectionClosed:
+                if not self._should_run:
+                    return
+                raise
+            if self._recorder is not None:
+                self._recorder.write(r)
+            await self._handle_frame(r)
+        await self.close()
+
+    async def _handle_frame(self, frame: Frame) -> None:
+        """Decodes a frame from the websocket connection and passes its messages on
+
+        Args:
+            frame (Frame): The msgpack encoded frame
+        """
+        if self._metrics is None:
+            for msg in msgpack.unpackb(frame):
+                await self._enqueue(msg)
+            return
+
+        received_at = time.perf_counter()
+        received_at_ns = time.time_ns()
+        msgs = msgpack.unpackb(frame)
+        self._metrics.record_frame(len(frame), time.perf_counter() - received_at)
+        for msg in msgs:
+            channel = _CHANNELS.get(msg.get("T"))
+            if channel is not None:
+                timestamp = msg.get("t")
+                self._metrics.record_message(
+                    channel,
+                    (
+                        timestamp.to_unix_nano()
+                        if isinstance(timestamp, msgpack.Timestamp)
+                        else None
+                    ),
+                    received_at_ns,
+                )
+                msg[_RECEIVED_AT] = received_at
+            await self._enqueue(msg)
+
+    async def _enqueue(self, msg: Dict) -> None:
+        """Queues a message for its handler, or handles it right away if the stream has no dispatch workers.
+
+        Args:
+            msg (Dict): The message from the websocket connection
+        """
+        msg_type = msg.get("T")
+        channel = _CHANNELS.get(msg_type)
+        if channel is not None:
+            await self._track(channel, msg)
+
+        if self._dispatcher is not None and msg_type not in _CONTROL_MESSAGE_TYPES:
+            await self._dispatcher.put(msg)
+            return
+
+        self._dispatch_stats.received += 1
+        await self._dispatch(msg)
+        self._dispatch_stats.dispatched += 1
+
+    async def _track(self, channel: str, msg: Dict) -> None:
+        """Records when a channel last received data, and reports the gap if it is the first data since reconnecting.
+
+        Args:
+            channel (str): The channel of the message
+            msg (Dict): The message from the websocket connection
+        """
+        self._last_received[channel] = time.monotonic()
+        timestamp = msg.get("t")
+        if timestamp is None:
+            return
+        if channel in self._gap_channels:
+            await self._report_gap(
+                StreamGap(
+                    channel,
+                    _to_datetime(self._gap_channels.pop(channel)),
+                    _to_datetime(timestamp),
+                )
+            )
+        self._last_timestamps[channel] = timestamp
+
+    async def _report_gap(self, gap: StreamGap) -> None:
+        """Logs a gap in a channel's data and passes it to the gap handler.
+
+        Args:
+            gap (StreamGap): The gap
+        """
+        log.warning(
+            f"{self._name} stream reconnected, {gap.channel} may be missing data from "
+            f"{gap.last_timestamp} to {gap.first_timestamp}"
+        )
+        if self._gap_handler is None:
+            return
+        try:
+            await self._gap_handler(gap)
+        except Exception as e:
+            log.exception(f"error in gap handler: {str(e)}")
+
+    def _cast(self, msg: Dict) -> Union[BaseModel, Tick, RawData]:
         """Parses data from websocket message if raw_data is False, otherwise
         returns the raw websocket message.
 
@@ -176,10 +452,14 @@ class DataStream:
             msg (Dict): The message containing market data
 
         Returns:
-            Union[BaseModel, RawData]: The raw or parsed message
+            Union[BaseModel, Tick, RawData]: The raw or parsed message
         """
         if self._raw_data:
             return msg
+        if self._tick_records:
+            tick = to_tick(msg)
+            if tick is not None:
+                return tick
         msg_type = msg.get("T")
         if "t" in msg:
             msg["t"] = msg["t"].to_datetime()
@@ -206,7 +486,30 @@ class DataStream:
         return msg
 
     async def _dispatch(self, msg: Dict) -> None:
-        """Distributes the message from websocket connection to the appropriate handler.
+        """Distributes the message from websocket connection to the appropriate handler, and reports how long it
+        waited and took if the stream has a metrics sink.
+
+        Args:
+            msg (Dict): The message from the websocket connection
+        """
+        received_at = msg.pop(_RECEIVED_AT, None) if self._metrics else None
+        if received_at is None:
+            await self._route(msg)
+            return
+
+        channel = _CHANNELS[msg["T"]]
+        started_at = time.perf_counter()
+        try:
+            await self._route(msg)
+        finally:
+            self._metrics.record_handled(
+                channel,
+                started_at - received_at,
+                time.perf_counter() - started_at,
+            )
+
+    async def _route(self, msg: Dict) -> None:
+        """Passes the message to the handler of its channel and symbol.
 
         Args:
             msg (Dict): The message from the websocket connection
@@ -240,29 +543,26 @@ class DataStream:
                 await asyncio.gather(*handlers_to_call)
             return
 
-        channel_types = {
-            "t": "trades",
-            "q": "quotes",
-            "o": "orderbooks",
-            "b": "bars",
-            "u": "updatedBars",
-            "d": "dailyBars",
-            "s": "statuses",
-            "l": "lulds",
-            "n": "news",
-            "c": "corrections",
-            "x": "cancelErrors",
-        }
-        channel = channel_types.get(msg_type)
+        channel = _CHANNELS.get(msg_type)
         if not channel:
             return
         symbol = msg.get("S")
         handler = self._handlers[channel].get(symbol, self._handlers[channel].get("*"))
-        if handler:
+        if isinstance(handler, BufferedHandler):
+            # parsed once the handler is ready for it
+            handler.offer(msg)
+        elif handler:
             await handler(self._cast(msg))
 
     def _subscribe(
-        self, handler: Callable, symbols: Tuple[str], handlers: Dict
+        self,
+        handler: Callable,
+        symbols: Tuple[str],
+        handlers: Dict,
+        conflate: bool = False,
+        batch: bool = False,
+        batch_window: Optional[float] = None,
+        columnar: bool = False,
     ) -> None:
         """Subscribes a coroutine callback function to receive data for a tuple of symbols
 
@@ -270,14 +570,63 @@ class DataStream:
             handler (Callable): The coroutine callback function to receive data
             symbols (Tuple[str]): The tuple containing the symbols to be subscribed to
             handlers (Dict): The dictionary of coroutine callback functions keyed by symbol
+            conflate (bool): Whether the handler only receives the latest message of each symbol, see
+              ConflatingHandler.
+            batch (bool): Whether the handler receives a list of the messages that arrived together, see
+              BatchHandler. With `conflate`, a dict of the latest message of each symbol instead.
+            batch_window (Optional[float]): The number of seconds to collect a batch for. Defaults to the messages
+              that arrived while the handler was busy, at least one websocket frame.
+            columnar (bool): Whether a batch is delivered as a dict of numpy arrays per field instead of a list.
         """
         self._ensure_coroutine(handler)
+        if (batch_window is not None or columnar) and (not batch or conflate):
+            raise ValueError(
+                "batch_window and columnar can only be used with batch and without conflate"
+            )
+        if batch and not conflate:
+            mapping = None
+            if columnar:
+                mapping = self._get_batch_mapping(handlers)
+                if mapping is None:
+                    raise ValueError("columnar is not supported for this channel")
+            handler = BatchHandler(
+                handler, self._cast, window=batch_window, mapping=mapping
+            )
+        elif conflate:
+            handler = ConflatingHandler(
+                handler,
+                self._cast,
+                batch=batch,
+                # orderbook messages only contain the levels that changed
+                merge=(
+                    merge_orderbook_updates
+                    if handlers is self._handlers["orderbooks"]
+                    else None
+                ),
+                stats=self._dispatch_stats,
+            )
         for symbol in symbols:
             handlers[symbol] = handler
+        self._notify_subscribed()
         if self._running:
-            asyncio.run_coroutine_threadsafe(
-                self._send_subscribe_msg(), self._loop
-            ).result()
+            self._run_in_loop(self._send_subscribe_msg())
+
+    def _get_batch_mapping(self, handlers: Dict) -> Optional[Dict[str, str]]:
+        """Returns the mapping of the columns of a columnar batch for a channel's handlers, if it has one
+
+        Args:
+            handlers (Dict): The dictionary of coroutine callback functions keyed by symbol of the channel
+        """
+        if handlers is self._handlers["trades"]:
+            return TRADE_MAPPING
+        if handlers is self._handlers["quotes"]:
+            return QUOTE_MAPPING
+        if any(
+            handlers is self._handlers[channel]
+            for channel in ("bars", "updatedBars", "dailyBars")
+        ):
+            return BAR_MAPPING
+        return None
 
     async def _send_subscribe_msg(self) -> None:
         msg = defaultdict(list)
@@ -295,9 +644,7 @@ class DataStream:
 
     def _unsubscribe(self, channel: str, symbols: List[str]) -> None:
         if self._running:
-            asyncio.run_coroutine_threadsafe(
-                self._send_unsubscribe_msg(channel, symbols), self._loop
-            ).result()
+            self._run_in_loop(self._send_unsubscribe_msg(channel, symbols))
         for symbol in symbols:
             del self._handlers[channel][symbol]
 
@@ -318,20 +665,86 @@ class DataStream:
         """
         self._loop = asyncio.get_running_loop()
         # do not start the websocket connection until we subscribe to something
-        while not any(
-            v
-            for k, v in self._handlers.items()
-            if k not in ("cancelErrors", "corrections")
-        ):
-            if not self._stop_stream_queue.empty():
-                # the ws was signaled to stop before starting the loop so
-                # we break
-                self._stop_stream_queue.get(timeout=1)
-                return
-            await asyncio.sleep(0)
+        if not await self._wait_for_subscription():
+            # stopped before subscribing, or by leaving `async with` before the task first ran
+            self._stop_event = None
+            return
         log.info(f"started {self._name} stream")
-        self._should_run = True
         self._running = False
+        self._start_dispatching()
+        watchdog = (
+            asyncio.ensure_future(self._watch_stale_channels())
+            if self._stale_timeouts
+            else None
+        )
+        if self._record_path is not None:
+            self._recorder = FrameRecorder(self._record_path)
+        try:
+            await self._run_connection()
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+                await asyncio.gather(watchdog, return_exceptions=True)
+            if self._recorder is not None:
+                self._recorder.close()
+                self._recorder = None
+            await self._stop_dispatching()
+            for iterator in list(self._iterators):
+                iterator.end()
+            self._stop_event = None
+
+    def _start_dispatching(self) -> None:
+        """Starts the dispatch workers, if the stream has any"""
+        if self._dispatch_workers is not None:
+            self._dispatcher = MessageDispatcher(
+                self._dispatch,
+                workers=self._dispatch_workers,
+                queue_size=self._dispatch_queue_size,
+                overflow_policy=self._overflow_policy,
+                stats=self._dispatch_stats,
+            )
+            self._dispatcher.start()
+
+    async def _stop_dispatching(self) -> None:
+        """Stops the dispatch workers and the buffered handlers"""
+        if self._dispatcher is not None:
+            await self._dispatcher.stop()
+            self._dispatcher = None
+        for handlers in self._handlers.values():
+            for handler in set(handlers.values()):
+                if isinstance(handler, BufferedHandler):
+                    await handler.close()
+
+    async def replay(self, path: str, speed: Optional[float] = None) -> int:
+        """Feeds the frames of a log written with `record_path` through the stream's handlers, without connecting.
+
+        The handlers, dispatch workers and conflation work as they would for a live connection, so this can be used
+        to reproduce a session or to benchmark the handlers at the rate the messages were received.
+
+        Args:
+            path (str): The path of the log.
+            speed (Optional[float]): How many times faster than they were received to replay the frames, e.g. 1 for
+              real time. Defaults to replaying them as fast as the handlers can take them.
+
+        Returns:
+            int: The number of frames replayed.
+        """
+        self._start_dispatching()
+        try:
+            count = await replay_frames(path, self._handle_frame, speed)
+            # let the handlers catch up before stopping them
+            if self._dispatcher is not None:
+                await self._dispatcher.join()
+            for handlers in self._handlers.values():
+                for handler in set(handlers.values()):
+                    if isinstance(handler, BufferedHandler):
+                        await handler.join()
+            return count
+        finally:
+            await self._stop_dispatching()
+
+    async def _run_connection(self) -> None:
+        """Keeps the websocket connection open and consumes it until the stream is stopped"""
         while True:
             try:
                 if not self._should_run:
@@ -342,12 +755,14 @@ class DataStream:
                     log.info("starting {} websocket connection".format(self._name))
                     await self._start_ws()
                     await self._send_subscribe_msg()
-                    self._running = True
+                    self._on_connected()
                 await self._consume()
             except websockets.WebSocketException as wse:
                 await self.close()
                 self._running = False
                 log.warning("data websocket error, restarting connection: " + str(wse))
+                if not await self._wait_to_reconnect():
+                    return
             except ValueError as ve:
                 if "insufficient subscription" in str(ve):
                     await self.close()
@@ -355,13 +770,75 @@ class DataStream:
                     log.exception(f"error during websocket communication: {str(ve)}")
                     return
                 log.exception(f"error during websocket communication: {str(ve)}")
+                if not self._running and not await self._wait_to_reconnect():
+                    return
             except Exception as e:
                 log.exception(f"error during websocket communication: {str(e)}")
+                # only failing to connect is retried with a backoff, handler errors keep consuming
+                if not self._running and not await self._wait_to_reconnect():
+                    return
             finally:
                 await asyncio.sleep(0)
 
+    def _on_connected(self) -> None:
+        """Marks the connection as running and starts watching for gaps in the channels that had data before"""
+        self._running = True
+        self._connected_at = time.monotonic()
+        self._gap_channels = dict(self._last_timestamps)
+
+    async def _wait_to_reconnect(self) -> bool:
+        """Waits before the next connection attempt as the reconnect policy says.
+
+        Returns:
+            bool: Whether to reconnect, False if the policy gave up.
+        """
+        if (
+            self._connected_at is not None
+            and time.monotonic() - self._connected_at
+            >= self._reconnect_policy.reset_after
+        ):
+            self._reconnect_attempts = 0
+        self._connected_at = None
+
+        delay = self._reconnect_policy.get_reconnect_delay(self._reconnect_attempts)
+        if delay is None:
+            log.error(
+                f"{self._name} stream giving up after {self._reconnect_attempts} reconnect attempts"
+            )
+            self._should_run = False
+            return False
+
+        self._reconnect_attempts += 1
+        log.info(f"reconnecting {self._name} stream in {delay:.2f}s")
+        return not await self._wait_for_stop(delay)
+
+    async def _watch_stale_channels(self) -> None:
+        """Reopens the connection when a subscribed channel goes without messages for longer than its stale timeout"""
+        interval = min(self._stale_timeouts.values()) / 4
+        while True:
+            await asyncio.sleep(interval)
+            if not self._running or self._connected_at is None:
+                continue
+
+            now = time.monotonic()
+            for channel, timeout in self._stale_timeouts.items():
+                if not self._handlers.get(channel):
+                    continue
+                last_received = max(
+                    self._last_received.get(channel, 0), self._connected_at
+                )
+                if now - last_received > timeout:
+                    log.warning(
+                        f"no {channel} received for {timeout}s, reopening {self._name} stream connection"
+                    )
+                    # consuming the closed connection fails and reconnects
+                    if self._ws is not None:
+                        await self._ws.close()
+                    break
+
     def run(self) -> None:
         """Starts up the websocket connection's event loop"""
+        self._prepare_run()
         try:
             asyncio.run(self._run_forever())
         except KeyboardInterrupt:
@@ -372,11 +849,81 @@ class DataStream:
 
     def stop(self) -> None:
         """Stops the websocket connection."""
-        if self._loop.is_running():
-            asyncio.run_coroutine_threadsafe(self.stop_ws(), self._loop).result(
-                timeout=5
+        if self._loop is not None and self._loop.is_running():
+            self._run_in_loop(self.stop_ws(), timeout=5)
+
+    def _run_in_loop(self, coro: Awaitable, timeout: Optional[float] = None) -> None:
+        """Runs a coroutine in the stream's event loop and waits for it, or schedules it when called from that loop
+
+        Args:
+            coro (Awaitable): The coroutine to run
+            timeout (Optional[float]): The maximum number of seconds to wait for the coroutine from another thread
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is not self._loop:
+            asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout=timeout)
+            return
+
+        # waiting for the coroutine here would block the loop it needs to run in
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error(f"error during websocket communication: {str(task.exception())}")
+
+    async def __aenter__(self) -> "DataStream":
+        """Starts the stream in the running event loop, for `async with stream:`
+
+        Returns:
+            DataStream: The stream.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._prepare_run()
+        self._task = asyncio.ensure_future(self._run_forever())
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stops the stream and waits for its connection to close"""
+        await self.stop_ws()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    def _iterate(
+        self, channel: str, symbols: Tuple[str], queue_size: int
+    ) -> MessageIterator:
+        """Subscribes a new MessageIterator to a channel for a tuple of symbols
+
+        Args:
+            channel (str): The channel to subscribe to
+            symbols (Tuple[str]): The tuple containing the symbols to be subscribed to
+            queue_size (int): The maximum number of messages queued for the iterator
+
+        Returns:
+            MessageIterator: The iterator of the messages.
+        """
+
+        def unsubscribe(iterator: MessageIterator) -> None:
+            self._iterators.discard(iterator)
+            handlers = self._handlers[channel]
+            # symbols that were subscribed to again since belong to their new handler
+            self._unsubscribe(
+                channel,
+                [symbol for symbol in symbols if handlers.get(symbol) == iterator.put],
             )
 
+        iterator = MessageIterator(queue_size, on_close=unsubscribe)
+        self._iterators.add(iterator)
+        self._subscribe(iterator.put, symbols, self._handlers[channel])
+        return iterator
+
     def _ensure_coroutine(self, handler: Callable) -> None:
         """Checks if a method is an asyncio coroutine method
 
@@ -388,3 +935,10 @@ class DataStream:
         """
         if not asyncio.iscoroutinefunction(handler):
             raise ValueError("handler must be a coroutine function")
+
+
+def _to_datetime(timestamp: Any) -> datetime:
+    """Converts the timestamp of a message to a datetime, if it isn't one already"""
+    if isinstance(timestamp, datetime):
+        return timestamp
+    return timestamp.to_datetime()
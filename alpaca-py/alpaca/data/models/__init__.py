@@ -4,4 +4,5 @@ from alpaca.data.models.news import *
 from alpaca.data.models.quotes import *
 from alpaca.data.models.trades import *
 from alpaca.data.models.snapshots import *
+from alpaca.data.models.ticks import *
 from alpaca.data.models.orderbooks import *
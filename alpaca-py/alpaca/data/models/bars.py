@@ -4,7 +4,12 @@ from typing import Dict, List, Optional
 from alpaca.common.models import ValidateBaseModel as BaseModel
 from alpaca.common.types import RawData
 from alpaca.data.mappings import BAR_MAPPING
-from alpaca.data.models.base import BaseDataSet, TimeSeriesMixin
+from alpaca.data.models.base import (
+    BaseDataSet,
+    LazyList,
+    LazyModelList,
+    TimeSeriesMixin,
+)
 
 
 class Bar(BaseModel):
@@ -55,10 +60,11 @@ class BarSet(BaseDataSet, TimeSeriesMixin):
     """A collection of Bars.
 
     Attributes:
-        data (Dict[str, List[Bar]]): The collection of Bars keyed by symbol.
+        data (Dict[str, LazyModelList]): The collection of Bars keyed by symbol. Each Bar is built
+          from the raw data when it is first accessed.
     """
 
-    data: Dict[str, List[Bar]] = {}
+    data: Dict[str, LazyList[Bar]] = {}
 
     def __init__(
         self,
@@ -76,8 +82,6 @@ class BarSet(BaseDataSet, TimeSeriesMixin):
 
         if raw_bars is not None:
             for symbol, bars in raw_bars.items():
-                parsed_bars[symbol] = [
-                    Bar(symbol, bar) for bar in bars if bar is not None
-                ]
+                parsed_bars[symbol] = LazyModelList(symbol, bars, Bar, BAR_MAPPING)
 
         super().__init__(data=parsed_bars)
@@ -1,11 +1,165 @@
 import itertools
-from typing import Any, Dict, List
+import operator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    SupportsIndex,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
 from pandas import DataFrame
+from pydantic import SkipValidation, WrapSerializer
+from typing_extensions import Annotated
 
 from alpaca.common.models import ValidateBaseModel as BaseModel
+from alpaca.common.types import RawData
+from alpaca.data.columnar import MarketDataColumns
+
+ModelT = TypeVar("ModelT")
+
+
+# stands in for the model of a row that hasn't been built yet
+_UNBUILT = object()
+
+
+class LazyModelList(list):
+    """
+    A list of the models of one symbol, that keeps the raw API data and only builds the model for a row the first
+    time it is accessed. It is a `list`, so indexing, slicing, iteration, `len`, `+` and `isinstance(x, list)` work as
+    before. Methods that modify the list, like `append` or `extend`, build the remaining models first.
+
+    Since rows are validated when their model is built, an invalid row raises when it is first accessed rather than
+    when the data set is created.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        raw_data: List[RawData],
+        model: Type[BaseModel],
+        mapping: Dict[str, str],
+    ) -> None:
+        """
+        Args:
+            symbol (str): The symbol the rows belong to.
+            raw_data (List[RawData]): The raw rows as received from the API.
+            model (Type[BaseModel]): The model to build for each row, instantiated as `model(symbol, row)`.
+            mapping (Dict[str, str]): The mapping of raw keys to model fields, e.g. BAR_MAPPING.
+        """
+        rows = [row for row in raw_data if row is not None]
+        super().__init__(itertools.repeat(_UNBUILT, len(rows)))
+        self._symbol = symbol
+        self._raw_data: Optional[List[RawData]] = rows
+        self._model = model
+        self._mapping = mapping
+
+    @property
+    def raw_data(self) -> Optional[List[RawData]]:
+        """The raw rows as received from the API, None once the list has been modified."""
+        return self._raw_data
+
+    def __getitem__(self, index: Union[SupportsIndex, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        item = super().__getitem__(index)
+        if item is _UNBUILT:
+            index = operator.index(index)
+            if index < 0:
+                index += len(self)
+            item = self._model(self._symbol, self._raw_data[index])
+            super().__setitem__(index, item)
+        return item
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reversed__(self) -> Iterator[BaseModel]:
+        for i in reversed(range(len(self))):
+            yield self[i]
+
+    def __contains__(self, value: Any) -> bool:
+        return any(item is value or item == value for item in self)
+
+    def __eq__(self, other: Any) -> bool:
+        return list(self) == other
+
+    def __ne__(self, other: Any) -> bool:
+        return list(self) != other
+
+    def __add__(self, other: Any) -> List[BaseModel]:
+        return list(self) + other
+
+    def __radd__(self, other: Any) -> List[BaseModel]:
+        return other + list(self)
+
+    def __mul__(self, n: SupportsIndex) -> List[BaseModel]:
+        return list(self) * n
+
+    __rmul__ = __mul__
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce__(self) -> Any:
+        # copies and pickles are plain lists of the models
+        return list, (list(self),)
+
+    def copy(self) -> List[BaseModel]:
+        return list(self)
+
+    def index(self, *args: Any) -> int:
+        self._build_all()
+        return super().index(*args)
+
+    def count(self, value: Any) -> int:
+        self._build_all()
+        return super().count(value)
+
+    def _build_all(self) -> None:
+        for i in range(len(self)):
+            self[i]
+
+    def _modifying(name: str) -> Callable:
+        def method(self: "LazyModelList", *args: Any, **kwargs: Any) -> Any:
+            self._build_all()
+            # the models no longer match the raw rows
+            self._raw_data = None
+            return getattr(super(LazyModelList, self), name)(*args, **kwargs)
+
+        method.__name__ = name
+        return method
+
+    append = _modifying("append")
+    extend = _modifying("extend")
+    insert = _modifying("insert")
+    pop = _modifying("pop")
+    remove = _modifying("remove")
+    clear = _modifying("clear")
+    sort = _modifying("sort")
+    reverse = _modifying("reverse")
+    __setitem__ = _modifying("__setitem__")
+    __delitem__ = _modifying("__delitem__")
+    __iadd__ = _modifying("__iadd__")
+    __imul__ = _modifying("__imul__")
+    del _modifying
+
+
+# a List field holding a LazyModelList, which is not validated (that would build every model) and is serialized
+# like a list of models
+LazyList = Annotated[
+    SkipValidation[List[ModelT]],
+    WrapSerializer(lambda value, handler: handler(list(value))),
+]
 
 
 class TimeSeriesMixin:
@@ -17,6 +171,15 @@ class TimeSeriesMixin:
         Returns:
             DataFrame: data in a pandas dataframe
         """
+        data = getattr(self, "data", None)
+        if data and all(
+            isinstance(rows, LazyModelList) and rows.raw_data is not None
+            for rows in data.values()
+        ):
+            # decode the raw data straight into columns, instead of building every model first
+            if any(len(rows) for rows in data.values()):
+                return _lazy_model_lists_to_frame(data)
+
         # combine all lists of data into one list
         data_list = list(itertools.chain.from_iterable(self.dict().values()))
 
@@ -77,3 +240,10 @@ class BaseDataSet(BaseModel):
             symbol: list(map(lambda d: d.model_dump(), data_list))
             for symbol, data_list in self.data.items()
         }
+
+
+def _lazy_model_lists_to_frame(data: Dict[str, LazyModelList]) -> DataFrame:
+    first = next(iter(data.values()))
+    columns = MarketDataColumns(first._mapping, first._model)
+    columns.decode_page({symbol: rows.raw_data for symbol, rows in data.items()})
+    return columns.to_frame()
@@ -5,7 +5,12 @@ from alpaca.common.models import ValidateBaseModel as BaseModel
 from alpaca.common.types import RawData
 from alpaca.data.enums import Exchange
 from alpaca.data.mappings import QUOTE_MAPPING
-from alpaca.data.models.base import BaseDataSet, TimeSeriesMixin
+from alpaca.data.models.base import (
+    BaseDataSet,
+    LazyList,
+    LazyModelList,
+    TimeSeriesMixin,
+)
 
 
 class Quote(BaseModel):
@@ -56,10 +61,11 @@ class QuoteSet(BaseDataSet, TimeSeriesMixin):
     """A collection of Quotes.
 
     Attributes:
-        data (Dict[str, List[Quote]]): The collection of Quotes keyed by symbol.
+        data (Dict[str, LazyModelList]): The collection of Quotes keyed by symbol. Each Quote is built
+          from the raw data when it is first accessed.
     """
 
-    data: Dict[str, List[Quote]] = {}
+    data: Dict[str, LazyList[Quote]] = {}
 
     def __init__(self, raw_data: RawData) -> None:
         """Instantiates a QuoteSet.
@@ -71,8 +77,8 @@ class QuoteSet(BaseDataSet, TimeSeriesMixin):
 
         if raw_data is not None:
             for symbol, quotes in raw_data.items():
-                parsed_quotes[symbol] = [
-                    Quote(symbol, quote) for quote in quotes if quote is not None
-                ]
+                parsed_quotes[symbol] = LazyModelList(
+                    symbol, quotes, Quote, QUOTE_MAPPING
+                )
 
         super().__init__(data=parsed_quotes)
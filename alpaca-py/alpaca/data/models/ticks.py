@@ -0,0 +1,216 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pytz import utc
+
+
+class Tick:
+    """
+    Base class of the lightweight records data streams can deliver instead of the validated models.
+
+    Ticks are built straight from the websocket message without validation or conversion. Timestamps are integer
+    nanoseconds since the epoch and exchanges are kept as the raw codes.
+    """
+
+    __slots__ = ("symbol", "timestamp")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields())
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self._fields()
+        )
+
+    @classmethod
+    def _fields(cls) -> Tuple[str, ...]:
+        return Tick.__slots__ + cls.__slots__
+
+    def to_datetime(self) -> datetime:
+        """Returns the timestamp as a timezone aware datetime. Precision below microseconds is lost."""
+        seconds, nanoseconds = divmod(self.timestamp, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, tz=utc).replace(
+            microsecond=nanoseconds // 1000
+        )
+
+
+class TradeTick(Tick):
+    """A trade from a data stream, see Trade.
+
+    Attributes:
+        symbol (str): The ticker identifier for the security whose data forms the trade.
+        timestamp (int): The time of the trade in nanoseconds since the epoch.
+        price (float): The price that the transaction occurred at.
+        size (float): The quantity traded.
+        exchange (Optional[str]): The code of the exchange the trade occurred.
+        id (Optional[int]): The trade ID.
+        conditions (Optional[Union[List[str], str]]): The trade conditions.
+        tape (Optional[str]): The trade tape.
+    """
+
+    __slots__ = ("price", "size", "exchange", "id", "conditions", "tape")
+
+    def __init__(
+        self,
+        symbol: str,
+        timestamp: int,
+        price: float,
+        size: float,
+        exchange: Optional[str] = None,
+        id: Optional[int] = None,
+        conditions: Optional[Union[List[str], str]] = None,
+        tape: Optional[str] = None,
+    ) -> None:
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.price = price
+        self.size = size
+        self.exchange = exchange
+        self.id = id
+        self.conditions = conditions
+        self.tape = tape
+
+
+class QuoteTick(Tick):
+    """A quote from a data stream, see Quote.
+
+    Attributes:
+        symbol (str): The ticker identifier for the security whose data forms the quote.
+        timestamp (int): The time of the quote in nanoseconds since the epoch.
+        bid_price (float): The bidding price of the quote.
+        bid_size (float): The size of the quote bid.
+        bid_exchange (Optional[str]): The code of the exchange the quote bid originates.
+        ask_price (float): The asking price of the quote.
+        ask_size (float): The size of the quote ask.
+        ask_exchange (Optional[str]): The code of the exchange the quote ask originates.
+        conditions (Optional[Union[List[str], str]]): The quote conditions.
+        tape (Optional[str]): The quote tape.
+    """
+
+    __slots__ = (
+        "bid_price",
+        "bid_size",
+        "bid_exchange",
+        "ask_price",
+        "ask_size",
+        "ask_exchange",
+        "conditions",
+        "tape",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        timestamp: int,
+        bid_price: float,
+        bid_size: float,
+        bid_exchange: Optional[str],
+        ask_price: float,
+        ask_size: float,
+        ask_exchange: Optional[str],
+        conditions: Optional[Union[List[str], str]] = None,
+        tape: Optional[str] = None,
+    ) -> None:
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.bid_price = bid_price
+        self.bid_size = bid_size
+        self.bid_exchange = bid_exchange
+        self.ask_price = ask_price
+        self.ask_size = ask_size
+        self.ask_exchange = ask_exchange
+        self.conditions = conditions
+        self.tape = tape
+
+
+class BarTick(Tick):
+    """A bar from a data stream, see Bar.
+
+    Attributes:
+        symbol (str): The ticker identifier for the security whose data forms the bar.
+        timestamp (int): The opening time of the bar in nanoseconds since the epoch.
+        open (float): The opening price of the interval.
+        high (float): The high price during the interval.
+        low (float): The low price during the interval.
+        close (float): The closing price of the interval.
+        volume (float): The volume traded over the interval.
+        trade_count (Optional[float]): The number of trades that occurred.
+        vwap (Optional[float]): The volume weighted average price.
+    """
+
+    __slots__ = ("open", "high", "low", "close", "volume", "trade_count", "vwap")
+
+    def __init__(
+        self,
+        symbol: str,
+        timestamp: int,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        trade_count: Optional[float] = None,
+        vwap: Optional[float] = None,
+    ) -> None:
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.trade_count = trade_count
+        self.vwap = vwap
+
+
+def to_tick(msg: Dict) -> Optional[Tick]:
+    """Builds the tick record of a trade, quote or bar websocket message.
+
+    Args:
+        msg (Dict): The message as decoded from the websocket, with its msgpack timestamp.
+
+    Returns:
+        Optional[Tick]: The tick, or None for any other type of message.
+    """
+    msg_type = msg.get("T")
+    get = msg.get
+    if msg_type == "t":
+        return TradeTick(
+            msg["S"],
+            msg["t"].to_unix_nano(),
+            msg["p"],
+            msg["s"],
+            get("x"),
+            get("i"),
+            get("c"),
+            get("z"),
+        )
+    if msg_type == "q":
+        return QuoteTick(
+            msg["S"],
+            msg["t"].to_unix_nano(),
+            msg["bp"],
+            msg["bs"],
+            get("bx"),
+            msg["ap"],
+            msg["as"],
+            get("ax"),
+            get("c"),
+            get("z"),
+        )
+    if msg_type in ("b", "u", "d"):
+        return BarTick(
+            msg["S"],
+            msg["t"].to_unix_nano(),
+            msg["o"],
+            msg["h"],
+            msg["l"],
+            msg["c"],
+            msg["v"],
+            get("n"),
+            get("vw"),
+        )
+    return None
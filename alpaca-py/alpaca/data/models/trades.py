@@ -10,7 +10,12 @@ from alpaca.data.mappings import (
     TRADE_MAPPING,
     TRADING_STATUS_MAPPING,
 )
-from alpaca.data.models.base import BaseDataSet, TimeSeriesMixin
+from alpaca.data.models.base import (
+    BaseDataSet,
+    LazyList,
+    LazyModelList,
+    TimeSeriesMixin,
+)
 
 
 class Trade(BaseModel):
@@ -57,10 +62,11 @@ class TradeSet(BaseDataSet, TimeSeriesMixin):
     """A collection of Trade objects.
 
     Attributes:
-        data (Dict[str, List[Trade]]]): The collection of Trades keyed by symbol.
+        data (Dict[str, LazyModelList]): The collection of Trades keyed by symbol. Each Trade is built
+          from the raw data when it is first accessed.
     """
 
-    data: Dict[str, List[Trade]] = {}
+    data: Dict[str, LazyList[Trade]] = {}
 
     def __init__(self, raw_data: RawData) -> None:
         """Instantiates a TradeSet - a collection of Trades.
@@ -72,9 +78,9 @@ class TradeSet(BaseDataSet, TimeSeriesMixin):
 
         if raw_data is not None:
             for symbol, trades in raw_data.items():
-                parsed_trades[symbol] = [
-                    Trade(symbol, trade) for trade in trades if trade is not None
-                ]
+                parsed_trades[symbol] = LazyModelList(
+                    symbol, trades, Trade, TRADE_MAPPING
+                )
 
         super().__init__(data=parsed_trades)
 
@@ -0,0 +1,304 @@
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from alpaca.common.types import RawData
+from alpaca.data.models.orderbooks import Orderbook, OrderbookQuote
+
+
+class _BookSide:
+    """
+    The levels of one side of a book, kept sorted from the best price in two arrays.
+
+    Bid prices are stored negated, so both sides are searched in ascending order.
+    """
+
+    def __init__(self, descending: bool) -> None:
+        self._sign = -1.0 if descending else 1.0
+        self.keys = np.empty(0, dtype=np.float64)
+        self.sizes = np.empty(0, dtype=np.float64)
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self.keys * self._sign
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def replace(self, prices: np.ndarray, sizes: np.ndarray) -> None:
+        keys = prices * self._sign
+        order = np.argsort(keys, kind="stable")
+        keys, sizes = keys[order], sizes[order]
+        present = sizes != 0
+        self.keys, self.sizes = keys[present], sizes[present]
+
+    def update(self, prices: np.ndarray, sizes: np.ndarray) -> None:
+        if len(prices) == 0:
+            return
+        keys = prices * self._sign
+
+        # a level updated twice in one message takes its last size
+        keys, last = np.unique(keys[::-1], return_index=True)
+        sizes = sizes[::-1][last]
+
+        index = np.searchsorted(self.keys, keys)
+        if len(self.keys):
+            bounded = np.minimum(index, len(self.keys) - 1)
+            exists = (index < len(self.keys)) & (self.keys[bounded] == keys)
+        else:
+            exists = np.zeros(len(keys), dtype=bool)
+
+        self.sizes[index[exists]] = sizes[exists]
+
+        added = ~exists & (sizes != 0)
+        if added.any():
+            self.keys = np.insert(self.keys, index[added], keys[added])
+            self.sizes = np.insert(self.sizes, index[added], sizes[added])
+
+        removed = self.sizes == 0
+        if removed.any():
+            self.keys = self.keys[~removed]
+            self.sizes = self.sizes[~removed]
+
+
+class LocalOrderbook:
+    """
+    An L2 order book of one symbol, maintained from orderbook snapshots and updates.
+
+    Levels are kept sorted in numpy arrays, so the best prices are read in constant time and depth views are slices.
+    An update sets the size of each level it contains, and removes the levels whose size is zero. A reset, like
+    the first message after subscribing, replaces the whole book.
+    """
+
+    def __init__(self, symbol: str) -> None:
+        """
+        Args:
+            symbol (str): The symbol of the book.
+        """
+        self.symbol = symbol
+        self.timestamp: Any = None
+        self._bids = _BookSide(descending=True)
+        self._asks = _BookSide(descending=False)
+
+    def apply(
+        self, orderbook: Union[Orderbook, RawData], reset: Optional[bool] = None
+    ) -> None:
+        """Applies an orderbook message to the book.
+
+        Args:
+            orderbook (Union[Orderbook, RawData]): The orderbook, parsed or as received from the stream or the
+              latest orderbook endpoint.
+            reset (Optional[bool]): Whether the orderbook replaces the whole book. Defaults to the orderbook's reset
+              flag.
+        """
+        if isinstance(orderbook, Orderbook):
+            bids, asks = _to_arrays(orderbook.bids), _to_arrays(orderbook.asks)
+            timestamp = orderbook.timestamp
+            is_reset = orderbook.reset
+        else:
+            bids = _to_arrays(orderbook.get("b", []))
+            asks = _to_arrays(orderbook.get("a", []))
+            timestamp = orderbook.get("t")
+            is_reset = orderbook.get("r", False)
+
+        if reset is None:
+            reset = is_reset
+
+        if reset:
+            self._bids.replace(*bids)
+            self._asks.replace(*asks)
+        else:
+            self._bids.update(*bids)
+            self._asks.update(*asks)
+        self.timestamp = timestamp
+
+    @property
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        """The price and size of the highest bid, or None if there are no bids."""
+        if not len(self._bids):
+            return None
+        return -float(self._bids.keys[0]), float(self._bids.sizes[0])
+
+    @property
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        """The price and size of the lowest ask, or None if there are no asks."""
+        if not len(self._asks):
+            return None
+        return float(self._asks.keys[0]), float(self._asks.sizes[0])
+
+    @property
+    def spread(self) -> Optional[float]:
+        """The difference between the best ask and bid prices, or None if a side is empty."""
+        if not len(self._bids) or not len(self._asks):
+            return None
+        return float(self._asks.keys[0] + self._bids.keys[0])
+
+    @property
+    def mid(self) -> Optional[float]:
+        """The average of the best bid and ask prices, or None if a side is empty."""
+        if not len(self._bids) or not len(self._asks):
+            return None
+        return float(self._asks.keys[0] - self._bids.keys[0]) / 2
+
+    @property
+    def microprice(self) -> Optional[float]:
+        """The average of the best bid and ask prices weighted by the size on the other side, or None if a side is
+        empty. Leans towards the side with less size, which is the side more likely to be taken out next.
+        """
+        if not len(self._bids) or not len(self._asks):
+            return None
+        bid, bid_size = -self._bids.keys[0], self._bids.sizes[0]
+        ask, ask_size = self._asks.keys[0], self._asks.sizes[0]
+        return float((bid * ask_size + ask * bid_size) / (bid_size + ask_size))
+
+    def bids(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the prices and sizes of the bids, best first.
+
+        Args:
+            depth (Optional[int]): The number of levels to return. Defaults to all.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The prices and the sizes.
+        """
+        return self._bids.prices[:depth], self._bids.sizes[:depth].copy()
+
+    def asks(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the prices and sizes of the asks, best first.
+
+        Args:
+            depth (Optional[int]): The number of levels to return. Defaults to all.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The prices and the sizes.
+        """
+        return self._asks.prices[:depth], self._asks.sizes[:depth].copy()
+
+    def to_orderbook_quotes(
+        self, depth: Optional[int] = None
+    ) -> Tuple[List[OrderbookQuote], List[OrderbookQuote]]:
+        """Returns the bids and asks as OrderbookQuote lists, best first.
+
+        Args:
+            depth (Optional[int]): The number of levels of each side to return. Defaults to all.
+
+        Returns:
+            Tuple[List[OrderbookQuote], List[OrderbookQuote]]: The bids and the asks.
+        """
+        return tuple(
+            [
+                OrderbookQuote(p=float(price), s=float(size))
+                for price, size in zip(*side(depth))
+            ]
+            for side in (self.bids, self.asks)
+        )
+
+
+class LocalOrderbooks:
+    """
+    The local order books of several symbols, e.g. of a crypto orderbook subscription.
+
+    Use `handle` as the handler of `CryptoDataStream.subscribe_orderbooks`, and `load` to start the books from
+    `CryptoHistoricalDataClient.get_crypto_latest_orderbook`.
+    """
+
+    def __init__(
+        self, on_update: Optional[Callable[[LocalOrderbook], Awaitable[None]]] = None
+    ) -> None:
+        """
+        Args:
+            on_update (Optional[Callable[[LocalOrderbook], Awaitable[None]]]): A coroutine called with the book of
+              a symbol after each orderbook of the symbol was applied. Defaults to None.
+        """
+        self._books: Dict[str, LocalOrderbook] = {}
+        self._on_update = on_update
+
+    def __getitem__(self, symbol: str) -> LocalOrderbook:
+        return self._books[symbol]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._books
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._books)
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+    def get_book(self, symbol: str) -> LocalOrderbook:
+        """Returns the book of a symbol, creating an empty one if there is none yet.
+
+        Args:
+            symbol (str): The symbol.
+
+        Returns:
+            LocalOrderbook: The book.
+        """
+        book = self._books.get(symbol)
+        if book is None:
+            book = self._books[symbol] = LocalOrderbook(symbol)
+        return book
+
+    def apply(
+        self, orderbook: Union[Orderbook, RawData], symbol: Optional[str] = None
+    ) -> LocalOrderbook:
+        """Applies an orderbook message to the book of its symbol.
+
+        Args:
+            orderbook (Union[Orderbook, RawData]): The orderbook, parsed or as received from the stream.
+            symbol (Optional[str]): The symbol of the orderbook. Defaults to the symbol of the orderbook.
+
+        Returns:
+            LocalOrderbook: The updated book.
+        """
+        if symbol is None:
+            symbol = (
+                orderbook.symbol
+                if isinstance(orderbook, Orderbook)
+                else orderbook.get("S")
+            )
+        book = self.get_book(symbol)
+        book.apply(orderbook)
+        return book
+
+    def load(self, orderbooks: Dict[str, Union[Orderbook, RawData]]) -> None:
+        """Replaces the books with full orderbooks, e.g. the result of `get_crypto_latest_orderbook`.
+
+        Args:
+            orderbooks (Dict[str, Union[Orderbook, RawData]]): The orderbooks keyed by symbol, parsed or raw.
+        """
+        for symbol, orderbook in orderbooks.items():
+            self.get_book(symbol).apply(orderbook, reset=True)
+
+    async def handle(self, orderbook: Union[Orderbook, RawData]) -> None:
+        """Applies an orderbook from a stream, for use as the handler of an orderbook subscription.
+
+        Args:
+            orderbook (Union[Orderbook, RawData]): The orderbook, parsed or raw.
+        """
+        book = self.apply(orderbook)
+        if self._on_update is not None:
+            await self._on_update(book)
+
+
+def _to_arrays(
+    levels: List[Union[OrderbookQuote, Dict]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the prices and sizes of a list of orderbook levels as arrays."""
+    if levels and isinstance(levels[0], OrderbookQuote):
+        pairs = [(level.price, level.size) for level in levels]
+    else:
+        pairs = [(level["p"], level["s"]) for level in levels]
+    if not pairs:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+    prices, sizes = np.array(pairs, dtype=np.float64).T
+    return prices, sizes
@@ -2,52 +2,898 @@ from uuid import UUID
 from pydantic import TypeAdapter
 import json
 
+from requests import Session
+
 from alpaca.common import RawData
 from alpaca.common.utils import (
     validate_symbol_or_contract_id,
     validate_uuid_id_param,
     validate_symbol_or_asset_id,
 )
-from alpaca.common.rest import RESTClient
-from typing import Optional, List, Union
-from alpaca.common.enums import BaseURL
+from alpaca.common.instrumentation import RequestHooks
+from alpaca.common.metrics import MetricsSink
+from alpaca.common.rate_limit import RateLimiter
+from alpaca.common.retry import RetryPolicy
+from alpaca.common.rest import APICall, AsyncRESTClient, RESTClient
+from alpaca.common.sessions import DEFAULT_TIMEOUT, Timeout
+from typing import TYPE_CHECKING, Optional, List, Union
+from alpaca.common.enums import BaseURL, JSONBackend
+
+from alpaca.trading.requests import (
+    GetCalendarRequest,
+    ClosePositionRequest,
+    GetAssetsRequest,
+    GetOptionContractsRequest,
+    GetPortfolioHistoryRequest,
+    OrderRequest,
+    GetOrdersRequest,
+    ReplaceOrderRequest,
+    GetOrderByIdRequest,
+    CancelOrderResponse,
+    CreateWatchlistRequest,
+    UpdateWatchlistRequest,
+    GetCorporateAnnouncementsRequest,
+)
+
+from alpaca.trading.models import (
+    OptionContract,
+    OptionContractsResponse,
+    Order,
+    PortfolioHistory,
+    Position,
+    ClosePositionResponse,
+    Asset,
+    Watchlist,
+    Clock,
+    Calendar,
+    TradeAccount,
+    CorporateActionAnnouncement,
+    AccountConfiguration,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class _TradingRequests:
+    """
+    Builds the calls of the trading API endpoints, shared by TradingClient and AsyncTradingClient so the two only
+    differ in whether they await sending them.
+    """
+
+    def _submit_order_call(self, order_data: OrderRequest) -> APICall:
+        data = order_data.to_request_fields()
+        return APICall("POST", "/orders", data, response_model=Order)
+
+    def _get_orders_call(self, filter: Optional[GetOrdersRequest] = None) -> APICall:
+        params = filter.to_request_fields() if filter is not None else {}
+
+        if "symbols" in params and isinstance(params["symbols"], list):
+            params["symbols"] = ",".join(params["symbols"])
+
+        return APICall(
+            "GET", "/orders", params, response_model=TypeAdapter(List[Order])
+        )
+
+    def _get_order_by_id_call(
+        self, order_id: Union[UUID, str], filter: Optional[GetOrderByIdRequest] = None
+    ) -> APICall:
+        params = filter.to_request_fields() if filter is not None else {}
+
+        order_id = validate_uuid_id_param(order_id, "order_id")
+
+        return APICall("GET", f"/orders/{order_id}", params, response_model=Order)
+
+    def _get_order_by_client_id_call(self, client_id: str) -> APICall:
+        params = {"client_order_id": client_id}
+
+        return APICall(
+            "GET", f"/orders:by_client_order_id", params, response_model=Order
+        )
+
+    def _replace_order_by_id_call(
+        self,
+        order_id: Union[UUID, str],
+        order_data: Optional[ReplaceOrderRequest] = None,
+    ) -> APICall:
+        params = order_data.to_request_fields() if order_data is not None else {}
+
+        order_id = validate_uuid_id_param(order_id, "order_id")
+
+        return APICall("PATCH", f"/orders/{order_id}", params, response_model=Order)
+
+    def _cancel_orders_call(self) -> APICall:
+        return APICall(
+            "DELETE", f"/orders", response_model=TypeAdapter(List[CancelOrderResponse])
+        )
+
+    def _cancel_order_by_id_call(self, order_id: Union[UUID, str]) -> APICall:
+        order_id = validate_uuid_id_param(order_id, "order_id")
+
+        # TODO: Should ideally return some information about the order's cancel status. (Issue #78).
+        # TODO: Currently no way to retrieve status details for empty responses with base REST implementation
+        return APICall("DELETE", f"/orders/{order_id}")
+
+    def _get_all_positions_call(
+        self,
+    ) -> APICall:
+        return APICall("GET", "/positions", response_model=TypeAdapter(List[Position]))
+
+    def _get_open_position_call(self, symbol_or_asset_id: Union[UUID, str]) -> APICall:
+        symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
+        return APICall(
+            "GET", f"/positions/{symbol_or_asset_id}", response_model=Position
+        )
+
+    def _close_all_positions_call(
+        self, cancel_orders: Optional[bool] = None
+    ) -> APICall:
+        return APICall(
+            "DELETE",
+            "/positions",
+            {"cancel_orders": cancel_orders} if cancel_orders else None,
+            response_model=TypeAdapter(List[ClosePositionResponse]),
+        )
+
+    def _close_position_call(
+        self,
+        symbol_or_asset_id: Union[UUID, str],
+        close_options: Optional[ClosePositionRequest] = None,
+    ) -> APICall:
+        symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
+        return APICall(
+            "DELETE",
+            f"/positions/{symbol_or_asset_id}",
+            close_options.to_request_fields() if close_options else {},
+            response_model=Order,
+        )
+
+    def _exercise_options_position_call(
+        self,
+        symbol_or_contract_id: Union[UUID, str],
+    ) -> APICall:
+        symbol_or_contract_id = validate_symbol_or_contract_id(symbol_or_contract_id)
+        return APICall("POST", f"/positions/{symbol_or_contract_id}/exercise")
+
+    def _get_portfolio_history_call(
+        self,
+        history_filter: Optional[GetPortfolioHistoryRequest] = None,
+    ) -> APICall:
+        return APICall(
+            "GET",
+            f"/account/portfolio/history",
+            history_filter.to_request_fields() if history_filter else {},
+            response_model=PortfolioHistory,
+        )
+
+    def _get_all_assets_call(
+        self, filter: Optional[GetAssetsRequest] = None
+    ) -> APICall:
+        params = filter.to_request_fields() if filter is not None else {}
+
+        return APICall(
+            "GET", f"/assets", params, response_model=TypeAdapter(List[Asset])
+        )
+
+    def _get_asset_call(self, symbol_or_asset_id: Union[UUID, str]) -> APICall:
+        symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
+
+        return APICall("GET", f"/assets/{symbol_or_asset_id}", response_model=Asset)
+
+    def _get_clock_call(self) -> APICall:
+        return APICall("GET", "/clock", response_model=Clock)
+
+    def _get_calendar_call(
+        self,
+        filters: Optional[GetCalendarRequest] = None,
+    ) -> APICall:
+        return APICall(
+            "GET",
+            "/calendar",
+            filters.to_request_fields() if filters else {},
+            response_model=TypeAdapter(List[Calendar]),
+        )
+
+    def _get_account_call(self) -> APICall:
+        return APICall("GET", "/account", response_model=TradeAccount)
+
+    def _get_account_configurations_call(self) -> APICall:
+        return APICall(
+            "GET", "/account/configurations", response_model=AccountConfiguration
+        )
+
+    def _set_account_configurations_call(
+        self, account_configurations: AccountConfiguration
+    ) -> APICall:
+        return APICall(
+            "PATCH",
+            "/account/configurations",
+            account_configurations.model_dump(),
+            response_model=AccountConfiguration,
+        )
+
+    def _get_watchlists_call(
+        self,
+    ) -> APICall:
+        return APICall(
+            "GET", f"/watchlists", response_model=TypeAdapter(List[Watchlist])
+        )
+
+    def _get_watchlist_by_id_call(
+        self,
+        watchlist_id: Union[UUID, str],
+    ) -> APICall:
+        watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
+
+        return APICall("GET", f"/watchlists/{watchlist_id}", response_model=Watchlist)
+
+    def _create_watchlist_call(
+        self,
+        watchlist_data: CreateWatchlistRequest,
+    ) -> APICall:
+        return APICall(
+            "POST",
+            "/watchlists",
+            watchlist_data.to_request_fields(),
+            response_model=Watchlist,
+        )
+
+    def _update_watchlist_by_id_call(
+        self,
+        watchlist_id: Union[UUID, str],
+        # Might be worth taking a union of this and Watchlist itself; but then we should make a change like that SDK
+        # wide. Probably a good 0.2.x change
+        watchlist_data: UpdateWatchlistRequest,
+    ) -> APICall:
+        watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
+
+        return APICall(
+            "PUT",
+            f"/watchlists/{watchlist_id}",
+            watchlist_data.to_request_fields(),
+            response_model=Watchlist,
+        )
+
+    def _add_asset_to_watchlist_by_id_call(
+        self,
+        watchlist_id: Union[UUID, str],
+        symbol: str,
+    ) -> APICall:
+        watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
+
+        params = {"symbol": symbol}
+
+        return APICall(
+            "POST", f"/watchlists/{watchlist_id}", params, response_model=Watchlist
+        )
+
+    def _delete_watchlist_by_id_call(
+        self,
+        watchlist_id: Union[UUID, str],
+    ) -> APICall:
+        watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
+
+        return APICall("DELETE", f"/watchlists/{watchlist_id}")
+
+    def _remove_asset_from_watchlist_by_id_call(
+        self,
+        watchlist_id: Union[UUID, str],
+        symbol: str,
+    ) -> APICall:
+        watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
+
+        return APICall(
+            "DELETE", f"/watchlists/{watchlist_id}/{symbol}", response_model=Watchlist
+        )
+
+    def _get_corporate_announcements_call(
+        self, filter: GetCorporateAnnouncementsRequest
+    ) -> APICall:
+        params = filter.to_request_fields() if filter else {}
+
+        if "ca_types" in params and isinstance(params["ca_types"], list):
+            params["ca_types"] = ",".join(params["ca_types"])
+
+        return APICall(
+            "GET",
+            "/corporate_actions/announcements",
+            params,
+            response_model=TypeAdapter(List[CorporateActionAnnouncement]),
+        )
+
+    def _get_corporate_announcement_by_id_call(
+        self, corporate_announcment_id: Union[UUID, str]
+    ) -> APICall:
+        corporate_announcment_id = validate_uuid_id_param(
+            corporate_announcment_id, "corporate_announcment_id"
+        )
+
+        return APICall(
+            "GET",
+            f"/corporate_actions/announcements/{corporate_announcment_id}",
+            response_model=CorporateActionAnnouncement,
+        )
+
+    def _get_option_contracts_call(self, request: GetOptionContractsRequest) -> APICall:
+        if request is None:
+            raise ValueError("request (GetOptionContractsRequest) is required")
+
+        params = request.to_request_fields()
+
+        if "underlying_symbols" in params and isinstance(
+            request.underlying_symbols, list
+        ):
+            params["underlying_symbols"] = ",".join(request.underlying_symbols)
+
+        return APICall(
+            "GET",
+            "/options/contracts",
+            params,
+            response_model=TypeAdapter(OptionContractsResponse),
+        )
+
+    def _get_option_contract_call(self, symbol_or_id: Union[UUID, str]) -> APICall:
+        if symbol_or_id == "":
+            raise ValueError("symbol_or_id is required")
+
+        return APICall(
+            "GET",
+            f"/options/contracts/{symbol_or_id}",
+            response_model=TypeAdapter(OptionContract),
+        )
+
+
+class TradingClient(_TradingRequests, RESTClient):
+    """
+    A client to interact with the trading API, in both paper and live mode.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        oauth_token: Optional[str] = None,
+        paper: bool = True,
+        raw_data: bool = False,
+        url_override: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        session: Optional[Session] = None,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Instantiates a client for trading and managing personal brokerage accounts.
+
+        Args:
+            api_key (Optional[str]): The API key for trading. Use paper keys if paper is set to true.
+            secret_key (Optional[str]): The secret key for trading. Use paper keys if paper is set to true.
+            oauth_token (Optional[str]): The oauth token for trading on behalf of end user.
+            paper (bool): True is paper trading should be enabled.
+            raw_data (bool): Whether API responses should be wrapped in data models or returned raw.
+                This has not been implemented yet.
+            url_override (Optional[str]): If specified allows you to override the base url the client points to for proxy/testing.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests.
+              Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request
+              are reported to this sink, labeled with the templated endpoint. Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its
+              timings. Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, e.g. JSONBackend.ORJSON
+              for large market data pages. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed
+              transparently. Defaults to True.
+            session (Optional[Session]): The requests session used to send requests, e.g. one made with
+              `create_session` to size its connection pool. Pass the same instance to several clients to share one
+              pool between them. Defaults to None.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
+        """
+        super().__init__(
+            api_key=api_key,
+            secret_key=secret_key,
+            oauth_token=oauth_token,
+            api_version="v2",
+            base_url=(
+                url_override
+                if url_override
+                else BaseURL.TRADING_PAPER if paper else BaseURL.TRADING_LIVE
+            ),
+            sandbox=paper,
+            raw_data=raw_data,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            session=session,
+            timeout=timeout,
+        )
+
+    # ############################## ORDERS ################################# #
+
+    def submit_order(self, order_data: OrderRequest) -> Union[Order, RawData]:
+        """Creates an order to buy or sell an asset.
+
+        Args:
+            order_data (alpaca.trading.requests.OrderRequest): The request data for creating a new order.
+
+        Returns:
+            alpaca.trading.models.Order: The resulting submitted order.
+        """
+        return self._call(self._submit_order_call(order_data))
+
+    def get_orders(
+        self, filter: Optional[GetOrdersRequest] = None
+    ) -> Union[List[Order], RawData]:
+        """
+        Returns all orders. Orders can be filtered by parameters.
+
+        Args:
+            filter (Optional[GetOrdersRequest]): The parameters to filter the orders with.
+
+        Returns:
+            List[alpaca.trading.models.Order]: The queried orders.
+        """
+        # checking to see if we specified at least one param
+        return self._call(self._get_orders_call(filter))
+
+    def get_order_by_id(
+        self, order_id: Union[UUID, str], filter: Optional[GetOrderByIdRequest] = None
+    ) -> Union[Order, RawData]:
+        """
+        Returns a specific order by its order id.
+
+        Args:
+            order_id (Union[UUID, str]): The unique uuid identifier for the order.
+            filter (Optional[GetOrderByIdRequest]): The parameters for the query.
+
+        Returns:
+            alpaca.trading.models.Order: The order that was queried.
+        """
+        # checking to see if we specified at least one param
+        return self._call(self._get_order_by_id_call(order_id, filter))
+
+    def get_order_by_client_id(self, client_id: str) -> Union[Order, RawData]:
+        """
+        Returns a specific order by its client order id.
+
+        Args:
+            client_id (str): The client order identifier for the order.
+
+        Returns:
+            alpaca.trading.models.Order: The queried order.
+        """
+        return self._call(self._get_order_by_client_id_call(client_id))
+
+    def replace_order_by_id(
+        self,
+        order_id: Union[UUID, str],
+        order_data: Optional[ReplaceOrderRequest] = None,
+    ) -> Union[Order, RawData]:
+        """
+        Updates an order with new parameters.
+
+        Args:
+            order_id (Union[UUID, str]): The unique uuid identifier for the order being replaced.
+            order_data (Optional[ReplaceOrderRequest]): The parameters we wish to update.
+
+        Returns:
+            alpaca.trading.models.Order: The updated order.
+        """
+        # checking to see if we specified at least one param
+        return self._call(self._replace_order_by_id_call(order_id, order_data))
+
+    def cancel_orders(self) -> Union[List[CancelOrderResponse], RawData]:
+        """
+        Cancels all orders.
+
+        Returns:
+            List[CancelOrderResponse]: The list of HTTP statuses for each order attempted to be cancelled.
+        """
+        return self._call(self._cancel_orders_call())
+
+    def cancel_order_by_id(self, order_id: Union[UUID, str]) -> None:
+        """
+        Cancels a specific order by its order id.
+
+        Args:
+            order_id (Union[UUID, str]): The unique uuid identifier of the order being cancelled.
+
+        Returns:
+            None
+        """
+        self._call(self._cancel_order_by_id_call(order_id))
+
+    # ############################## POSITIONS ################################# #
+
+    def get_all_positions(
+        self,
+    ) -> Union[List[Position], RawData]:
+        """
+        Gets all the current open positions.
+
+        Returns:
+            List[Position]: List of open positions.
+        """
+        return self._call(self._get_all_positions_call())
+
+    def get_open_position(
+        self, symbol_or_asset_id: Union[UUID, str]
+    ) -> Union[Position, RawData]:
+        """
+        Gets the open position for an account for a single asset. Throws an APIError if the position does not exist.
+
+        Args:
+            symbol_or_asset_id (Union[UUID, str]): The symbol name of asset id of the position to get.
+
+        Returns:
+            Position: Open position of the asset.
+        """
+        return self._call(self._get_open_position_call(symbol_or_asset_id))
+
+    def close_all_positions(
+        self, cancel_orders: Optional[bool] = None
+    ) -> Union[List[ClosePositionResponse], RawData]:
+        """
+        Liquidates all positions for an account.
+
+        Places an order for each open position to liquidate.
+
+        Args:
+            cancel_orders (Optional[bool]): If true is specified, cancel all open orders before liquidating all positions.
+
+        Returns:
+            List[ClosePositionResponse]: A list of responses from each closed position containing the status code and
+              order id.
+        """
+        return self._call(self._close_all_positions_call(cancel_orders))
+
+    def close_position(
+        self,
+        symbol_or_asset_id: Union[UUID, str],
+        close_options: Optional[ClosePositionRequest] = None,
+    ) -> Union[Order, RawData]:
+        """
+        Liquidates the position for a single asset.
+
+        Places a single order to close the position for the asset.
+
+        **This method will throw an error if the position does not exist!**
+
+        Args:
+            symbol_or_asset_id (Union[UUID, str]): The symbol name of asset id of the position to close.
+            close_options: The various close position request parameters.
+
+        Returns:
+            alpaca.trading.models.Order: The order that was placed to close the position.
+        """
+        return self._call(self._close_position_call(symbol_or_asset_id, close_options))
+
+    def exercise_options_position(
+        self,
+        symbol_or_contract_id: Union[UUID, str],
+    ) -> None:
+        """
+        This endpoint enables users to exercise a held option contract, converting it into the underlying asset based on the specified terms.
+        All available held shares of this option contract will be exercised.
+        By default, Alpaca will automatically exercise in-the-money (ITM) contracts at expiry.
+        Exercise requests will be processed immediately once received. Exercise requests submitted outside market hours will be rejected.
+        To cancel an exercise request or to submit a Do-not-exercise (DNE) instruction, please contact our support team.
+
+        Args:
+            symbol_or_contract_id (Union[UUID, str]): Option contract symbol or ID.
+
+        Returns:
+            None
+        """
+        self._call(self._exercise_options_position_call(symbol_or_contract_id))
+
+    # ############################## Portfolio ################################# #
+
+    def get_portfolio_history(
+        self,
+        history_filter: Optional[GetPortfolioHistoryRequest] = None,
+    ) -> Union[PortfolioHistory, RawData]:
+        """
+        Gets the portfolio history statistics for an account.
+
+        Args:
+            account_id (Union[UUID, str]): The ID of the Account to get the portfolio history for.
+            history_filter: The various portfolio history request parameters.
+
+        Returns:
+            PortfolioHistory: The portfolio history statistics for the account.
+        """
+        return self._call(self._get_portfolio_history_call(history_filter))
+
+    # ############################## Assets ################################# #
+
+    def get_all_assets(
+        self, filter: Optional[GetAssetsRequest] = None
+    ) -> Union[List[Asset], RawData]:
+        """
+        The assets API serves as the master list of assets available for trade and data consumption from Alpaca.
+        Some assets are not tradable with Alpaca. These assets will be marked with the flag tradable=false.
+
+        Args:
+            filter (Optional[GetAssetsRequest]): The parameters that can be assets can be queried by.
+
+        Returns:
+            List[Asset]: The list of assets.
+        """
+        # checking to see if we specified at least one param
+        return self._call(self._get_all_assets_call(filter))
+
+    def get_asset(self, symbol_or_asset_id: Union[UUID, str]) -> Union[Asset, RawData]:
+        """
+        Returns a specific asset by its symbol or asset id. If the specified asset does not exist
+        a 404 error will be thrown.
+
+        Args:
+            symbol_or_asset_id (Union[UUID, str]): The symbol or asset id for the specified asset
+
+        Returns:
+            Asset: The asset if it exists.
+        """
+
+        return self._call(self._get_asset_call(symbol_or_asset_id))
+
+    # ############################## CLOCK & CALENDAR ################################# #
+
+    def get_clock(self) -> Union[Clock, RawData]:
+        """
+        Gets the current market timestamp, whether or not the market is currently open, as well as the times
+        of the next market open and close.
+
+        Returns:
+            Clock: The market Clock data
+        """
+
+        return self._call(self._get_clock_call())
+
+    def get_calendar(
+        self,
+        filters: Optional[GetCalendarRequest] = None,
+    ) -> Union[List[Calendar], RawData]:
+        """
+        The calendar API serves the full list of market days from 1970 to 2029. It can also be queried by specifying a
+        start and/or end time to narrow down the results.
+
+        In addition to the dates, the response also contains the specific open and close times for the market days,
+        taking into account early closures.
+
+        Args:
+            filters: Any optional filters to limit the returned market days
+
+        Returns:
+            List[Calendar]: A list of Calendar objects representing the market days.
+        """
+
+        return self._call(self._get_calendar_call(filters))
+
+    # ############################## ACCOUNT ################################# #
+
+    def get_account(self) -> Union[TradeAccount, RawData]:
+        """
+        Returns account details. Contains information like buying power,
+        number of day trades, and account status.
+
+        Returns:
+            alpaca.trading.models.TradeAccount: The account details
+        """
+
+        return self._call(self._get_account_call())
+
+    def get_account_configurations(self) -> Union[AccountConfiguration, RawData]:
+        """
+        Returns account configuration details. Contains information like shorting, margin multiplier
+        trader confirmation emails, and Pattern Day Trading (PDT) checks.
+
+        Returns:
+            alpaca.broker.models.AccountConfiguration: The account configuration details
+        """
+        return self._call(self._get_account_configurations_call())
+
+    def set_account_configurations(
+        self, account_configurations: AccountConfiguration
+    ) -> Union[AccountConfiguration, RawData]:
+        """
+        Returns account configuration details. Contains information like shorting, margin multiplier
+        trader confirmation emails, and Pattern Day Trading (PDT) checks.
+
+        Returns:
+            alpaca.broker.models.TradeAccountConfiguration: The account configuration details
+        """
+        return self._call(self._set_account_configurations_call(account_configurations))
+
+    # ############################## WATCHLIST ################################# #
+
+    def get_watchlists(
+        self,
+    ) -> Union[List[Watchlist], RawData]:
+        """
+        Returns all watchlists.
+
+        Returns:
+            List[Watchlist]: The list of all watchlists.
+        """
+
+        return self._call(self._get_watchlists_call())
+
+    def get_watchlist_by_id(
+        self,
+        watchlist_id: Union[UUID, str],
+    ) -> Union[Watchlist, RawData]:
+        """
+        Returns a specific watchlist by its id.
+
+        Args:
+            watchlist_id (Union[UUID, str]): The watchlist to retrieve.
+
+        Returns:
+            Watchlist: The watchlist.
+        """
+        return self._call(self._get_watchlist_by_id_call(watchlist_id))
+
+    def create_watchlist(
+        self,
+        watchlist_data: CreateWatchlistRequest,
+    ) -> Union[Watchlist, RawData]:
+        """
+        Creates a new watchlist.
+
+        Args:
+            watchlist_data (CreateWatchlistRequest): The watchlist to create.
+
+        Returns:
+            Watchlist: The new watchlist.
+        """
+        return self._call(self._create_watchlist_call(watchlist_data))
+
+    def update_watchlist_by_id(
+        self,
+        watchlist_id: Union[UUID, str],
+        # Might be worth taking a union of this and Watchlist itself; but then we should make a change like that SDK
+        # wide. Probably a good 0.2.x change
+        watchlist_data: UpdateWatchlistRequest,
+    ) -> Union[Watchlist, RawData]:
+        """
+        Updates a watchlist with new data.
+
+        Args:
+            watchlist_id (Union[UUID, str]): The watchlist to be updated.
+            watchlist_data (UpdateWatchlistRequest): The new watchlist data.
+
+        Returns:
+            Watchlist: The watchlist with updated data.
+        """
+        return self._call(
+            self._update_watchlist_by_id_call(watchlist_id, watchlist_data)
+        )
+
+    def add_asset_to_watchlist_by_id(
+        self,
+        watchlist_id: Union[UUID, str],
+        symbol: str,
+    ) -> Union[Watchlist, RawData]:
+        """
+        Adds an asset by its symbol to a specified watchlist.
+
+        Args:
+            watchlist_id (Union[UUID, str]): The watchlist to add the symbol to.
+            symbol (str): The symbol for the asset to add.
+
+        Returns:
+            Watchlist: The updated watchlist.
+        """
+        return self._call(self._add_asset_to_watchlist_by_id_call(watchlist_id, symbol))
+
+    def delete_watchlist_by_id(
+        self,
+        watchlist_id: Union[UUID, str],
+    ) -> None:
+        """
+        Deletes a watchlist. This is permanent.
+
+        Args:
+            watchlist_id (Union[UUID, str]): The watchlist to delete.
+
+        Returns:
+            None
+        """
+        self._call(self._delete_watchlist_by_id_call(watchlist_id))
+
+    def remove_asset_from_watchlist_by_id(
+        self,
+        watchlist_id: Union[UUID, str],
+        symbol: str,
+    ) -> Union[Watchlist, RawData]:
+        """
+        Removes an asset from a watchlist.
+
+        Args:
+            watchlist_id (Union[UUID, str]): The watchlist to remove the asset from.
+            symbol (str): The symbol for the asset to add.
 
-from alpaca.trading.requests import (
-    GetCalendarRequest,
-    ClosePositionRequest,
-    GetAssetsRequest,
-    GetOptionContractsRequest,
-    GetPortfolioHistoryRequest,
-    OrderRequest,
-    GetOrdersRequest,
-    ReplaceOrderRequest,
-    GetOrderByIdRequest,
-    CancelOrderResponse,
-    CreateWatchlistRequest,
-    UpdateWatchlistRequest,
-    GetCorporateAnnouncementsRequest,
-)
+        Returns:
+            Watchlist: The updated watchlist.
+        """
+        return self._call(
+            self._remove_asset_from_watchlist_by_id_call(watchlist_id, symbol)
+        )
 
-from alpaca.trading.models import (
-    OptionContract,
-    OptionContractsResponse,
-    Order,
-    PortfolioHistory,
-    Position,
-    ClosePositionResponse,
-    Asset,
-    Watchlist,
-    Clock,
-    Calendar,
-    TradeAccount,
-    CorporateActionAnnouncement,
-    AccountConfiguration,
-)
+    # ############################## CORPORATE ACTIONS ################################# #
+
+    def get_corporate_announcements(
+        self, filter: GetCorporateAnnouncementsRequest
+    ) -> Union[List[CorporateActionAnnouncement], RawData]:
+        """
+        Returns corporate action announcements data given specified search criteria.
+        Args:
+            filter (GetCorporateAnnouncementsRequest): The parameters to filter the search by.
+        Returns:
+            List[CorporateActionAnnouncement]: The resulting announcements from the search.
+        """
+        return self._call(self._get_corporate_announcements_call(filter))
+
+    def get_corporate_announcement_by_id(
+        self, corporate_announcment_id: Union[UUID, str]
+    ) -> Union[CorporateActionAnnouncement, RawData]:
+        """
+        Returns a specific corporate action announcement.
+        Args:
+            corporate_announcment_id: The id of the desired corporate action announcement
+        Returns:
+            CorporateActionAnnouncement: The corporate action queried.
+        """
+        return self._call(
+            self._get_corporate_announcement_by_id_call(corporate_announcment_id)
+        )
+
+    # ############################## OPTIONS CONTRACTS ################################# #
+
+    def get_option_contracts(
+        self, request: GetOptionContractsRequest
+    ) -> Union[OptionContractsResponse, RawData]:
+        """
+        The option contracts API serves as the master list of option contracts available for trade and data consumption from Alpaca.
+
+        Args:
+            request (GetOptionContractsRequest): The parameters that option contracts can be queried by.
+
+        Returns:
+            OptionContracts (Union[OptionContractsResponse, RawData]): The object includes list of option contracts.
+        """
+        return self._call(self._get_option_contracts_call(request))
+
+    def get_option_contract(
+        self, symbol_or_id: Union[UUID, str]
+    ) -> Union[OptionContract, RawData]:
+        """
+        The option contracts API serves as the master list of option contracts available for trade and data consumption from Alpaca.
+
+        Args:
+            symbol_or_id (Union[UUID, str]): The symbol or id of the option contract to retrieve.
+
+        Returns:
+            OptionContracts (Union[OptionContracts, RawData]): The list of option contracts.
+        """
+        return self._call(self._get_option_contract_call(symbol_or_id))
 
 
-class TradingClient(RESTClient):
+class AsyncTradingClient(_TradingRequests, AsyncRESTClient):
     """
-    A client to interact with the trading API, in both paper and live mode.
+    An asyncio client to interact with the trading API, in both paper and live mode.
+
+    Takes the same request models and returns the same response models as TradingClient, but every endpoint method
+    is a coroutine.
     """
 
     def __init__(
@@ -58,6 +904,14 @@ class TradingClient(RESTClient):
         paper: bool = True,
         raw_data: bool = False,
         url_override: Optional[str] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[JSONBackend] = None,
+        compress_responses: bool = True,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
     ) -> None:
         """
         Instantiates a client for trading and managing personal brokerage accounts.
@@ -70,6 +924,22 @@ class TradingClient(RESTClient):
             raw_data (bool): Whether API responses should be wrapped in data models or returned raw.
                 This has not been implemented yet.
             url_override (Optional[str]): If specified allows you to override the base url the client points to for proxy/testing.
+            http_client (Optional[httpx.AsyncClient]): An httpx client to send requests with, e.g. to share one
+              connection pool between several clients. Defaults to None.
+            rate_limiter (Optional[RateLimiter]): A rate limiter to pace requests with. Share one instance between all
+              clients using the same API key. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): The policy deciding whether and when to retry failed requests.
+              Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the count, duration and phase timings of every request
+              are reported to this sink, labeled with the templated endpoint. Defaults to None.
+            request_hooks (Optional[RequestHooks]): Callbacks run before and after every request with its
+              timings. Defaults to None.
+            json_backend (Optional[JSONBackend]): The library to decode responses with, e.g. JSONBackend.ORJSON
+              for large market data pages. Defaults to the standard library.
+            compress_responses (bool): Whether the API may compress responses, which are decompressed
+              transparently. Defaults to True.
+            timeout (Optional[Timeout]): The connect and read timeouts of requests in seconds, or one timeout for
+              both. None to wait forever. Defaults to 10 seconds to connect and 60 to read.
         """
         super().__init__(
             api_key=api_key,
@@ -83,11 +953,19 @@ class TradingClient(RESTClient):
             ),
             sandbox=paper,
             raw_data=raw_data,
+            http_client=http_client,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            metrics_sink=metrics_sink,
+            request_hooks=request_hooks,
+            json_backend=json_backend,
+            compress_responses=compress_responses,
+            timeout=timeout,
         )
 
     # ############################## ORDERS ################################# #
 
-    def submit_order(self, order_data: OrderRequest) -> Union[Order, RawData]:
+    async def submit_order(self, order_data: OrderRequest) -> Union[Order, RawData]:
         """Creates an order to buy or sell an asset.
 
         Args:
@@ -96,15 +974,9 @@ class TradingClient(RESTClient):
         Returns:
             alpaca.trading.models.Order: The resulting submitted order.
         """
-        data = order_data.to_request_fields()
-        response = self.post("/orders", data)
-
-        if self._use_raw_data:
-            return response
+        return await self._call(self._submit_order_call(order_data))
 
-        return Order(**response)
-
-    def get_orders(
+    async def get_orders(
         self, filter: Optional[GetOrdersRequest] = None
     ) -> Union[List[Order], RawData]:
         """
@@ -117,19 +989,9 @@ class TradingClient(RESTClient):
             List[alpaca.trading.models.Order]: The queried orders.
         """
         # checking to see if we specified at least one param
-        params = filter.to_request_fields() if filter is not None else {}
-
-        if "symbols" in params and isinstance(params["symbols"], list):
-            params["symbols"] = ",".join(params["symbols"])
+        return await self._call(self._get_orders_call(filter))
 
-        response = self.get("/orders", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[Order]).validate_python(response)
-
-    def get_order_by_id(
+    async def get_order_by_id(
         self, order_id: Union[UUID, str], filter: Optional[GetOrderByIdRequest] = None
     ) -> Union[Order, RawData]:
         """
@@ -143,18 +1005,9 @@ class TradingClient(RESTClient):
             alpaca.trading.models.Order: The order that was queried.
         """
         # checking to see if we specified at least one param
-        params = filter.to_request_fields() if filter is not None else {}
-
-        order_id = validate_uuid_id_param(order_id, "order_id")
-
-        response = self.get(f"/orders/{order_id}", params)
+        return await self._call(self._get_order_by_id_call(order_id, filter))
 
-        if self._use_raw_data:
-            return response
-
-        return Order(**response)
-
-    def get_order_by_client_id(self, client_id: str) -> Union[Order, RawData]:
+    async def get_order_by_client_id(self, client_id: str) -> Union[Order, RawData]:
         """
         Returns a specific order by its client order id.
 
@@ -164,16 +1017,9 @@ class TradingClient(RESTClient):
         Returns:
             alpaca.trading.models.Order: The queried order.
         """
-        params = {"client_order_id": client_id}
+        return await self._call(self._get_order_by_client_id_call(client_id))
 
-        response = self.get(f"/orders:by_client_order_id", params)
-
-        if self._use_raw_data:
-            return response
-
-        return Order(**response)
-
-    def replace_order_by_id(
+    async def replace_order_by_id(
         self,
         order_id: Union[UUID, str],
         order_data: Optional[ReplaceOrderRequest] = None,
@@ -189,32 +1035,18 @@ class TradingClient(RESTClient):
             alpaca.trading.models.Order: The updated order.
         """
         # checking to see if we specified at least one param
-        params = order_data.to_request_fields() if order_data is not None else {}
-
-        order_id = validate_uuid_id_param(order_id, "order_id")
-
-        response = self.patch(f"/orders/{order_id}", params)
+        return await self._call(self._replace_order_by_id_call(order_id, order_data))
 
-        if self._use_raw_data:
-            return response
-
-        return Order(**response)
-
-    def cancel_orders(self) -> Union[List[CancelOrderResponse], RawData]:
+    async def cancel_orders(self) -> Union[List[CancelOrderResponse], RawData]:
         """
         Cancels all orders.
 
         Returns:
             List[CancelOrderResponse]: The list of HTTP statuses for each order attempted to be cancelled.
         """
-        response = self.delete(f"/orders")
-
-        if self._use_raw_data:
-            return response
+        return await self._call(self._cancel_orders_call())
 
-        return TypeAdapter(List[CancelOrderResponse]).validate_python(response)
-
-    def cancel_order_by_id(self, order_id: Union[UUID, str]) -> None:
+    async def cancel_order_by_id(self, order_id: Union[UUID, str]) -> None:
         """
         Cancels a specific order by its order id.
 
@@ -224,15 +1056,11 @@ class TradingClient(RESTClient):
         Returns:
             None
         """
-        order_id = validate_uuid_id_param(order_id, "order_id")
-
-        # TODO: Should ideally return some information about the order's cancel status. (Issue #78).
-        # TODO: Currently no way to retrieve status details for empty responses with base REST implementation
-        self.delete(f"/orders/{order_id}")
+        await self._call(self._cancel_order_by_id_call(order_id))
 
     # ############################## POSITIONS ################################# #
 
-    def get_all_positions(
+    async def get_all_positions(
         self,
     ) -> Union[List[Position], RawData]:
         """
@@ -241,14 +1069,9 @@ class TradingClient(RESTClient):
         Returns:
             List[Position]: List of open positions.
         """
-        response = self.get("/positions")
-
-        if self._use_raw_data:
-            return response
+        return await self._call(self._get_all_positions_call())
 
-        return TypeAdapter(List[Position]).validate_python(response)
-
-    def get_open_position(
+    async def get_open_position(
         self, symbol_or_asset_id: Union[UUID, str]
     ) -> Union[Position, RawData]:
         """
@@ -260,15 +1083,9 @@ class TradingClient(RESTClient):
         Returns:
             Position: Open position of the asset.
         """
-        symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
-        response = self.get(f"/positions/{symbol_or_asset_id}")
-
-        if self._use_raw_data:
-            return response
+        return await self._call(self._get_open_position_call(symbol_or_asset_id))
 
-        return Position(**response)
-
-    def close_all_positions(
+    async def close_all_positions(
         self, cancel_orders: Optional[bool] = None
     ) -> Union[List[ClosePositionResponse], RawData]:
         """
@@ -283,17 +1100,9 @@ class TradingClient(RESTClient):
             List[ClosePositionResponse]: A list of responses from each closed position containing the status code and
               order id.
         """
-        response = self.delete(
-            "/positions",
-            {"cancel_orders": cancel_orders} if cancel_orders else None,
-        )
-
-        if self._use_raw_data:
-            return response
+        return await self._call(self._close_all_positions_call(cancel_orders))
 
-        return TypeAdapter(List[ClosePositionResponse]).validate_python(response)
-
-    def close_position(
+    async def close_position(
         self,
         symbol_or_asset_id: Union[UUID, str],
         close_options: Optional[ClosePositionRequest] = None,
@@ -312,18 +1121,11 @@ class TradingClient(RESTClient):
         Returns:
             alpaca.trading.models.Order: The order that was placed to close the position.
         """
-        symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
-        response = self.delete(
-            f"/positions/{symbol_or_asset_id}",
-            close_options.to_request_fields() if close_options else {},
+        return await self._call(
+            self._close_position_call(symbol_or_asset_id, close_options)
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Order(**response)
-
-    def exercise_options_position(
+    async def exercise_options_position(
         self,
         symbol_or_contract_id: Union[UUID, str],
     ) -> None:
@@ -340,14 +1142,11 @@ class TradingClient(RESTClient):
         Returns:
             None
         """
-        symbol_or_contract_id = validate_symbol_or_contract_id(symbol_or_contract_id)
-        self.post(
-            f"/positions/{symbol_or_contract_id}/exercise",
-        )
+        await self._call(self._exercise_options_position_call(symbol_or_contract_id))
 
     # ############################## Portfolio ################################# #
 
-    def get_portfolio_history(
+    async def get_portfolio_history(
         self,
         history_filter: Optional[GetPortfolioHistoryRequest] = None,
     ) -> Union[PortfolioHistory, RawData]:
@@ -361,19 +1160,11 @@ class TradingClient(RESTClient):
         Returns:
             PortfolioHistory: The portfolio history statistics for the account.
         """
-        response = self.get(
-            f"/account/portfolio/history",
-            history_filter.to_request_fields() if history_filter else {},
-        )
-
-        if self._use_raw_data:
-            return response
-
-        return PortfolioHistory(**response)
+        return await self._call(self._get_portfolio_history_call(history_filter))
 
     # ############################## Assets ################################# #
 
-    def get_all_assets(
+    async def get_all_assets(
         self, filter: Optional[GetAssetsRequest] = None
     ) -> Union[List[Asset], RawData]:
         """
@@ -387,16 +1178,11 @@ class TradingClient(RESTClient):
             List[Asset]: The list of assets.
         """
         # checking to see if we specified at least one param
-        params = filter.to_request_fields() if filter is not None else {}
+        return await self._call(self._get_all_assets_call(filter))
 
-        response = self.get(f"/assets", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[Asset]).validate_python(response)
-
-    def get_asset(self, symbol_or_asset_id: Union[UUID, str]) -> Union[Asset, RawData]:
+    async def get_asset(
+        self, symbol_or_asset_id: Union[UUID, str]
+    ) -> Union[Asset, RawData]:
         """
         Returns a specific asset by its symbol or asset id. If the specified asset does not exist
         a 404 error will be thrown.
@@ -408,18 +1194,11 @@ class TradingClient(RESTClient):
             Asset: The asset if it exists.
         """
 
-        symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
-
-        response = self.get(f"/assets/{symbol_or_asset_id}")
-
-        if self._use_raw_data:
-            return response
-
-        return Asset(**response)
+        return await self._call(self._get_asset_call(symbol_or_asset_id))
 
     # ############################## CLOCK & CALENDAR ################################# #
 
-    def get_clock(self) -> Union[Clock, RawData]:
+    async def get_clock(self) -> Union[Clock, RawData]:
         """
         Gets the current market timestamp, whether or not the market is currently open, as well as the times
         of the next market open and close.
@@ -428,14 +1207,9 @@ class TradingClient(RESTClient):
             Clock: The market Clock data
         """
 
-        response = self.get("/clock")
-
-        if self._use_raw_data:
-            return response
-
-        return Clock(**response)
+        return await self._call(self._get_clock_call())
 
-    def get_calendar(
+    async def get_calendar(
         self,
         filters: Optional[GetCalendarRequest] = None,
     ) -> Union[List[Calendar], RawData]:
@@ -453,16 +1227,11 @@ class TradingClient(RESTClient):
             List[Calendar]: A list of Calendar objects representing the market days.
         """
 
-        result = self.get("/calendar", filters.to_request_fields() if filters else {})
-
-        if self._use_raw_data:
-            return result
-
-        return TypeAdapter(List[Calendar]).validate_python(result)
+        return await self._call(self._get_calendar_call(filters))
 
     # ############################## ACCOUNT ################################# #
 
-    def get_account(self) -> Union[TradeAccount, RawData]:
+    async def get_account(self) -> Union[TradeAccount, RawData]:
         """
         Returns account details. Contains information like buying power,
         number of day trades, and account status.
@@ -471,14 +1240,9 @@ class TradingClient(RESTClient):
             alpaca.trading.models.TradeAccount: The account details
         """
 
-        response = self.get("/account")
+        return await self._call(self._get_account_call())
 
-        if self._use_raw_data:
-            return response
-
-        return TradeAccount(**response)
-
-    def get_account_configurations(self) -> Union[AccountConfiguration, RawData]:
+    async def get_account_configurations(self) -> Union[AccountConfiguration, RawData]:
         """
         Returns account configuration details. Contains information like shorting, margin multiplier
         trader confirmation emails, and Pattern Day Trading (PDT) checks.
@@ -486,14 +1250,9 @@ class TradingClient(RESTClient):
         Returns:
             alpaca.broker.models.AccountConfiguration: The account configuration details
         """
-        response = self.get("/account/configurations")
-
-        if self._use_raw_data:
-            return response
+        return await self._call(self._get_account_configurations_call())
 
-        return AccountConfiguration(**response)
-
-    def set_account_configurations(
+    async def set_account_configurations(
         self, account_configurations: AccountConfiguration
     ) -> Union[AccountConfiguration, RawData]:
         """
@@ -503,18 +1262,13 @@ class TradingClient(RESTClient):
         Returns:
             alpaca.broker.models.TradeAccountConfiguration: The account configuration details
         """
-        response = self.patch(
-            "/account/configurations", data=account_configurations.model_dump()
+        return await self._call(
+            self._set_account_configurations_call(account_configurations)
         )
 
-        if self._use_raw_data:
-            return response
-
-        return AccountConfiguration(**response)
-
     # ############################## WATCHLIST ################################# #
 
-    def get_watchlists(
+    async def get_watchlists(
         self,
     ) -> Union[List[Watchlist], RawData]:
         """
@@ -524,14 +1278,9 @@ class TradingClient(RESTClient):
             List[Watchlist]: The list of all watchlists.
         """
 
-        result = self.get(f"/watchlists")
-
-        if self._use_raw_data:
-            return result
+        return await self._call(self._get_watchlists_call())
 
-        return TypeAdapter(List[Watchlist]).validate_python(result)
-
-    def get_watchlist_by_id(
+    async def get_watchlist_by_id(
         self,
         watchlist_id: Union[UUID, str],
     ) -> Union[Watchlist, RawData]:
@@ -544,16 +1293,9 @@ class TradingClient(RESTClient):
         Returns:
             Watchlist: The watchlist.
         """
-        watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
-
-        result = self.get(f"/watchlists/{watchlist_id}")
-
-        if self._use_raw_data:
-            return result
-
-        return Watchlist(**result)
+        return await self._call(self._get_watchlist_by_id_call(watchlist_id))
 
-    def create_watchlist(
+    async def create_watchlist(
         self,
         watchlist_data: CreateWatchlistRequest,
     ) -> Union[Watchlist, RawData]:
@@ -566,17 +1308,9 @@ class TradingClient(RESTClient):
         Returns:
             Watchlist: The new watchlist.
         """
-        result = self.post(
-            "/watchlists",
-            watchlist_data.to_request_fields(),
-        )
+        return await self._call(self._create_watchlist_call(watchlist_data))
 
-        if self._use_raw_data:
-            return result
-
-        return Watchlist(**result)
-
-    def update_watchlist_by_id(
+    async def update_watchlist_by_id(
         self,
         watchlist_id: Union[UUID, str],
         # Might be worth taking a union of this and Watchlist itself; but then we should make a change like that SDK
@@ -593,19 +1327,11 @@ class TradingClient(RESTClient):
         Returns:
             Watchlist: The watchlist with updated data.
         """
-        watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
-
-        result = self.put(
-            f"/watchlists/{watchlist_id}",
-            watchlist_data.to_request_fields(),
+        return await self._call(
+            self._update_watchlist_by_id_call(watchlist_id, watchlist_data)
         )
 
-        if self._use_raw_data:
-            return result
-
-        return Watchlist(**result)
-
-    def add_asset_to_watchlist_by_id(
+    async def add_asset_to_watchlist_by_id(
         self,
         watchlist_id: Union[UUID, str],
         symbol: str,
@@ -620,18 +1346,11 @@ class TradingClient(RESTClient):
         Returns:
             Watchlist: The updated watchlist.
         """
-        watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
-
-        params = {"symbol": symbol}
-
-        result = self.post(f"/watchlists/{watchlist_id}", params)
-
-        if self._use_raw_data:
-            return result
-
-        return Watchlist(**result)
+        return await self._call(
+            self._add_asset_to_watchlist_by_id_call(watchlist_id, symbol)
+        )
 
-    def delete_watchlist_by_id(
+    async def delete_watchlist_by_id(
         self,
         watchlist_id: Union[UUID, str],
     ) -> None:
@@ -644,11 +1363,9 @@ class TradingClient(RESTClient):
         Returns:
             None
         """
-        watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
-
-        self.delete(f"/watchlists/{watchlist_id}")
+        await self._call(self._delete_watchlist_by_id_call(watchlist_id))
 
-    def remove_asset_from_watchlist_by_id(
+    async def remove_asset_from_watchlist_by_id(
         self,
         watchlist_id: Union[UUID, str],
         symbol: str,
@@ -663,18 +1380,13 @@ class TradingClient(RESTClient):
         Returns:
             Watchlist: The updated watchlist.
         """
-        watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
-
-        result = self.delete(f"/watchlists/{watchlist_id}/{symbol}")
-
-        if self._use_raw_data:
-            return result
-
-        return Watchlist(**result)
+        return await self._call(
+            self._remove_asset_from_watchlist_by_id_call(watchlist_id, symbol)
+        )
 
     # ############################## CORPORATE ACTIONS ################################# #
 
-    def get_corporate_announcements(
+    async def get_corporate_announcements(
         self, filter: GetCorporateAnnouncementsRequest
     ) -> Union[List[CorporateActionAnnouncement], RawData]:
         """
@@ -684,19 +1396,9 @@ class TradingClient(RESTClient):
         Returns:
             List[CorporateActionAnnouncement]: The resulting announcements from the search.
         """
-        params = filter.to_request_fields() if filter else {}
+        return await self._call(self._get_corporate_announcements_call(filter))
 
-        if "ca_types" in params and isinstance(params["ca_types"], list):
-            params["ca_types"] = ",".join(params["ca_types"])
-
-        response = self.get("/corporate_actions/announcements", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[CorporateActionAnnouncement]).validate_python(response)
-
-    def get_corporate_announcement_by_id(
+    async def get_corporate_announcement_by_id(
         self, corporate_announcment_id: Union[UUID, str]
     ) -> Union[CorporateActionAnnouncement, RawData]:
         """
@@ -706,22 +1408,13 @@ class TradingClient(RESTClient):
         Returns:
             CorporateActionAnnouncement: The corporate action queried.
         """
-        corporate_announcment_id = validate_uuid_id_param(
-            corporate_announcment_id, "corporate_announcment_id"
-        )
-
-        response = self.get(
-            f"/corporate_actions/announcements/{corporate_announcment_id}"
+        return await self._call(
+            self._get_corporate_announcement_by_id_call(corporate_announcment_id)
         )
 
-        if self._use_raw_data:
-            return response
-
-        return CorporateActionAnnouncement(**response)
-
     # ############################## OPTIONS CONTRACTS ################################# #
 
-    def get_option_contracts(
+    async def get_option_contracts(
         self, request: GetOptionContractsRequest
     ) -> Union[OptionContractsResponse, RawData]:
         """
@@ -733,24 +1426,9 @@ class TradingClient(RESTClient):
         Returns:
             OptionContracts (Union[OptionContractsResponse, RawData]): The object includes list of option contracts.
         """
-        if request is None:
-            raise ValueError("request (GetOptionContractsRequest) is required")
+        return await self._call(self._get_option_contracts_call(request))
 
-        params = request.to_request_fields()
-
-        if "underlying_symbols" in params and isinstance(
-            request.underlying_symbols, list
-        ):
-            params["underlying_symbols"] = ",".join(request.underlying_symbols)
-
-        response = self.get("/options/contracts", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(OptionContractsResponse).validate_python(response)
-
-    def get_option_contract(
+    async def get_option_contract(
         self, symbol_or_id: Union[UUID, str]
     ) -> Union[OptionContract, RawData]:
         """
@@ -762,12 +1440,4 @@ class TradingClient(RESTClient):
         Returns:
             OptionContracts (Union[OptionContracts, RawData]): The list of option contracts.
         """
-        if symbol_or_id == "":
-            raise ValueError("symbol_or_id is required")
-
-        response = self.get(f"/options/contracts/{symbol_or_id}")
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(OptionContract).validate_python(response)
+        return await self._call(self._get_option_contract_call(symbol_or_id))
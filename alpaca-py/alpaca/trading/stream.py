@@ -1,15 +1,18 @@
 import asyncio
 import json
 import logging
-import queue
-from typing import Callable, Dict, Optional, Union
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Union
 
+import pandas as pd
 import websockets
 from pydantic import BaseModel
 from websockets.legacy import client as websockets_legacy
 
 from alpaca.common import RawData
 from alpaca.common.enums import BaseURL
+from alpaca.common.metrics import MetricsSink, StreamMetrics
+from alpaca.common.recording import Frame, FrameRecorder, replay_frames
 from alpaca.trading import TradeUpdate
 
 log = logging.getLogger(__name__)
@@ -32,7 +35,24 @@ class TradingStream:
         raw_data: bool = False,
         url_override: str = None,
         websocket_params: Optional[Dict] = None,
+        record_path: Optional[str] = None,
+        metrics_sink: Optional[MetricsSink] = None,
     ):
+        """
+        Args:
+            api_key (str): Alpaca API key.
+            secret_key (str): Alpaca API secret key.
+            paper (bool): Whether the keys are paper trading keys. Defaults to True.
+            raw_data (bool): Whether to return raw API data or parsed data. Defaults to False.
+            url_override (str): If specified allows you to override the base url the client points to for
+              proxy/testing. Defaults to None.
+            websocket_params (Optional[Dict]): Any websocket connection configuration parameters. Defaults to None.
+            record_path (Optional[str]): If set, every frame received is appended with its receive time to a gzip
+              compressed log at this path, which `replay` can feed back through the handler. Defaults to None.
+            metrics_sink (Optional[MetricsSink]): If set, the stream reports the messages and bytes received, decode
+              and handler times and the latency from the timestamp of each update to receiving it to this sink.
+              Defaults to None.
+        """
         self._api_key = api_key
         self._secret_key = secret_key
         self._trade_updates_handler = None
@@ -45,8 +65,18 @@ class TradingStream:
         self._running = False
         self._loop = None
         self._raw_data = raw_data
-        self._stop_stream_queue = queue.Queue()
+        self._stop_event: Optional[asyncio.Event] = None
+        # set when something is subscribed to while the stream waits for its first subscription
+        self._subscribed_event: Optional[asyncio.Event] = None
+        self._record_path = record_path
+        self._recorder: Optional[FrameRecorder] = None
+        self._metrics = (
+            StreamMetrics(metrics_sink, "trading") if metrics_sink is not None else None
+        )
         self._should_run = True
+        self._task: Optional[asyncio.Task] = None
+        # tasks started from inside the loop, e.g. subscribing from a handler
+        self._tasks: Set[asyncio.Task] = set()
         self._websocket_params = {
             "ping_interval": 10,
             "ping_timeout": 180,
@@ -122,10 +152,9 @@ class TradingStream:
         """
         self._ensure_coroutine(handler)
         self._trade_updates_handler = handler
+        self._notify_subscribed()
         if self._running:
-            asyncio.run_coroutine_threadsafe(
-                self._subscribe_trade_updates(), self._loop
-            ).result()
+            self._run_in_loop(self._subscribe_trade_updates())
 
     async def _start_ws(self):
         await self._connect()
@@ -134,43 +163,97 @@ class TradingStream:
         await self._subscribe_trade_updates()
 
     async def _consume(self):
-        while True:
-            if not self._stop_stream_queue.empty():
-                self._stop_stream_queue.get(timeout=1)
-                await self.close()
-                break
-            else:
-                try:
-                    r = await asyncio.wait_for(self._ws.recv(), 5)
-                    msg = json.loads(r)
-                    await self._dispatch(msg)
-                except asyncio.TimeoutError:
-                    # ws.recv is hanging when no data is received. by using
-                    # wait_for we break when no data is received, allowing us
-                    # to break the loop when needed
-                    pass
+        # stop_ws closes the connection, which ends the wait for the next message
+        ws = self._ws
+        while self._should_run:
+            try:
+                r = await ws.recv()
+            except websockets.ConnectionClosed:
+                if not self._should_run:
+                    return
+                raise
+            if self._recorder is not None:
+                self._recorder.write(r)
+            await self._handle_frame(r)
+        await self.close()
+
+    async def _handle_frame(self, frame: Frame) -> None:
+        """Decodes a frame from the websocket connection and dispatches it
+
+        Args:
+            frame (Frame): The JSON encoded frame
+        """
+        if self._metrics is None:
+            await self._dispatch(json.loads(frame))
+            return
+
+        received_at = time.perf_counter()
+        received_at_ns = time.time_ns()
+        msg = json.loads(frame)
+        self._metrics.record_frame(len(frame), time.perf_counter() - received_at)
+        channel = msg.get("stream")
+        if channel is None:
+            await self._dispatch(msg)
+            return
+
+        timestamp = (msg.get("data") or {}).get("timestamp")
+        self._metrics.record_message(
+            channel,
+            pd.Timestamp(timestamp).value if timestamp else None,
+            received_at_ns,
+        )
+        started_at = time.perf_counter()
+        try:
+            await self._dispatch(msg)
+        finally:
+            self._metrics.record_handled(
+                channel, started_at - received_at, time.perf_counter() - started_at
+            )
+
+    async def replay(self, path: str, speed: Optional[float] = None) -> int:
+        """Feeds the frames of a log written with `record_path` through the stream's handler, without connecting.
+
+        Args:
+            path (str): The path of the log.
+            speed (Optional[float]): How many times faster than they were received to replay the frames, e.g. 1 for
+              real time. Defaults to replaying them as fast as the handler can take them.
+
+        Returns:
+            int: The number of frames replayed.
+        """
+        return await replay_frames(path, self._handle_frame, speed)
 
     async def _run_forever(self):
         self._loop = asyncio.get_running_loop()
         # do not start the websocket connection until we subscribe to something
-        while not self._trade_updates_handler:
-            if not self._stop_stream_queue.empty():
-                self._stop_stream_queue.get(timeout=1)
-                return
-            await asyncio.sleep(0.1)
+        if not await self._wait_for_subscription():
+            # stopped before subscribing, or by leaving `async with` before the task first ran
+            self._stop_event = None
+            return
         log.info("started trading stream")
-        self._should_run = True
         self._running = False
+        if self._record_path is not None:
+            self._recorder = FrameRecorder(self._record_path)
+        try:
+            await self._run_connection()
+        finally:
+            if self._recorder is not None:
+                self._recorder.close()
+                self._recorder = None
+
+    async def _run_connection(self):
         while True:
             try:
                 if not self._should_run:
                     log.info("Trading stream stopped")
+                    self._stop_event = None
                     return
                 if not self._running:
                     log.info("starting trading websocket connection")
                     await self._start_ws()
                     self._running = True
-                    await self._consume()
+                # consuming again after an error in the handler
+                await self._consume()
             except websockets.WebSocketException as wse:
                 await self.close()
                 self._running = False
@@ -194,18 +277,103 @@ class TradingStream:
             self._running = False
 
     async def stop_ws(self) -> None:
-        """Signals websocket connection should close by adding a closing message to the stop_stream_queue"""
+        """Signals the stream to stop and closes the websocket connection, which ends waiting for messages right away"""
         self._should_run = False
-        if self._stop_stream_queue.empty():
-            self._stop_stream_queue.put_nowait({"should_stop": True})
+        self._get_stop_event().set()
+        await self.close()
+
+    def _prepare_run(self) -> None:
+        """Clears a stop requested by an earlier run. Called before the stream's task is started, so a stop requested
+        before the task first runs is not overwritten."""
+        self._should_run = True
+        self._stop_event = None
+
+    def _has_subscriptions(self) -> bool:
+        """Whether anything is subscribed to, which the connection is only opened for"""
+        return self._trade_updates_handler is not None
+
+    def _notify_subscribed(self) -> None:
+        """Wakes up the stream if it is waiting for its first subscription. Safe to call from any thread."""
+        event = self._subscribed_event
+        if event is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(event.set)
+
+    async def _wait_for_subscription(self) -> bool:
+        """Waits until something is subscribed to or the stream is signaled to stop
+
+        Returns:
+            bool: Whether to open the connection, False if the stream was signaled to stop.
+        """
+        self._subscribed_event = asyncio.Event()
+        try:
+            while self._should_run and not self._has_subscriptions():
+                subscribed = asyncio.ensure_future(self._subscribed_event.wait())
+                stopped = asyncio.ensure_future(self._get_stop_event().wait())
+                try:
+                    await asyncio.wait(
+                        {subscribed, stopped}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    for waiter in (subscribed, stopped):
+                        waiter.cancel()
+                    await asyncio.gather(subscribed, stopped, return_exceptions=True)
+                self._subscribed_event.clear()
+        finally:
+            self._subscribed_event = None
+        return self._should_run
+
+    def _get_stop_event(self) -> asyncio.Event:
+        """Returns the event set when the stream is signaled to stop. Created in the stream's loop on first use."""
+        if self._stop_event is None:
+            self._stop_event = asyncio.Event()
+        return self._stop_event
 
     def stop(self) -> None:
         """Stops the websocket connection."""
-        if self._loop.is_running():
-            asyncio.run_coroutine_threadsafe(self.stop_ws(), self._loop).result()
+        if self._loop is not None and self._loop.is_running():
+            self._run_in_loop(self.stop_ws())
+
+    def _run_in_loop(self, coro: Awaitable) -> None:
+        """Runs a coroutine in the stream's event loop and waits for it, or schedules it when called from that loop
+
+        Args:
+            coro (Awaitable): The coroutine to run
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is not self._loop:
+            asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+            return
+
+        # waiting for the coroutine here would block the loop it needs to run in
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def __aenter__(self) -> "TradingStream":
+        """Starts the stream in the running event loop, for `async with stream:`
+
+        Returns:
+            TradingStream: The stream.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._prepare_run()
+        self._task = asyncio.ensure_future(self._run_forever())
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stops the stream and waits for its connection to close"""
+        await self.stop_ws()
+        if self._task is not None:
+            await self._task
+            self._task = None
 
     def run(self) -> None:
         """Starts up the websocket connection's event loop"""
+        self._prepare_run()
         try:
             asyncio.run(self._run_forever())
         except KeyboardInterrupt:
@@ -0,0 +1,501 @@
+import gzip
+import json
+from datetime import datetime
+from typing import Callable, List
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from alpaca.common.enums import PaginationType
+from alpaca.common.exceptions import APIError
+from alpaca.common.metrics import (
+    REST_BODY_BYTES,
+    REST_REQUESTS,
+    REST_WIRE_BYTES,
+    InMemoryMetricsSink,
+)
+from alpaca.common.retry import RetryPolicy
+from alpaca.data.historical import (
+    AsyncCryptoHistoricalDataClient,
+    AsyncOptionHistoricalDataClient,
+    AsyncStockHistoricalDataClient,
+    CryptoHistoricalDataClient,
+    OptionHistoricalDataClient,
+    StockHistoricalDataClient,
+)
+from alpaca.data.models import BarSet, Quote
+from alpaca.data.requests import (
+    CryptoLatestQuoteRequest,
+    CryptoTradesRequest,
+    OptionLatestQuoteRequest,
+    StockBarsRequest,
+)
+from alpaca.data.timeframe import TimeFrame
+from alpaca.trading.client import AsyncTradingClient, TradingClient
+from alpaca.trading.enums import OrderSide, TimeInForce
+from alpaca.trading.models import Order
+from alpaca.trading.requests import MarketOrderRequest
+
+
+def mock_http_client(
+    handler: Callable[[httpx.Request], httpx.Response]
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_async_get_stock_bars_paginates():
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "page_token" not in request.url.params:
+            return httpx.Response(
+                200,
+                json={
+                    "bars": {
+                        "AAPL": [
+                            {
+                                "t": "2022-02-01T05:00:00Z",
+                                "o": 174,
+                                "h": 174.84,
+                                "l": 172.31,
+                                "c": 174.61,
+                                "v": 85998033,
+                                "n": 732412,
+                                "vw": 173.703516,
+                            }
+                        ]
+                    },
+                    "next_page_token": "token",
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "bars": {
+                    "AAPL": [
+                        {
+                            "t": "2022-02-02T05:00:00Z",
+                            "o": 174.64,
+                            "h": 175.88,
+                            "l": 173.33,
+                            "c": 175.84,
+                            "v": 84817432,
+                            "n": 675034,
+                            "vw": 174.941288,
+                        }
+                    ]
+                },
+                "next_page_token": None,
+            },
+        )
+
+    async with AsyncStockHistoricalDataClient(
+        "key-id", "secret-key", http_client=mock_http_client(handler)
+    ) as client:
+        barset = await client.get_stock_bars(
+            StockBarsRequest(
+                symbol_or_symbols="AAPL",
+                timeframe=TimeFrame.Day,
+                start=datetime(2022, 2, 1),
+            )
+        )
+
+    assert isinstance(barset, BarSet)
+    assert len(barset["AAPL"]) == 2
+    assert barset["AAPL"][1].close == 175.84
+
+    assert len(requests) == 2
+    first, second = requests
+    assert first.url.path == "/v2/stocks/bars"
+    assert first.url.params["timeframe"] == "1Day"
+    assert first.url.params["limit"] == "10000"
+    assert second.url.params["page_token"] == "token"
+    assert first.headers["APCA-API-KEY-ID"] == "key-id"
+
+
+@pytest.mark.asyncio
+async def test_async_clients_share_http_client():
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(
+            200,
+            json={
+                "quotes": {
+                    "SYM": {
+                        "t": "2024-01-24T09:00:00Z",
+                        "ax": "C",
+                        "ap": 1.5,
+                        "as": 10,
+                        "bx": "C",
+                        "bp": 1.4,
+                        "bs": 12,
+                        "c": "A",
+                    }
+                }
+            },
+        )
+
+    http_client = mock_http_client(handler)
+    option_client = AsyncOptionHistoricalDataClient(
+        "key-id", "secret-key", http_client=http_client
+    )
+    crypto_client = AsyncCryptoHistoricalDataClient(http_client=http_client)
+
+    option_quotes = await option_client.get_option_latest_quote(
+        OptionLatestQuoteRequest(symbol_or_symbols="SYM")
+    )
+    crypto_quotes = await crypto_client.get_crypto_latest_quote(
+        CryptoLatestQuoteRequest(symbol_or_symbols="SYM")
+    )
+
+    # closing a client that does not own the shared http client leaves it open
+    await option_client.aclose()
+    assert not http_client.is_closed
+    await http_client.aclose()
+
+    assert isinstance(option_quotes["SYM"], Quote)
+    assert crypto_quotes["SYM"].ask_price == 1.5
+    assert paths == [
+        "/v1beta1/options/quotes/latest",
+        "/v1beta3/crypto/us/latest/quotes",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_trading_client():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            body = json.loads(request.content)
+            assert body["symbol"] == "SPY"
+            assert body["side"] == "buy"
+            return httpx.Response(
+                200,
+                json={
+                    "id": "61e69015-8549-4bfd-b9c3-01e75843f47d",
+                    "client_order_id": "eb9e2aaa-f71a-4f51-b5b4-52a6c565dad4",
+                    "created_at": "2021-03-16T18:38:01.942282Z",
+                    "updated_at": "2021-03-16T18:38:01.942282Z",
+                    "submitted_at": "2021-03-16T18:38:01.937734Z",
+                    "filled_at": None,
+                    "expired_at": None,
+                    "canceled_at": None,
+                    "failed_at": None,
+                    "replaced_at": None,
+                    "replaced_by": None,
+                    "replaces": None,
+                    "asset_id": "b0b6dd9d-8b9b-48a9-ba46-b9d54906e415",
+                    "symbol": "SPY",
+                    "asset_class": "us_equity",
+                    "notional": None,
+                    "qty": "1",
+                    "filled_qty": "0",
+                    "filled_avg_price": None,
+                    "order_class": "simple",
+                    "order_type": "market",
+                    "type": "market",
+                    "side": "buy",
+                    "time_in_force": "day",
+                    "limit_price": None,
+                    "stop_price": None,
+                    "status": "accepted",
+                    "extended_hours": False,
+                    "legs": None,
+                    "trail_percent": None,
+                    "trail_price": None,
+                    "hwm": None,
+                },
+            )
+        return httpx.Response(
+            403, json={"code": 40310000, "message": "forbidden"}, request=request
+        )
+
+    client = AsyncTradingClient(
+        "key-id", "secret-key", http_client=mock_http_client(handler)
+    )
+
+    order = await client.submit_order(
+        MarketOrderRequest(
+            symbol="SPY", qty=1, side=OrderSide.BUY, time_in_force=TimeInForce.DAY
+        )
+    )
+    assert isinstance(order, Order)
+    assert order.symbol == "SPY"
+
+    with pytest.raises(APIError) as error:
+        await client.get_account()
+
+    assert error.value.status_code == 403
+    assert error.value.code == 40310000
+
+    await client.aclose()
+
+
+@pytest.mark.parametrize(
+    "sync_client, async_client",
+    [
+        (TradingClient, AsyncTradingClient),
+        (StockHistoricalDataClient, AsyncStockHistoricalDataClient),
+        (CryptoHistoricalDataClient, AsyncCryptoHistoricalDataClient),
+        (OptionHistoricalDataClient, AsyncOptionHistoricalDataClient),
+    ],
+)
+def test_async_clients_mirror_sync_clients(sync_client, async_client):
+    def endpoints(client):
+        return {name for name in vars(client) if not name.startswith("_")}
+
+    assert endpoints(sync_client) == endpoints(async_client)
+
+
+@pytest.mark.asyncio
+async def test_async_trading_client_validates_like_sync_client():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request should be sent")
+
+    client = AsyncTradingClient(
+        "key-id", "secret-key", http_client=mock_http_client(handler)
+    )
+
+    with pytest.raises(ValueError):
+        await client.get_option_contract("")
+
+    with pytest.raises(ValueError):
+        await client.cancel_order_by_id("not-a-uuid")
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_request_retries_rate_limit():
+    responses = [
+        httpx.Response(429, text="rate limited"),
+        httpx.Response(200, json={"status": "ok"}),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    client = AsyncStockHistoricalDataClient(
+        "key-id",
+        "secret-key",
+        http_client=mock_http_client(handler),
+        retry_policy=RetryPolicy(base_wait=0),
+    )
+
+    assert await client.get("/stocks/meta/exchanges") == {"status": "ok"}
+    assert responses == []
+
+
+@pytest.mark.asyncio
+async def test_async_request_metrics():
+    responses = [
+        httpx.Response(429, text="rate limited"),
+        httpx.Response(200, json={"status": "ok"}),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    sink = InMemoryMetricsSink()
+    client = AsyncStockHistoricalDataClient(
+        "key-id",
+        "secret-key",
+        http_client=mock_http_client(handler),
+        retry_policy=RetryPolicy(base_wait=0),
+        metrics_sink=sink,
+    )
+
+    assert await client.get("/stocks/meta/exchanges") == {"status": "ok"}
+    assert (
+        sink.get_counter(
+            REST_REQUESTS,
+            method="GET",
+            endpoint="/v2/stocks/meta/exchanges",
+            status="200",
+        )
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_request_measures_compressed_responses():
+    body = json.dumps({"exchanges": ["V"] * 1000}).encode()
+    compressed = gzip.compress(body)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"Content-Encoding": "gzip"},
+            stream=httpx.ByteStream(compressed),
+        )
+
+    sink = InMemoryMetricsSink()
+    client = AsyncStockHistoricalDataClient(
+        "key-id",
+        "secret-key",
+        http_client=mock_http_client(handler),
+        metrics_sink=sink,
+    )
+
+    assert await client.get("/stocks/meta/exchanges") == json.loads(body)
+    labels = {"method": "GET", "endpoint": "/v2/stocks/meta/exchanges", "status": "200"}
+    assert sink.get_counter(REST_WIRE_BYTES, **labels) == len(compressed)
+    assert sink.get_counter(REST_BODY_BYTES, **labels) == len(body)
+
+
+@pytest.mark.asyncio
+async def test_async_get_stock_bars_sharded():
+    symbols = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        symbol = request.url.params["symbols"]
+        symbols.append(symbol)
+        return httpx.Response(
+            200,
+            json={
+                "bars": {
+                    symbol: [
+                        {
+                            "t": "2022-02-01T05:00:00Z",
+                            "o": 174,
+                            "h": 174.84,
+                            "l": 172.31,
+                            "c": 174.61,
+                            "v": 85998033,
+                            "n": 732412,
+                            "vw": 173.703516,
+                        }
+                    ]
+                },
+                "next_page_token": None,
+            },
+        )
+
+    async with AsyncStockHistoricalDataClient(
+        "key-id", "secret-key", http_client=mock_http_client(handler)
+    ) as client:
+        barset = await client.get_stock_bars(
+            StockBarsRequest(
+                symbol_or_symbols=["AAPL", "TSLA"],
+                timeframe=TimeFrame.Day,
+                start=datetime(2022, 2, 1),
+            ),
+            max_workers=2,
+        )
+
+    assert sorted(symbols) == ["AAPL", "TSLA"]
+    assert list(barset.data.keys()) == ["AAPL", "TSLA"]
+
+
+@pytest.mark.asyncio
+async def test_async_get_crypto_trades_as_frame():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "trades": {
+                    "BTC/USD": [
+                        {
+                            "t": "2022-05-26T11:47:18.44347136Z",
+                            "p": 29058,
+                            "s": 0.1,
+                            "tks": "S",
+                            "i": 3447,
+                        }
+                    ]
+                },
+                "next_page_token": None,
+            },
+        )
+
+    async with AsyncCryptoHistoricalDataClient(
+        http_client=mock_http_client(handler)
+    ) as client:
+        df = await client.get_crypto_trades(
+            CryptoTradesRequest(symbol_or_symbols="BTC/USD"), as_frame=True
+        )
+
+    assert df.index.names == ["symbol", "timestamp"]
+    assert df["price"].tolist() == [29058.0]
+    # columns without any values are dropped, like in the models' df
+    assert "exchange" not in df.columns
+
+
+@pytest.mark.asyncio
+async def test_async_get_stock_bars_iterator():
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page_token", "0"))
+        return httpx.Response(
+            200,
+            json={
+                "bars": {
+                    "AAPL": [
+                        {
+                            "t": f"2022-02-0{page + 1}T05:00:00Z",
+                            "o": 174 + page,
+                            "h": 174.84,
+                            "l": 172.31,
+                            "c": 174.61,
+                            "v": 85998033,
+                            "n": 732412,
+                            "vw": 173.703516,
+                        }
+                    ]
+                },
+                "next_page_token": str(page + 1) if page < 1 else None,
+            },
+        )
+
+    async with AsyncStockHistoricalDataClient(
+        "key-id", "secret-key", http_client=mock_http_client(handler)
+    ) as client:
+        pages = await client.get_stock_bars(
+            StockBarsRequest(
+                symbol_or_symbols="AAPL",
+                timeframe=TimeFrame.Day,
+                start=datetime(2022, 2, 1),
+            ),
+            handle_pagination=PaginationType.ITERATOR,
+        )
+        opens = [barset["AAPL"][0].open async for barset in pages]
+
+    assert opens == [174, 175]
+
+
+@pytest.mark.asyncio
+async def test_async_get_option_latest_quote_batches_symbols():
+    symbols = [f"SPY240426C00{strike}000" for strike in range(400, 650)]
+    batches = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        batch = request.url.params["symbols"].split(",")
+        batches.append(batch)
+        return httpx.Response(
+            200,
+            json={
+                "quotes": {
+                    symbol: {
+                        "t": "2024-01-24T14:02:43.651613184Z",
+                        "ap": 0.06,
+                        "as": 1593,
+                        "bp": 0.05,
+                        "bs": 1344,
+                    }
+                    for symbol in batch
+                }
+            },
+        )
+
+    async with AsyncOptionHistoricalDataClient(
+        "key-id", "secret-key", http_client=mock_http_client(handler)
+    ) as client:
+        quotes = await client.get_option_latest_quote(
+            OptionLatestQuoteRequest(symbol_or_symbols=symbols)
+        )
+
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+    assert list(quotes) == symbols
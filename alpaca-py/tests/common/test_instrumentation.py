@@ -0,0 +1,291 @@
+import gzip
+import json
+import time
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+
+from alpaca.common.enums import BaseURL
+from alpaca.common.exceptions import APIError
+from alpaca.common.instrumentation import (
+    PHASE_DECODE,
+    PHASE_DOWNLOAD,
+    PHASE_RESPONSE,
+    PHASE_RETRY_SLEEP,
+    PHASE_VALIDATE,
+    RequestHooks,
+    RequestSpan,
+    template_endpoint,
+)
+from alpaca.common.metrics import (
+    REST_BODY_BYTES,
+    REST_PHASE_SECONDS,
+    REST_REQUEST_SECONDS,
+    REST_REQUESTS,
+    REST_WIRE_BYTES,
+    InMemoryMetricsSink,
+)
+from alpaca.common.retry import RetryPolicy
+from alpaca.data.historical import StockHistoricalDataClient
+from alpaca.data.requests import StockBarsRequest, StockLatestTradeRequest
+from alpaca.data.timeframe import TimeFrame
+from alpaca.trading.client import TradingClient
+
+
+class RecordingHooks(RequestHooks):
+    def __init__(self) -> None:
+        self.started: List[RequestSpan] = []
+        self.finished: List[RequestSpan] = []
+
+    def before_request(self, span: RequestSpan) -> None:
+        self.started.append(span)
+
+    def after_request(self, span: RequestSpan) -> None:
+        self.finished.append(span)
+
+
+@pytest.mark.parametrize(
+    "path, endpoint",
+    [
+        ("/v2/clock", "/v2/clock"),
+        (
+            "/v2/orders/61e69015-8549-4bfd-b9c3-01e75843f47d",
+            "/v2/orders/{id}",
+        ),
+        ("/v2/orders:by_client_order_id", "/v2/orders:by_client_order_id"),
+        ("/v2/positions/AAPL", "/v2/positions/{symbol}"),
+        (
+            "/v2/positions/904837e3-3b76-47ec-b432-046db621571b",
+            "/v2/positions/{id}",
+        ),
+        (
+            "/v1/trading/accounts/2a87c088-ffb6-472b-a4a3-cd9305c8605c/watchlists/"
+            "2a87c089-ffb6-472b-a4a3-cd9305c8605d/SPY",
+            "/v1/trading/accounts/{id}/watchlists/{id}/{symbol}",
+        ),
+        ("/v1beta1/options/snapshots/AAPL", "/v1beta1/options/snapshots/{symbol}"),
+        ("/v2/stocks/snapshots", "/v2/stocks/snapshots"),
+        ("/v1/rebalancing/runs/123", "/v1/rebalancing/runs/{id}"),
+    ],
+)
+def test_template_endpoint(path: str, endpoint: str):
+    assert template_endpoint(path) == endpoint
+
+
+def test_request_span_and_metrics(reqmock, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    reqmock.get(
+        f"{BaseURL.TRADING_PAPER.value}/v2/clock",
+        [
+            {"status_code": 429, "text": "", "headers": {"Retry-After": "2"}},
+            {
+                "status_code": 200,
+                "json": {
+                    "timestamp": "2024-01-02T09:30:00-05:00",
+                    "is_open": True,
+                    "next_open": "2024-01-03T09:30:00-05:00",
+                    "next_close": "2024-01-02T16:00:00-05:00",
+                },
+            },
+        ],
+    )
+    sink = InMemoryMetricsSink()
+    hooks = RecordingHooks()
+    client = TradingClient(
+        "key-id",
+        "secret-key",
+        retry_policy=RetryPolicy(jitter=False),
+        metrics_sink=sink,
+        request_hooks=hooks,
+    )
+
+    clock = client.get_clock()
+
+    assert clock.is_open
+    assert hooks.started == hooks.finished
+    span = hooks.finished[0]
+    assert span.method == "GET"
+    assert span.endpoint == "/v2/clock"
+    assert span.attempts == 2
+    assert span.status_code == 200
+    assert span.error is None
+    assert span.duration is not None
+    assert span.phases[PHASE_RETRY_SLEEP] == 2
+    assert {PHASE_RESPONSE, PHASE_DOWNLOAD, PHASE_DECODE, PHASE_VALIDATE} <= set(
+        span.phases
+    )
+
+    labels = {"method": "GET", "endpoint": "/v2/clock"}
+    assert sink.get_counter(REST_REQUESTS, status="200", **labels) == 1
+    assert sink.get_histogram(REST_REQUEST_SECONDS, status="200", **labels).count == 1
+    # validating the response is reported after the request
+    validate = sink.get_histogram(REST_PHASE_SECONDS, phase=PHASE_VALIDATE, **labels)
+    assert validate.count == 1
+    assert validate.total == span.phases[PHASE_VALIDATE]
+
+
+def test_request_span_reports_errors(reqmock):
+    order_id = "61e69015-8549-4bfd-b9c3-01e75843f47d"
+    reqmock.get(
+        f"{BaseURL.TRADING_PAPER.value}/v2/orders/{order_id}",
+        status_code=404,
+        text='{"code": 40410000, "message": "order not found"}',
+    )
+    sink = InMemoryMetricsSink()
+    hooks = RecordingHooks()
+    client = TradingClient(
+        "key-id", "secret-key", metrics_sink=sink, request_hooks=hooks
+    )
+
+    with pytest.raises(APIError):
+        client.get_order_by_id(order_id)
+
+    span = hooks.finished[0]
+    assert span.endpoint == "/v2/orders/{id}"
+    assert span.status_code == 404
+    assert isinstance(span.error, APIError)
+    assert (
+        sink.get_counter(
+            REST_REQUESTS, method="GET", endpoint="/v2/orders/{id}", status="404"
+        )
+        == 1
+    )
+
+
+def test_uninstrumented_client_has_no_spans(reqmock):
+    reqmock.get(f"{BaseURL.TRADING_PAPER.value}/v2/clock", json={})
+    client = TradingClient("key-id", "secret-key")
+
+    assert client._start_span("GET", "/clock", "url") is None
+    assert client.get("/clock") == {}
+
+
+def test_request_span_measures_compressed_responses(reqmock):
+    body = json.dumps({"exchanges": ["V"] * 1000}).encode()
+    reqmock.get(
+        f"{BaseURL.DATA.value}/v2/stocks/meta/exchanges",
+        content=gzip.compress(body),
+        headers={"Content-Encoding": "gzip"},
+    )
+    sink = InMemoryMetricsSink()
+    hooks = RecordingHooks()
+    client = StockHistoricalDataClient(
+        "key-id", "secret-key", metrics_sink=sink, request_hooks=hooks
+    )
+
+    assert client.get("/stocks/meta/exchanges") == json.loads(body)
+    assert "gzip" in reqmock.last_request.headers["Accept-Encoding"]
+
+    span = hooks.finished[0]
+    assert span.wire_bytes == len(gzip.compress(body))
+    assert span.body_bytes == len(body)
+    assert span.compression_ratio > 10
+    labels = {"method": "GET", "endpoint": "/v2/stocks/meta/exchanges", "status": "200"}
+    assert sink.get_counter(REST_WIRE_BYTES, **labels) == span.wire_bytes
+    assert sink.get_counter(REST_BODY_BYTES, **labels) == len(body)
+
+
+def test_compression_can_be_turned_off(reqmock):
+    reqmock.get(f"{BaseURL.TRADING_PAPER.value}/v2/clock", json={})
+    client = TradingClient("key-id", "secret-key", compress_responses=False)
+
+    client.get("/clock")
+
+    assert reqmock.last_request.headers["Accept-Encoding"] == "identity"
+
+
+def test_validation_is_not_reported_to_another_client(reqmock):
+    reqmock.get(
+        f"{BaseURL.TRADING_PAPER.value}/v2/clock",
+        json={
+            "timestamp": "2024-01-02T09:30:00-05:00",
+            "is_open": True,
+            "next_open": "2024-01-03T09:30:00-05:00",
+            "next_close": "2024-01-02T16:00:00-05:00",
+        },
+    )
+    reqmock.get(
+        f"{BaseURL.DATA.value}/v2/stocks/trades/latest",
+        json={
+            "trades": {
+                "AAPL": {
+                    "t": "2022-03-18T14:02:09.722539521Z",
+                    "x": "D",
+                    "p": 161.2958,
+                    "s": 100,
+                    "c": ["@"],
+                    "i": 22730,
+                    "z": "C",
+                }
+            }
+        },
+    )
+    sink = InMemoryMetricsSink()
+    hooks = RecordingHooks()
+    trading_client = TradingClient(
+        "key-id", "secret-key", metrics_sink=sink, request_hooks=hooks
+    )
+    stock_client = StockHistoricalDataClient("key-id", "secret-key")
+
+    trading_client.get_clock()
+    clock_validate = hooks.finished[0].phases[PHASE_VALIDATE]
+    trades = stock_client.get_stock_latest_trade(
+        StockLatestTradeRequest(symbol_or_symbols="AAPL")
+    )
+
+    assert trades["AAPL"].price == 161.2958
+    # the uninstrumented client's validation is neither added to the last span nor reported to the other sink
+    assert hooks.finished[0].phases[PHASE_VALIDATE] == clock_validate
+    validate = sink.get_histogram(
+        REST_PHASE_SECONDS, method="GET", endpoint="/v2/clock", phase=PHASE_VALIDATE
+    )
+    assert validate.count == 1
+
+
+def test_paged_marketdata_validation_is_reported_per_endpoint(reqmock):
+    def page(timestamp: str, next_page_token: Optional[str]) -> dict:
+        bar = {
+            "t": timestamp,
+            "o": 1,
+            "h": 1,
+            "l": 1,
+            "c": 1,
+            "v": 1,
+            "n": 1,
+            "vw": 1,
+        }
+        return {"bars": {"AAPL": [bar]}, "next_page_token": next_page_token}
+
+    reqmock.get(
+        f"{BaseURL.DATA.value}/v2/stocks/bars",
+        [
+            {"json": page("2024-01-02T14:30:00Z", "token")},
+            {"json": page("2024-01-02T14:31:00Z", None)},
+        ],
+    )
+    sink = InMemoryMetricsSink()
+    hooks = RecordingHooks()
+    client = StockHistoricalDataClient(
+        "key-id", "secret-key", metrics_sink=sink, request_hooks=hooks
+    )
+
+    barset = client.get_stock_bars(
+        StockBarsRequest(
+            symbol_or_symbols="AAPL",
+            timeframe=TimeFrame.Minute,
+            start=datetime(2024, 1, 2),
+        )
+    )
+
+    assert len(barset["AAPL"]) == 2
+    assert len(hooks.finished) == 2
+    # validating the merged pages belongs to neither page's span
+    assert all(PHASE_VALIDATE not in span.phases for span in hooks.finished)
+    validate = sink.get_histogram(
+        REST_PHASE_SECONDS,
+        method="GET",
+        endpoint="/v2/stocks/bars",
+        phase=PHASE_VALIDATE,
+    )
+    assert validate.count == 1
@@ -0,0 +1,48 @@
+import pytest
+
+from alpaca.common import rest
+from alpaca.common.enums import BaseURL, JSONBackend
+from alpaca.data.historical import StockHistoricalDataClient
+from alpaca.data.requests import StockLatestTradeRequest
+from alpaca.trading.client import TradingClient
+
+LATEST_TRADE = b"""
+{
+    "trades": {
+        "AAPL": {"t": "2024-01-02T14:30:00.123456789Z", "x": "V", "p": 185.64, "s": 100, "c": ["@"], "i": 1, "z": "C"}
+    }
+}
+"""
+
+
+@pytest.mark.parametrize("backend", [JSONBackend.STDLIB, JSONBackend.ORJSON])
+def test_json_backends_decode_the_same(reqmock, backend: JSONBackend):
+    if backend == JSONBackend.ORJSON:
+        pytest.importorskip("orjson")
+    reqmock.get(
+        f"{BaseURL.DATA.value}/v2/stocks/trades/latest",
+        content=LATEST_TRADE,
+        headers={"Content-Type": "application/json"},
+    )
+    client = StockHistoricalDataClient("key-id", "secret-key", json_backend=backend)
+
+    trades = client.get_stock_latest_trade(
+        StockLatestTradeRequest(symbol_or_symbols="AAPL")
+    )
+
+    assert trades["AAPL"].price == 185.64
+    assert trades["AAPL"].conditions == ["@"]
+
+
+def test_empty_response_is_not_decoded(reqmock):
+    reqmock.delete(f"{BaseURL.TRADING_PAPER.value}/v2/orders", content=b"")
+    client = TradingClient("key-id", "secret-key")
+
+    assert client.delete("/orders") is None
+
+
+def test_missing_json_backend_raises(monkeypatch):
+    monkeypatch.setattr(rest, "orjson", None)
+
+    with pytest.raises(ImportError):
+        TradingClient("key-id", "secret-key", json_backend=JSONBackend.ORJSON)
@@ -0,0 +1,92 @@
+import pytest
+
+from alpaca.common.metrics import (
+    STREAM_BYTES,
+    STREAM_HANDLER_SECONDS,
+    STREAM_LATENCY_SECONDS,
+    STREAM_MESSAGES,
+    STREAM_QUEUE_DELAY_SECONDS,
+    CallbackMetricsSink,
+    InMemoryMetricsSink,
+    PrometheusMetricsSink,
+    StreamMetrics,
+)
+
+
+def test_stream_metrics_labels():
+    reported = []
+    metrics = StreamMetrics(
+        CallbackMetricsSink(lambda *metric: reported.append(metric)), "data"
+    )
+
+    metrics.record_frame(128, 0.001)
+    metrics.record_message("trades", 1_000_000_000, 1_250_000_000)
+    metrics.record_message("statuses", None, 1_250_000_000)
+    metrics.record_handled("trades", 0.5, 0.25)
+
+    assert reported == [
+        ("counter", STREAM_BYTES, 128, {"stream": "data"}),
+        ("histogram", "stream_decode_seconds", 0.001, {"stream": "data"}),
+        ("counter", STREAM_MESSAGES, 1, {"stream": "data", "channel": "trades"}),
+        (
+            "histogram",
+            STREAM_LATENCY_SECONDS,
+            0.25,
+            {"stream": "data", "channel": "trades"},
+        ),
+        ("counter", STREAM_MESSAGES, 1, {"stream": "data", "channel": "statuses"}),
+        (
+            "histogram",
+            STREAM_QUEUE_DELAY_SECONDS,
+            0.5,
+            {"stream": "data", "channel": "trades"},
+        ),
+        (
+            "histogram",
+            STREAM_HANDLER_SECONDS,
+            0.25,
+            {"stream": "data", "channel": "trades"},
+        ),
+    ]
+
+
+def test_in_memory_sink():
+    sink = InMemoryMetricsSink()
+
+    sink.increment(STREAM_MESSAGES, 1, {"stream": "data", "channel": "trades"})
+    sink.increment(STREAM_MESSAGES, 2, {"channel": "trades", "stream": "data"})
+    sink.observe(STREAM_LATENCY_SECONDS, 0.1, {"channel": "trades"})
+    sink.observe(STREAM_LATENCY_SECONDS, 0.3, {"channel": "trades"})
+
+    assert sink.get_counter(STREAM_MESSAGES, stream="data", channel="trades") == 3
+    assert sink.get_counter(STREAM_MESSAGES, stream="data", channel="quotes") == 0
+
+    latency = sink.get_histogram(STREAM_LATENCY_SECONDS, channel="trades")
+    assert latency.count == 2
+    assert latency.minimum == 0.1
+    assert latency.maximum == 0.3
+    assert latency.mean == pytest.approx(0.2)
+    assert sink.get_histogram(STREAM_LATENCY_SECONDS).count == 0
+
+    rates = sink.get_rates()
+    key = (STREAM_MESSAGES, (("channel", "trades"), ("stream", "data")))
+    assert rates[key] > 0
+    # rates only count what was added since the last call
+    assert sink.get_rates()[key] == 0
+
+
+def test_prometheus_sink():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    sink = PrometheusMetricsSink(registry=registry)
+
+    metrics = StreamMetrics(sink, "data")
+    metrics.record_message("trades", 1_000_000_000, 1_002_000_000)
+    metrics.record_message("trades", None, 1_002_000_000)
+
+    labels = {"stream": "data", "channel": "trades"}
+    assert registry.get_sample_value("alpaca_stream_messages_total", labels) == 2
+    assert registry.get_sample_value("alpaca_stream_latency_seconds_count", labels) == 1
+    assert registry.get_sample_value(
+        "alpaca_stream_latency_seconds_sum", labels
+    ) == pytest.approx(0.002)
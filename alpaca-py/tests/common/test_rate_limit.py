@@ -0,0 +1,118 @@
+import time
+
+import pytest
+
+from alpaca.common.enums import BaseURL
+from alpaca.common.rate_limit import RateLimiter
+from alpaca.data.historical import StockHistoricalDataClient
+from alpaca.trading.client import TradingClient
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+    return clock
+
+
+def test_rate_limiter_paces_after_burst(clock: FakeClock):
+    limiter = RateLimiter(requests_per_minute=60, burst=2, utilization=1)
+
+    for _ in range(4):
+        limiter.acquire()
+
+    # the burst goes out immediately, then requests are spaced one second apart
+    assert clock.sleeps == [pytest.approx(1.0), pytest.approx(1.0)]
+
+
+def test_rate_limiter_refills_over_time(clock: FakeClock):
+    limiter = RateLimiter(requests_per_minute=60, burst=1, utilization=1)
+
+    limiter.acquire()
+    clock.now += 5
+    limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_rate_limiter_applies_utilization(clock: FakeClock):
+    limiter = RateLimiter(requests_per_minute=60, burst=1, utilization=0.5)
+
+    limiter.acquire()
+    limiter.acquire()
+
+    assert clock.sleeps == [pytest.approx(2.0)]
+
+
+def test_rate_limiter_calibrates_from_headers(clock: FakeClock):
+    limiter = RateLimiter(requests_per_minute=60, burst=1, utilization=1)
+
+    limiter.update_from_headers({"X-RateLimit-Limit": "120"})
+    assert limiter.limit == 120
+
+    limiter.acquire()
+    limiter.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_rate_limiter_blocks_until_reset(clock: FakeClock, monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 5000.0)
+    limiter = RateLimiter(requests_per_minute=60, burst=5, utilization=1)
+
+    limiter.update_from_headers(
+        {
+            "X-RateLimit-Limit": "60",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "5010",
+        }
+    )
+    limiter.acquire()
+
+    assert clock.sleeps == [pytest.approx(11.0)]
+
+
+def test_rate_limiter_validates_arguments():
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_minute=0)
+
+    with pytest.raises(ValueError):
+        RateLimiter(utilization=1.5)
+
+    with pytest.raises(ValueError):
+        RateLimiter(burst=0)
+
+
+def test_rate_limiter_shared_between_clients(reqmock, clock: FakeClock):
+    limiter = RateLimiter(requests_per_minute=60, burst=1, utilization=1)
+    headers = {"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "59"}
+
+    reqmock.get(
+        f"{BaseURL.DATA.value}/v2/stocks/meta/exchanges", json={}, headers=headers
+    )
+    reqmock.get(f"{BaseURL.TRADING_PAPER.value}/v2/clock", json={}, headers=headers)
+
+    data_client = StockHistoricalDataClient(
+        "key-id", "secret-key", rate_limiter=limiter
+    )
+    trading_client = TradingClient("key-id", "secret-key", rate_limiter=limiter)
+
+    data_client.get("/stocks/meta/exchanges")
+    trading_client.get("/clock")
+
+    assert reqmock.call_count == 2
+    assert clock.sleeps == [pytest.approx(1.0)]
@@ -0,0 +1,53 @@
+import time
+
+import pytest
+
+from alpaca.common.recording import FrameRecorder, read_frames, replay_frames
+
+
+def test_recorder_appends_frames(tmp_path):
+    path = str(tmp_path / "session.log.gz")
+
+    recorder = FrameRecorder(path)
+    recorder.write(b"\x91\x81\xa1T\xa1t", received_at=1)
+    recorder.write('{"stream": "trade_updates"}', received_at=2)
+    recorder.close()
+
+    # a second session appends to the same log
+    recorder = FrameRecorder(path)
+    recorder.write(b"", received_at=3)
+    recorder.close()
+
+    assert list(read_frames(path)) == [
+        (1, b"\x91\x81\xa1T\xa1t"),
+        (2, '{"stream": "trade_updates"}'),
+        (3, b""),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_replay_frames_speed(tmp_path):
+    path = str(tmp_path / "session.log.gz")
+    recorder = FrameRecorder(path)
+    for i in range(3):
+        recorder.write(f"{i}", received_at=i * 50_000_000)
+    recorder.close()
+
+    frames = []
+
+    async def handle_frame(frame):
+        frames.append(frame)
+
+    started_at = time.monotonic()
+    assert await replay_frames(path, handle_frame) == 3
+    assert time.monotonic() - started_at < 0.05
+
+    # the frames were received 50ms apart, which is 10ms apart at 5x
+    started_at = time.monotonic()
+    assert await replay_frames(path, handle_frame, speed=5) == 3
+    assert time.monotonic() - started_at >= 0.02
+
+    assert frames == ["0", "1", "2"] * 2
+
+    with pytest.raises(ValueError):
+        await replay_frames(path, handle_frame, speed=0)
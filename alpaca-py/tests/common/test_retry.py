@@ -0,0 +1,198 @@
+import time
+from typing import List
+
+import pytest
+
+from alpaca.broker.client import BrokerClient
+from alpaca.common.enums import BaseURL
+from alpaca.common.exceptions import APIError
+from alpaca.common.retry import ReconnectPolicy, RetryPolicy
+from alpaca.trading.client import TradingClient
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> List[float]:
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_backoff_grows_exponentially_up_to_max_wait():
+    policy = RetryPolicy(base_wait=1, max_wait=5, jitter=False)
+
+    assert [policy.backoff(retries) for retries in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_backoff_full_jitter_stays_within_bounds():
+    policy = RetryPolicy(base_wait=1, max_wait=8)
+
+    for retries in range(5):
+        for _ in range(20):
+            assert 0 <= policy.backoff(retries) <= min(8, 2**retries)
+
+
+def test_reconnect_delay_grows_until_max_attempts():
+    policy = ReconnectPolicy(base_wait=0.5, max_wait=2, max_attempts=4, jitter=False)
+
+    assert [policy.get_reconnect_delay(attempts) for attempts in range(5)] == [
+        0.5,
+        1,
+        2,
+        2,
+        None,
+    ]
+    assert 0 <= ReconnectPolicy(base_wait=1).get_reconnect_delay(3) <= 8
+
+
+def test_retry_delay_respects_retry_codes_and_max_retries():
+    policy = RetryPolicy(max_retries=2, base_wait=1, jitter=False)
+    state = policy.start()
+
+    assert policy.get_retry_delay(state, 500) is None
+    assert policy.get_retry_delay(state, 429) == 1
+    assert policy.get_retry_delay(state, 504) == 2
+    assert policy.get_retry_delay(state, 429) is None
+    assert state.retries == 2
+    assert state.status_retries == {429: 1, 504: 1}
+
+
+def test_retry_delay_respects_status_budgets():
+    policy = RetryPolicy(max_retries=5, status_budgets={504: 1}, jitter=False)
+    state = policy.start()
+
+    assert policy.get_retry_delay(state, 504) is not None
+    assert policy.get_retry_delay(state, 504) is None
+    assert policy.get_retry_delay(state, 429) is not None
+
+
+def test_retry_delay_honors_retry_after():
+    policy = RetryPolicy(base_wait=1, jitter=False)
+
+    assert policy.get_retry_delay(policy.start(), 429, {"Retry-After": "7"}) == 7
+    assert (
+        policy.get_retry_delay(
+            policy.start(),
+            429,
+            {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        == 0
+    )
+
+
+def test_retry_delay_honors_rate_limit_reset(monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 1000.0)
+    policy = RetryPolicy(base_wait=1, jitter=False)
+    headers = {"X-RateLimit-Reset": "1012"}
+
+    assert policy.get_retry_delay(policy.start(), 429, headers) == 12
+    # the reset header is ignored unless we are rate limited
+    assert policy.get_retry_delay(policy.start(), 504, headers) == 1
+
+
+def test_retry_delay_respects_deadline():
+    policy = RetryPolicy(base_wait=1, deadline=5, jitter=False)
+    state = policy.start()
+
+    assert policy.get_retry_delay(state, 429, {"Retry-After": "10"}) is None
+    assert policy.get_retry_delay(state, 429) == 1
+
+
+def test_retry_policy_validates_arguments():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+
+    with pytest.raises(ValueError):
+        RetryPolicy(base_wait=-1)
+
+    with pytest.raises(ValueError):
+        RetryPolicy(deadline=0)
+
+
+def test_request_retries_with_policy(reqmock, sleeps: List[float]):
+    reqmock.get(
+        f"{BaseURL.TRADING_PAPER.value}/v2/clock",
+        [
+            {"status_code": 429, "text": "", "headers": {"Retry-After": "2"}},
+            {"status_code": 504, "text": ""},
+            {"status_code": 200, "json": {}},
+        ],
+    )
+
+    client = TradingClient(
+        "key-id",
+        "secret-key",
+        retry_policy=RetryPolicy(base_wait=1, jitter=False),
+    )
+
+    assert client.get("/clock") == {}
+    assert reqmock.call_count == 3
+    assert sleeps == [2, 2]
+
+
+def test_request_raises_when_retries_exhausted(reqmock, sleeps: List[float]):
+    reqmock.get(
+        f"{BaseURL.TRADING_PAPER.value}/v2/clock",
+        status_code=504,
+        text='{"code": 50400000, "message": "timeout"}',
+    )
+
+    client = TradingClient(
+        "key-id", "secret-key", retry_policy=RetryPolicy(max_retries=2)
+    )
+
+    with pytest.raises(APIError) as error:
+        client.get("/clock")
+
+    assert error.value.status_code == 504
+    assert reqmock.call_count == 3
+    assert len(sleeps) == 2
+
+
+def test_download_trade_document_retries(reqmock, sleeps: List[float], tmp_path):
+    account_id = "2a87c088-ffb6-472b-a4a3-cd9305c8605c"
+    document_id = "2a87c089-ffb6-472b-a4a3-cd9305c8605d"
+
+    reqmock.get(
+        BaseURL.BROKER_SANDBOX.value
+        + f"/v1/accounts/{account_id}/documents/{document_id}/download",
+        [
+            {"status_code": 429, "text": "", "headers": {"Retry-After": "1"}},
+            {"status_code": 200, "text": "document"},
+        ],
+    )
+
+    client = BrokerClient("key-id", "secret-key", sandbox=True)
+    file_path = tmp_path / "document.pdf"
+
+    client.download_trade_document_for_account_by_id(
+        account_id=account_id, document_id=document_id, file_path=str(file_path)
+    )
+
+    assert reqmock.call_count == 2
+    assert sleeps[0] >= 1
+    assert file_path.read_text() == "document"
+
+
+def test_sse_events_retry_and_raise(reqmock, sleeps: List[float]):
+    url = BaseURL.BROKER_SANDBOX.value + "/v1/events/trades"
+
+    reqmock.get(
+        url,
+        [
+            {"status_code": 504, "text": ""},
+            {"status_code": 200, "text": "data: first\n\ndata: second\n\n"},
+        ],
+    )
+
+    client = BrokerClient("key-id", "secret-key", sandbox=True)
+
+    assert list(client.get_trade_events()) == ["first", "second"]
+    assert reqmock.call_count == 2
+    assert len(sleeps) == 1
+
+    reqmock.get(url, status_code=403, text='{"code": 40310000, "message": "no"}')
+
+    with pytest.raises(APIError) as error:
+        list(client.get_trade_events())
+
+    assert error.value.status_code == 403
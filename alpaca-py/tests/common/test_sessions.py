@@ -0,0 +1,107 @@
+import socket
+
+import httpx
+import pytest
+
+from alpaca.common.enums import BaseURL
+from alpaca.common.sessions import (
+    DEFAULT_TIMEOUT,
+    create_async_http_client,
+    create_session,
+    to_httpx_timeout,
+)
+from alpaca.data.historical import (
+    AsyncStockHistoricalDataClient,
+    StockHistoricalDataClient,
+)
+from alpaca.trading.client import TradingClient
+
+
+def test_create_session_sizes_pool():
+    session = create_session(pool_connections=2, pool_maxsize=64, pool_block=True)
+
+    adapter = session.get_adapter("https://api.alpaca.markets")
+    pool_kw = adapter.poolmanager.connection_pool_kw
+
+    assert adapter.poolmanager.pools._maxsize == 2
+    assert pool_kw["maxsize"] == 64
+    assert pool_kw["block"] is True
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool_kw["socket_options"]
+
+
+def test_create_session_without_tcp_keepalive():
+    session = create_session(tcp_keepalive=False)
+
+    pool_kw = session.get_adapter(
+        "https://api.alpaca.markets"
+    ).poolmanager.connection_pool_kw
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in pool_kw["socket_options"]
+
+
+def test_create_session_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        create_session(pool_maxsize=0)
+
+
+def test_clients_share_session(reqmock):
+    reqmock.get(f"{BaseURL.TRADING_PAPER.value}/v2/clock", json={})
+    session = create_session()
+    trading = TradingClient("key-id", "secret-key", session=session)
+    data = StockHistoricalDataClient("key-id", "secret-key", session=session)
+
+    trading.get("/clock")
+
+    assert trading._session is data._session is session
+    assert reqmock.last_request.timeout == DEFAULT_TIMEOUT
+
+
+def test_client_closes_only_own_session(monkeypatch):
+    closed = []
+    monkeypatch.setattr(
+        "requests.Session.close", lambda session: closed.append(session)
+    )
+    session = create_session()
+
+    TradingClient("key-id", "secret-key", session=session).close()
+    assert closed == []
+
+    with TradingClient("key-id", "secret-key") as client:
+        pass
+    assert closed == [client._session]
+
+
+def test_client_timeout(reqmock):
+    reqmock.get(f"{BaseURL.TRADING_PAPER.value}/v2/clock", json={})
+    client = TradingClient("key-id", "secret-key", timeout=3)
+
+    client.get("/clock")
+
+    assert reqmock.last_request.timeout == 3
+
+
+def test_to_httpx_timeout():
+    timeout = to_httpx_timeout((2, 30))
+
+    assert timeout.connect == 2
+    assert timeout.read == 30
+    assert to_httpx_timeout(None).read is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_timeout():
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    http_client = create_async_http_client(max_connections=4)
+    http_client._transport = httpx.MockTransport(handler)
+    client = AsyncStockHistoricalDataClient(
+        "key-id", "secret-key", http_client=http_client, timeout=(1, 5)
+    )
+
+    await client.get("/stocks/meta/exchanges")
+
+    assert timeouts == [{"connect": 1, "read": 5, "write": 5, "pool": 5}]
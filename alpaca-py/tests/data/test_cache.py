@@ -0,0 +1,454 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
+
+import httpx
+import pandas as pd
+import pytest
+
+from alpaca.common.enums import Sort
+from alpaca.data.cache import (
+    FileMarketDataCache,
+    InMemoryMarketDataCache,
+    LatestDataCache,
+    MarketDataCache,
+)
+from alpaca.data.historical.stock import (
+    AsyncStockHistoricalDataClient,
+    StockHistoricalDataClient,
+)
+from alpaca.data.requests import StockBarsRequest, StockLatestBarRequest
+from alpaca.data.timeframe import TimeFrame
+
+BARS_URL = "https://data.alpaca.markets/v2/stocks/bars"
+LATEST_BARS_URL = "https://data.alpaca.markets/v2/stocks/bars/latest"
+
+
+@pytest.fixture
+def fetched_ranges() -> List[Tuple[str, str, str]]:
+    return []
+
+
+@pytest.fixture
+def daily_bars_callback(fetched_ranges: List[Tuple[str, str, str]]):
+    def callback(request, context):
+        symbols = request.qs["symbols"][0].upper().split(",")
+        start = pd.Timestamp(request.qs["start"][0].upper())
+        end = pd.Timestamp(request.qs["end"][0].upper())
+        fetched_ranges.append((",".join(symbols), start.date(), end.date()))
+
+        days = pd.date_range(start.ceil("D"), end.floor("D"), freq="D")
+        return {
+            "bars": {
+                symbol: [
+                    {
+                        "t": day.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "o": 100 + i,
+                        "h": 101 + i,
+                        "l": 99 + i,
+                        "c": 100.5 + i,
+                        "v": 1000,
+                        "n": 10,
+                        "vw": 100.2,
+                    }
+                    for i, day in enumerate(days)
+                ]
+                for symbol in symbols
+            },
+            "next_page_token": None,
+        }
+
+    return callback
+
+
+def _get_client(cache: MarketDataCache) -> StockHistoricalDataClient:
+    return StockHistoricalDataClient(
+        api_key="key-id", secret_key="secret-key", cache=cache
+    )
+
+
+def _bars_request(symbols, start: datetime, end: datetime, **kwargs):
+    return StockBarsRequest(
+        symbol_or_symbols=symbols,
+        timeframe=TimeFrame.Day,
+        start=start,
+        end=end,
+        **kwargs,
+    )
+
+
+def test_repeated_request_is_served_from_cache(reqmock, daily_bars_callback):
+    reqmock.get(BARS_URL, json=daily_bars_callback)
+    client = _get_client(InMemoryMarketDataCache())
+    request = _bars_request(
+        ["AAPL", "MSFT"], datetime(2022, 1, 1), datetime(2022, 1, 5)
+    )
+
+    first = client.get_stock_bars(request)
+    second = client.get_stock_bars(request)
+
+    assert reqmock.call_count == 1
+    assert len(first["AAPL"]) == 5
+    assert second.df.equals(first.df)
+
+
+def test_only_missing_ranges_are_fetched(
+    reqmock, daily_bars_callback, fetched_ranges: List[Tuple[str, str, str]]
+):
+    reqmock.get(BARS_URL, json=daily_bars_callback)
+    client = _get_client(InMemoryMarketDataCache())
+
+    client.get_stock_bars(
+        _bars_request("AAPL", datetime(2022, 1, 3), datetime(2022, 1, 5))
+    )
+    barset = client.get_stock_bars(
+        _bars_request(["AAPL", "MSFT"], datetime(2022, 1, 1), datetime(2022, 1, 7))
+    )
+
+    # symbols missing the same ranges are fetched together
+    assert fetched_ranges[1:] == [
+        ("AAPL", datetime(2022, 1, 1).date(), datetime(2022, 1, 3).date()),
+        ("AAPL", datetime(2022, 1, 5).date(), datetime(2022, 1, 7).date()),
+        ("MSFT", datetime(2022, 1, 1).date(), datetime(2022, 1, 7).date()),
+    ]
+
+    # bars at the boundaries of the cached range are not duplicated
+    timestamps = [bar.timestamp.day for bar in barset["AAPL"]]
+    assert timestamps == [1, 2, 3, 4, 5, 6, 7]
+    assert len(barset["MSFT"]) == 7
+
+
+def test_cached_rows_are_filtered_and_sorted(reqmock, daily_bars_callback):
+    reqmock.get(BARS_URL, json=daily_bars_callback)
+    client = _get_client(InMemoryMarketDataCache())
+
+    client.get_stock_bars(
+        _bars_request("AAPL", datetime(2022, 1, 1), datetime(2022, 1, 7))
+    )
+    barset = client.get_stock_bars(
+        _bars_request(
+            "AAPL", datetime(2022, 1, 2), datetime(2022, 1, 4), sort=Sort.DESC
+        )
+    )
+
+    assert reqmock.call_count == 1
+    assert [bar.timestamp.day for bar in barset["AAPL"]] == [4, 3, 2]
+
+
+def test_unsettled_data_is_fetched_again(reqmock, daily_bars_callback):
+    reqmock.get(BARS_URL, json=daily_bars_callback)
+    client = _get_client(InMemoryMarketDataCache())
+    now = datetime.now(timezone.utc)
+    request = _bars_request("AAPL", now - timedelta(days=3), now)
+
+    client.get_stock_bars(request)
+    client.get_stock_bars(request)
+
+    assert reqmock.call_count == 2
+
+
+def test_unfinished_bars_are_not_cached(reqmock):
+    now = datetime.now(timezone.utc)
+    today = pd.Timestamp(now).floor("D")
+    calls = []
+
+    def callback(request, context):
+        calls.append(pd.Timestamp(request.qs["start"][0].upper()))
+        days = pd.date_range(
+            pd.Timestamp(request.qs["start"][0].upper()).ceil("D"), today, freq="D"
+        )
+        return {
+            "bars": {
+                "AAPL": [
+                    # today's bar grows with every request
+                    {
+                        "t": day.isoformat(),
+                        "o": 1,
+                        "h": 1,
+                        "l": 1,
+                        "c": 1,
+                        "v": len(calls),
+                        "n": 1,
+                        "vw": 1,
+                    }
+                    for day in days
+                ]
+            },
+            "next_page_token": None,
+        }
+
+    reqmock.get(BARS_URL, json=callback)
+    cache = InMemoryMarketDataCache()
+    client = _get_client(cache)
+    request = _bars_request("AAPL", now - timedelta(days=3), now)
+
+    client.get_stock_bars(request)
+    barset = client.get_stock_bars(request)
+
+    # today's bar was fetched again instead of being served from the cache
+    assert calls[1] <= today
+    assert barset["AAPL"][-1].timestamp == today
+    assert barset["AAPL"][-1].volume == 2
+
+    # only bars that ended before the settle time are stored
+    (entry,) = cache._entries.values()
+    assert all(pd.Timestamp(row["t"]) < today for row in entry.rows)
+    assert entry.ranges[-1][1] < today
+
+
+def test_requests_with_limit_are_not_cached(reqmock, daily_bars_callback):
+    reqmock.get(BARS_URL, json=daily_bars_callback)
+    cache = InMemoryMarketDataCache()
+    client = _get_client(cache)
+    request = _bars_request("AAPL", datetime(2022, 1, 1), datetime(2022, 1, 5), limit=2)
+
+    client.get_stock_bars(request)
+
+    assert cache._entries == {}
+
+
+def test_cache_fetches_concurrently():
+    cache = InMemoryMarketDataCache()
+    both_fetching = threading.Barrier(2, timeout=1)
+
+    def fetch(params):
+        # fails with BrokenBarrierError if the other thread can't fetch at the same time
+        both_fetching.wait()
+        return {params["symbols"]: [{"t": "2022-01-03T00:00:00Z", "c": 1}]}
+
+    def get(symbol):
+        params = {"symbols": symbol, "start": "2022-01-01", "end": "2022-01-05"}
+        return cache.get_marketdata("/v2/stocks/bars", params, fetch)
+
+    with ThreadPoolExecutor(2) as executor:
+        results = list(executor.map(get, ["AAPL", "MSFT"]))
+
+    assert [list(result) for result in results] == [["AAPL"], ["MSFT"]]
+    assert get("AAPL") == results[0]
+
+
+def test_file_cache_round_trip(reqmock, daily_bars_callback, tmp_path):
+    reqmock.get(BARS_URL, json=daily_bars_callback)
+    request = _bars_request("AAPL", datetime(2022, 1, 1), datetime(2022, 1, 5))
+
+    first = _get_client(FileMarketDataCache(str(tmp_path))).get_stock_bars(request)
+
+    # a new cache on the same directory, e.g. the next run of a backtest
+    second = _get_client(FileMarketDataCache(str(tmp_path))).get_stock_bars(request)
+
+    assert reqmock.call_count == 1
+    assert len(list(tmp_path.iterdir())) == 1
+    assert second["AAPL"] == first["AAPL"]
+
+
+def test_cache_serves_frames(reqmock, daily_bars_callback):
+    reqmock.get(BARS_URL, json=daily_bars_callback)
+    client = _get_client(InMemoryMarketDataCache())
+    request = _bars_request("AAPL", datetime(2022, 1, 1), datetime(2022, 1, 5))
+
+    expected = client.get_stock_bars(request).df
+    df = client.get_stock_bars(request, as_frame=True)
+
+    assert reqmock.call_count == 1
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def _latest_bars(symbols: List[str]):
+    return {
+        "bars": {
+            symbol: {
+                "t": "2022-01-03T14:30:00Z",
+                "o": 100,
+                "h": 101,
+                "l": 99,
+                "c": 100.5,
+                "v": 1000,
+                "n": 10,
+                "vw": 100.2,
+            }
+            for symbol in symbols
+            if symbol != "NOPE"
+        }
+    }
+
+
+def _latest_bars_callback(request, context):
+    return _latest_bars(request.qs["symbols"][0].upper().split(","))
+
+
+def test_latest_cache_fetches_only_missing_symbols(reqmock, monkeypatch):
+    reqmock.get(LATEST_BARS_URL, json=_latest_bars_callback)
+    monkeypatch.setattr(time, "monotonic", lambda: 1000.0)
+    client = StockHistoricalDataClient(
+        api_key="key-id", secret_key="secret-key", latest_cache=LatestDataCache()
+    )
+
+    client.get_stock_latest_bar(
+        StockLatestBarRequest(symbol_or_symbols=["SPY", "NOPE"])
+    )
+    bars = client.get_stock_latest_bar(
+        StockLatestBarRequest(symbol_or_symbols=["SPY", "QQQ", "NOPE"])
+    )
+
+    # symbols the API returned nothing for aren't requested again either
+    assert reqmock.call_count == 2
+    assert reqmock.request_history[1].qs["symbols"] == ["qqq"]
+    assert list(bars) == ["SPY", "QQQ"]
+
+
+def test_latest_cache_entries_expire(reqmock, monkeypatch):
+    reqmock.get(LATEST_BARS_URL, json=_latest_bars_callback)
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    client = StockHistoricalDataClient(
+        api_key="key-id",
+        secret_key="secret-key",
+        latest_cache=LatestDataCache(ttl=1, endpoint_ttls={"/stocks/bars/latest": 5}),
+    )
+    request = StockLatestBarRequest(symbol_or_symbols="SPY")
+
+    client.get_stock_latest_bar(request)
+    now[0] += 4
+    client.get_stock_latest_bar(request)
+    assert reqmock.call_count == 1
+
+    now[0] += 2
+    client.get_stock_latest_bar(request)
+    assert reqmock.call_count == 2
+
+
+def test_latest_cache_evicts_least_recently_used(reqmock):
+    reqmock.get(LATEST_BARS_URL, json=_latest_bars_callback)
+    client = StockHistoricalDataClient(
+        api_key="key-id",
+        secret_key="secret-key",
+        latest_cache=LatestDataCache(ttl=60, max_entries=2),
+    )
+
+    for symbol in ["SPY", "QQQ", "SPY", "IWM", "SPY", "QQQ"]:
+        client.get_stock_latest_bar(StockLatestBarRequest(symbol_or_symbols=symbol))
+
+    # QQQ was evicted when IWM was cached, SPY was used more recently
+    assert [request.qs["symbols"] for request in reqmock.request_history] == [
+        ["spy"],
+        ["qqq"],
+        ["iwm"],
+        ["qqq"],
+    ]
+
+
+def test_latest_cache_coalesces_concurrent_requests(reqmock):
+    release = threading.Event()
+
+    def callback(request, context):
+        release.wait(timeout=5)
+        return _latest_bars_callback(request, context)
+
+    reqmock.get(LATEST_BARS_URL, json=callback)
+    client = StockHistoricalDataClient(
+        api_key="key-id", secret_key="secret-key", latest_cache=LatestDataCache()
+    )
+    request = StockLatestBarRequest(symbol_or_symbols="SPY")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(client.get_stock_latest_bar, request) for _ in range(4)
+        ]
+        # give the other threads time to find the pending request
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert reqmock.call_count == 1
+    assert all(result["SPY"] == results[0]["SPY"] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_async_latest_cache_coalesces_concurrent_requests():
+    requests: List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            200, json=_latest_bars(request.url.params["symbols"].split(","))
+        )
+
+    client = AsyncStockHistoricalDataClient(
+        api_key="key-id",
+        secret_key="secret-key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        latest_cache=LatestDataCache(),
+    )
+
+    results = await asyncio.gather(
+        client.get_stock_latest_bar(StockLatestBarRequest(symbol_or_symbols="SPY")),
+        client.get_stock_latest_bar(
+            StockLatestBarRequest(symbol_or_symbols=["SPY", "QQQ"])
+        ),
+        client.get_stock_latest_bar(StockLatestBarRequest(symbol_or_symbols="SPY")),
+    )
+
+    assert [request.url.params["symbols"] for request in requests] == ["SPY", "QQQ"]
+    assert list(results[1]) == ["SPY", "QQQ"]
+    assert results[0]["SPY"] == results[2]["SPY"]
+
+
+@pytest.mark.asyncio
+async def test_async_latest_cache_shares_errors():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(403, text='{"code": 40310000, "message": "no"}')
+
+    client = AsyncStockHistoricalDataClient(
+        api_key="key-id",
+        secret_key="secret-key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        latest_cache=LatestDataCache(),
+    )
+    request = StockLatestBarRequest(symbol_or_symbols="SPY")
+
+    results = await asyncio.gather(
+        client.get_stock_latest_bar(request),
+        client.get_stock_latest_bar(request),
+        return_exceptions=True,
+    )
+
+    assert len(calls) == 1
+    assert all(isinstance(result, Exception) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_async_latest_cache_retries_when_owner_is_cancelled():
+    calls = []
+    first_call = asyncio.Event()
+
+    async def fetch(params):
+        calls.append(params["symbols"])
+        if len(calls) == 1:
+            first_call.set()
+            await asyncio.sleep(10)
+        return _latest_bars(params["symbols"].split(","))["bars"]
+
+    cache = LatestDataCache()
+    params = {"symbols": "SPY"}
+    owner = asyncio.ensure_future(
+        cache.async_get_marketdata("/stocks/bars/latest", params, fetch)
+    )
+    await first_call.wait()
+    waiter = asyncio.ensure_future(
+        cache.async_get_marketdata("/stocks/bars/latest", params, fetch)
+    )
+    await asyncio.sleep(0)
+
+    owner.cancel()
+
+    assert list(await asyncio.wait_for(waiter, 1)) == ["SPY"]
+    assert owner.cancelled()
+    assert calls == ["SPY", "SPY"]
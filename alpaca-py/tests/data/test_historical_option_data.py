@@ -775,6 +775,44 @@ def test_get_latest_quote_multi_empty_response(
     assert reqmock.called_once
 
 
+def test_get_latest_quote_batches_symbols(
+    reqmock, option_client: OptionHistoricalDataClient
+):
+    symbols = [f"SPY240426C00{strike}000" for strike in range(400, 650)]
+
+    def callback(request, context):
+        return {
+            "quotes": {
+                symbol.upper(): {
+                    "t": "2024-01-24T14:02:43.651613184Z",
+                    "ax": "N",
+                    "ap": 0.06,
+                    "as": 1593,
+                    "bx": "N",
+                    "bp": 0.05,
+                    "bs": 1344,
+                    "c": "B",
+                }
+                for symbol in request.qs["symbols"][0].split(",")
+            }
+        }
+
+    reqmock.get(
+        "https://data.alpaca.markets/v1beta1/options/quotes/latest", json=callback
+    )
+
+    request = OptionLatestQuoteRequest(symbol_or_symbols=symbols)
+
+    quotes = option_client.get_option_latest_quote(request)
+
+    assert reqmock.call_count == 3
+    assert sorted(
+        len(request.qs["symbols"][0].split(",")) for request in reqmock.request_history
+    ) == [50, 100, 100]
+    assert sorted(quotes) == symbols
+    assert all(isinstance(quote, Quote) for quote in quotes.values())
+
+
 def test_get_snapshot(reqmock, option_client: OptionHistoricalDataClient):
     # Test single symbol request
     symbol = "AAPL240126P00050000"
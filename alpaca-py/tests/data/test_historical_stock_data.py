@@ -1,12 +1,16 @@
 import urllib.parse
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict
 
-from alpaca.common.enums import Sort
+import pandas as pd
+import pytest
+
+from alpaca.common.enums import PaginationType, Sort
 from alpaca.data import Bar, Quote, Snapshot, Trade
 from alpaca.data.enums import DataFeed, Exchange
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.models import BarSet, QuoteSet, TradeSet
+from alpaca.data.models.base import _UNBUILT, LazyModelList
 from alpaca.data.requests import (
     StockBarsRequest,
     StockLatestBarRequest,
@@ -276,6 +280,412 @@ def test_get_bars_multi_empty_response(
     assert reqmock.called_once
 
 
+def test_get_bars_sharded_by_symbol(reqmock, stock_client: StockHistoricalDataClient):
+    def bars_callback(request, context):
+        symbol = request.qs["symbols"][0].upper()
+        return {
+            "bars": {
+                symbol: [
+                    {
+                        "t": "2022-02-01T05:00:00Z",
+                        "o": 174,
+                        "h": 174.84,
+                        "l": 172.31,
+                        "c": 174.61,
+                        "v": 85998033,
+                        "n": 732412,
+                        "vw": 173.703516,
+                    }
+                ]
+            },
+            "next_page_token": None,
+        }
+
+    reqmock.get("https://data.alpaca.markets/v2/stocks/bars", json=bars_callback)
+
+    request = StockBarsRequest(
+        symbol_or_symbols=["AAPL", "TSLA", "SPY"],
+        timeframe=TimeFrame.Day,
+        start=datetime(2022, 2, 1),
+    )
+    barset = stock_client.get_stock_bars(request_params=request, max_workers=2)
+
+    assert isinstance(barset, BarSet)
+    assert list(barset.data.keys()) == ["AAPL", "TSLA", "SPY"]
+    assert barset["TSLA"][0].open == 174
+
+    assert reqmock.call_count == 3
+    assert sorted(r.qs["symbols"][0] for r in reqmock.request_history) == [
+        "aapl",
+        "spy",
+        "tsla",
+    ]
+
+
+def test_get_trades_sharded_by_time(reqmock, stock_client: StockHistoricalDataClient):
+    def trades_callback(request, context):
+        return {
+            "trades": {
+                "AAPL": [
+                    {
+                        "t": request.qs["start"][0].upper(),
+                        "x": "V",
+                        "p": 174.61,
+                        "s": 100,
+                        "c": ["@"],
+                        "i": 1,
+                        "z": "C",
+                    }
+                ]
+            },
+            "next_page_token": None,
+        }
+
+    reqmock.get("https://data.alpaca.markets/v2/stocks/trades", json=trades_callback)
+
+    request = StockTradesRequest(
+        symbol_or_symbols="AAPL",
+        start=datetime(2022, 2, 1),
+        end=datetime(2022, 2, 3, 12),
+        sort=Sort.DESC,
+    )
+    tradeset = stock_client.get_stock_trades(
+        request_params=request, max_workers=4, time_slice=timedelta(days=1)
+    )
+
+    # slices are merged in the requested sort order
+    assert [trade.timestamp.day for trade in tradeset["AAPL"]] == [3, 2, 1]
+
+    ranges = sorted((r.qs["start"][0], r.qs["end"][0]) for r in reqmock.request_history)
+    assert ranges == [
+        ("2022-02-01t00:00:00+00:00", "2022-02-01t23:59:59.999999+00:00"),
+        ("2022-02-02t00:00:00+00:00", "2022-02-02t23:59:59.999999+00:00"),
+        ("2022-02-03t00:00:00+00:00", "2022-02-03t12:00:00+00:00"),
+    ]
+
+
+def test_get_bars_sharded_with_limit(stock_client: StockHistoricalDataClient):
+    request = StockBarsRequest(
+        symbol_or_symbols=["AAPL", "TSLA"],
+        timeframe=TimeFrame.Day,
+        start=datetime(2022, 2, 1),
+        limit=10,
+    )
+
+    with pytest.raises(ValueError):
+        stock_client.get_stock_bars(request_params=request, max_workers=2)
+
+
+def test_get_bars_as_frame(reqmock, stock_client: StockHistoricalDataClient):
+    def bars_callback(request, context):
+        if "page_token" not in request.qs:
+            return {
+                "bars": {
+                    "AAPL": [
+                        {
+                            "t": "2022-02-01T05:00:00Z",
+                            "o": 174,
+                            "h": 174.84,
+                            "l": 172.31,
+                            "c": 174.61,
+                            "v": 85998033,
+                            "n": 732412,
+                            "vw": 173.703516,
+                        }
+                    ]
+                },
+                "next_page_token": "token",
+            }
+        return {
+            "bars": {
+                "AAPL": [
+                    {
+                        "t": "2022-02-02T05:00:00Z",
+                        "o": 174.64,
+                        "h": 175.88,
+                        "l": 173.33,
+                        "c": 175.84,
+                        "v": 84817432,
+                        "n": 675034,
+                        "vw": 174.941288,
+                    }
+                ],
+                "TSLA": [
+                    {
+                        "t": "2022-02-01T05:00:00Z",
+                        "o": 935.21,
+                        "h": 943.7,
+                        "l": 905,
+                        "c": 931.25,
+                        "v": 24379446,
+                        "n": 1048764,
+                        "vw": 926.398562,
+                    }
+                ],
+            },
+            "next_page_token": None,
+        }
+
+    reqmock.get("https://data.alpaca.markets/v2/stocks/bars", json=bars_callback)
+
+    request = StockBarsRequest(
+        symbol_or_symbols=["AAPL", "TSLA"],
+        timeframe=TimeFrame.Day,
+        start=datetime(2022, 2, 1),
+    )
+    df = stock_client.get_stock_bars(request_params=request, as_frame=True)
+
+    assert reqmock.call_count == 2
+
+    assert isinstance(df, pd.DataFrame)
+    assert df.index.names == ["symbol", "timestamp"]
+    assert list(df.columns) == [
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "trade_count",
+        "vwap",
+    ]
+    assert df.loc[("AAPL", pd.Timestamp("2022-02-02T05:00:00Z")), "close"] == 175.84
+    assert df.loc["TSLA"]["open"].tolist() == [935.21]
+
+    # the columnar path matches the frame built from models
+    barset = stock_client.get_stock_bars(request_params=request)
+    expected = pd.DataFrame(
+        [bar.model_dump() for bars in barset.data.values() for bar in bars]
+    ).set_index(["symbol", "timestamp"])
+    pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+
+
+def test_get_trades_as_frame_sharded(reqmock, stock_client: StockHistoricalDataClient):
+    def trades_callback(request, context):
+        symbol = request.qs["symbols"][0].upper()
+        return {
+            "trades": {
+                symbol: [
+                    {
+                        "t": "2022-03-18T14:00:00.000123456Z",
+                        "x": "V",
+                        "p": 174.61,
+                        "s": 100,
+                        "c": ["@", "I"],
+                        "i": 52983525033527,
+                        "z": "C",
+                    },
+                    {
+                        "t": "2022-03-18T14:00:01Z",
+                        "x": "V",
+                        "p": 174.62,
+                        "s": 10,
+                        "c": ["@"],
+                        "i": 52983525033528,
+                        "z": "C",
+                    },
+                ]
+            },
+            "next_page_token": None,
+        }
+
+    reqmock.get("https://data.alpaca.markets/v2/stocks/trades", json=trades_callback)
+
+    request = StockTradesRequest(
+        symbol_or_symbols=["AAPL", "TSLA"], start=datetime(2022, 3, 18)
+    )
+    df = stock_client.get_stock_trades(
+        request_params=request, max_workers=2, as_frame=True
+    )
+
+    assert reqmock.call_count == 2
+    assert df.index.get_level_values("symbol").tolist() == [
+        "AAPL",
+        "AAPL",
+        "TSLA",
+        "TSLA",
+    ]
+    assert df["id"].dtype == "int64"
+    assert df["conditions"].iloc[0] == ["@", "I"]
+    # timestamps are truncated to microseconds like the models' datetimes
+    assert df.index.get_level_values("timestamp")[0] == pd.Timestamp(
+        "2022-03-18T14:00:00.000123Z"
+    )
+
+    # the columnar path matches the frame built from models
+    tradeset = stock_client.get_stock_trades(request_params=request, max_workers=2)
+    expected = pd.DataFrame(
+        [trade.model_dump() for trades in tradeset.data.values() for trade in trades]
+    ).set_index(["symbol", "timestamp"])
+    # the models' UTC timezone is pydantic's own tzinfo, so only the index values are compared
+    pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+    assert (
+        df.index.get_level_values("timestamp").asi8
+        == expected.index.get_level_values("timestamp").asi8
+    ).all()
+
+
+def test_barset_builds_bars_lazily():
+    raw_bars = {
+        "AAPL": [
+            {
+                "t": f"2022-02-0{day}T05:00:00Z",
+                "o": day,
+                "h": day,
+                "l": day,
+                "c": day,
+                "v": 100,
+                "n": 10,
+                "vw": day,
+            }
+            for day in range(1, 6)
+        ]
+    }
+    barset = BarSet(raw_bars)
+    bars = barset["AAPL"]
+
+    assert isinstance(bars, LazyModelList)
+    assert len(bars) == 5
+    assert _built_count(bars) == 0
+
+    assert bars[-1].close == 5
+    assert [bar.open for bar in bars[1:3]] == [2, 3]
+    assert _built_count(bars) == 3
+    assert bars[-1] is bars[4]
+
+    with pytest.raises(IndexError):
+        bars[5]
+
+    # the frame is decoded from the raw data without building the other bars
+    df = barset.df
+    assert df["open"].tolist() == [1, 2, 3, 4, 5]
+    assert _built_count(bars) == 3
+
+    assert barset.model_dump()["data"]["AAPL"][0]["open"] == 1
+    assert bars == list(bars)
+    assert raw_bars["AAPL"] == bars.raw_data
+
+
+def test_barset_bars_are_a_list():
+    raw_bars = {
+        "AAPL": [
+            {
+                "t": f"2022-02-0{day}T05:00:00Z",
+                "o": day,
+                "h": day,
+                "l": day,
+                "c": day,
+                "v": 100,
+                "n": 10,
+                "vw": day,
+            }
+            for day in range(1, 4)
+        ]
+    }
+    barset = BarSet(raw_bars)
+    bars = barset["AAPL"]
+
+    assert isinstance(bars, list)
+
+    combined = bars + barset["AAPL"][:1]
+    assert type(combined) is list
+    assert [bar.open for bar in combined] == [1, 2, 3, 1]
+    assert [bar.open for bar in [] + bars] == [1, 2, 3]
+
+    # modifying the list builds the remaining bars, and the frame is built from the models
+    bars.append(bars[0])
+    assert _built_count(bars) == 4
+    assert bars.raw_data is None
+    assert barset.df["open"].tolist() == [1, 2, 3, 1]
+
+
+def _built_count(models: LazyModelList) -> int:
+    return sum(item is not _UNBUILT for item in list.__iter__(models))
+
+
+def _paged_trades_callback(request, context):
+    page = int(request.qs.get("page_token", ["0"])[0])
+    return {
+        "trades": {
+            "AAPL": [
+                {
+                    "t": f"2022-03-18T14:00:0{page}Z",
+                    "x": "V",
+                    "p": 174.61 + page,
+                    "s": 100,
+                    "c": ["@"],
+                    "i": page,
+                    "z": "C",
+                }
+            ]
+        },
+        "next_page_token": str(page + 1) if page < 2 else None,
+    }
+
+
+def test_get_trades_iterator(reqmock, stock_client: StockHistoricalDataClient):
+    reqmock.get(
+        "https://data.alpaca.markets/v2/stocks/trades", json=_paged_trades_callback
+    )
+
+    request = StockTradesRequest(symbol_or_symbols="AAPL", start=datetime(2022, 3, 18))
+    pages = stock_client.get_stock_trades(
+        request_params=request, handle_pagination=PaginationType.ITERATOR
+    )
+
+    # pages are only fetched as they are consumed
+    assert reqmock.call_count == 0
+
+    first = next(pages)
+    assert isinstance(first, TradeSet)
+    assert first["AAPL"][0].id == 0
+    assert reqmock.call_count == 1
+
+    assert [page["AAPL"][0].id for page in pages] == [1, 2]
+    assert reqmock.call_count == 3
+
+
+def test_get_trades_iterator_as_frame(reqmock, stock_client: StockHistoricalDataClient):
+    reqmock.get(
+        "https://data.alpaca.markets/v2/stocks/trades", json=_paged_trades_callback
+    )
+
+    request = StockTradesRequest(
+        symbol_or_symbols="AAPL", start=datetime(2022, 3, 18), limit=2
+    )
+    frames = list(
+        stock_client.get_stock_trades(
+            request_params=request,
+            as_frame=True,
+            handle_pagination=PaginationType.ITERATOR,
+        )
+    )
+
+    # the total limit is respected across pages
+    assert [len(frame) for frame in frames] == [1, 1]
+    assert frames[1]["id"].tolist() == [1]
+
+
+def test_get_trades_single_page(reqmock, stock_client: StockHistoricalDataClient):
+    reqmock.get(
+        "https://data.alpaca.markets/v2/stocks/trades", json=_paged_trades_callback
+    )
+
+    request = StockTradesRequest(symbol_or_symbols="AAPL", start=datetime(2022, 3, 18))
+    tradeset = stock_client.get_stock_trades(
+        request_params=request, handle_pagination=PaginationType.NONE
+    )
+
+    assert len(tradeset["AAPL"]) == 1
+    assert reqmock.call_count == 1
+
+    with pytest.raises(ValueError):
+        stock_client.get_stock_trades(
+            request_params=request,
+            max_workers=2,
+            handle_pagination=PaginationType.ITERATOR,
+        )
+
+
 def test_get_quotes(reqmock, stock_client: StockHistoricalDataClient):
     # Test single symbol request
 
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from alpaca.data.models.orderbooks import Orderbook
+from alpaca.data.orderbook import LocalOrderbook, LocalOrderbooks
+
+
+def _levels(*levels):
+    return [{"p": price, "s": size} for price, size in levels]
+
+
+def test_local_orderbook_applies_updates():
+    book = LocalOrderbook("BTC/USD")
+    assert book.best_bid is None
+    assert book.mid is None
+
+    book.apply(
+        {
+            "b": _levels((100, 1), (99, 2), (98, 3)),
+            "a": _levels((102, 1), (101, 4)),
+            "r": True,
+        }
+    )
+    assert book.best_bid == (100, 1)
+    assert book.best_ask == (101, 4)
+    assert book.spread == 1
+    assert book.mid == 100.5
+    assert book.microprice == (100 * 4 + 101 * 1) / 5
+
+    # zero sizes remove levels, other sizes replace or add them
+    book.apply({"b": _levels((100, 0), (99, 5), (99.5, 1)), "a": _levels((101, 0))})
+    prices, sizes = book.bids()
+    assert list(prices) == [99.5, 99, 98]
+    assert list(sizes) == [1, 5, 3]
+    assert book.best_ask == (102, 1)
+
+    prices, sizes = book.asks(depth=1)
+    assert list(prices) == [102]
+
+    # removing a level that isn't in the book doesn't add it
+    book.apply({"b": _levels((50, 0)), "a": []})
+    assert len(book.bids()[0]) == 3
+
+    book.apply({"b": _levels((90, 1)), "a": _levels((95, 1)), "r": True})
+    assert list(book.bids()[0]) == [90]
+    assert list(book.asks()[0]) == [95]
+
+
+def test_local_orderbooks_from_models():
+    books = LocalOrderbooks()
+    books.load(
+        {
+            "BTC/USD": {
+                "t": "2024-01-01T00:00:00Z",
+                "b": _levels((100, 1)),
+                "a": _levels((101, 1)),
+            }
+        }
+    )
+    assert books["BTC/USD"].mid == 100.5
+
+    update = Orderbook(
+        "BTC/USD",
+        {
+            "t": "2024-01-01T00:00:01Z",
+            "b": _levels((100.5, 2)),
+            "a": _levels((101, 0), (102, 3)),
+        },
+    )
+    book = books.apply(update)
+
+    assert book.best_bid == (100.5, 2)
+    assert book.best_ask == (102, 3)
+    bids, asks = book.to_orderbook_quotes(depth=1)
+    assert (bids[0].price, asks[0].size) == (100.5, 3)
+    assert np.array_equal(book.bids()[1], [2, 1])
+    assert "ETH/USD" not in books
+
+
+@pytest.mark.asyncio
+async def test_local_orderbooks_handle_stream_messages():
+    updates = []
+
+    async def on_update(book):
+        updates.append((book.symbol, book.best_bid))
+
+    books = LocalOrderbooks(on_update=on_update)
+    await books.handle(
+        {"S": "ETH/USD", "b": _levels((10, 1)), "a": _levels((11, 1)), "r": True}
+    )
+    await books.handle({"S": "ETH/USD", "b": _levels((10.5, 1)), "a": []})
+
+    assert updates == [("ETH/USD", (10, 1)), ("ETH/USD", (10.5, 1))]
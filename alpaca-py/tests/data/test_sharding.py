@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from functools import partial
+
+import pytest
+from msgpack.ext import Timestamp
+
+from alpaca.data.live.sharding import ShardedDataStream
+from alpaca.data.live.websocket import DataStream
+from alpaca.data.models import Trade
+
+
+class ReplayStream(DataStream):
+    """Stream that sends one trade for each subscribed symbol instead of connecting."""
+
+    async def _run_forever(self) -> None:
+        for symbol in self._handlers["trades"]:
+            await self._dispatch(
+                {
+                    "T": "t",
+                    "S": symbol,
+                    "i": 1,
+                    "x": "V",
+                    "p": 100.0,
+                    "s": 1,
+                    "t": Timestamp(seconds=10),
+                }
+            )
+        while self._should_run:
+            await asyncio.sleep(0.01)
+
+
+def test_sharded_stream():
+    stream = ShardedDataStream(
+        partial(ReplayStream, "endpoint", "key-id", "secret-key"), shards=3
+    )
+    symbols = ["AAPL", "MSFT", "SPY", "TSLA", "NVDA", "AMD"]
+    trades = []
+
+    async def handler(trade):
+        trades.append(trade)
+        if len(trades) == len(symbols):
+            stream.stop()
+
+    stream.subscribe_trades(handler, *symbols)
+    stream.run()
+
+    assert sorted(trade.symbol for trade in trades) == sorted(symbols)
+    assert all(type(trade) == Trade for trade in trades)
+
+    with pytest.raises(ValueError):
+        stream.subscribe_quotes(lambda quote: None, "AAPL")
+
+
+def test_get_shard():
+    stream = ShardedDataStream(DataStream, shards=4)
+
+    assert stream.get_shard("*") == 0
+    assert stream.get_shard("AAPL") == stream.get_shard("AAPL")
+    assert {stream.get_shard(f"SYM{i}") for i in range(100)} == {0, 1, 2, 3}
+
+    with pytest.raises(ValueError):
+        ShardedDataStream(DataStream, shards=0)
+
+
+def test_sharded_stream_stops_with_full_queue():
+    stream = ShardedDataStream(
+        partial(ReplayStream, "endpoint", "key-id", "secret-key"),
+        shards=1,
+        queue_size=1,
+    )
+
+    async def handler(trade):
+        # like Ctrl-C while the shard is waiting for room in the queue
+        raise KeyboardInterrupt
+
+    stream.subscribe_trades(handler, "AAPL", "MSFT", "SPY", "TSLA")
+    running = threading.Thread(target=stream.run, daemon=True)
+    running.start()
+    running.join(timeout=5)
+
+    assert not running.is_alive()
+    assert stream._workers == []
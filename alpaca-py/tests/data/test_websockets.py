@@ -1,16 +1,40 @@
+import asyncio
 from datetime import datetime
 
+import msgpack
+import numpy as np
 import pytest
+import websockets
 from msgpack.ext import Timestamp
 from pytz import utc
 
-from alpaca.data.enums import Exchange
+from alpaca.common.metrics import (
+    STREAM_BYTES,
+    STREAM_DECODE_SECONDS,
+    STREAM_HANDLER_SECONDS,
+    STREAM_LATENCY_SECONDS,
+    STREAM_MESSAGES,
+    STREAM_QUEUE_DELAY_SECONDS,
+    InMemoryMetricsSink,
+)
+from alpaca.common.recording import FrameRecorder
+from alpaca.common.retry import ReconnectPolicy
+from alpaca.data.enums import Exchange, OverflowPolicy
+from alpaca.data.live.dispatch import (
+    DispatchQueue,
+    DispatchStats,
+    MessageDispatcher,
+    MessageIterator,
+    merge_orderbook_updates,
+)
 from alpaca.data.models import Bar, Trade, News
+from alpaca.data.live.health import StreamGap
 from alpaca.data.live.websocket import DataStream
 from alpaca.data.models import Bar, Trade
 from alpaca.data.models.news import News
 from alpaca.data.models.orderbooks import Orderbook, OrderbookQuote
 from alpaca.data.models.quotes import Quote
+from alpaca.data.models.ticks import BarTick, QuoteTick, TradeTick
 from alpaca.data.models.trades import TradeCancel, TradingStatus
 
 
@@ -232,3 +256,796 @@ async def test_dispatch(ws_client: DataStream, timestamp: Timestamp):
     assert len(articles_b) == 1
     assert len(articles_star) == 2
     assert articles_star[1].headline == "c"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_queue_drops_oldest():
+    stats = DispatchStats()
+    queue = DispatchQueue(2, OverflowPolicy.DROP_OLDEST, stats)
+
+    for price in [1, 2, 3]:
+        await queue.put(("q", "AAPL"), {"T": "q", "S": "AAPL", "bp": price})
+
+    assert stats.dropped == 1
+    assert [(await queue.get())["bp"] for _ in range(2)] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_queue_conflates_latest():
+    stats = DispatchStats()
+    queue = DispatchQueue(2, OverflowPolicy.CONFLATE_LATEST, stats)
+
+    await queue.put(("q", "AAPL"), {"S": "AAPL", "bp": 1})
+    await queue.put(("q", "MSFT"), {"S": "MSFT", "bp": 1})
+    await queue.put(("q", "AAPL"), {"S": "AAPL", "bp": 2})
+
+    assert stats.conflated == 1
+    assert len(queue) == 2
+    # the latest message keeps the position of the one it replaced
+    assert await queue.get() == {"S": "AAPL", "bp": 2}
+
+    await queue.put(("q", "TSLA"), {"S": "TSLA", "bp": 1})
+    await queue.put(("q", "NVDA"), {"S": "NVDA", "bp": 1})
+
+    assert stats.dropped == 1
+    assert [(await queue.get())["S"] for _ in range(2)] == ["TSLA", "NVDA"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_queue_conflates_only_when_full():
+    stats = DispatchStats()
+    queue = DispatchQueue(3, OverflowPolicy.CONFLATE_LATEST, stats)
+
+    for price in [1, 2]:
+        await queue.put(("q", "AAPL"), {"S": "AAPL", "bp": price})
+
+    assert stats.conflated == 0
+    assert [(await queue.get())["bp"] for _ in range(2)] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_queue_never_conflates_news_or_trades():
+    stats = DispatchStats()
+    queue = DispatchQueue(2, OverflowPolicy.CONFLATE_LATEST, stats)
+
+    # news have no symbol, so every article shares a key
+    await queue.put(("n", None), {"T": "n", "headline": "a"})
+    await queue.put(("n", None), {"T": "n", "headline": "b"})
+    assert [(await queue.get())["headline"] for _ in range(2)] == ["a", "b"]
+
+    for price in [1, 2, 3]:
+        await queue.put(("t", "AAPL"), {"T": "t", "S": "AAPL", "p": price})
+
+    # a full queue drops the oldest trade instead of overwriting the latest one
+    assert stats.conflated == 0
+    assert stats.dropped == 1
+    assert [(await queue.get())["p"] for _ in range(2)] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_queue_merges_orderbooks_when_full():
+    stats = DispatchStats()
+    queue = DispatchQueue(1, OverflowPolicy.CONFLATE_LATEST, stats)
+
+    await queue.put(
+        ("o", "BTC/USD"),
+        {"T": "o", "S": "BTC/USD", "b": [{"p": 1, "s": 1}], "a": [{"p": 3, "s": 1}]},
+    )
+    await queue.put(
+        ("o", "BTC/USD"), {"T": "o", "S": "BTC/USD", "b": [{"p": 2, "s": 1}], "a": []}
+    )
+
+    assert stats.conflated == 1
+    msg = await queue.get()
+    assert [level["p"] for level in msg["b"]] == [2, 1]
+    assert [level["p"] for level in msg["a"]] == [3]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_queue_blocks_when_full():
+    queue = DispatchQueue(1, OverflowPolicy.BLOCK, DispatchStats())
+
+    await queue.put(("q", "AAPL"), {"bp": 1})
+    put = asyncio.ensure_future(queue.put(("q", "AAPL"), {"bp": 2}))
+    await asyncio.sleep(0)
+    assert not put.done()
+
+    assert await queue.get() == {"bp": 1}
+    await asyncio.wait_for(put, 1)
+    assert await queue.get() == {"bp": 2}
+
+
+@pytest.mark.asyncio
+async def test_message_dispatcher_decouples_slow_handlers():
+    release = asyncio.Event()
+    handled = []
+
+    async def dispatch(msg):
+        if msg["S"] == "SLOW":
+            await release.wait()
+        if msg.get("fail"):
+            raise ValueError("handler failed")
+        handled.append((msg["S"], msg["i"]))
+
+    dispatcher = MessageDispatcher(dispatch, workers=4)
+    dispatcher.start()
+
+    for i in range(3):
+        await dispatcher.put({"T": "t", "S": "SLOW", "i": i})
+    await dispatcher.put({"T": "t", "S": "FAST", "i": 0, "fail": True})
+    for i in range(1, 3):
+        await dispatcher.put({"T": "t", "S": "FAST", "i": i})
+
+    # reading continues while a handler is stuck
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert ("FAST", 2) in handled
+    assert all(symbol == "FAST" for symbol, _ in handled)
+
+    release.set()
+    for _ in range(20):
+        await asyncio.sleep(0)
+    await dispatcher.stop()
+
+    # messages of the same symbol are handled in order, and a failing handler doesn't stop the worker
+    assert [i for symbol, i in handled if symbol == "SLOW"] == [0, 1, 2]
+    assert [i for symbol, i in handled if symbol == "FAST"] == [1, 2]
+    assert dispatcher.stats.received == 6
+    assert dispatcher.stats.dispatched == 6
+
+
+@pytest.mark.asyncio
+async def test_message_dispatcher_join_waits_for_blocked_put():
+    release = asyncio.Event()
+    handled = []
+
+    async def dispatch(msg):
+        if msg["i"] == 0:
+            await release.wait()
+        handled.append(msg["i"])
+
+    dispatcher = MessageDispatcher(dispatch, workers=1, queue_size=1)
+    dispatcher.start()
+
+    await dispatcher.put({"T": "t", "S": "AAPL", "i": 0})
+    await asyncio.sleep(0)
+    await dispatcher.put({"T": "t", "S": "AAPL", "i": 1})
+    # waits for room until the worker takes the second message
+    put = asyncio.ensure_future(dispatcher.put({"T": "t", "S": "AAPL", "i": 2}))
+    await asyncio.sleep(0)
+    assert not put.done()
+
+    release.set()
+    await dispatcher.join()
+    assert handled == [0, 1, 2]
+
+    await put
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_stream_handles_control_messages_inline():
+    stream = DataStream("endpoint", "key-id", "secret-key", dispatch_workers=2)
+    stream._dispatcher = MessageDispatcher(
+        stream._dispatch, workers=2, stats=stream.dispatch_stats
+    )
+    stream._dispatcher.start()
+
+    await stream._enqueue({"T": "subscription", "trades": ["AAPL"]})
+    await stream._enqueue({"T": "t", "S": "AAPL"})
+
+    assert stream.dispatch_stats.received == 2
+    assert stream.dispatch_stats.dispatched == 1
+    await stream._dispatcher.stop()
+
+
+def _quote_msg(symbol: str, bid: float, timestamp: Timestamp) -> dict:
+    return {
+        "T": "q",
+        "S": symbol,
+        "bx": "V",
+        "bp": bid,
+        "bs": 35,
+        "ax": "V",
+        "ap": bid + 0.02,
+        "as": 35,
+        "c": ["R"],
+        "z": "B",
+        "t": timestamp,
+    }
+
+
+@pytest.mark.asyncio
+async def test_conflated_subscription(ws_client: DataStream, timestamp: Timestamp):
+    quotes = []
+
+    async def handler(quote):
+        quotes.append(quote)
+
+    ws_client._subscribe(
+        handler, ("AAPL", "MSFT"), ws_client._handlers["quotes"], conflate=True
+    )
+
+    for bid in [1, 2, 3]:
+        await ws_client._dispatch(_quote_msg("AAPL", bid, timestamp))
+    await ws_client._dispatch(_quote_msg("MSFT", 1, timestamp))
+    await asyncio.sleep(0)
+
+    assert [(quote.symbol, quote.bid_price) for quote in quotes] == [
+        ("AAPL", 3),
+        ("MSFT", 1),
+    ]
+    assert type(quotes[0]) == Quote
+    assert ws_client.dispatch_stats.conflated == 2
+
+    await ws_client._dispatch(_quote_msg("AAPL", 4, timestamp))
+    await asyncio.sleep(0)
+    assert quotes[-1].bid_price == 4
+
+
+@pytest.mark.asyncio
+async def test_conflated_batch_subscription(
+    raw_ws_client: DataStream, timestamp: Timestamp
+):
+    batches = []
+
+    async def handler(batch):
+        batches.append(batch)
+
+    raw_ws_client._subscribe(
+        handler, ("*",), raw_ws_client._handlers["quotes"], conflate=True, batch=True
+    )
+
+    for symbol, bid in [("AAPL", 1), ("MSFT", 1), ("AAPL", 2)]:
+        await raw_ws_client._dispatch(_quote_msg(symbol, bid, timestamp))
+    await asyncio.sleep(0)
+
+    assert len(batches) == 1
+    assert {symbol: quote["bp"] for symbol, quote in batches[0].items()} == {
+        "AAPL": 2,
+        "MSFT": 1,
+    }
+
+    with pytest.raises(ValueError):
+        raw_ws_client._subscribe(
+            handler,
+            ("AAPL",),
+            raw_ws_client._handlers["quotes"],
+            conflate=True,
+            batch=True,
+            columnar=True,
+        )
+
+
+def _trade_msg(symbol: str, price: float, timestamp: Timestamp) -> dict:
+    return {
+        "T": "t",
+        "S": symbol,
+        "i": 6142,
+        "x": "V",
+        "p": price,
+        "s": 90,
+        "c": ["@", "I"],
+        "z": "C",
+        "t": timestamp,
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_subscription(ws_client: DataStream, timestamp: Timestamp):
+    batches = []
+
+    async def handler(batch):
+        batches.append(batch)
+
+    ws_client._subscribe(handler, ("*",), ws_client._handlers["trades"], batch=True)
+
+    # the messages of one frame are dispatched without yielding to the event loop
+    for symbol, price in [("AAPL", 1), ("MSFT", 2), ("AAPL", 3)]:
+        await ws_client._dispatch(_trade_msg(symbol, price, timestamp))
+    await asyncio.sleep(0)
+
+    assert len(batches) == 1
+    assert [(trade.symbol, trade.price) for trade in batches[0]] == [
+        ("AAPL", 1),
+        ("MSFT", 2),
+        ("AAPL", 3),
+    ]
+    assert type(batches[0][0]) == Trade
+
+    await ws_client._dispatch(_trade_msg("AAPL", 4, timestamp))
+    await asyncio.sleep(0)
+    assert [trade.price for trade in batches[1]] == [4]
+
+
+@pytest.mark.asyncio
+async def test_batch_subscription_window(
+    raw_ws_client: DataStream, timestamp: Timestamp
+):
+    batches = []
+
+    async def handler(batch):
+        batches.append(batch)
+
+    raw_ws_client._subscribe(
+        handler,
+        ("AAPL",),
+        raw_ws_client._handlers["trades"],
+        batch=True,
+        batch_window=0.01,
+    )
+
+    await raw_ws_client._dispatch(_trade_msg("AAPL", 1, timestamp))
+    await asyncio.sleep(0)
+    await raw_ws_client._dispatch(_trade_msg("AAPL", 2, timestamp))
+    assert batches == []
+
+    await asyncio.sleep(0.05)
+    assert [[trade["p"] for trade in batch] for batch in batches] == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_columnar_batch_subscription(ws_client: DataStream, timestamp: Timestamp):
+    batches = []
+
+    async def handler(batch):
+        batches.append(batch)
+
+    ws_client._subscribe(
+        handler, ("*",), ws_client._handlers["trades"], batch=True, columnar=True
+    )
+
+    await ws_client._dispatch(_trade_msg("AAPL", 1.5, timestamp))
+    await ws_client._dispatch(_trade_msg("MSFT", 2.5, timestamp))
+    await asyncio.sleep(0)
+
+    columns = batches[0]
+    assert list(columns["symbol"]) == ["AAPL", "MSFT"]
+    assert columns["price"].dtype == np.float64
+    assert list(columns["price"]) == [1.5, 2.5]
+    assert list(columns["timestamp"]) == [10_000_000_010, 10_000_000_010]
+    assert columns["conditions"][0] == ["@", "I"]
+
+    with pytest.raises(ValueError):
+        ws_client._subscribe(
+            handler, ("*",), ws_client._handlers["news"], batch=True, columnar=True
+        )
+
+
+def test_merge_orderbook_updates():
+    snapshot = {
+        "T": "o",
+        "S": "BTC/USD",
+        "r": True,
+        "b": [{"p": 100, "s": 1}, {"p": 99, "s": 2}],
+        "a": [{"p": 101, "s": 1}],
+    }
+    update = {
+        "T": "o",
+        "S": "BTC/USD",
+        "b": [{"p": 99, "s": 0}, {"p": 100.5, "s": 3}],
+        "a": [{"p": 102, "s": 4}],
+    }
+    later = {"T": "o", "S": "BTC/USD", "b": [{"p": 98, "s": 0}], "a": []}
+
+    merged = merge_orderbook_updates(snapshot, update)
+    assert merged["r"] is True
+    assert merged["b"] == [{"p": 100.5, "s": 3}, {"p": 100, "s": 1}]
+    assert merged["a"] == [{"p": 101, "s": 1}, {"p": 102, "s": 4}]
+
+    # removals are kept while the merged messages are updates
+    merged = merge_orderbook_updates(update, later)
+    assert "r" not in merged
+    assert merged["b"] == [{"p": 100.5, "s": 3}, {"p": 99, "s": 0}, {"p": 98, "s": 0}]
+
+    assert merge_orderbook_updates(update, snapshot) == snapshot
+
+
+def test_cast_tick_records(timestamp: Timestamp):
+    stream = DataStream("endpoint", "key-id", "secret-key", tick_records=True)
+
+    trade = stream._cast(_trade_msg("AAPL", 177.79, timestamp))
+    assert trade == TradeTick(
+        "AAPL", 10_000_000_010, 177.79, 90, "V", 6142, ["@", "I"], "C"
+    )
+    assert trade.to_datetime() == datetime(1970, 1, 1, 0, 0, 10, tzinfo=utc)
+    with pytest.raises(AttributeError):
+        trade.extra = 1
+
+    quote = stream._cast(_quote_msg("AAPL", 1.5, timestamp))
+    assert type(quote) == QuoteTick
+    assert (quote.bid_price, quote.ask_size, quote.timestamp) == (
+        1.5,
+        35,
+        10_000_000_010,
+    )
+
+    bar = stream._cast(
+        {
+            "T": "b",
+            "S": "AAPL",
+            "o": 177.94,
+            "c": 178.005,
+            "h": 178.005,
+            "l": 177.94,
+            "v": 8547,
+            "t": timestamp,
+            "n": 66,
+            "vw": 177.987562,
+        }
+    )
+    assert type(bar) == BarTick
+    assert (bar.close, bar.trade_count) == (178.005, 66)
+
+    # messages without a tick record are parsed as usual
+    status = stream._cast(
+        {
+            "T": "s",
+            "S": "AAPL",
+            "sc": "H",
+            "sm": "Trading Halt",
+            "rc": "T12",
+            "rm": "Trading Halted; For information requested by NASDAQ",
+            "t": timestamp,
+            "z": "C",
+        }
+    )
+    assert type(status) == TradingStatus
+
+    with pytest.raises(ValueError):
+        DataStream("endpoint", "key-id", "secret-key", raw_data=True, tick_records=True)
+
+
+@pytest.mark.asyncio
+async def test_gap_reporting(timestamp: Timestamp):
+    gaps = []
+
+    async def gap_handler(gap):
+        gaps.append(gap)
+
+    stream = DataStream(
+        "endpoint", "key-id", "secret-key", raw_data=True, gap_handler=gap_handler
+    )
+
+    stream._on_connected()
+    await stream._enqueue(_trade_msg("AAPL", 1, timestamp))
+    assert gaps == []
+
+    stream._on_connected()
+    await stream._enqueue(_quote_msg("AAPL", 1, Timestamp(seconds=20)))
+    await stream._enqueue(_trade_msg("AAPL", 2, Timestamp(seconds=30)))
+    await stream._enqueue(_trade_msg("AAPL", 3, Timestamp(seconds=40)))
+
+    assert len(gaps) == 1
+    assert type(gaps[0]) == StreamGap
+    assert gaps[0].channel == "trades"
+    assert gaps[0].last_timestamp == timestamp.to_datetime()
+    assert gaps[0].first_timestamp == datetime(1970, 1, 1, 0, 0, 30, tzinfo=utc)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backoff(monkeypatch):
+    sleeps = []
+
+    async def wait_for_stop(timeout):
+        sleeps.append(timeout)
+        return False
+
+    stream = DataStream(
+        "endpoint",
+        "key-id",
+        "secret-key",
+        reconnect_policy=ReconnectPolicy(
+            base_wait=1, max_attempts=3, reset_after=60, jitter=False
+        ),
+    )
+    monkeypatch.setattr(stream, "_wait_for_stop", wait_for_stop)
+
+    assert await stream._wait_to_reconnect()
+    assert await stream._wait_to_reconnect()
+
+    # a connection that stayed up long enough starts the backoff over
+    stream._on_connected()
+    stream._connected_at -= 60
+    assert await stream._wait_to_reconnect()
+    assert await stream._wait_to_reconnect()
+    assert await stream._wait_to_reconnect()
+    assert not await stream._wait_to_reconnect()
+
+    assert sleeps == [1, 2, 1, 2, 4]
+    assert not stream._should_run
+
+
+@pytest.mark.asyncio
+async def test_stale_channel_reopens_connection(timestamp: Timestamp):
+    class FakeWebsocket:
+        closed = False
+
+        async def close(self):
+            self.closed = True
+
+    async def handler(msg):
+        pass
+
+    stream = DataStream(
+        "endpoint", "key-id", "secret-key", stale_timeouts={"trades": 0.02}
+    )
+    stream._subscribe(handler, ("AAPL",), stream._handlers["trades"])
+    stream._ws = FakeWebsocket()
+    stream._on_connected()
+
+    watchdog = asyncio.ensure_future(stream._watch_stale_channels())
+    try:
+        for _ in range(4):
+            await asyncio.sleep(0.01)
+            await stream._enqueue(_trade_msg("AAPL", 1, timestamp))
+        assert not stream._ws.closed
+
+        await asyncio.sleep(0.05)
+        assert stream._ws.closed
+    finally:
+        watchdog.cancel()
+
+
+@pytest.mark.asyncio
+async def test_message_iterator():
+    closed = []
+    iterator = MessageIterator(on_close=closed.append)
+
+    await iterator.put(1)
+    await iterator.put(2)
+    await iterator.aclose()
+    await iterator.put(3)
+
+    assert [msg async for msg in iterator] == [1, 2]
+    assert closed == [iterator]
+
+
+class FakeWebsocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, msg):
+        self.sent.append(msg)
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_subscribe_from_event_loop():
+    async def handler(msg):
+        pass
+
+    stream = DataStream("endpoint", "key-id", "secret-key")
+    stream._loop = asyncio.get_running_loop()
+    stream._ws = FakeWebsocket()
+    stream._running = True
+
+    # used to wait for the loop it runs in
+    stream._subscribe(handler, ("AAPL",), stream._handlers["trades"])
+    stream._unsubscribe("trades", ["AAPL"])
+    await asyncio.sleep(0)
+
+    assert len(stream._ws.sent) == 2
+
+
+class ReplayStream(DataStream):
+    """Stream that sends a trade for each subscribed symbol instead of connecting."""
+
+    async def _run_connection(self) -> None:
+        for symbol in list(self._handlers["trades"]):
+            await self._enqueue(_trade_msg(symbol, 1, Timestamp(seconds=10)))
+        while self._should_run:
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_async_with_and_iterator():
+    async with ReplayStream("endpoint", "key-id", "secret-key") as stream:
+        trades = stream._iterate("trades", ("AAPL", "MSFT"), 10)
+        received = []
+        async for trade in trades:
+            received.append(trade.symbol)
+            if len(received) == 2:
+                break
+        await trades.aclose()
+
+        assert sorted(received) == ["AAPL", "MSFT"]
+        assert stream._handlers["trades"] == {}
+
+
+class IdleWebsocket(FakeWebsocket):
+    """Websocket that receives nothing until it is closed."""
+
+    def __init__(self):
+        super().__init__()
+        self._closed = asyncio.Event()
+
+    async def recv(self):
+        await self._closed.wait()
+        raise websockets.ConnectionClosedOK(None, None)
+
+    async def close(self):
+        self._closed.set()
+
+
+class IdleStream(DataStream):
+    """Stream that connects to an IdleWebsocket."""
+
+    async def _connect(self) -> None:
+        self._ws = IdleWebsocket()
+
+    async def _auth(self) -> None:
+        pass
+
+
+def _idle_stream() -> IdleStream:
+    async def handler(msg):
+        pass
+
+    stream = IdleStream("endpoint", "key-id", "secret-key")
+    stream._subscribe(handler, ("AAPL",), stream._handlers["trades"])
+    return stream
+
+
+@pytest.mark.asyncio
+async def test_async_with_empty_body():
+    stream = _idle_stream()
+
+    async def run():
+        async with stream:
+            pass
+
+    await asyncio.wait_for(run(), 1)
+    assert stream._task is None
+
+
+@pytest.mark.asyncio
+async def test_async_with_body_raising():
+    stream = _idle_stream()
+
+    async def run():
+        async with stream:
+            raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(run(), 1)
+
+
+@pytest.mark.asyncio
+async def test_subscribing_from_another_thread_starts_connection():
+    async def handler(msg):
+        pass
+
+    stream = IdleStream("endpoint", "key-id", "secret-key")
+
+    async with stream:
+        await asyncio.sleep(0.01)
+        assert not stream._running
+
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            lambda: stream._subscribe(handler, ("AAPL",), stream._handlers["trades"]),
+        )
+        for _ in range(50):
+            if stream._running:
+                break
+            await asyncio.sleep(0.01)
+
+        assert stream._running
+
+
+@pytest.mark.asyncio
+async def test_async_with_without_subscriptions():
+    stream = IdleStream("endpoint", "key-id", "secret-key")
+
+    async def run():
+        async with stream:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(run(), 1)
+    assert not stream._running
+
+
+@pytest.mark.asyncio
+async def test_stop_interrupts_receiving():
+    class IdleWebsocket(FakeWebsocket):
+        def __init__(self):
+            super().__init__()
+            self._closed = asyncio.Event()
+
+        async def recv(self):
+            await self._closed.wait()
+            raise websockets.ConnectionClosedOK(None, None)
+
+        async def close(self):
+            self._closed.set()
+
+    stream = DataStream("endpoint", "key-id", "secret-key")
+    stream._loop = asyncio.get_running_loop()
+    stream._ws = IdleWebsocket()
+    stream._running = True
+
+    consuming = asyncio.ensure_future(stream._consume())
+    await asyncio.sleep(0)
+    await stream.stop_ws()
+
+    await asyncio.wait_for(consuming, 0.1)
+    assert stream._ws is None
+
+
+@pytest.mark.asyncio
+async def test_replay(tmp_path, timestamp: Timestamp):
+    path = str(tmp_path / "session.log.gz")
+    recorder = FrameRecorder(path)
+    for i in range(3):
+        recorder.write(
+            msgpack.packb(
+                [_trade_msg("AAPL", i, timestamp), _trade_msg("MSFT", i, timestamp)],
+            )
+        )
+    recorder.close()
+
+    trades = []
+    batches = []
+
+    async def handler(trade):
+        trades.append((trade.symbol, trade.price))
+
+    async def batch_handler(batch):
+        batches.append(batch)
+
+    stream = DataStream("endpoint", "key-id", "secret-key", dispatch_workers=2)
+    stream._subscribe(handler, ("AAPL",), stream._handlers["trades"])
+    stream._subscribe(batch_handler, ("MSFT",), stream._handlers["trades"], batch=True)
+
+    assert await stream.replay(path) == 3
+
+    assert trades == [("AAPL", 0), ("AAPL", 1), ("AAPL", 2)]
+    assert [trade.price for batch in batches for trade in batch] == [0, 1, 2]
+    assert stream._dispatcher is None
+
+
+@pytest.mark.asyncio
+async def test_stream_metrics(timestamp: Timestamp):
+    sink = InMemoryMetricsSink()
+    stream = DataStream(
+        "endpoint",
+        "key-id",
+        "secret-key",
+        raw_data=True,
+        dispatch_workers=1,
+        metrics_sink=sink,
+    )
+    trades = []
+
+    async def handler(trade):
+        trades.append(trade)
+
+    stream._subscribe(handler, ("AAPL",), stream._handlers["trades"])
+    stream._start_dispatching()
+    frame = msgpack.packb(
+        [
+            _trade_msg("AAPL", 1, timestamp),
+            _trade_msg("AAPL", 2, timestamp),
+            _quote_msg("AAPL", 1, timestamp),
+        ]
+    )
+    await stream._handle_frame(frame)
+    await stream._dispatcher.join()
+    await stream._stop_dispatching()
+
+    trades_labels = {"stream": "data", "channel": "trades"}
+    assert sink.get_counter(STREAM_BYTES, stream="data") == len(frame)
+    assert sink.get_counter(STREAM_MESSAGES, **trades_labels) == 2
+    assert sink.get_counter(STREAM_MESSAGES, stream="data", channel="quotes") == 1
+    assert sink.get_histogram(STREAM_DECODE_SECONDS, stream="data").count == 1
+    # the message timestamps are from 1970
+    assert sink.get_histogram(STREAM_LATENCY_SECONDS, **trades_labels).minimum > 1e9
+    assert sink.get_histogram(STREAM_QUEUE_DELAY_SECONDS, **trades_labels).count == 2
+    assert sink.get_histogram(STREAM_HANDLER_SECONDS, **trades_labels).count == 2
+
+    # the receive time doesn't reach the handlers
+    assert [trade["p"] for trade in trades] == [1, 2]
+    assert all("_received_at" not in trade for trade in trades)
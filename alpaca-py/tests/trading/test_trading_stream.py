@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+import websockets
+
+from alpaca.trading.stream import TradingStream
+
+
+class IdleWebsocket:
+    """Websocket that receives nothing until it is closed."""
+
+    def __init__(self):
+        self.sent = []
+        self._closed = asyncio.Event()
+
+    async def send(self, msg):
+        self.sent.append(msg)
+
+    async def recv(self):
+        await self._closed.wait()
+        raise websockets.ConnectionClosedOK(None, None)
+
+    async def close(self):
+        self._closed.set()
+
+
+class IdleStream(TradingStream):
+    """Stream that connects to an IdleWebsocket."""
+
+    async def _connect(self) -> None:
+        self._ws = IdleWebsocket()
+
+    async def _auth(self) -> None:
+        pass
+
+
+def _idle_stream() -> IdleStream:
+    async def handler(msg):
+        pass
+
+    stream = IdleStream("key-id", "secret-key")
+    stream.subscribe_trade_updates(handler)
+    return stream
+
+
+@pytest.mark.asyncio
+async def test_async_with_empty_body():
+    stream = _idle_stream()
+
+    async def run():
+        async with stream:
+            pass
+
+    await asyncio.wait_for(run(), 1)
+    assert stream._task is None
+
+
+@pytest.mark.asyncio
+async def test_async_with_body_raising():
+    stream = _idle_stream()
+
+    async def run():
+        async with stream:
+            raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(run(), 1)
+
+
+@pytest.mark.asyncio
+async def test_async_with_connects_until_stopped():
+    stream = _idle_stream()
+
+    async with stream:
+        await asyncio.sleep(0.05)
+        assert stream._running
+
+    assert not stream._running
+
+
+@pytest.mark.asyncio
+async def test_subscribing_from_another_thread_starts_connection():
+    async def handler(msg):
+        pass
+
+    stream = IdleStream("key-id", "secret-key")
+
+    async with stream:
+        await asyncio.sleep(0.01)
+        assert not stream._running
+
+        await asyncio.get_running_loop().run_in_executor(
+            None, stream.subscribe_trade_updates, handler
+        )
+        for _ in range(50):
+            if stream._running:
+                break
+            await asyncio.sleep(0.01)
+
+        assert stream._running
@@ -21,16 +21,9 @@ sample_df = options_df[options_df["query_date"].isin(unique_dates)].copy()
 client = OptionHistoricalDataClient(api_key, secret_key)
 all_symbols = sample_df["symbol"].dropna().unique().tolist()
 
-# Batch fetch quotes (Alpaca may limit batch size, so use chunks)
-def chunks(lst, n):
-    for i in range(0, len(lst), n):
-        yield lst[i:i + n]
-
-quotes_dict = {}
-for batch in chunks(all_symbols, 50):
-    req = OptionLatestQuoteRequest(symbol_or_symbols=batch)
-    quotes = client.get_option_latest_quote(req)
-    quotes_dict.update(quotes)
+# The client splits long symbol lists into batches and fetches them concurrently
+req = OptionLatestQuoteRequest(symbol_or_symbols=all_symbols)
+quotes_dict = client.get_option_latest_quote(req)
 
 # --- MERGE QUOTES INTO SAMPLE DF ---
 sample_df["bid"] = sample_df["symbol"].map(lambda s: quotes_dict[s].bid_price if s in quotes_dict else np.nan)